@@ -1,20 +1,68 @@
-from .branches import Branches, AsyncBranches
-from .cash_registers import CashRegisters, AsyncCashRegisters
-from .cashier import Cashier, AsyncCashier
-from .currency import Currency, AsyncCurrency
-from .extended_reports import ExtendedReports, AsyncExtendedReports
-from .goods import Goods, AsyncGoods
-from .invoices import Invoices, AsyncInvoices
-from .nova_post import NovaPost, AsyncNovaPost
-from .orders import Orders, AsyncOrders
-from .organization import Organization, AsyncOrganization
-from .prepayment_receipts import PrepaymentReceipts, AsyncPrepaymentReceipts
-from .receipts import Receipts, AsyncReceipts
-from .reports import Reports, AsyncReports
-from .shifts import Shifts, AsyncShifts
-from .tax import Tax, AsyncTax
-from .transactions import Transactions, AsyncTransactions
-from .webhook import Webhook, AsyncWebhook
+"""
+The API namespaces of the clients.
+
+The namespace classes are imported from their submodules on first access, so importing a client does not load every
+namespace module.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from .branches import Branches, AsyncBranches
+    from .cash_registers import CashRegisters, AsyncCashRegisters
+    from .cashier import Cashier, AsyncCashier
+    from .currency import Currency, AsyncCurrency
+    from .extended_reports import ExtendedReports, AsyncExtendedReports
+    from .goods import Goods, AsyncGoods
+    from .invoices import Invoices, AsyncInvoices
+    from .nova_post import NovaPost, AsyncNovaPost
+    from .orders import Orders, AsyncOrders
+    from .organization import Organization, AsyncOrganization
+    from .prepayment_receipts import PrepaymentReceipts, AsyncPrepaymentReceipts
+    from .receipts import Receipts, AsyncReceipts
+    from .reports import Reports, AsyncReports
+    from .shifts import Shifts, AsyncShifts
+    from .tax import Tax, AsyncTax
+    from .transactions import Transactions, AsyncTransactions
+    from .webhook import Webhook, AsyncWebhook
+
+_NAMESPACES: Dict[str, str] = {
+    "Branches": "branches",
+    "AsyncBranches": "branches",
+    "CashRegisters": "cash_registers",
+    "AsyncCashRegisters": "cash_registers",
+    "Cashier": "cashier",
+    "AsyncCashier": "cashier",
+    "Currency": "currency",
+    "AsyncCurrency": "currency",
+    "ExtendedReports": "extended_reports",
+    "AsyncExtendedReports": "extended_reports",
+    "Goods": "goods",
+    "AsyncGoods": "goods",
+    "Invoices": "invoices",
+    "AsyncInvoices": "invoices",
+    "NovaPost": "nova_post",
+    "AsyncNovaPost": "nova_post",
+    "Orders": "orders",
+    "AsyncOrders": "orders",
+    "Organization": "organization",
+    "AsyncOrganization": "organization",
+    "PrepaymentReceipts": "prepayment_receipts",
+    "AsyncPrepaymentReceipts": "prepayment_receipts",
+    "Receipts": "receipts",
+    "AsyncReceipts": "receipts",
+    "Reports": "reports",
+    "AsyncReports": "reports",
+    "Shifts": "shifts",
+    "AsyncShifts": "shifts",
+    "Tax": "tax",
+    "AsyncTax": "tax",
+    "Transactions": "transactions",
+    "AsyncTransactions": "transactions",
+    "Webhook": "webhook",
+    "AsyncWebhook": "webhook",
+}
 
 __all__ = [
     "CashRegisters",
@@ -52,3 +100,15 @@ __all__ = [
     "NovaPost",
     "AsyncNovaPost",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _NAMESPACES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_NAMESPACES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,55 +1,150 @@
-from typing import Optional, AsyncGenerator, Generator
+import asyncio
+import copy
+import queue
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional, AsyncGenerator, Generator
 
 from checkbox_sdk.methods.base import AbstractMethod
 from checkbox_sdk.storage.simple import SessionStorage
 
 
+class _PageFailure:  # pylint: disable=too-few-public-methods
+    """
+    Exception raised while fetching a page in the background, re-raised by the consumer.
+    """
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
 class PaginationMixin:  # pylint: disable=too-few-public-methods
     def __init__(self, client):
         self.client = client
 
     def fetch_paginated_results(
-        self, request_obj: AbstractMethod, storage: Optional[SessionStorage] = None
+        self, request_obj: AbstractMethod, storage: Optional[SessionStorage] = None, prefetch: Optional[int] = None
     ) -> Generator:
         """
         Generic method to handle fetching and yielding paginated results synchronously.
 
+        With a positive ``prefetch``, the pages are fetched by a background thread into a queue of up to ``prefetch``
+        pages while the caller processes the current one, so the processing and the network round trips overlap.
+        An error of a request is raised after the results of the pages fetched before it, and the thread stops when
+        the generator is closed.
+
         Args:
             request_obj (AbstractMethod): The request object for fetching results.
             storage (Optional[SessionStorage]): Optional session storage to use.
+            prefetch (Optional[int]): The number of pages fetched ahead in the background. Defaults to the
+                ``page_prefetch`` option of the client.
 
         Yields:
             Dict[str, Any]: A dictionary representing each result.
+
+        Example:
+            .. code-block:: python
+
+                get_transactions = transactions.GetTransactions(limit=100)
+                for transaction in client.transactions.fetch_paginated_results(get_transactions, prefetch=2):
+                    process(transaction)
         """
-        while True:
+        if prefetch is None:
+            prefetch = self.client.page_prefetch
+        if prefetch > 0:
+            yield from self._fetch_pages_in_background(request_obj, storage, prefetch)
+            return
+
+        for results in self._iter_pages(request_obj, storage):
+            yield from results
+
+    def _iter_pages(
+        self, request_obj: AbstractMethod, storage: Optional[SessionStorage], stopped: Optional[threading.Event] = None
+    ) -> Generator:
+        while stopped is None or not stopped.is_set():
             transactions_result = self.client(request_obj, storage=storage)
             results = transactions_result.get("results", [])
 
             if not results:
                 break
 
-            yield from results
+            yield results
             request_obj.resolve_pagination(transactions_result)  # type: ignore[attr-defined]
             request_obj.shift_next_page()  # type: ignore[attr-defined]
 
+    def _fetch_pages_in_background(
+        self, request_obj: AbstractMethod, storage: Optional[SessionStorage], prefetch: int
+    ) -> Generator:
+        """
+        Yields the results of the pages fetched by a background thread into a bounded queue.
+        """
+        pages: "queue.Queue[Any]" = queue.Queue(maxsize=prefetch)
+        stopped = threading.Event()
+
+        def put(item: Any) -> bool:
+            # A full queue is retried until the consumer takes a page or stops the iteration
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for results in self._iter_pages(request_obj, storage, stopped):
+                    if not put(results):
+                        return
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                put(_PageFailure(e))
+            else:
+                put(None)
+
+        thread = threading.Thread(target=produce, name="checkbox-page-prefetch", daemon=True)
+        thread.start()
+        try:
+            while (results := pages.get()) is not None:
+                if isinstance(results, _PageFailure):
+                    raise results.exception
+                yield from results
+        finally:
+            stopped.set()
+
 
 class AsyncPaginationMixin:  # pylint: disable=too-few-public-methods
     def __init__(self, client):
         self.client = client
 
     async def fetch_paginated_results(
-        self, request_obj: AbstractMethod, storage: Optional[SessionStorage] = None
+        self, request_obj: AbstractMethod, storage: Optional[SessionStorage] = None, prefetch: Optional[int] = None
     ) -> AsyncGenerator:
         """
         Generic method to handle fetching and yielding paginated results.
 
+        With a positive ``prefetch``, the first page is fetched alone to learn the page size from its ``meta``, and
+        then up to ``prefetch`` upcoming pages are fetched concurrently while the current one is consumed. Results are
+        still yielded in order, and the pages requested after the first empty one are cancelled.
+
         Args:
             request_obj (AbstractMethod): The request object for fetching results.
             storage (Optional[SessionStorage]): Optional session storage to use.
+            prefetch (Optional[int]): The number of upcoming pages fetched concurrently. Defaults to the
+                ``page_prefetch`` option of the client.
 
         Yields:
             Dict[str, Any]: A dictionary representing each result.
+
+        Example:
+            .. code-block:: python
+
+                get_receipts = receipts.GetReceiptsSearch(from_date=from_date, to_date=to_date, limit=100)
+                async for receipt in client.receipts.fetch_paginated_results(get_receipts, prefetch=8):
+                    print(receipt["id"])
         """
+        if prefetch is None:
+            prefetch = self.client.page_prefetch
+
         while True:
             result = await self.client(request_obj, storage=storage)
             results = result.get("results", [])
@@ -62,3 +157,46 @@ class AsyncPaginationMixin:  # pylint: disable=too-few-public-methods
 
             request_obj.resolve_pagination(result)  # type: ignore[attr-defined]
             request_obj.shift_next_page()  # type: ignore[attr-defined]
+
+            if prefetch > 0:
+                # The page size is known from the first page, the following pages are fetched concurrently
+                pages = self._fetch_pages_concurrently(request_obj, storage, prefetch)
+                try:
+                    async for item in pages:
+                        yield item
+                finally:
+                    await pages.aclose()
+                break
+
+    async def _fetch_pages_concurrently(
+        self, request_obj: AbstractMethod, storage: Optional[SessionStorage], prefetch: int
+    ) -> AsyncGenerator:
+        """
+        Fetches the pages starting at the current offset of the request, keeping a window of pages in flight.
+        """
+        offset, limit = request_obj.offset, request_obj.limit  # type: ignore[attr-defined]
+        pending: Deque["asyncio.Future[Dict[str, Any]]"] = deque()
+        page = 0
+
+        def fetch_page(number: int) -> "asyncio.Future[Dict[str, Any]]":
+            call = copy.copy(request_obj)
+            call.offset = offset + number * limit  # type: ignore[attr-defined]
+            return asyncio.ensure_future(self.client(call, storage=storage))
+
+        try:
+            while True:
+                while len(pending) < prefetch:
+                    pending.append(fetch_page(page))
+                    page += 1
+
+                results = (await pending.popleft()).get("results", [])
+                if not results:
+                    break
+
+                for item in results:
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+            # Collects the outcome of the cancelled pages, so their errors are not reported as never retrieved
+            await asyncio.gather(*pending, return_exceptions=True)
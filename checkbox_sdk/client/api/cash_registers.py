@@ -184,6 +184,11 @@ class CashRegisters(PaginationMixin):
 
         Returns:
             List[str]: A list of fiscal codes for offline transactions.
+
+        Notes:
+            - The codes are requested on the caller's path. Use
+              :class:`checkbox_sdk.client.offline_codes.OfflineCodeReservoir` to keep a pool of codes refilled in the
+              background.
         """
         logger.info("Checking available number of offline codes...")
         response = self.client(cash_register.GetOfflineCodesCount(), storage=storage)
@@ -429,6 +434,11 @@ class AsyncCashRegisters(AsyncPaginationMixin):
 
         Returns:
             List[str]: A list of fiscal codes for offline transactions.
+
+        Notes:
+            - The codes are requested on the caller's path. Use
+              :class:`checkbox_sdk.client.offline_codes.AsyncOfflineCodeReservoir` to keep a pool of codes refilled in
+              the background.
         """
         logger.info("Checking available number of offline codes...")
         response = await self.client(cash_register.GetOfflineCodesCount(), storage=storage)
@@ -1,6 +1,8 @@
 from typing import Optional, Dict, Any, List, Union
 from uuid import UUID
 
+from checkbox_sdk.client.base import Sink
+from checkbox_sdk.consts import DEFAULT_CHUNK_SIZE
 from checkbox_sdk.methods import extended_reports
 from checkbox_sdk.storage.simple import SessionStorage
 
@@ -300,6 +302,42 @@ class ExtendedReports:
             storage=storage,
         )
 
+    def download_report_xlsx_task_by_id(
+        self,
+        report_task_id: Union[str, UUID],
+        sink: Sink,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        storage: Optional[SessionStorage] = None,
+    ) -> int:
+        """
+        Streams the XLSX file of a specific report task to a sink.
+
+        Args:
+            report_task_id: The ID of the report task to retrieve. Can be a string or a UUID.
+            sink: A file path or a binary file-like object to write the XLSX file to.
+            chunk_size: The size of the chunks the file is streamed in. Default is `DEFAULT_CHUNK_SIZE`.
+            storage: An optional session storage to use for the operation.
+
+        Returns:
+            The number of bytes written.
+
+        Example:
+            .. code-block:: python
+
+                client.extended_reports.download_report_xlsx_task_by_id(
+                    report_task_id="123e4567-e89b-12d3-a456-426614174000", sink="report.xlsx"
+                )
+
+        Notes:
+            - The file is streamed in chunks and never held fully in memory.
+        """
+        return self.client.download(
+            extended_reports.GetReportXlsxTaskById(report_task_id=report_task_id),
+            sink,
+            storage=storage,
+            chunk_size=chunk_size,
+        )
+
     def report_json_task_by_id(
         self,
         report_task_id: Union[str, UUID],
@@ -626,6 +664,42 @@ class AsyncExtendedReports:
             storage=storage,
         )
 
+    async def download_report_xlsx_task_by_id(
+        self,
+        report_task_id: Union[str, UUID],
+        sink: Sink,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        storage: Optional[SessionStorage] = None,
+    ) -> int:
+        """
+        Asynchronously streams the XLSX file of a specific report task to a sink.
+
+        Args:
+            report_task_id: The ID of the report task to retrieve. Can be a string or a UUID.
+            sink: A file path or a binary file-like object to write the XLSX file to.
+            chunk_size: The size of the chunks the file is streamed in. Default is `DEFAULT_CHUNK_SIZE`.
+            storage: An optional session storage to use for the operation.
+
+        Returns:
+            The number of bytes written.
+
+        Example:
+            .. code-block:: python
+
+                await client.extended_reports.download_report_xlsx_task_by_id(
+                    report_task_id="123e4567-e89b-12d3-a456-426614174000", sink="report.xlsx"
+                )
+
+        Notes:
+            - The file is streamed in chunks and never held fully in memory.
+        """
+        return await self.client.download(
+            extended_reports.GetReportXlsxTaskById(report_task_id=report_task_id),
+            sink,
+            storage=storage,
+            chunk_size=chunk_size,
+        )
+
     async def report_json_task_by_id(
         self,
         report_task_id: Union[str, UUID],
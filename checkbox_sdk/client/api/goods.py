@@ -3,10 +3,13 @@ from typing import Optional, Union, Generator, AsyncGenerator, Dict, Any
 from uuid import UUID
 
 from checkbox_sdk.client.api.base import AsyncPaginationMixin, PaginationMixin
-from checkbox_sdk.consts import DEFAULT_REQUESTS_RELAX
+from checkbox_sdk.client.base import Sink
+from checkbox_sdk.client.polling import Relax
+from checkbox_sdk.consts import DEFAULT_CHUNK_SIZE, DEFAULT_REQUESTS_RELAX
 from checkbox_sdk.exceptions import StatusException
 from checkbox_sdk.methods import goods
 from checkbox_sdk.storage.simple import SessionStorage
+from checkbox_sdk.upload import UploadSource
 
 logger = logging.getLogger(__name__)
 
@@ -151,7 +154,7 @@ class Goods(PaginationMixin):
     def export_goods(
         self,
         export_extension: str,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
     ) -> Union[str | bytes]:
@@ -191,9 +194,22 @@ class Goods(PaginationMixin):
         task: Dict[str, Any],
         export_extension: str,
         storage: Optional[SessionStorage] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[float] = None,
     ) -> Union[str | bytes]:
+        self._check_export_task(task, storage, relax, timeout)
+        return self.client(
+            goods.ExportGoodsFile(task_id=task["task_id"], export_extension=export_extension),
+            storage=storage,
+        )
+
+    def _check_export_task(
+        self,
+        task: Dict[str, Any],
+        storage: Optional[SessionStorage] = None,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
+        timeout: Optional[float] = None,
+    ) -> None:
         export_task = self.client.wait_status(
             goods.ExportGoodsTaskStatus(task_id=task["task_id"]),
             storage=storage,
@@ -209,31 +225,79 @@ class Goods(PaginationMixin):
             error_details = "; ".join(error_messages) if error_messages else "Unknown error"
             raise StatusException(f"Export task failed with status 'error'. Details: {error_details}")
 
-        return self.client(
+    def download_goods(  # pylint: disable=too-many-arguments
+        self,
+        export_extension: str,
+        sink: Sink,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
+        timeout: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        storage: Optional[SessionStorage] = None,
+    ) -> int:
+        """
+        Exports goods data in the specified format and streams the exported file to a sink.
+
+        Args:
+            export_extension: The format in which to export the goods data (e.g., "csv", "json").
+            sink: A file path or a binary file-like object to write the exported file to.
+            relax: The time to wait between checks while waiting for the export task to complete. Default is
+                   `DEFAULT_REQUESTS_RELAX`.
+            timeout: The maximum time to wait for the export task to complete. If `None`, it will wait indefinitely.
+            chunk_size: The size of the chunks the file is streamed in. Default is `DEFAULT_CHUNK_SIZE`.
+            storage: An optional session storage to use for the operation.
+
+        Returns:
+            The number of bytes written.
+
+        Example:
+            .. code-block:: python
+
+                client.goods.download_goods(export_extension="csv", sink="goods.csv")
+
+        Notes:
+            - Unlike :meth:`export_goods`, the exported file is written as is and never held fully in memory.
+        """
+        task = self.client(
+            goods.ExportGoods(export_extension=export_extension),
+            storage=storage,
+        )
+
+        logger.info("Trying to export goods with task %s", task["task_id"])
+        self._check_export_task(task, storage, relax, timeout)
+        return self.client.download(
             goods.ExportGoodsFile(task_id=task["task_id"], export_extension=export_extension),
+            sink,
             storage=storage,
+            chunk_size=chunk_size,
         )
 
-    def import_goods(
+    def import_goods(  # pylint: disable=too-many-arguments
         self,
-        file: str,
+        file: UploadSource,
         ignore_barcode_duplicates: Optional[bool] = False,
         auto_supply: Optional[bool] = False,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
+        filename: Optional[str] = None,
+        gzip: bool = False,
     ) -> Dict[str, Any]:
         """
         Imports goods from a file.
 
         Args:
-            file: The path to the file containing goods data to be imported.
+            file: The file containing goods data to be imported: a path, a binary file-like object, bytes or an
+                  iterator of bytes. The file is streamed in chunks and a file opened from a path is always closed.
             ignore_barcode_duplicates: A flag to indicate if barcode duplicates should be ignored. Default is `False`.
             auto_supply: A flag to indicate if auto supply should be enabled. Default is `False`.
             relax: The time to wait between checks while waiting for the import task to complete. Default is
                    `DEFAULT_REQUESTS_RELAX`.
             timeout: The maximum time to wait for the import task to complete. If `None`, it will wait indefinitely.
             storage: An optional session storage to use for the operation.
+            filename: The name of the file sent to the API, which determines its format (e.g., "goods.csv"). Derived
+                      from the path or the file object if not given.
+            gzip: Whether to compress the upload with gzip on the fly. Only use it if the API accepts compressed
+                  requests. Default is `False`.
 
         Returns:
             A dictionary containing the result of the import operation.
@@ -253,6 +317,8 @@ class Goods(PaginationMixin):
                 file=file,
                 ignore_barcode_duplicates=ignore_barcode_duplicates,
                 auto_supply=auto_supply,
+                filename=filename,
+                gzip=gzip,
             ),
             storage=storage,
         )
@@ -264,7 +330,7 @@ class Goods(PaginationMixin):
         self,
         task: Dict[str, Any],
         storage: Optional[SessionStorage] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         import_task = self.client.wait_status(
@@ -449,7 +515,7 @@ class AsyncGoods(AsyncPaginationMixin):
     async def export_goods(
         self,
         export_extension: str,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
     ) -> Union[str | bytes]:
@@ -489,9 +555,22 @@ class AsyncGoods(AsyncPaginationMixin):
         task: Dict[str, Any],
         export_extension: str,
         storage: Optional[SessionStorage] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[float] = None,
     ) -> Union[str | bytes]:
+        await self._check_export_task(task, storage, relax, timeout)
+        return await self.client(
+            goods.ExportGoodsFile(task_id=task["task_id"], export_extension=export_extension),
+            storage=storage,
+        )
+
+    async def _check_export_task(
+        self,
+        task: Dict[str, Any],
+        storage: Optional[SessionStorage] = None,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
+        timeout: Optional[float] = None,
+    ) -> None:
         export_task = await self.client.wait_status(
             goods.ExportGoodsTaskStatus(task_id=task["task_id"]),
             storage=storage,
@@ -507,31 +586,80 @@ class AsyncGoods(AsyncPaginationMixin):
             error_details = "; ".join(error_messages) if error_messages else "Unknown error"
             raise StatusException(f"Export task failed with status 'error'. Details: {error_details}")
 
-        return await self.client(
+    async def download_goods(  # pylint: disable=too-many-arguments
+        self,
+        export_extension: str,
+        sink: Sink,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
+        timeout: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        storage: Optional[SessionStorage] = None,
+    ) -> int:
+        """
+        Asynchronously exports goods data in the specified format and streams the exported file to a sink.
+
+        Args:
+            export_extension: The format in which to export the goods data (e.g., "csv", "json").
+            sink: A file path or a binary file-like object to write the exported file to.
+            relax: The time to wait between checks while waiting for the export task to complete. Default is
+                   `DEFAULT_REQUESTS_RELAX`.
+            timeout: The maximum time to wait for the export task to complete. If `None`, it will wait indefinitely.
+            chunk_size: The size of the chunks the file is streamed in. Default is `DEFAULT_CHUNK_SIZE`.
+            storage: An optional session storage to use for the operation.
+
+        Returns:
+            The number of bytes written.
+
+        Example:
+            .. code-block:: python
+
+                await client.goods.download_goods(export_extension="csv", sink="goods.csv")
+
+        Notes:
+            - Unlike :meth:`export_goods`, the exported file is written as is and never held fully in memory.
+        """
+        task = await self.client(
+            goods.ExportGoods(export_extension=export_extension),
+            storage=storage,
+        )
+
+        logger.info("Trying to export goods with task %s", task["task_id"])
+        await self._check_export_task(task, storage, relax, timeout)
+        return await self.client.download(
             goods.ExportGoodsFile(task_id=task["task_id"], export_extension=export_extension),
+            sink,
             storage=storage,
+            chunk_size=chunk_size,
         )
 
-    async def import_goods(
+    async def import_goods(  # pylint: disable=too-many-arguments
         self,
-        file: str,
+        file: UploadSource,
         ignore_barcode_duplicates: Optional[bool] = False,
         auto_supply: Optional[bool] = False,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
+        filename: Optional[str] = None,
+        gzip: bool = False,
     ) -> Dict[str, Any]:
         """
         Asynchronously imports goods from a file.
 
         Args:
-            file: The path to the file containing goods data to be imported.
+            file: The file containing goods data to be imported: a path, a binary file-like object, bytes or a
+                  sync or async iterator of bytes. The file is streamed in chunks and a file opened from a path is
+                  always closed.
             ignore_barcode_duplicates: A flag to indicate if barcode duplicates should be ignored. Default is `False`.
             auto_supply: A flag to indicate if auto supply should be enabled. Default is `False`.
             relax: The time to wait between checks while waiting for the import task to complete. Default is
                    `DEFAULT_REQUESTS_RELAX`.
             timeout: The maximum time to wait for the import task to complete. If `None`, it will wait indefinitely.
             storage: An optional session storage to use for the operation.
+            filename: The name of the file sent to the API, which determines its format (e.g., "goods.csv"). Derived
+                      from the path or the file object if not given.
+            gzip: Whether to compress the upload with gzip on the fly. Only use it if the API accepts compressed
+                  requests. Default is `False`.
 
         Returns:
             A dictionary containing the result of the import operation.
@@ -551,6 +679,8 @@ class AsyncGoods(AsyncPaginationMixin):
                 file=file,
                 ignore_barcode_duplicates=ignore_barcode_duplicates,
                 auto_supply=auto_supply,
+                filename=filename,
+                gzip=gzip,
             ),
             storage=storage,
         )
@@ -562,7 +692,7 @@ class AsyncGoods(AsyncPaginationMixin):
         self,
         task: Dict[str, Any],
         storage: Optional[SessionStorage] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         import_task = await self.client.wait_status(
@@ -4,6 +4,7 @@ from typing import Optional, Union, Generator, AsyncGenerator, Dict, Any, List
 
 from checkbox_sdk.client.api.base import AsyncPaginationMixin, PaginationMixin
 from checkbox_sdk.client.api.receipts import check_status, check_status_async
+from checkbox_sdk.client.polling import Relax
 from checkbox_sdk.consts import DEFAULT_REQUESTS_RELAX
 from checkbox_sdk.methods import prepayment_receipts
 from checkbox_sdk.storage.simple import SessionStorage
@@ -79,7 +80,7 @@ class PrepaymentReceipts(PaginationMixin):
         self,
         relation_id: str,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -114,7 +115,7 @@ class PrepaymentReceipts(PaginationMixin):
     def create_prepayment_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -241,7 +242,7 @@ class AsyncPrepaymentReceipts(AsyncPaginationMixin):
         self,
         relation_id: str,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -276,7 +277,7 @@ class AsyncPrepaymentReceipts(AsyncPaginationMixin):
     async def create_prepayment_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -1,22 +1,44 @@
+import asyncio
 import datetime
 import logging
+import time
 from typing import Any, Dict, List, Optional, Generator, Union, AsyncGenerator
 from uuid import UUID
 
 from checkbox_sdk.client.api.base import AsyncPaginationMixin, PaginationMixin
-from checkbox_sdk.consts import DEFAULT_REQUESTS_RELAX
-from checkbox_sdk.exceptions import StatusException
+from checkbox_sdk.client.base import Sink
+from checkbox_sdk.client.polling import Relax, get_polling
+from checkbox_sdk.consts import DEFAULT_CHUNK_SIZE, DEFAULT_REQUESTS_RELAX
+from checkbox_sdk.exceptions import CheckBoxAPIError, CheckBoxCircuitOpenError, CheckBoxError, StatusException
 from checkbox_sdk.methods import receipts
 from checkbox_sdk.storage.simple import SessionStorage
 
 logger = logging.getLogger(__name__)
 
 
+def raise_for_receipt_error(receipt: Dict[str, Any]) -> None:
+    """
+    Raises an exception if the fiscalization of the receipt failed.
+
+    Args:
+        receipt: The receipt as returned by the API.
+
+    Raises:
+        StatusException: If the receipt is in the ``ERROR`` status.
+    """
+    if receipt["status"] == "ERROR":
+        initial_transaction = receipt["transaction"]
+        raise StatusException(
+            f"Receipt can not be created in due to transaction status moved to {initial_transaction['status']!r}: "
+            f"{initial_transaction['response_status']!r} {initial_transaction['response_error_message']!r}"
+        )
+
+
 def check_status(
     client,
     receipt: Dict[str, Any],
     storage: Optional[SessionStorage] = None,
-    relax: float = DEFAULT_REQUESTS_RELAX,
+    relax: Relax = DEFAULT_REQUESTS_RELAX,
     timeout: Optional[float] = None,
 ):
     shift = client.wait_status(
@@ -27,12 +49,7 @@ def check_status(
         expected_value={"DONE", "ERROR"},
         timeout=timeout,
     )
-    if shift["status"] == "ERROR":
-        initial_transaction = shift["transaction"]
-        raise StatusException(
-            f"Receipt can not be created in due to transaction status moved to {initial_transaction['status']!r}: "
-            f"{initial_transaction['response_status']!r} {initial_transaction['response_error_message']!r}"
-        )
+    raise_for_receipt_error(shift)
     return shift
 
 
@@ -40,7 +57,7 @@ async def check_status_async(
     client,
     receipt: Dict[str, Any],
     storage: Optional[SessionStorage] = None,
-    relax: float = DEFAULT_REQUESTS_RELAX,
+    relax: Relax = DEFAULT_REQUESTS_RELAX,
     timeout: Optional[float] = None,
 ):
     shift = await client.wait_status(
@@ -51,23 +68,129 @@ async def check_status_async(
         expected_value={"DONE", "ERROR"},
         timeout=timeout,
     )
-    if shift["status"] == "ERROR":
-        initial_transaction = shift["transaction"]
-        raise StatusException(
-            f"Receipt can not be created in due to transaction status moved to {initial_transaction['status']!r}: "
-            f"{initial_transaction['response_status']!r} {initial_transaction['response_error_message']!r}"
-        )
+    raise_for_receipt_error(shift)
     return shift
 
 
+def _is_lost_response(error: CheckBoxError) -> bool:
+    # API errors (4xx, including rate limiting) mean the server rejected the receipt and an open circuit means the
+    # request was never sent, anything else may hide a created one
+    return not isinstance(error, (CheckBoxAPIError, CheckBoxCircuitOpenError))
+
+
+def _is_not_found(error: CheckBoxError) -> bool:
+    return isinstance(error, CheckBoxAPIError) and error.status == 404
+
+
+def create_idempotent(
+    client,
+    call: receipts.CreateReceipt,
+    storage: Optional[SessionStorage] = None,
+    attempts: int = 1,
+    relax: Relax = DEFAULT_REQUESTS_RELAX,
+) -> Dict[str, Any]:
+    """
+    Creates a receipt with a client-generated ID, recovering from lost responses.
+
+    Before the request is sent the receipt gets a stable UUID. If the request fails with a network error or a server
+    error, the receipt is looked up by this ID first and re-sent only if it was not created.
+
+    Args:
+        client: The client used to send the requests.
+        call: The receipt creation method.
+        storage: Optional session storage to use.
+        attempts: The maximum number of times the receipt is sent. Defaults to 1.
+        relax: The delay, in seconds, before the receipt is re-sent, or a polling strategy for the delays.
+
+    Returns:
+        Dict[str, Any]: The created receipt.
+
+    Raises:
+        CheckBoxError: If the receipt can not be created in the given number of attempts.
+    """
+    receipt_id = call.ensure_id()
+    error = CheckBoxError(f"Receipt {receipt_id} was not created")
+    delays = get_polling(relax).delays()
+    for attempt in range(1, attempts + 1):
+        try:
+            return client(call, storage=storage)
+        except CheckBoxError as e:
+            if not _is_lost_response(e):
+                raise
+            logger.warning("Receipt %s creation failed (attempt %d): %s", receipt_id, attempt, e)
+            error = e
+
+        try:
+            return client(receipts.GetReceipt(receipt_id=receipt_id), storage=storage)
+        except CheckBoxError as e:
+            # The receipt is unknown only if the server says so, otherwise re-sending the same ID is still safe
+            if not _is_not_found(e) and not _is_lost_response(e):
+                raise
+
+        if attempt < attempts:
+            time.sleep(next(delays))
+
+    raise error
+
+
+async def create_idempotent_async(
+    client,
+    call: receipts.CreateReceipt,
+    storage: Optional[SessionStorage] = None,
+    attempts: int = 1,
+    relax: Relax = DEFAULT_REQUESTS_RELAX,
+) -> Dict[str, Any]:
+    """
+    Asynchronously creates a receipt with a client-generated ID, recovering from lost responses.
+
+    See :func:`create_idempotent` for details.
+
+    Args:
+        client: The client used to send the requests.
+        call: The receipt creation method.
+        storage: Optional session storage to use.
+        attempts: The maximum number of times the receipt is sent. Defaults to 1.
+        relax: The delay, in seconds, before the receipt is re-sent, or a polling strategy for the delays.
+
+    Returns:
+        Dict[str, Any]: The created receipt.
+
+    Raises:
+        CheckBoxError: If the receipt can not be created in the given number of attempts.
+    """
+    receipt_id = call.ensure_id()
+    error = CheckBoxError(f"Receipt {receipt_id} was not created")
+    delays = get_polling(relax).delays()
+    for attempt in range(1, attempts + 1):
+        try:
+            return await client(call, storage=storage)
+        except CheckBoxError as e:
+            if not _is_lost_response(e):
+                raise
+            logger.warning("Receipt %s creation failed (attempt %d): %s", receipt_id, attempt, e)
+            error = e
+
+        try:
+            return await client(receipts.GetReceipt(receipt_id=receipt_id), storage=storage)
+        except CheckBoxError as e:
+            if not _is_not_found(e) and not _is_lost_response(e):
+                raise
+
+        if attempt < attempts:
+            await asyncio.sleep(next(delays))
+
+    raise error
+
+
 class Receipts(PaginationMixin):
     def create_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
+        attempts: int = 1,
         **payload,
     ) -> Dict[str, Any]:
         """
@@ -81,16 +204,20 @@ class Receipts(PaginationMixin):
             timeout (Optional[int]): An optional timeout value.
             storage (Optional[SessionStorage]): The session storage to use.
             wait (bool): Flag to indicate whether to wait for the receipt status.
+            attempts (int): The maximum number of times the receipt is sent if the response is lost. The receipt
+                            gets a client-generated ID, so it is looked up before being re-sent.
             **payload: Additional keyword arguments for creating the receipt. Cannot be used together with @receipt.
 
         Returns:
             Dict[str, Any]: The result of checking the status of the created receipt if wait is True, otherwise the
                             created receipt itself.
         """
-        response = self.client(
+        response = create_idempotent(
+            self.client,
             receipts.CreateReceipt(receipt=receipt, **payload),
             storage=storage,
-            # request_timeout=timeout,
+            attempts=attempts,
+            relax=relax,
         )
         logger.info("Trying create receipt %s", response["id"])  # type: ignore[index]
         if not wait:
@@ -115,6 +242,9 @@ class Receipts(PaginationMixin):
         Returns:
             A list of dictionaries containing the results of the created receipts.
 
+        Notes:
+            - All receipts are sent in one request. Use :class:`checkbox_sdk.client.bulk.BulkReceiptSubmitter` to send
+              large numbers of receipts in concurrent, size-bounded chunks.
         """
         response = self.client(
             receipts.CreateBulkReceipts(receipts=receipt_list, **payload),
@@ -126,10 +256,11 @@ class Receipts(PaginationMixin):
     def create_receipt_offline(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
+        attempts: int = 1,
         **payload,
     ) -> Dict[str, Any]:
         """
@@ -141,16 +272,20 @@ class Receipts(PaginationMixin):
             timeout: The timeout duration for the operation.
             storage: An optional session storage to use for the operation.
             wait: A boolean indicating whether to wait for the operation to complete.
+            attempts: The maximum number of times the receipt is sent if the response is lost. The receipt gets a
+                      client-generated ID, so it is looked up before being re-sent.
             **payload: Additional keyword arguments for creating the receipt.
 
         Returns:
             A dictionary containing the response of the created receipt.
 
         """
-        response = self.client(
+        response = create_idempotent(
+            self.client,
             receipts.CreateReceiptOffline(receipt=receipt, **payload),
             storage=storage,
-            # request_timeout=timeout,
+            attempts=attempts,
+            relax=relax,
         )
         logger.info("Trying create receipt %s", response["id"])
         if not wait:
@@ -161,7 +296,7 @@ class Receipts(PaginationMixin):
     def create_external_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -196,7 +331,7 @@ class Receipts(PaginationMixin):
     def create_service_currency_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -230,7 +365,7 @@ class Receipts(PaginationMixin):
     def create_currency_exchange_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -263,7 +398,7 @@ class Receipts(PaginationMixin):
     def create_cash_withdrawal_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -379,7 +514,7 @@ class Receipts(PaginationMixin):
     def create_service_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[float] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -474,6 +609,51 @@ class Receipts(PaginationMixin):
             storage=storage,
         )
 
+    def download_receipt_visualization_pdf(  # pylint: disable=too-many-arguments
+        self,
+        receipt_id: Union[str, UUID],
+        sink: Sink,
+        is_second_copy: Optional[bool] = False,
+        download: Optional[bool] = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        storage: Optional[SessionStorage] = None,
+    ) -> int:
+        """
+        Streams the PDF visualization of a receipt to a file.
+
+        Args:
+            receipt_id: The ID of the receipt to visualize.
+            sink: A file path or a binary file-like object to write the PDF document to.
+            is_second_copy: A flag indicating if it is a second copy of the receipt.
+            download: A flag indicating if the PDF should be downloaded.
+            chunk_size: The size of the chunks the file is streamed in. Default is `DEFAULT_CHUNK_SIZE`.
+            storage: An optional session storage to use for the operation.
+
+        Returns:
+            The number of bytes written.
+
+        Example:
+            .. code-block:: python
+
+                client.receipts.download_receipt_visualization_pdf(
+                    receipt_id="123e4567-e89b-12d3-a456-426614174000", sink="receipt.pdf"
+                )
+
+        Notes:
+            - The file is streamed in chunks and never held fully in memory. Use the client's
+              ``iter_bytes`` method with the same API method to get the chunks as an iterator instead.
+        """
+        return self.client.download(
+            receipts.GetReceiptVisualizationPdf(
+                receipt_id=receipt_id,
+                is_second_copy=is_second_copy,
+                download=download,
+            ),
+            sink,
+            storage=storage,
+            chunk_size=chunk_size,
+        )
+
     def get_receipt_visualization_text(
         self,
         receipt_id: Union[str, UUID],
@@ -538,6 +718,57 @@ class Receipts(PaginationMixin):
             storage=storage,
         )
 
+    def download_receipt_visualization_png(  # pylint: disable=too-many-arguments
+        self,
+        receipt_id: Union[str, UUID],
+        sink: Sink,
+        is_second_copy: Optional[bool] = False,
+        width: Optional[int] = 30,
+        paper_width: Optional[int] = 58,
+        qrcode_scale: Optional[int] = 75,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        storage: Optional[SessionStorage] = None,
+    ) -> int:
+        """
+        Streams the PNG visualization of a receipt to a file.
+
+        Args:
+            receipt_id: The ID of the receipt to visualize.
+            sink: A file path or a binary file-like object to write the PNG image to.
+            is_second_copy: A flag indicating if it is a second copy of the receipt.
+            width: The width of the PNG visualization.
+            paper_width: The width of the paper for the visualization.
+            qrcode_scale: The scale of the QR code in the visualization.
+            chunk_size: The size of the chunks the file is streamed in. Default is `DEFAULT_CHUNK_SIZE`.
+            storage: An optional session storage to use for the operation.
+
+        Returns:
+            The number of bytes written.
+
+        Example:
+            .. code-block:: python
+
+                client.receipts.download_receipt_visualization_png(
+                    receipt_id="123e4567-e89b-12d3-a456-426614174000", sink="receipt.png"
+                )
+
+        Notes:
+            - The file is streamed in chunks and never held fully in memory. Use the client's
+              ``iter_bytes`` method with the same API method to get the chunks as an iterator instead.
+        """
+        return self.client.download(
+            receipts.GetReceiptVisualizationPng(
+                receipt_id=receipt_id,
+                is_second_copy=is_second_copy,
+                width=width,
+                paper_width=paper_width,
+                qrcode_scale=qrcode_scale,
+            ),
+            sink,
+            storage=storage,
+            chunk_size=chunk_size,
+        )
+
     def get_receipt_visualization_qrcode(
         self,
         receipt_id: Union[str, UUID],
@@ -641,10 +872,11 @@ class AsyncReceipts(AsyncPaginationMixin):
     async def create_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
+        attempts: int = 1,
         **payload,
     ) -> Dict[str, Any]:
         """
@@ -658,16 +890,20 @@ class AsyncReceipts(AsyncPaginationMixin):
             timeout (Optional[int]): An optional timeout value.
             storage (Optional[SessionStorage]): The session storage to use.
             wait (bool): Flag to indicate whether to wait for the receipt status.
+            attempts (int): The maximum number of times the receipt is sent if the response is lost. The receipt
+                            gets a client-generated ID, so it is looked up before being re-sent.
             **payload: Additional keyword arguments for creating the receipt. Cannot be used together with @receipt.
 
         Returns:
             Dict[str, Any]: The result of checking the status of the created receipt if wait is True, otherwise the
                             created receipt itself.
         """
-        response = await self.client(
+        response = await create_idempotent_async(
+            self.client,
             receipts.CreateReceipt(receipt=receipt, **payload),
             storage=storage,
-            # request_timeout=timeout,
+            attempts=attempts,
+            relax=relax,
         )
         logger.info("Trying create receipt %s", response["id"])  # type: ignore[index]
         if not wait:
@@ -692,6 +928,9 @@ class AsyncReceipts(AsyncPaginationMixin):
         Returns:
             A list of dictionaries containing the results of the created receipts.
 
+        Notes:
+            - All receipts are sent in one request. Use :class:`checkbox_sdk.client.bulk.AsyncBulkReceiptSubmitter` to
+              send large numbers of receipts in concurrent, size-bounded chunks.
         """
         response = await self.client(
             receipts.CreateBulkReceipts(receipts=receipt_list, **payload),
@@ -703,10 +942,11 @@ class AsyncReceipts(AsyncPaginationMixin):
     async def create_receipt_offline(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
+        attempts: int = 1,
         **payload,
     ) -> Dict[str, Any]:
         """
@@ -718,16 +958,20 @@ class AsyncReceipts(AsyncPaginationMixin):
             timeout: The timeout duration for the operation.
             storage: An optional session storage to use for the operation.
             wait: A boolean indicating whether to wait for the operation to complete.
+            attempts: The maximum number of times the receipt is sent if the response is lost. The receipt gets a
+                      client-generated ID, so it is looked up before being re-sent.
             **payload: Additional keyword arguments for creating the receipt.
 
         Returns:
             A dictionary containing the response of the created receipt.
 
         """
-        response = await self.client(
+        response = await create_idempotent_async(
+            self.client,
             receipts.CreateReceiptOffline(receipt=receipt, **payload),
             storage=storage,
-            # request_timeout=timeout,
+            attempts=attempts,
+            relax=relax,
         )
         logger.info("Trying create receipt %s", response["id"])
         if not wait:
@@ -738,7 +982,7 @@ class AsyncReceipts(AsyncPaginationMixin):
     async def create_external_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -773,7 +1017,7 @@ class AsyncReceipts(AsyncPaginationMixin):
     async def create_service_currency_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -807,7 +1051,7 @@ class AsyncReceipts(AsyncPaginationMixin):
     async def create_currency_exchange_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -840,7 +1084,7 @@ class AsyncReceipts(AsyncPaginationMixin):
     async def create_cash_withdrawal_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -960,7 +1204,7 @@ class AsyncReceipts(AsyncPaginationMixin):
     async def create_service_receipt(
         self,
         receipt: Optional[Dict[str, Any]] = None,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[float] = None,
         storage: Optional[SessionStorage] = None,
         wait: bool = True,
@@ -1056,6 +1300,51 @@ class AsyncReceipts(AsyncPaginationMixin):
             storage=storage,
         )
 
+    async def download_receipt_visualization_pdf(  # pylint: disable=too-many-arguments
+        self,
+        receipt_id: Union[str, UUID],
+        sink: Sink,
+        is_second_copy: Optional[bool] = False,
+        download: Optional[bool] = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        storage: Optional[SessionStorage] = None,
+    ) -> int:
+        """
+        Asynchronously streams the PDF visualization of a receipt to a file.
+
+        Args:
+            receipt_id: The ID of the receipt to visualize.
+            sink: A file path or a binary file-like object to write the PDF document to.
+            is_second_copy: A flag indicating if it is a second copy of the receipt.
+            download: A flag indicating if the PDF should be downloaded.
+            chunk_size: The size of the chunks the file is streamed in. Default is `DEFAULT_CHUNK_SIZE`.
+            storage: An optional session storage to use for the operation.
+
+        Returns:
+            The number of bytes written.
+
+        Example:
+            .. code-block:: python
+
+                await client.receipts.download_receipt_visualization_pdf(
+                    receipt_id="123e4567-e89b-12d3-a456-426614174000", sink="receipt.pdf"
+                )
+
+        Notes:
+            - The file is streamed in chunks and never held fully in memory. Use the client's
+              ``aiter_bytes`` method with the same API method to get the chunks as an iterator instead.
+        """
+        return await self.client.download(
+            receipts.GetReceiptVisualizationPdf(
+                receipt_id=receipt_id,
+                is_second_copy=is_second_copy,
+                download=download,
+            ),
+            sink,
+            storage=storage,
+            chunk_size=chunk_size,
+        )
+
     async def get_receipt_visualization_text(
         self,
         receipt_id: Union[str, UUID],
@@ -1120,6 +1409,57 @@ class AsyncReceipts(AsyncPaginationMixin):
             storage=storage,
         )
 
+    async def download_receipt_visualization_png(  # pylint: disable=too-many-arguments
+        self,
+        receipt_id: Union[str, UUID],
+        sink: Sink,
+        is_second_copy: Optional[bool] = False,
+        width: Optional[int] = 30,
+        paper_width: Optional[int] = 58,
+        qrcode_scale: Optional[int] = 75,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        storage: Optional[SessionStorage] = None,
+    ) -> int:
+        """
+        Asynchronously streams the PNG visualization of a receipt to a file.
+
+        Args:
+            receipt_id: The ID of the receipt to visualize.
+            sink: A file path or a binary file-like object to write the PNG image to.
+            is_second_copy: A flag indicating if it is a second copy of the receipt.
+            width: The width of the PNG visualization.
+            paper_width: The width of the paper for the visualization.
+            qrcode_scale: The scale of the QR code in the visualization.
+            chunk_size: The size of the chunks the file is streamed in. Default is `DEFAULT_CHUNK_SIZE`.
+            storage: An optional session storage to use for the operation.
+
+        Returns:
+            The number of bytes written.
+
+        Example:
+            .. code-block:: python
+
+                await client.receipts.download_receipt_visualization_png(
+                    receipt_id="123e4567-e89b-12d3-a456-426614174000", sink="receipt.png"
+                )
+
+        Notes:
+            - The file is streamed in chunks and never held fully in memory. Use the client's
+              ``aiter_bytes`` method with the same API method to get the chunks as an iterator instead.
+        """
+        return await self.client.download(
+            receipts.GetReceiptVisualizationPng(
+                receipt_id=receipt_id,
+                is_second_copy=is_second_copy,
+                width=width,
+                paper_width=paper_width,
+                qrcode_scale=qrcode_scale,
+            ),
+            sink,
+            storage=storage,
+            chunk_size=chunk_size,
+        )
+
     async def get_receipt_visualization_qrcode(
         self,
         receipt_id: Union[str, UUID],
@@ -3,6 +3,8 @@ from typing import Union, Optional, List, Generator, AsyncGenerator, Dict, Any
 from uuid import UUID
 
 from checkbox_sdk.client.api.base import AsyncPaginationMixin, PaginationMixin
+from checkbox_sdk.client.base import Sink
+from checkbox_sdk.consts import DEFAULT_CHUNK_SIZE
 from checkbox_sdk.methods import reports
 from checkbox_sdk.storage.simple import SessionStorage
 
@@ -271,6 +273,48 @@ class Reports(PaginationMixin):
             storage=storage,
         )
 
+    def download_report_png(  # pylint: disable=too-many-arguments
+        self,
+        report_id: Union[str, UUID],
+        sink: Sink,
+        width: Optional[int] = 34,
+        paper_width: Optional[int] = 58,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        storage: Optional[SessionStorage] = None,
+    ) -> int:
+        """
+        Streams the ASCII image visualization of a specific report to a file.
+
+        Args:
+            report_id: The ID of the report to retrieve.
+            sink: A file path or a binary file-like object to write the visualization to.
+            width: The width of the ASCII image visualization. Default is 34.
+            paper_width: The width of the paper for the ASCII image visualization. Default is 58.
+            chunk_size: The size of the chunks the file is streamed in. Default is `DEFAULT_CHUNK_SIZE`.
+            storage: An optional session storage to use for the operation.
+
+        Returns:
+            The number of bytes written.
+
+        Example:
+            .. code-block:: python
+
+                client.reports.download_report_png(
+                    report_id="123e4567-e89b-12d3-a456-426614174000", sink="report.txt"
+                )
+
+        Notes:
+            - The visualization is written as UTF-8 encoded text, see :meth:`get_report_png`.
+            - The file is streamed in chunks and never held fully in memory. Use the client's
+              ``iter_bytes`` method with the same API method to get the chunks as an iterator instead.
+        """
+        return self.client.download(
+            reports.GetReportVisualizationPng(report_id=report_id, width=width, paper_width=paper_width),
+            sink,
+            storage=storage,
+            chunk_size=chunk_size,
+        )
+
 
 class AsyncReports(AsyncPaginationMixin):
     async def get_periodical_report(
@@ -551,3 +595,45 @@ class AsyncReports(AsyncPaginationMixin):
             reports.GetReportVisualizationPng(report_id=report_id, width=width, paper_width=paper_width),
             storage=storage,
         )
+
+    async def download_report_png(  # pylint: disable=too-many-arguments
+        self,
+        report_id: Union[str, UUID],
+        sink: Sink,
+        width: Optional[int] = 34,
+        paper_width: Optional[int] = 58,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        storage: Optional[SessionStorage] = None,
+    ) -> int:
+        """
+        Asynchronously streams the ASCII image visualization of a specific report to a file.
+
+        Args:
+            report_id: The ID of the report to retrieve.
+            sink: A file path or a binary file-like object to write the visualization to.
+            width: The width of the ASCII image visualization. Default is 34.
+            paper_width: The width of the paper for the ASCII image visualization. Default is 58.
+            chunk_size: The size of the chunks the file is streamed in. Default is `DEFAULT_CHUNK_SIZE`.
+            storage: An optional session storage to use for the operation.
+
+        Returns:
+            The number of bytes written.
+
+        Example:
+            .. code-block:: python
+
+                await client.reports.download_report_png(
+                    report_id="123e4567-e89b-12d3-a456-426614174000", sink="report.txt"
+                )
+
+        Notes:
+            - The visualization is written as UTF-8 encoded text, see :meth:`get_report_png`.
+            - The file is streamed in chunks and never held fully in memory. Use the client's
+              ``aiter_bytes`` method with the same API method to get the chunks as an iterator instead.
+        """
+        return await self.client.download(
+            reports.GetReportVisualizationPng(report_id=report_id, width=width, paper_width=paper_width),
+            sink,
+            storage=storage,
+            chunk_size=chunk_size,
+        )
@@ -3,6 +3,7 @@ import logging
 from typing import Any, Dict, List, Optional, Generator, Union, AsyncGenerator
 from uuid import UUID
 
+from checkbox_sdk.client.polling import Relax
 from checkbox_sdk.consts import DEFAULT_REQUESTS_RELAX
 from checkbox_sdk.exceptions import StatusException
 from checkbox_sdk.methods import shifts
@@ -49,7 +50,7 @@ class Shifts(PaginationMixin):
 
     def create_shift(
         self,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         **kwargs: Any,
@@ -104,7 +105,7 @@ class Shifts(PaginationMixin):
 
     def close_shift(
         self,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         **payload,
@@ -154,7 +155,7 @@ class Shifts(PaginationMixin):
 
     def close_shift_online(
         self,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         transaction_timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
@@ -211,7 +212,7 @@ class Shifts(PaginationMixin):
     def close_shift_by_senior_cashier(
         self,
         shift_id: Union[str, UUID],
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         transaction_timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
@@ -306,7 +307,7 @@ class AsyncShifts(AsyncPaginationMixin):
 
     async def create_shift(
         self,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         **kwargs: Any,
@@ -361,7 +362,7 @@ class AsyncShifts(AsyncPaginationMixin):
 
     async def close_shift(
         self,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
         **payload,
@@ -411,7 +412,7 @@ class AsyncShifts(AsyncPaginationMixin):
 
     async def close_shift_online(
         self,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         transaction_timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
@@ -468,7 +469,7 @@ class AsyncShifts(AsyncPaginationMixin):
     async def close_shift_by_senior_cashier(
         self,
         shift_id: Union[str, UUID],
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         transaction_timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
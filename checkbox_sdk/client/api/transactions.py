@@ -1,5 +1,6 @@
 from typing import Optional, Generator, List, AsyncGenerator
 
+from checkbox_sdk.client.polling import Relax
 from checkbox_sdk.consts import DEFAULT_REQUESTS_RELAX
 from checkbox_sdk.exceptions import StatusException
 from checkbox_sdk.methods import transactions
@@ -11,7 +12,7 @@ class Transactions(PaginationMixin):
     def wait_transaction(
         self,
         transaction_id: str,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
     ):
@@ -79,7 +80,7 @@ class AsyncTransactions(AsyncPaginationMixin):
     async def wait_transaction(
         self,
         transaction_id: str,
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[int] = None,
         storage: Optional[SessionStorage] = None,
     ):
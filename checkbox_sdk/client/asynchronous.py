@@ -1,35 +1,41 @@
+import asyncio
+import inspect
 import logging
 import time
-from typing import Any, Optional, Set
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
 
 from httpcore import NetworkError
-from httpx import AsyncClient, HTTPError, Timeout
+from httpx import AsyncClient, HTTPError, Response
 
-from checkbox_sdk.client.base import BaseAsyncCheckBoxClient
-from checkbox_sdk.consts import DEFAULT_REQUESTS_RELAX
+from checkbox_sdk.client.base import BaseAsyncCheckBoxClient, LazyNamespace, Sink
+from checkbox_sdk.client.polling import Relax, get_polling
+from checkbox_sdk.codec import use_codec
+from checkbox_sdk.consts import DEFAULT_BATCH_CONCURRENCY, DEFAULT_CHUNK_SIZE, DEFAULT_REQUESTS_RELAX
 from checkbox_sdk.exceptions import CheckBoxNetworkError, CheckBoxError
-from checkbox_sdk.methods import cash_register, cashier
 from checkbox_sdk.methods.base import AbstractMethod, BaseMethod
 from checkbox_sdk.storage.simple import SessionStorage
-from .api import (
-    AsyncCashRegisters,
-    AsyncCashier,
-    AsyncReceipts,
-    AsyncShifts,
-    AsyncTax,
-    AsyncTransactions,
-    AsyncOrganization,
-    AsyncPrepaymentReceipts,
-    AsyncReports,
-    AsyncExtendedReports,
-    AsyncGoods,
-    AsyncOrders,
-    AsyncCurrency,
-    AsyncWebhook,
-    AsyncInvoices,
-    AsyncNovaPost,
-    AsyncBranches,
-)
+
+if TYPE_CHECKING:
+    from .api import (
+        AsyncCashier,
+        AsyncCashRegisters,
+        AsyncShifts,
+        AsyncReceipts,
+        AsyncTransactions,
+        AsyncTax,
+        AsyncOrganization,
+        AsyncPrepaymentReceipts,
+        AsyncReports,
+        AsyncExtendedReports,
+        AsyncGoods,
+        AsyncOrders,
+        AsyncCurrency,
+        AsyncWebhook,
+        AsyncInvoices,
+        AsyncNovaPost,
+        AsyncBranches,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -43,27 +49,42 @@ class AsyncCheckBoxClient(BaseAsyncCheckBoxClient):  # pylint: disable=too-many-
     making it easier to handle resources automatically.
     """
 
+    cashier: LazyNamespace["AsyncCashier"] = LazyNamespace("cashier", "AsyncCashier")
+    cash_registers: LazyNamespace["AsyncCashRegisters"] = LazyNamespace("cash_registers", "AsyncCashRegisters")
+    shifts: LazyNamespace["AsyncShifts"] = LazyNamespace("shifts", "AsyncShifts")
+    receipts: LazyNamespace["AsyncReceipts"] = LazyNamespace("receipts", "AsyncReceipts")
+    transactions: LazyNamespace["AsyncTransactions"] = LazyNamespace("transactions", "AsyncTransactions")
+    tax: LazyNamespace["AsyncTax"] = LazyNamespace("tax", "AsyncTax")
+    organization: LazyNamespace["AsyncOrganization"] = LazyNamespace("organization", "AsyncOrganization")
+    prepayment_receipts: LazyNamespace["AsyncPrepaymentReceipts"] = LazyNamespace(
+        "prepayment_receipts", "AsyncPrepaymentReceipts"
+    )
+    reports: LazyNamespace["AsyncReports"] = LazyNamespace("reports", "AsyncReports")
+    extended_reports: LazyNamespace["AsyncExtendedReports"] = LazyNamespace("extended_reports", "AsyncExtendedReports")
+    goods: LazyNamespace["AsyncGoods"] = LazyNamespace("goods", "AsyncGoods")
+    orders: LazyNamespace["AsyncOrders"] = LazyNamespace("orders", "AsyncOrders")
+    currency: LazyNamespace["AsyncCurrency"] = LazyNamespace("currency", "AsyncCurrency")
+    webhook: LazyNamespace["AsyncWebhook"] = LazyNamespace("webhook", "AsyncWebhook")
+    invoices: LazyNamespace["AsyncInvoices"] = LazyNamespace("invoices", "AsyncInvoices")
+    nova_post: LazyNamespace["AsyncNovaPost"] = LazyNamespace("nova_post", "AsyncNovaPost")
+    branches: LazyNamespace["AsyncBranches"] = LazyNamespace("branches", "AsyncBranches")
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        self._session = AsyncClient(proxies=self.proxy, timeout=Timeout(timeout=self.timeout), verify=self.verify_ssl)
-        self.cashier = AsyncCashier(self)
-        self.cash_registers = AsyncCashRegisters(self)
-        self.shifts = AsyncShifts(self)
-        self.receipts = AsyncReceipts(self)
-        self.transactions = AsyncTransactions(self)
-        self.tax = AsyncTax(self)
-        self.organization = AsyncOrganization(self)
-        self.prepayment_receipts = AsyncPrepaymentReceipts(self)
-        self.reports = AsyncReports(self)
-        self.extended_reports = AsyncExtendedReports(self)
-        self.goods = AsyncGoods(self)
-        self.orders = AsyncOrders(self)
-        self.currency = AsyncCurrency(self)
-        self.webhook = AsyncWebhook(self)
-        self.invoices = AsyncInvoices(self)
-        self.nova_post = AsyncNovaPost(self)
-        self.branches = AsyncBranches(self)
+        self._session: Optional[AsyncClient] = None
+
+    @property
+    def session(self) -> AsyncClient:
+        """
+        The HTTP session of the client.
+
+        The session, with its connection pool and SSL context, is created on first use, so creating a client that is
+        never used to make requests stays cheap.
+        """
+        if self._session is None:
+            self._session = AsyncClient(**self.session_options)
+        return self._session
 
     async def __aenter__(self):
         return self
@@ -110,37 +131,297 @@ class AsyncCheckBoxClient(BaseAsyncCheckBoxClient):  # pylint: disable=too-many-
         Raises:
             CheckBoxError: If an HTTP error occurs during the request.
             CheckBoxNetworkError: If a network error occurs during the request.
+            CheckBoxCircuitOpenError: If the circuit breaker rejects the request.
 
         Notes:
             - The `url` for the request is constructed based on whether the call is internal or external.
+            - Every attempt waits for the client's rate limiter, if one is configured.
+            - Failed attempts are repeated according to the client's retry policy, if one is configured.
+            - Responses of cacheable methods are served from the client's response cache, if one is configured.
+            - The payload is encoded and the response is parsed with the client's JSON codec.
             - The response is checked and parsed according to the method call's specifications.
         """
         # pylint: disable=duplicate-code
         storage = storage or self.storage
 
-        if not call.internal:
-            url = f"{self.base_url}/api/v{self.api_version}/{call.uri}"
-        else:
-            url = f"{self.base_url}/{call.uri}"
+        url = self._get_url(call)
+        headers = self._get_headers(storage, call)
+        cache_key = self._get_cache_key(call, headers)
+        if (cached := self._get_cached_response(cache_key)) is not None:
+            with use_codec(self.codec):
+                return call.parse_response(storage=storage, response=cached)
+        response = await self._send(call, storage, url, headers, self._encode_payload(call), request_timeout)
+
+        logger.debug("Request response: %s", response)
+        with use_codec(self.codec):
+            self._check_response(response=response)
+            self._store_response(call, cache_key, response)
+            return call.parse_response(storage=storage, response=response)
+
+    async def _send(  # pylint: disable=too-many-arguments
+        self,
+        call: AbstractMethod,
+        storage: SessionStorage,
+        url: str,
+        headers: Dict[str, Any],
+        content: Optional[bytes],
+        request_timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> Response:
+        """
+        Asynchronously sends the request, repeating it according to the client's retry policy.
+
+        Args:
+            call: The API method being executed.
+            storage: The session storage of the request.
+            url: The URL of the request.
+            headers: The headers of the request.
+            content: The payload encoded by :meth:`_encode_payload`.
+            request_timeout: Optional timeout value for the request.
+            stream: Whether to return before the response body is read. The caller must close such a response.
+
+        Returns:
+            The response of the last attempt.
+
+        Raises:
+            CheckBoxError: If an HTTP error occurs during the request.
+            CheckBoxNetworkError: If a network error occurs during the request.
+            CheckBoxCircuitOpenError: If the circuit breaker rejects the request.
+        """
+        attempt = 0
+        started = time.monotonic()
+        while True:
+            attempt += 1
+            if self.circuit_breaker:
+                self.circuit_breaker.before_request(call)
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(storage)
+            try:
+                request = self.session.build_request(
+                    method=call.method.name,
+                    url=url,
+                    timeout=request_timeout or self.timeout,
+                    params=call.query,
+                    **self._get_request_body(call, headers, content),
+                )
+                response = await self.session.send(request, stream=stream)
+            except (HTTPError, NetworkError) as e:
+                self._record_attempt(call, exception=e)
+                if (delay := self._get_retry_delay(call, attempt, started, exception=e)) is None:
+                    if isinstance(e, NetworkError):
+                        raise CheckBoxNetworkError(e) from e
+                    raise CheckBoxError(e) from e
+            else:
+                self._record_attempt(call, response=response)
+                if (delay := self._get_retry_delay(call, attempt, started, response=response)) is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        call: AbstractMethod,
+        storage: Optional[SessionStorage] = None,
+        request_timeout: Optional[float] = None,
+    ) -> AsyncIterator[Response]:
+        """
+        Asynchronously sends the request and provides the response before its body is read.
+
+        The body can then be consumed in chunks with the `httpx` streaming methods, e.g.
+        :meth:`httpx.Response.aiter_bytes`, so large files never sit fully in memory. Error responses are read and
+        checked as usual before the context is entered. The response cache is bypassed.
+
+        Args:
+            call: The API method to call.
+            storage: Optional session storage to use for the request. If not provided, the default storage will be
+                     used.
+            request_timeout: Optional timeout value for the request. If not provided, the default timeout will be used.
+
+        Yields:
+            The successful streaming response. It is closed when the context exits.
+
+        Raises:
+            CheckBoxError: If an HTTP error occurs during the request or while the body is read.
+            CheckBoxNetworkError: If a network error occurs during the request.
+            CheckBoxAPIError: If the API returns an error response.
+
+        Example:
+            .. code-block:: python
 
+                async with client.stream(receipts.GetReceiptVisualizationPdf(receipt_id=receipt_id)) as response:
+                    async for chunk in response.aiter_bytes():
+                        archive.write(chunk)
+        """
+        storage = storage or self.storage
+        headers = self._get_headers(storage, call)
+        response = await self._send(
+            call, storage, self._get_url(call), headers, self._encode_payload(call), request_timeout, stream=True
+        )
         try:
-            response = await self._session.request(
-                method=call.method.name,
-                url=url,
-                timeout=request_timeout or self.timeout,
-                params=call.query,
-                files=call.files,
-                headers={**storage.headers, **call.headers, **self.client_headers},
-                json=call.payload,
-            )
-        except HTTPError as e:
-            raise CheckBoxError(e) from e
-        except NetworkError as e:
-            raise CheckBoxNetworkError(e) from e
+            logger.debug("Request response: %s", response)
+            if response.status_code >= 400:
+                await response.aread()
+            with use_codec(self.codec):
+                self._check_response(response=response)
+            self._store_response(call, None, response)
+            try:
+                yield response
+            except (HTTPError, NetworkError) as e:
+                raise CheckBoxError(e) from e
+        finally:
+            await response.aclose()
+
+    async def aiter_bytes(
+        self,
+        call: AbstractMethod,
+        storage: Optional[SessionStorage] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        request_timeout: Optional[float] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Asynchronously streams the response body of the API method in chunks.
 
-        logger.debug("Request response: %s", response)
-        self._check_response(response=response)
-        return call.parse_response(storage=storage, response=response)
+        The request is sent when the iteration starts and the connection is released when it ends.
+
+        Args:
+            call: The API method to call, usually a file download such as
+                  :class:`checkbox_sdk.methods.receipts.GetReceiptVisualizationPdf`.
+            storage: Optional session storage to use for the request.
+            chunk_size: The size of the chunks in bytes. Defaults to `DEFAULT_CHUNK_SIZE`.
+            request_timeout: Optional timeout value for the request.
+
+        Yields:
+            The chunks of the response body.
+        """
+        async with self.stream(call, storage=storage, request_timeout=request_timeout) as response:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def download(  # pylint: disable=too-many-arguments
+        self,
+        call: AbstractMethod,
+        sink: Sink,
+        storage: Optional[SessionStorage] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        request_timeout: Optional[float] = None,
+    ) -> int:
+        """
+        Asynchronously streams the response body of the API method to a file.
+
+        Args:
+            call: The API method to call, usually a file download such as
+                  :class:`checkbox_sdk.methods.receipts.GetReceiptVisualizationPdf`.
+            sink: A file path or a binary file-like object to write to. The ``write`` method of the file-like object
+                  may also be a coroutine, as in `aiofiles`. A path is created only once the API has answered
+                  successfully and is removed if the download fails.
+            storage: Optional session storage to use for the request.
+            chunk_size: The size of the chunks in bytes. Defaults to `DEFAULT_CHUNK_SIZE`.
+            request_timeout: Optional timeout value for the request.
+
+        Returns:
+            The number of bytes written.
+        """
+        size = 0
+        async with self.stream(call, storage=storage, request_timeout=request_timeout) as response:
+            with self._open_sink(sink) as file:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    if inspect.isawaitable(written := file.write(chunk)):
+                        await written
+                    size += len(chunk)
+        return size
+
+    async def emit_many(
+        self,
+        calls: Iterable[AbstractMethod],
+        storage: Optional[SessionStorage] = None,
+        request_timeout: Optional[float] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[Any]:
+        """
+        Asynchronously sends many independent requests concurrently and returns their parsed responses in order.
+
+        The number of requests in flight is bounded by a semaphore, and the retry policy, rate limiter, circuit
+        breaker and response cache of the client apply to every one of them. A failing call does not abort the
+        batch: its exception is returned in place of the response.
+
+        Args:
+            calls: The API methods to call.
+            storage: Optional session storage to use for the requests. If not provided, the default storage will be
+                     used.
+            request_timeout: Optional timeout value for every request.
+            concurrency: The maximum number of requests sent at the same time. Defaults to
+                         `DEFAULT_BATCH_CONCURRENCY`.
+
+        Returns:
+            The parsed responses, or the raised exceptions, in the order of the calls.
+
+        Example:
+            .. code-block:: python
+
+                results = await client.emit_many(
+                    receipts.GetReceipt(receipt_id=receipt_id) for receipt_id in receipt_ids
+                )
+                failed = [result for result in results if isinstance(result, Exception)]
+        """
+        emit = self._bounded_emit(concurrency, storage, request_timeout)
+        return await asyncio.gather(*(emit(call) for call in calls), return_exceptions=True)
+
+    async def emit_as_completed(
+        self,
+        calls: Iterable[AbstractMethod],
+        storage: Optional[SessionStorage] = None,
+        request_timeout: Optional[float] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Asynchronously sends many independent requests concurrently and yields their results as soon as they complete.
+
+        Works like :meth:`emit_many`, but the results are streamed in the order the requests finish. Pending requests
+        are cancelled when the iteration is stopped early.
+
+        Args:
+            calls: The API methods to call.
+            storage: Optional session storage to use for the requests.
+            request_timeout: Optional timeout value for every request.
+            concurrency: The maximum number of requests sent at the same time. Defaults to
+                         `DEFAULT_BATCH_CONCURRENCY`.
+
+        Yields:
+            Tuples of the index of the call and its parsed response, or the raised exception.
+        """
+        emit = self._bounded_emit(concurrency, storage, request_timeout)
+
+        async def run(index: int, call: AbstractMethod) -> Tuple[int, Any]:
+            try:
+                return index, await emit(call)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return index, e
+
+        tasks = [asyncio.ensure_future(run(index, call)) for index, call in enumerate(calls)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _bounded_emit(
+        self,
+        concurrency: int,
+        storage: Optional[SessionStorage] = None,
+        request_timeout: Optional[float] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be positive")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def emit(call: AbstractMethod) -> Any:
+            async with semaphore:
+                return await self.emit(call, storage=storage, request_timeout=request_timeout)
+
+        return emit
 
     async def refresh_info(self, storage: Optional[SessionStorage] = None):
         """
@@ -159,6 +440,9 @@ class AsyncCheckBoxClient(BaseAsyncCheckBoxClient):  # pylint: disable=too-many-
             - If a `license_key` is present in the storage, information about the cash register is also updated.
             - The method makes API calls to fetch and update this information based on the provided storage.
         """
+        # The methods are only needed here, so they are not loaded when the client is imported
+        from checkbox_sdk.methods import cash_register, cashier  # pylint: disable=import-outside-toplevel
+
         storage = storage or self.storage
 
         await self(cashier.GetMe(), storage=storage)
@@ -171,7 +455,7 @@ class AsyncCheckBoxClient(BaseAsyncCheckBoxClient):  # pylint: disable=too-many-
         method: BaseMethod,
         expected_value: Set[Any],
         field: str = "status",
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[float] = None,
         storage: Optional[SessionStorage] = None,
     ):
@@ -183,7 +467,9 @@ class AsyncCheckBoxClient(BaseAsyncCheckBoxClient):  # pylint: disable=too-many-
             method: The method to call repeatedly to check the status.
             expected_value: A set of expected values for the specified field.
             field: The field in the result to monitor for changes. Defaults to "status".
-            relax: The amount of time (in seconds) to wait between checks. Defaults to `DEFAULT_REQUESTS_RELAX`.
+            relax: The amount of time (in seconds) to wait between checks, or a
+                   :class:`checkbox_sdk.client.polling.PollingStrategy` that adapts it. Defaults to
+                   `DEFAULT_REQUESTS_RELAX`.
             timeout: The maximum amount of time (in seconds) to wait for the status change. If `None`, waits
                      indefinitely.
             storage: Optional session storage to use for the method calls. If not provided, the default storage will be
@@ -201,15 +487,30 @@ class AsyncCheckBoxClient(BaseAsyncCheckBoxClient):  # pylint: disable=too-many-
             - If the field's value does not match any of the expected values within the timeout period, a `ValueError`
               is raised.
             - The method logs the status of the wait operation and the time taken.
+            - With a ``webhook_dispatcher`` configured, the method is called again when a webhook event of the object
+              arrives instead of polling, until the fallback deadline of the dispatcher passes.
         """
         logger.info("Wait until %r will be changed to one of %s", field, expected_value)
+        polling = get_polling(relax)
+        delays = polling.delays()
+        polls = 1
         initial = time.monotonic()
+        watch = self._watch_status(method)
         # pylint: disable=duplicate-code
-        while (result := await self(method, storage=storage))[field] not in expected_value:
-            if timeout is not None and time.monotonic() > initial + timeout:
-                logger.error("Status did not changed in required time")
-                break
-            time.sleep(relax)
-
-        self.handle_wait_status(result, field, expected_value, initial)
+        try:
+            while (result := await self(method, storage=storage))[field] not in expected_value:
+                if timeout is not None and time.monotonic() > initial + timeout:
+                    logger.error("Status did not changed in required time")
+                    break
+                if watch is not None and watch.active:
+                    # The object is re-fetched when its webhook event arrives, polling is only a fallback
+                    await watch.wait_async(None if timeout is None else initial + timeout - time.monotonic())
+                else:
+                    await asyncio.sleep(self._get_poll_delay(delays, initial, timeout))
+                polls += 1
+        finally:
+            if watch is not None:
+                watch.close()
+
+        self.handle_wait_status(result, field, expected_value, initial, polls, polling)
         return result
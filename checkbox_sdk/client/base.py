@@ -1,18 +1,96 @@
+import importlib
 import logging
+import os
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Union, Optional, Set
+from contextlib import contextmanager, suppress
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterator,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
-from httpx import Response
+from httpx import Limits, Response, Timeout
 
 from checkbox_sdk import __version__
-from checkbox_sdk.consts import API_VERSION, BASE_API_URL, DEFAULT_REQUEST_TIMEOUT
+from checkbox_sdk.client.cache import CacheKey, ResponseCache
+from checkbox_sdk.client.circuit_breaker import CircuitBreaker
+from checkbox_sdk.client.polling import PollingStrategy, WaitStats
+from checkbox_sdk.client.rate_limit import RateLimiter
+from checkbox_sdk.client.retry import RetryPolicy
+from checkbox_sdk.codec import JSONCodec, decode_response, get_codec
+from checkbox_sdk.consts import (
+    API_VERSION,
+    BASE_API_URL,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_KEEPALIVE_EXPIRY,
+)
 from checkbox_sdk.exceptions import CheckBoxAPIError, CheckBoxAPIValidationError, CheckBoxError
-from checkbox_sdk.methods.base import AbstractMethod
+from checkbox_sdk.methods.base import AbstractMethod, HTTPMethod
 from checkbox_sdk.storage.simple import SessionStorage
+from checkbox_sdk.upload import MultipartUpload
+
+if TYPE_CHECKING:
+    from checkbox_sdk.client.webhook_receiver import StatusWatch, WebhookDispatcher
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+Sink = Union[str, os.PathLike, IO[bytes]]
+"""
+Destination of a streamed download: a file path or a binary file-like object.
+"""
+
+# Attributes the cached client headers and URL prefixes are built from
+_CACHED_ATTRIBUTES = frozenset({"base_url", "api_version", "client_name", "client_version", "integration_key"})
+
+
+class LazyNamespace(Generic[T]):
+    """
+    Descriptor that creates an API namespace of a client on first access.
+
+    The module of the namespace is imported only when the namespace is used for the first time, and the created
+    namespace is stored in the client instance, so later accesses are plain attribute lookups.
+
+    Args:
+        module: The name of the module in :mod:`checkbox_sdk.client.api` that defines the namespace class.
+        name: The name of the namespace class.
+    """
+
+    def __init__(self, module: str, name: str):
+        self.module = f"checkbox_sdk.client.api.{module}"
+        self.name = name
+        self.attribute = name
+
+    def __set_name__(self, owner: Type[Any], name: str) -> None:
+        self.attribute = name
+
+    @overload
+    def __get__(self, instance: None, owner: Type[Any]) -> "LazyNamespace[T]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: Type[Any]) -> T: ...
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        namespace = getattr(importlib.import_module(self.module), self.name)(instance)
+        instance.__dict__[self.attribute] = namespace
+        return namespace
+
 
 class BaseCheckBoxClient(ABC):
     """
@@ -33,6 +111,32 @@ class BaseCheckBoxClient(ABC):
         client_name: The name of the client, used for identifying requests. Defaults to `"checkbox-sdk"`.
         client_version: The version of the client. Defaults to the package version `__version__`.
         integration_key: Optional integration key for accessing the API. Defaults to `None`.
+        max_connections: The maximum number of concurrent connections in the connection pool. `None` means no limit.
+                         Defaults to `DEFAULT_MAX_CONNECTIONS`.
+        max_keepalive_connections: The maximum number of idle keep-alive connections kept in the pool. `None` means
+                                   no limit. Defaults to `DEFAULT_MAX_KEEPALIVE_CONNECTIONS`.
+        keepalive_expiry: The time, in seconds, after which an idle keep-alive connection is closed. `None` keeps idle
+                          connections forever. Defaults to `DEFAULT_KEEPALIVE_EXPIRY`.
+        http2: Whether to enable HTTP/2 support. Requires the `h2` package (``pip install httpx[http2]``).
+               Defaults to `False`.
+        transport: Optional custom `httpx` transport. When provided, the pool limits and HTTP/2 settings are
+                   defined by the transport itself. Defaults to `None`.
+        retry_policy: Optional :class:`checkbox_sdk.client.retry.RetryPolicy` applied to every request. When `None`,
+                      failed requests are not retried. Defaults to `None`.
+        rate_limiter: Optional :class:`checkbox_sdk.client.rate_limit.RateLimiter` consulted before every request.
+                      The same limiter can be shared by several clients. Defaults to `None`.
+        circuit_breaker: Optional :class:`checkbox_sdk.client.circuit_breaker.CircuitBreaker` that rejects requests
+                         to failing endpoints without waiting for them. Defaults to `None`.
+        response_cache: Optional :class:`checkbox_sdk.client.cache.ResponseCache` for the responses of API methods
+                        that declare a `cache_ttl`. Defaults to `None`.
+        codec: The JSON codec used to encode payloads and decode responses: a
+               :class:`checkbox_sdk.codec.JSONCodec` instance, ``"json"``, ``"orjson"``, ``"ujson"`` or ``"auto"`` for
+               the fastest installed library. Defaults to the standard library `json` module.
+        webhook_dispatcher: Optional :class:`checkbox_sdk.client.webhook_receiver.WebhookDispatcher` whose events
+                            complete waits for a status, with polling as a fallback. Defaults to `None`.
+        page_prefetch: The number of upcoming pages of paginated methods fetched ahead of the consumer. The
+                       asynchronous client fetches them concurrently, the synchronous client in a background
+                       thread. `0` fetches one page after another. Defaults to `0`.
 
     Attributes:
         base_url: The base URL for the Checkbox API.
@@ -45,9 +149,24 @@ class BaseCheckBoxClient(ABC):
         client_version: The version of the client.
         integration_key: The integration key for accessing the API.
         trust_env: Whether to trust environment variables for proxy configuration.
+        max_connections: The maximum number of concurrent connections in the connection pool.
+        max_keepalive_connections: The maximum number of idle keep-alive connections kept in the pool.
+        keepalive_expiry: The time, in seconds, after which an idle keep-alive connection is closed.
+        http2: Whether HTTP/2 support is enabled.
+        transport: The custom `httpx` transport, if any.
+        retry_policy: The retry policy applied to every request, if any.
+        rate_limiter: The rate limiter consulted before every request, if any.
+        circuit_breaker: The circuit breaker consulted around every request, if any.
+        response_cache: The cache of responses of read-mostly API methods, if any.
+        codec: The JSON codec instance.
+        webhook_dispatcher: The dispatcher of webhook events completing waits for a status, if any.
+        page_prefetch: The number of upcoming pages of paginated methods fetched ahead of the consumer.
     """
 
-    def __init__(  # pylint: disable=too-many-arguments
+    _client_headers: Optional[Dict[str, Any]] = None
+    _api_url_prefix: Optional[str] = None
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-locals
         self,
         base_url: str = BASE_API_URL,
         requests_timeout: int = DEFAULT_REQUEST_TIMEOUT,
@@ -59,6 +178,18 @@ class BaseCheckBoxClient(ABC):
         client_name: str = "checkbox-sdk",
         client_version: str = __version__,
         integration_key: Optional[str] = None,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        transport: Optional[Any] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        response_cache: Optional[ResponseCache] = None,
+        codec: Union[str, JSONCodec, None] = None,
+        webhook_dispatcher: Optional["WebhookDispatcher"] = None,
+        page_prefetch: int = 0,
     ) -> None:
         self.base_url = base_url
         self.api_version = api_version
@@ -70,22 +201,262 @@ class BaseCheckBoxClient(ABC):
         self.client_version = client_version
         self.integration_key = integration_key
         self.trust_env = trust_env
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.response_cache = response_cache
+        self.codec = get_codec(codec)
+        self.webhook_dispatcher = webhook_dispatcher
+        self.page_prefetch = page_prefetch
+
+    @property
+    def limits(self) -> Limits:
+        """
+        Constructs the connection pool limits for the HTTP session.
+
+        Returns:
+            An `httpx.Limits` instance built from the client's pool configuration.
+        """
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def session_options(self) -> Dict[str, Any]:
+        """
+        Constructs the keyword arguments used to create the underlying `httpx` session.
+
+        Returns:
+            A dictionary of options shared by the synchronous and asynchronous clients.
+        """
+        return {
+            "proxies": self.proxy,
+            "timeout": Timeout(timeout=self.timeout),
+            "verify": self.verify_ssl,
+            "limits": self.limits,
+            "http2": self.http2,
+            "transport": self.transport,
+        }
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _CACHED_ATTRIBUTES:
+            super().__setattr__("_client_headers", None)
+            super().__setattr__("_api_url_prefix", None)
 
     @property
     def client_headers(self) -> Dict[str, Any]:
         """
         Constructs the headers to be used in API requests.
 
+        The headers are cached until the client name, version or integration key changes. The returned dictionary
+        must not be modified.
+
         Returns:
             A dictionary of headers including the client name, version, and optionally the integration key.
         """
-        headers = {
-            "X-Client-Name": self.client_name,
-            "X-Client-Version": self.client_version,
-        }
-        if self.integration_key:
-            headers["X-Access-Key"] = self.integration_key
-        return headers
+        if self._client_headers is None:
+            headers = {
+                "X-Client-Name": self.client_name,
+                "X-Client-Version": self.client_version,
+            }
+            if self.integration_key:
+                headers["X-Access-Key"] = self.integration_key
+            self._client_headers = headers
+        return self._client_headers
+
+    def _get_url(self, call: AbstractMethod) -> str:
+        """
+        Builds the URL of the request from the API URL prefix precomputed for the base URL and API version.
+
+        Args:
+            call: The API method being executed.
+
+        Returns:
+            The full URL of the API endpoint.
+        """
+        if call.internal:
+            return f"{self.base_url}/{call.uri}"
+        if self._api_url_prefix is None:
+            self._api_url_prefix = f"{self.base_url}/api/v{self.api_version}/"
+        return self._api_url_prefix + call.uri
+
+    def _get_headers(self, storage: SessionStorage, call: AbstractMethod) -> Dict[str, Any]:
+        """
+        Returns the headers of the request.
+
+        The session headers merged with the client headers are cached in the session storage, so only requests with
+        their own headers are merged again.
+
+        Args:
+            storage: The session storage of the request.
+            call: The API method being executed.
+
+        Returns:
+            The request headers. The dictionary must not be modified.
+        """
+        if call_headers := call.headers:
+            return {**storage.headers, **call_headers, **self.client_headers}
+        return storage.merge_headers(self.client_headers)
+
+    def _encode_payload(self, call: AbstractMethod) -> Optional[bytes]:
+        """
+        Encodes the JSON payload of the request with the client's codec.
+
+        Args:
+            call: The API method being executed.
+
+        Returns:
+            The encoded payload, or `None` if the method has no payload.
+        """
+        payload = call.payload
+        return None if payload is None else self.codec.dumps(payload)
+
+    def _get_request_body(
+        self, call: AbstractMethod, headers: Dict[str, Any], content: Optional[bytes]
+    ) -> Dict[str, Any]:
+        """
+        Builds the body related arguments of the request.
+
+        Files are sent as a multipart form, streamed in chunks if given as a
+        :class:`checkbox_sdk.upload.MultipartUpload`, otherwise the pre-encoded JSON payload is sent.
+
+        Args:
+            call: The API method being executed.
+            headers: The headers of the request.
+            content: The payload encoded by :meth:`_encode_payload`.
+
+        Returns:
+            The keyword arguments for :meth:`httpx.Client.request`.
+        """
+        if files := call.files:
+            if isinstance(files, MultipartUpload):
+                return {"content": self._iter_upload(files), "headers": {**headers, **files.headers}}
+            return {"files": files, "headers": headers}
+        if content is None:
+            return {"headers": headers}
+        return {"content": content, "headers": {**headers, "Content-Type": "application/json"}}
+
+    @abstractmethod
+    def _iter_upload(self, upload: MultipartUpload) -> Union[Iterator[bytes], AsyncIterator[bytes]]:
+        """
+        Returns the iterator the client streams the body of a multipart upload from.
+
+        Args:
+            upload: The multipart upload.
+
+        Returns:
+            A sync iterator for the synchronous client, an async iterator for the asynchronous one.
+        """
+
+    def _get_cache_key(self, call: AbstractMethod, headers: Dict[str, Any]) -> Optional[CacheKey]:
+        """
+        Builds the response cache key of the request.
+
+        Args:
+            call: The API method being executed.
+            headers: The headers of the request.
+
+        Returns:
+            The cache key, or `None` if the response of the method must not be cached.
+        """
+        if self.response_cache is None or call.cache_ttl is None or call.method != HTTPMethod.GET:
+            return None
+        return self.response_cache.make_key(call, headers)
+
+    def _get_cached_response(self, cache_key: Optional[CacheKey]) -> Optional[Response]:
+        """
+        Looks the request up in the response cache.
+
+        Args:
+            cache_key: The cache key returned by :meth:`_get_cache_key`.
+
+        Returns:
+            The cached response, or `None` if there is no valid one.
+        """
+        if self.response_cache is None or cache_key is None:
+            return None
+        return self.response_cache.get(cache_key)
+
+    def _store_response(self, call: AbstractMethod, cache_key: Optional[CacheKey], response: Response) -> None:
+        """
+        Updates the response cache after a successful request.
+
+        Cacheable responses are stored, other non-GET requests invalidate the cached responses of their API section.
+
+        Args:
+            call: The API method being executed.
+            cache_key: The cache key returned by :meth:`_get_cache_key`.
+            response: The successful response.
+        """
+        if self.response_cache is None:
+            return
+        if cache_key is not None:
+            self.response_cache.set(cache_key, response, call.cache_ttl)  # type: ignore[arg-type]
+        elif call.method != HTTPMethod.GET:
+            self.response_cache.invalidate(call)
+
+    def _record_attempt(
+        self,
+        call: AbstractMethod,
+        response: Optional[Response] = None,
+        exception: Optional[Exception] = None,
+    ) -> None:
+        """
+        Reports the outcome of a request attempt to the circuit breaker.
+
+        Args:
+            call: The API method being executed.
+            response: The response of the attempt, if one was received.
+            exception: The exception raised by the attempt, if any.
+        """
+        if self.circuit_breaker is None:
+            return
+        success = exception is None and response is not None and response.status_code < 500
+        self.circuit_breaker.record(call, success=success)
+
+    def _get_retry_delay(
+        self,
+        call: AbstractMethod,
+        attempt: int,
+        started: float,
+        response: Optional[Response] = None,
+        exception: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Asks the retry policy whether the finished attempt must be repeated.
+
+        Args:
+            call: The API method being executed.
+            attempt: The number of the attempt that has just finished, starting from 1.
+            started: The value of :func:`time.monotonic` when the first attempt started.
+            response: The response of the attempt, if one was received.
+            exception: The exception raised by the attempt, if any.
+
+        Returns:
+            The delay in seconds before the next attempt, or `None` if the call must not be retried.
+        """
+        if self.retry_policy is None:
+            return None
+
+        delay = self.retry_policy.get_delay(call, attempt, started, response=response, exception=exception)
+        if delay is not None:
+            logger.info(
+                "Retrying %s %s in %.3f seconds (attempt %d failed with %s)",
+                call.method.name,
+                call.uri,
+                delay,
+                attempt,
+                exception if exception is not None else response.status_code,  # type: ignore[union-attr]
+            )
+        return delay
 
     @classmethod
     def _check_response(cls, response: Response):
@@ -103,9 +474,36 @@ class BaseCheckBoxClient(ABC):
         if response.status_code >= 500:
             raise CheckBoxError(f"Failed to make request [status={response.status_code}, text={response.text!r}]")
         if response.status_code == 422:
-            raise CheckBoxAPIValidationError(status=response.status_code, content=response.json())
+            raise CheckBoxAPIValidationError(status=response.status_code, content=decode_response(response))
         if response.status_code >= 400:
-            raise CheckBoxAPIError(status=response.status_code, content=response.json())
+            raise CheckBoxAPIError(status=response.status_code, content=decode_response(response))
+
+    @staticmethod
+    @contextmanager
+    def _open_sink(sink: Sink) -> Iterator[IO[bytes]]:
+        """
+        Opens the destination of a streamed download.
+
+        A path is opened for writing and removed again if the download fails, so no truncated files are left behind.
+        A file-like object is used as is and left open.
+
+        Args:
+            sink: A file path or a binary file-like object.
+
+        Yields:
+            The file-like object to write the downloaded chunks to.
+        """
+        if not isinstance(sink, (str, os.PathLike)):
+            yield sink
+            return
+
+        try:
+            with open(sink, "wb") as file:
+                yield file
+        except BaseException:
+            with suppress(OSError):
+                os.remove(sink)
+            raise
 
     def set_license_key(self, storage: Optional[SessionStorage], license_key: Optional[str]) -> None:
         """
@@ -121,20 +519,67 @@ class BaseCheckBoxClient(ABC):
         storage.license_key = license_key
 
     @staticmethod
-    def handle_wait_status(result: Dict[str, Any], field: str, expected_value: Set[Any], initial: float):
-        if result[field] not in expected_value:
+    def handle_wait_status(  # pylint: disable=too-many-arguments
+        result: Dict[str, Any],
+        field: str,
+        expected_value: Set[Any],
+        initial: float,
+        polls: int = 1,
+        polling: Optional[PollingStrategy] = None,
+    ):
+        elapsed = time.monotonic() - initial
+        succeeded = result[field] in expected_value
+        if polling:
+            polling.report(
+                WaitStats(field=field, value=result[field], polls=polls, elapsed=elapsed, succeeded=succeeded)
+            )
+        if not succeeded:
             raise ValueError(
                 f"Object did not change field {field!r} "
                 f"to one of expected values {expected_value} (actually {result[field]!r}) "
-                f"in {time.monotonic() - initial:.3f} seconds"  # noqa: E231
+                f"in {elapsed:.3f} seconds"  # noqa: E231
             )
 
         logger.info(
-            "Status changed in %.3f seconds to %r",
-            time.monotonic() - initial,
+            "Status changed in %.3f seconds to %r after %d polls",
+            elapsed,
             result[field],
+            polls,
         )
 
+    def _watch_status(self, method: AbstractMethod) -> Optional["StatusWatch"]:
+        """
+        Subscribes a wait for a status to the webhook events of the object the method returns.
+
+        Args:
+            method: The method called to check the status.
+
+        Returns:
+            The subscription, or `None` if no webhook dispatcher is configured or the method does not return a single
+            object with a status.
+        """
+        if self.webhook_dispatcher is None or method.status_object_id is None:
+            return None
+        return self.webhook_dispatcher.watch(method.status_object_id)
+
+    @staticmethod
+    def _get_poll_delay(delays: Iterator[float], initial: float, timeout: Optional[float]) -> float:
+        """
+        Returns the next delay of a wait for a status change, shortened so the wait does not overrun its timeout.
+
+        Args:
+            delays: The delays of the polling strategy.
+            initial: The time the wait started at.
+            timeout: The maximum time of the wait, if any.
+
+        Returns:
+            The time, in seconds, to sleep before the next poll.
+        """
+        delay = next(delays)
+        if timeout is not None:
+            delay = min(delay, max(0.0, initial + timeout - time.monotonic()))
+        return delay
+
 
 class BaseSyncCheckBoxClient(BaseCheckBoxClient, ABC):
     @abstractmethod
@@ -160,6 +605,9 @@ class BaseSyncCheckBoxClient(BaseCheckBoxClient, ABC):
         This method must be implemented by any subclass.
         """
 
+    def _iter_upload(self, upload: MultipartUpload) -> Iterator[bytes]:
+        return upload.iter_bytes()
+
     def __call__(self, *args, **kwargs):
         return self.emit(*args, **kwargs)
 
@@ -188,5 +636,8 @@ class BaseAsyncCheckBoxClient(BaseCheckBoxClient, ABC):
         This method must be implemented by any subclass.
         """
 
+    def _iter_upload(self, upload: MultipartUpload) -> AsyncIterator[bytes]:
+        return upload.aiter_bytes()
+
     async def __call__(self, *args, **kwargs):
         return await self.emit(*args, **kwargs)
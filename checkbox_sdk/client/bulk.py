@@ -0,0 +1,413 @@
+import asyncio
+import concurrent.futures
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from checkbox_sdk.client.polling import Relax, get_polling
+from checkbox_sdk.client.receipt_poller import AsyncReceiptStatusPoller, ReceiptStatusPoller
+from checkbox_sdk.consts import DEFAULT_BATCH_CONCURRENCY, DEFAULT_REQUESTS_RELAX
+from checkbox_sdk.exceptions import CheckBoxAPIError, CheckBoxError
+from checkbox_sdk.methods import receipts
+from checkbox_sdk.storage.simple import SessionStorage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BULK_CHUNK_RECEIPTS = 100
+"""
+The default maximum number of receipts sent by one bulk request.
+"""
+
+DEFAULT_BULK_CHUNK_BYTES = 512 * 1024
+"""
+The default maximum size, in bytes, of the receipts sent by one bulk request.
+"""
+
+# The bytes of the payload around the receipts, and between two receipts
+_PAYLOAD_OVERHEAD = len('{"receipts": []}')
+_RECEIPT_SEPARATOR = len(", ")
+
+
+@dataclass
+class BulkReceiptResult:
+    """
+    The outcome of one receipt of a bulk submission.
+
+    Attributes:
+        index: The position of the receipt in the submitted list.
+        receipt: The sent receipt, with its client-generated ID.
+        result: The receipt returned by the API, or the fiscalized receipt when waiting for the fiscalization.
+        error: The error that prevented the receipt from being created or fiscalized.
+        size: The size, in bytes, of the encoded receipt.
+    """
+
+    index: int
+    receipt: Dict[str, Any]
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[Exception] = None
+    size: int = field(default=0, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the receipt was created, and fiscalized if waited for.
+        """
+        return self.error is None and self.result is not None
+
+    @property
+    def receipt_id(self) -> str:
+        """
+        The client-generated ID of the receipt.
+        """
+        return str(self.receipt["id"])
+
+
+def split_chunks(sizes: Sequence[int], max_receipts: int, max_bytes: int) -> List[List[int]]:
+    """
+    Splits receipts into consecutive chunks bounded by the number of receipts and the size of the payload.
+
+    A receipt larger than ``max_bytes`` is sent in a chunk of its own.
+
+    Args:
+        sizes: The encoded sizes, in bytes, of the receipts.
+        max_receipts: The maximum number of receipts of a chunk.
+        max_bytes: The maximum size, in bytes, of the payload of a chunk.
+
+    Returns:
+        The positions of the receipts of every chunk.
+    """
+    if max_receipts < 1:
+        raise ValueError("'max_receipts' must be positive")
+
+    chunks: List[List[int]] = []
+    chunk: List[int] = []
+    chunk_bytes = _PAYLOAD_OVERHEAD
+    for index, size in enumerate(sizes):
+        added = size + (_RECEIPT_SEPARATOR if chunk else 0)
+        if chunk and (len(chunk) >= max_receipts or chunk_bytes + added > max_bytes):
+            chunks.append(chunk)
+            chunk, chunk_bytes, added = [], _PAYLOAD_OVERHEAD, size
+        chunk.append(index)
+        chunk_bytes += added
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class _BaseBulkReceiptSubmitter:
+    """
+    Chunking and result mapping shared by the synchronous and asynchronous bulk submitters.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        client,
+        max_receipts: int = DEFAULT_BULK_CHUNK_RECEIPTS,
+        max_bytes: int = DEFAULT_BULK_CHUNK_BYTES,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        attempts: int = 3,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
+        poller=None,
+    ):
+        if attempts < 1:
+            raise ValueError("'attempts' must be positive")
+
+        self.client = client
+        self.max_receipts = max_receipts
+        self.max_bytes = max_bytes
+        self.concurrency = concurrency
+        self.attempts = attempts
+        self.relax = relax
+        self.poller = poller
+        self.requests = 0
+
+    def _prepare(self, receipt_list: Iterable[Dict[str, Any]]) -> List[BulkReceiptResult]:
+        results = []
+        for index, receipt in enumerate(receipt_list):
+            # The client-generated ID maps the results back and makes re-sending after a lost response safe
+            receipt = receipt if receipt.get("id") else {**receipt, "id": str(uuid.uuid4())}
+            results.append(BulkReceiptResult(index, receipt, size=len(self.client.codec.dumps(receipt))))
+        return results
+
+    def _chunks(self, indexes: Sequence[int], results: List[BulkReceiptResult]) -> List[List[int]]:
+        sizes = [results[index].size for index in indexes]
+        return [
+            [indexes[position] for position in chunk]
+            for chunk in split_chunks(sizes, self.max_receipts, self.max_bytes)
+        ]
+
+    @staticmethod
+    def _call(chunk: List[int], results: List[BulkReceiptResult]) -> receipts.CreateBulkReceipts:
+        return receipts.CreateBulkReceipts(receipts=[results[index].receipt for index in chunk])
+
+    @staticmethod
+    def _apply_response(chunk: List[int], response: Dict[str, Any], results: List[BulkReceiptResult]) -> None:
+        by_id = {results[index].receipt_id: index for index in chunk}
+        answered = set()
+        for position, item in enumerate(response.get("results") or []):
+            index = by_id.get(str(item.get("id"))) if item.get("id") else None
+            if index is None and position < len(chunk):
+                index = chunk[position]
+            if index is not None:
+                results[index].result, results[index].error = item, None
+                answered.add(index)
+        for index in chunk:
+            if index not in answered:
+                results[index].error = CheckBoxError(f"Receipt {results[index].receipt_id} is missing in the response")
+
+    def _process(
+        self, chunks: List[List[int]], responses: List[Any], results: List[BulkReceiptResult]
+    ) -> Tuple[List[List[int]], List[List[int]]]:
+        """
+        Applies the responses of the chunks. Returns the halves of the chunks rejected as too large, and the chunks
+        whose response was lost.
+        """
+        split, lost = [], []
+        for chunk, response in zip(chunks, responses):
+            if not isinstance(response, Exception):
+                self._apply_response(chunk, response, results)
+                continue
+
+            for index in chunk:
+                results[index].error = response
+            if isinstance(response, CheckBoxAPIError) and response.status == 413 and len(chunk) > 1:
+                logger.info("Bulk request of %d receipts is too large, splitting it", len(chunk))
+                half = len(chunk) // 2
+                split.extend([chunk[:half], chunk[half:]])
+            elif not isinstance(response, CheckBoxAPIError):
+                # API errors mean the server rejected the receipts, anything else may hide created ones
+                logger.warning("Bulk request of %d receipts failed: %s", len(chunk), response)
+                lost.append(chunk)
+        return split, lost
+
+    def _apply_lookups(
+        self, indexes: List[int], lookups: List[Any], results: List[BulkReceiptResult]
+    ) -> List[List[int]]:
+        """
+        Completes the receipts created despite a lost response, and returns the chunks of the rest to re-send.
+        """
+        unsent = []
+        for index, lookup in zip(indexes, lookups):
+            if not isinstance(lookup, Exception):
+                results[index].result, results[index].error = lookup, None
+            elif not isinstance(lookup, CheckBoxAPIError) or lookup.status == 404:
+                unsent.append(index)
+        return self._chunks(unsent, results)
+
+    @staticmethod
+    def _to_wait(results: List[BulkReceiptResult]) -> List[Tuple[BulkReceiptResult, Dict[str, Any]]]:
+        """
+        Returns the created receipts that are not fiscalized yet, with the receipts returned by the API.
+        """
+        return [
+            (result, result.result)
+            for result in results
+            if result.error is None and result.result is not None and result.result.get("status") != "DONE"
+        ]
+
+
+class BulkReceiptSubmitter(_BaseBulkReceiptSubmitter):
+    """
+    Submits large numbers of receipts, e.g. a day of offline sales, with concurrent bulk requests.
+
+    The receipts are split into chunks bounded by ``max_receipts`` receipts and ``max_bytes`` bytes of payload, and
+    the chunks are sent with up to ``concurrency`` concurrent :class:`checkbox_sdk.methods.receipts.CreateBulkReceipts`
+    requests. Every receipt gets a client-generated ID, which maps the results back to the submitted receipts.
+
+    Failures are handled per chunk: a chunk rejected as too large (HTTP 413) is split in half and re-sent, a chunk
+    whose response was lost to a network or server error is looked up receipt by receipt and only the receipts that
+    were not created are re-sent, up to ``attempts`` times. Other API errors fail the receipts of their chunk.
+
+    Args:
+        client: The synchronous client used to send the requests.
+        max_receipts: The maximum number of receipts of one request. Defaults to `DEFAULT_BULK_CHUNK_RECEIPTS`.
+        max_bytes: The maximum size of the payload of one request. Defaults to `DEFAULT_BULK_CHUNK_BYTES`.
+        concurrency: The maximum number of requests sent at the same time. Defaults to `DEFAULT_BATCH_CONCURRENCY`.
+        attempts: The maximum number of times a receipt is sent after lost responses. Defaults to 3.
+        relax: The delay, in seconds, before lost chunks are re-sent, or a polling strategy for the delays.
+        poller: Optional :class:`checkbox_sdk.client.receipt_poller.ReceiptStatusPoller` used to wait for the
+                fiscalization. Defaults to a poller created for every submission.
+
+    Example:
+        .. code-block:: python
+
+            submitter = BulkReceiptSubmitter(client, concurrency=4)
+            results = submitter.submit(offline_receipts, wait=True, timeout=600)
+            failed = [result for result in results if not result.ok]
+    """
+
+    def _recover(self, lost: List[List[int]], results: List[BulkReceiptResult], storage) -> List[List[int]]:
+        indexes = [index for chunk in lost for index in chunk]
+        if not indexes:
+            return []
+        self.requests += len(indexes)
+        lookups = self.client.emit_many(
+            (receipts.GetReceipt(receipt_id=results[index].receipt_id) for index in indexes),
+            storage=storage,
+            concurrency=self.concurrency,
+        )
+        return self._apply_lookups(indexes, lookups, results)
+
+    def submit(
+        self,
+        receipt_list: Iterable[Dict[str, Any]],
+        storage: Optional[SessionStorage] = None,
+        wait: bool = False,
+        timeout: Optional[float] = None,
+    ) -> List[BulkReceiptResult]:
+        """
+        Submits the receipts.
+
+        Args:
+            receipt_list: The receipts to create.
+            storage: Optional session storage to use for the requests.
+            wait: Whether to wait for the fiscalization of the created receipts. Defaults to `False`.
+            timeout: The maximum time, in seconds, to wait for the fiscalization. If `None`, waits indefinitely.
+
+        Returns:
+            The results in the order of the submitted receipts.
+        """
+        results = self._prepare(receipt_list)
+        pending = self._chunks(list(range(len(results))), results)
+        delays = get_polling(self.relax).delays()
+        attempt = 1
+        while pending:
+            self.requests += len(pending)
+            responses = self.client.emit_many(
+                (self._call(chunk, results) for chunk in pending), storage=storage, concurrency=self.concurrency
+            )
+            split, lost = self._process(pending, responses, results)
+            unsent = self._recover(lost, results, storage)
+            if unsent and attempt < self.attempts:
+                attempt += 1
+                time.sleep(next(delays))
+            elif unsent:
+                logger.warning("%d receipts were not created after %d attempts", sum(map(len, unsent)), attempt)
+                unsent = []
+            pending = split + unsent
+
+        if wait:
+            self._wait(results, storage, timeout)
+        return results
+
+    def _wait(self, results: List[BulkReceiptResult], storage: Optional[SessionStorage], timeout: Optional[float]):
+        poller = self.poller or ReceiptStatusPoller(self.client)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waits = [(result, poller.submit(receipt, storage)) for result, receipt in self._to_wait(results)]
+        try:
+            for result, future in waits:
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                try:
+                    result.result = future.result(remaining)
+                except concurrent.futures.TimeoutError:
+                    poller.discard(result.receipt_id, future)
+                    result.error = ValueError(
+                        f"Receipt {result.receipt_id} did not change status in {timeout} seconds"
+                    )
+                except CheckBoxError as e:
+                    result.error = e
+        finally:
+            if self.poller is None:
+                poller.close()
+
+
+class AsyncBulkReceiptSubmitter(_BaseBulkReceiptSubmitter):
+    """
+    Asynchronously submits large numbers of receipts with concurrent bulk requests.
+
+    See :class:`BulkReceiptSubmitter` for details.
+
+    Args:
+        client: The asynchronous client used to send the requests.
+        max_receipts: The maximum number of receipts of one request. Defaults to `DEFAULT_BULK_CHUNK_RECEIPTS`.
+        max_bytes: The maximum size of the payload of one request. Defaults to `DEFAULT_BULK_CHUNK_BYTES`.
+        concurrency: The maximum number of requests sent at the same time. Defaults to `DEFAULT_BATCH_CONCURRENCY`.
+        attempts: The maximum number of times a receipt is sent after lost responses. Defaults to 3.
+        relax: The delay, in seconds, before lost chunks are re-sent, or a polling strategy for the delays.
+        poller: Optional :class:`checkbox_sdk.client.receipt_poller.AsyncReceiptStatusPoller` used to wait for the
+                fiscalization. Defaults to a poller created for every submission.
+
+    Example:
+        .. code-block:: python
+
+            submitter = AsyncBulkReceiptSubmitter(client)
+            results = await submitter.submit(offline_receipts, wait=True)
+    """
+
+    async def _recover(self, lost: List[List[int]], results: List[BulkReceiptResult], storage) -> List[List[int]]:
+        indexes = [index for chunk in lost for index in chunk]
+        if not indexes:
+            return []
+        self.requests += len(indexes)
+        lookups = await self.client.emit_many(
+            (receipts.GetReceipt(receipt_id=results[index].receipt_id) for index in indexes),
+            storage=storage,
+            concurrency=self.concurrency,
+        )
+        return self._apply_lookups(indexes, lookups, results)
+
+    async def submit(
+        self,
+        receipt_list: Iterable[Dict[str, Any]],
+        storage: Optional[SessionStorage] = None,
+        wait: bool = False,
+        timeout: Optional[float] = None,
+    ) -> List[BulkReceiptResult]:
+        """
+        Asynchronously submits the receipts.
+
+        Args:
+            receipt_list: The receipts to create.
+            storage: Optional session storage to use for the requests.
+            wait: Whether to wait for the fiscalization of the created receipts. Defaults to `False`.
+            timeout: The maximum time, in seconds, to wait for the fiscalization. If `None`, waits indefinitely.
+
+        Returns:
+            The results in the order of the submitted receipts.
+        """
+        results = self._prepare(receipt_list)
+        pending = self._chunks(list(range(len(results))), results)
+        delays = get_polling(self.relax).delays()
+        attempt = 1
+        while pending:
+            self.requests += len(pending)
+            responses = await self.client.emit_many(
+                (self._call(chunk, results) for chunk in pending), storage=storage, concurrency=self.concurrency
+            )
+            split, lost = self._process(pending, responses, results)
+            unsent = await self._recover(lost, results, storage)
+            if unsent and attempt < self.attempts:
+                attempt += 1
+                await asyncio.sleep(next(delays))
+            elif unsent:
+                logger.warning("%d receipts were not created after %d attempts", sum(map(len, unsent)), attempt)
+                unsent = []
+            pending = split + unsent
+
+        if wait:
+            await self._wait(results, storage, timeout)
+        return results
+
+    async def _wait(
+        self, results: List[BulkReceiptResult], storage: Optional[SessionStorage], timeout: Optional[float]
+    ):
+        poller = self.poller or AsyncReceiptStatusPoller(self.client)
+        waits = {poller.submit(receipt, storage): result for result, receipt in self._to_wait(results)}
+        try:
+            if not waits:
+                return
+            done, not_done = await asyncio.wait(list(waits), timeout=timeout)
+            for future in done:
+                try:
+                    waits[future].result = future.result()
+                except CheckBoxError as e:
+                    waits[future].error = e
+            for future in not_done:
+                result = waits[future]
+                poller.discard(result.receipt_id, future)
+                result.error = ValueError(f"Receipt {result.receipt_id} did not change status in {timeout} seconds")
+        finally:
+            if self.poller is None:
+                await poller.close()
@@ -0,0 +1,155 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from httpx import QueryParams, Response
+
+from checkbox_sdk.methods.base import AbstractMethod
+
+CacheKey = Tuple[Hashable, ...]
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of a response cache, intended for monitoring.
+
+    Attributes:
+        hits: The number of requests answered from the cache.
+        misses: The number of cacheable requests sent to the API.
+        evictions: The number of entries dropped because the cache was full.
+        size: The number of entries currently in the cache.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL and LRU cache of API responses.
+
+    Only API methods that declare a :attr:`checkbox_sdk.methods.base.AbstractMethod.cache_ttl` are cached. Responses
+    are cached per request and per auth identity, so sessions of different cashiers or cash registers never see each
+    other's data. The raw responses are kept and parsed again on every hit, so callers always get fresh objects.
+
+    A successful non-GET request invalidates all cached responses of the same API section (the first segment of the
+    URI), e.g. setting a webhook drops the cached webhook info.
+
+    Args:
+        maxsize: The maximum number of cached responses. The least recently used response is evicted when the cache
+                 is full. Defaults to 256.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Response]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def get_section(call: AbstractMethod) -> str:
+        """
+        Returns the API section of the method, used for invalidation.
+
+        Args:
+            call: The API method.
+
+        Returns:
+            The first segment of the method URI.
+        """
+        return call.uri.split("/", 1)[0]
+
+    def make_key(self, call: AbstractMethod, headers: Dict[str, Any]) -> CacheKey:
+        """
+        Builds the cache key of a request.
+
+        Args:
+            call: The API method.
+            headers: The headers of the request, which carry the auth identity.
+
+        Returns:
+            The cache key.
+        """
+        return (
+            self.get_section(call),
+            call.method.name,
+            call.internal,
+            call.uri,
+            str(QueryParams(call.query)),
+            tuple(sorted((key.lower(), str(value)) for key, value in headers.items())),
+        )
+
+    def get(self, key: CacheKey) -> Optional[Response]:
+        """
+        Returns the cached response, if it has not expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached response or `None`.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def set(self, key: CacheKey, response: Response, ttl: float) -> None:
+        """
+        Stores the response in the cache.
+
+        Args:
+            key: The cache key.
+            response: The response to store.
+            ttl: The time, in seconds, the response stays valid.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, call: Optional[AbstractMethod] = None) -> None:
+        """
+        Drops cached responses.
+
+        Args:
+            call: The API method whose section is invalidated. If `None`, the whole cache is cleared.
+        """
+        with self._lock:
+            if call is None:
+                self._entries.clear()
+                return
+            section = self.get_section(call)
+            for key in [key for key in self._entries if key[0] == section]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Clears the whole cache.
+        """
+        self.invalidate()
+
+    def stats(self) -> CacheStats:
+        """
+        Returns the cache counters.
+
+        Returns:
+            A snapshot of the counters.
+        """
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, evictions=self._evictions, size=len(self._entries))
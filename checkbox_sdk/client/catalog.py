@@ -0,0 +1,432 @@
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from checkbox_sdk.storage.simple import SessionStorage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_REFRESH = 300.0
+"""
+The default time, in seconds, between two refreshes of a goods catalog.
+"""
+
+DEFAULT_CATALOG_PAGE_SIZE = 100
+"""
+The default number of goods fetched by one request when a catalog is loaded page by page.
+"""
+
+SOURCES = ("goods", "export")
+"""
+The sources a catalog can be loaded from: the paginated goods search or the JSON export of the whole catalog.
+"""
+
+Good = Dict[str, Any]
+
+
+def _split(value: Any) -> List[str]:
+    if not value:
+        return []
+    values = value if isinstance(value, (list, tuple)) else str(value).split(",")
+    return [str(item).strip() for item in values if str(item).strip()]
+
+
+def good_key(good: Good) -> Optional[str]:
+    """
+    Returns the key identifying a good in a catalog: its ID, or its code for goods of the export, which have no ID.
+
+    Args:
+        good: The good as returned by the API.
+    """
+    key = good.get("id") or good.get("code")
+    return str(key) if key is not None else None
+
+
+def good_barcodes(good: Good) -> List[str]:
+    """
+    Returns all barcodes of a good, which the API returns as one barcode and a comma-separated list.
+
+    Args:
+        good: The good as returned by the API.
+    """
+    return list(dict.fromkeys(_split(good.get("barcode")) + _split(good.get("barcodes"))))
+
+
+def good_groups(good: Good) -> List[str]:
+    """
+    Returns the keys of the group of a good: its ID and name, or the name given by the export.
+
+    Args:
+        good: The good as returned by the API.
+    """
+    group = good.get("group")
+    if isinstance(group, dict):
+        keys = [group.get("id"), group.get("name")]
+    else:
+        keys = [group, good.get("group_id")]
+    return [str(key) for key in dict.fromkeys(keys) if key]
+
+
+@dataclass(frozen=True)
+class CatalogChanges:
+    """
+    The changes applied to a catalog by a refresh.
+
+    Attributes:
+        added: The number of new goods.
+        updated: The number of changed goods.
+        removed: The number of goods no longer in the catalog.
+    """
+
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+class _CatalogIndex:
+    """
+    An immutable snapshot of the catalog and its hash indexes. A refresh patches a copy and swaps it in, so lookups
+    read a consistent snapshot without locking.
+    """
+
+    __slots__ = ("goods", "by_barcode", "by_code", "by_uktzed", "by_group")
+
+    def __init__(
+        self,
+        goods: Optional[Dict[str, Good]] = None,
+        by_barcode: Optional[Dict[str, Good]] = None,
+        by_code: Optional[Dict[str, Good]] = None,
+        by_uktzed: Optional[Dict[str, Tuple[Good, ...]]] = None,
+        by_group: Optional[Dict[str, Tuple[Good, ...]]] = None,
+    ):
+        self.goods = goods or {}
+        self.by_barcode = by_barcode or {}
+        self.by_code = by_code or {}
+        self.by_uktzed = by_uktzed or {}
+        self.by_group = by_group or {}
+
+    def patch(self, removed: Iterable[Good], added: Iterable[Good]) -> "_CatalogIndex":
+        index = _CatalogIndex(
+            dict(self.goods), dict(self.by_barcode), dict(self.by_code), dict(self.by_uktzed), dict(self.by_group)
+        )
+        for good in removed:
+            index._remove(good)
+        for good in added:
+            index._add(good)
+        return index
+
+    @staticmethod
+    def _unlink(index: Dict[str, Tuple[Good, ...]], key: str, good: Good) -> None:
+        rest = tuple(other for other in index.get(key, ()) if other is not good)
+        if rest:
+            index[key] = rest
+        else:
+            index.pop(key, None)
+
+    def _remove(self, good: Good) -> None:
+        self.goods.pop(good_key(good), None)  # type: ignore[arg-type]
+        for barcode in good_barcodes(good):
+            if self.by_barcode.get(barcode) is good:
+                del self.by_barcode[barcode]
+        if (code := good.get("code")) and self.by_code.get(str(code)) is good:
+            del self.by_code[str(code)]
+        if uktzed := good.get("uktzed"):
+            self._unlink(self.by_uktzed, str(uktzed), good)
+        for group in good_groups(good):
+            self._unlink(self.by_group, group, good)
+
+    def _add(self, good: Good) -> None:
+        self.goods[good_key(good)] = good  # type: ignore[index]
+        for barcode in good_barcodes(good):
+            self.by_barcode[barcode] = good
+        if code := good.get("code"):
+            self.by_code[str(code)] = good
+        if uktzed := good.get("uktzed"):
+            self.by_uktzed[str(uktzed)] = self.by_uktzed.get(str(uktzed), ()) + (good,)
+        for group in good_groups(good):
+            self.by_group[group] = self.by_group.get(group, ()) + (good,)
+
+
+class _BaseGoodsCatalog:
+    """
+    Indexes and lookups shared by the synchronous and asynchronous goods catalogs.
+    """
+
+    def __init__(
+        self,
+        client,
+        source: str = "goods",
+        interval: float = DEFAULT_CATALOG_REFRESH,
+        page_size: int = DEFAULT_CATALOG_PAGE_SIZE,
+        storage: Optional[SessionStorage] = None,
+    ):
+        if source not in SOURCES:
+            raise ValueError(f"Unknown catalog source {source!r}, expected one of {SOURCES}")
+
+        self.client = client
+        self.source = source
+        self.interval = interval
+        self.page_size = page_size
+        self.storage = storage
+        self.refreshes = 0
+        self.refreshed_at: Optional[float] = None
+        self._index = _CatalogIndex()
+
+    def __len__(self) -> int:
+        return len(self._index.goods)
+
+    def __iter__(self) -> Iterator[Good]:
+        return iter(list(self._index.goods.values()))
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Whether the catalog was loaded at least once.
+        """
+        return self.refreshed_at is not None
+
+    def by_barcode(self, barcode: str) -> Optional[Good]:
+        """
+        Looks up a good by one of its barcodes.
+
+        Args:
+            barcode: The scanned barcode.
+
+        Returns:
+            The good, or `None` if no good has the barcode.
+        """
+        return self._index.by_barcode.get(barcode.strip())
+
+    def by_code(self, code: str) -> Optional[Good]:
+        """
+        Looks up a good by its code.
+
+        Args:
+            code: The code of the good.
+
+        Returns:
+            The good, or `None` if no good has the code.
+        """
+        return self._index.by_code.get(str(code))
+
+    def by_uktzed(self, uktzed: str) -> List[Good]:
+        """
+        Looks up the goods with a UKTZED code.
+
+        Args:
+            uktzed: The UKTZED code.
+
+        Returns:
+            The goods with the code.
+        """
+        return list(self._index.by_uktzed.get(uktzed, ()))
+
+    def by_group(self, group: str) -> List[Good]:
+        """
+        Looks up the goods of a group.
+
+        Args:
+            group: The ID or the name of the group.
+
+        Returns:
+            The goods of the group.
+        """
+        return list(self._index.by_group.get(group, ()))
+
+    def _apply(self, records: Iterable[Good]) -> CatalogChanges:
+        current = self._index.goods
+        fetched: Dict[str, Good] = {}
+        for good in records:
+            if (key := good_key(good)) is not None:
+                fetched[key] = good
+
+        removed = [current[key] for key in current.keys() - fetched.keys()]
+        stale, added = [], []
+        for key, good in fetched.items():
+            previous = current.get(key)
+            if previous is None or previous != good:
+                if previous is not None:
+                    stale.append(previous)
+                added.append(good)
+
+        changes = CatalogChanges(added=len(added) - len(stale), updated=len(stale), removed=len(removed))
+        if changes:
+            self._index = self._index.patch(removed + stale, added)
+        self.refreshes += 1
+        self.refreshed_at = time.monotonic()
+        logger.debug("Refreshed goods catalog of %d goods: %s", len(fetched), changes)
+        return changes
+
+
+class GoodsCatalog(_BaseGoodsCatalog):
+    """
+    In-memory goods catalog with hash indexes for local lookups by barcode, code, UKTZED and group.
+
+    The catalog is loaded once, from the paginated goods search or from the JSON export of the whole catalog, and
+    refreshed on a schedule by a background thread. A refresh compares the fetched goods with the indexed ones and
+    patches only the entries of added, changed and removed goods into a copy of the indexes, which then replaces the
+    current one. Lookups are plain dictionary reads of the current indexes and never wait for a refresh or the
+    network.
+
+    Args:
+        client: The synchronous client used to send the requests.
+        source: ``"goods"`` to load the catalog page by page, or ``"export"`` to load it with one export task.
+                Defaults to ``"goods"``.
+        interval: The time, in seconds, between two refreshes started by :meth:`start`. Defaults to
+                  `DEFAULT_CATALOG_REFRESH`.
+        page_size: The number of goods fetched by one request of the ``"goods"`` source. Defaults to
+                   `DEFAULT_CATALOG_PAGE_SIZE`.
+        storage: Optional session storage to use for the requests.
+
+    Example:
+        .. code-block:: python
+
+            with GoodsCatalog(client, interval=600) as catalog:
+                good = catalog.by_barcode(scanned_barcode)
+    """
+
+    def __init__(self, client, **kwargs):
+        super().__init__(client, **kwargs)
+        self._thread: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+
+    def _fetch(self) -> Iterable[Good]:
+        if self.source == "export":
+            return self.client.goods.export_goods("json", storage=self.storage).get("goods") or []
+        return self.client.goods.get_goods(limit=self.page_size, storage=self.storage)
+
+    def refresh(self) -> CatalogChanges:
+        """
+        Fetches the catalog and applies the changes to the indexes.
+
+        Returns:
+            The applied changes.
+        """
+        return self._apply(self._fetch())
+
+    def start(self) -> "GoodsCatalog":
+        """
+        Loads the catalog, if it is not loaded yet, and starts refreshing it in a background thread.
+
+        Returns:
+            The catalog itself.
+        """
+        if not self.loaded:
+            self.refresh()
+        if self._thread is None:
+            self._closed.clear()
+            self._thread = threading.Thread(target=self._run, name="checkbox-goods-catalog", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """
+        Stops the background refreshes. The loaded catalog can still be used.
+        """
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._closed.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Network errors and unexpected responses must not stop the scheduled refreshes
+                logger.warning("Goods catalog refresh failed, keeping the loaded catalog: %s", e)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncGoodsCatalog(_BaseGoodsCatalog):
+    """
+    In-memory goods catalog with hash indexes, loaded and refreshed asynchronously.
+
+    See :class:`GoodsCatalog` for details. The refreshes run in a background task of the running event loop, the
+    lookups are synchronous.
+
+    Args:
+        client: The asynchronous client used to send the requests.
+        source: ``"goods"`` to load the catalog page by page, or ``"export"`` to load it with one export task.
+                Defaults to ``"goods"``.
+        interval: The time, in seconds, between two refreshes started by :meth:`start`. Defaults to
+                  `DEFAULT_CATALOG_REFRESH`.
+        page_size: The number of goods fetched by one request of the ``"goods"`` source. Defaults to
+                   `DEFAULT_CATALOG_PAGE_SIZE`.
+        storage: Optional session storage to use for the requests.
+
+    Example:
+        .. code-block:: python
+
+            async with AsyncGoodsCatalog(client, source="export") as catalog:
+                good = catalog.by_barcode(scanned_barcode)
+    """
+
+    def __init__(self, client, **kwargs):
+        super().__init__(client, **kwargs)
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def _fetch(self) -> List[Good]:
+        if self.source == "export":
+            return (await self.client.goods.export_goods("json", storage=self.storage)).get("goods") or []
+        return [good async for good in self.client.goods.get_goods(limit=self.page_size, storage=self.storage)]
+
+    async def refresh(self) -> CatalogChanges:
+        """
+        Asynchronously fetches the catalog and applies the changes to the indexes.
+
+        Returns:
+            The applied changes.
+        """
+        return self._apply(await self._fetch())
+
+    async def start(self) -> "AsyncGoodsCatalog":
+        """
+        Loads the catalog, if it is not loaded yet, and starts refreshing it in a background task.
+
+        Returns:
+            The catalog itself.
+        """
+        if not self.loaded:
+            await self.refresh()
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        return self
+
+    async def close(self) -> None:
+        """
+        Stops the background refreshes. The loaded catalog can still be used.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Network errors and unexpected responses must not stop the scheduled refreshes
+                logger.warning("Goods catalog refresh failed, keeping the loaded catalog: %s", e)
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -0,0 +1,230 @@
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, Optional, Union
+
+from checkbox_sdk.exceptions import CheckBoxCircuitOpenError
+from checkbox_sdk.methods.base import AbstractMethod
+
+logger = logging.getLogger(__name__)
+
+KeyFunc = Callable[[AbstractMethod], str]
+
+# Path segments holding the ID of a resource, e.g. of a receipt or a shift
+_ID_SEGMENT = re.compile(r"^(?:[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}|\d+)$")
+
+
+def _uri_key(call: AbstractMethod) -> str:
+    # IDs are templated out, so all requests to an endpoint share one circuit
+    path = "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in call.uri.split("/"))
+    return f"{call.method.name} {path}"
+
+
+KEY_FUNCS: Dict[str, KeyFunc] = {
+    "method": lambda call: f"{type(call).__module__}.{type(call).__qualname__}",
+    "uri": _uri_key,
+}
+"""
+Predefined ways to choose the circuit of a request.
+"""
+
+
+class CircuitState(Enum):
+    """
+    Enumeration of circuit states.
+
+    Members:
+        CLOSED: Requests pass through, failures are counted.
+        OPEN: Requests are rejected immediately until the recovery timeout expires.
+        HALF_OPEN: A limited number of trial requests pass through to probe whether the endpoint has recovered.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitStats:
+    """
+    Snapshot of a single circuit, intended for monitoring.
+
+    Attributes:
+        state: The current state of the circuit.
+        failures: The number of consecutive failures.
+        changed_at: The value of :func:`time.monotonic` when the circuit last changed its state, if ever.
+        trials: The number of trial requests in flight while the circuit is half-open.
+    """
+
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    changed_at: Optional[float] = None
+    trials: int = 0
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker consulted by the clients around every request.
+
+    Each endpoint gets its own circuit. After ``failure_threshold`` consecutive failures (network errors, timeouts or
+    5xx responses) the circuit opens and requests to the endpoint fail fast with
+    :class:`checkbox_sdk.exceptions.CheckBoxCircuitOpenError` instead of waiting for the request timeout. Once
+    ``recovery_timeout`` has passed, up to ``half_open_max_calls`` trial requests are let through: a success closes
+    the circuit, a failure opens it again.
+
+    Args:
+        failure_threshold: The number of consecutive failures that opens a circuit. Defaults to 5.
+        recovery_timeout: The time, in seconds, a circuit stays open before trial requests are allowed. Defaults to
+                          30.
+        half_open_max_calls: The number of concurrent trial requests allowed in the half-open state. Defaults to 1.
+        key: Either ``"method"`` (one circuit per API method class), ``"uri"`` (one circuit per HTTP method and URI,
+             with UUIDs and numeric IDs in the path replaced by ``{id}``) or a callable returning the circuit key for
+             an API method. Defaults to ``"method"``.
+        on_state_change: Optional callback called with the circuit key, the old state and the new state whenever a
+                         circuit changes its state.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        key: Union[str, KeyFunc] = "method",
+        on_state_change: Optional[Callable[[str, CircuitState, CircuitState], None]] = None,
+    ):
+        if isinstance(key, str):
+            if key not in KEY_FUNCS:
+                raise ValueError(f"Unknown circuit breaker key {key!r}, expected one of {sorted(KEY_FUNCS)}")
+            key = KEY_FUNCS[key]
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.key_func = key
+        self.on_state_change = on_state_change
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, CircuitStats] = {}
+
+    def get_key(self, call: AbstractMethod) -> str:
+        """
+        Returns the circuit key of the API method.
+
+        Args:
+            call: The API method.
+
+        Returns:
+            The circuit key.
+        """
+        return self.key_func(call)
+
+    @staticmethod
+    def _set_state(circuit: CircuitStats, state: CircuitState) -> CircuitState:
+        old_state, circuit.state = circuit.state, state
+        circuit.changed_at = time.monotonic()
+        circuit.trials = 0
+        return old_state
+
+    def _notify(self, key: str, old_state: CircuitState, state: CircuitState) -> None:
+        # Called outside the lock, so the callback may safely query the breaker
+        logger.warning("Circuit %s changed state from %s to %s", key, old_state.value, state.value)
+        if self.on_state_change:
+            self.on_state_change(key, old_state, state)
+
+    def before_request(self, call: AbstractMethod) -> None:
+        """
+        Checks whether a request may be sent.
+
+        Args:
+            call: The API method about to be sent.
+
+        Raises:
+            CheckBoxCircuitOpenError: If the circuit of the method is open or has no free trial slots.
+        """
+        key = self.get_key(call)
+        old_state = None
+        with self._lock:
+            circuit = self._circuits.setdefault(key, CircuitStats())
+            if circuit.state is not CircuitState.CLOSED:
+                remaining = circuit.changed_at + self.recovery_timeout - time.monotonic()  # type: ignore[operator]
+                if circuit.state is CircuitState.OPEN:
+                    if remaining > 0:
+                        raise CheckBoxCircuitOpenError(key, remaining)
+                    old_state = self._set_state(circuit, CircuitState.HALF_OPEN)
+                elif circuit.trials >= self.half_open_max_calls:
+                    if remaining > 0:
+                        raise CheckBoxCircuitOpenError(key, remaining)
+                    # Trial requests that never reported back (e.g. cancelled) must not block the circuit forever
+                    circuit.changed_at, circuit.trials = time.monotonic(), 0
+                circuit.trials += 1
+
+        if old_state is not None:
+            self._notify(key, old_state, CircuitState.HALF_OPEN)
+
+    def record(self, call: AbstractMethod, success: bool) -> None:
+        """
+        Records the outcome of a request.
+
+        Args:
+            call: The API method that has been sent.
+            success: Whether the endpoint handled the request. Client errors (4xx) count as successes.
+        """
+        key = self.get_key(call)
+        old_state, state = None, None
+        with self._lock:
+            circuit = self._circuits.setdefault(key, CircuitStats())
+            if success:
+                circuit.failures = 0
+                if circuit.state is not CircuitState.CLOSED:
+                    state = CircuitState.CLOSED
+            else:
+                circuit.failures += 1
+                if circuit.state is CircuitState.HALF_OPEN or (
+                    circuit.state is CircuitState.CLOSED and circuit.failures >= self.failure_threshold
+                ):
+                    state = CircuitState.OPEN
+            if state is not None:
+                old_state = self._set_state(circuit, state)
+
+        if old_state is not None and state is not None:
+            self._notify(key, old_state, state)
+
+    def get_state(self, call: Union[AbstractMethod, str]) -> CircuitState:
+        """
+        Returns the current state of a circuit.
+
+        Args:
+            call: The API method or the circuit key.
+
+        Returns:
+            The circuit state. Unknown circuits are closed.
+        """
+        key = call if isinstance(call, str) else self.get_key(call)
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit else CircuitState.CLOSED
+
+    def stats(self) -> Dict[str, CircuitStats]:
+        """
+        Returns a snapshot of all known circuits.
+
+        Returns:
+            A dictionary mapping circuit keys to copies of their statistics.
+        """
+        with self._lock:
+            return {key: CircuitStats(**vars(circuit)) for key, circuit in self._circuits.items()}
+
+    def reset(self, call: Optional[Union[AbstractMethod, str]] = None) -> None:
+        """
+        Closes one circuit, or all circuits, and forgets their failures.
+
+        Args:
+            call: The API method or the circuit key. If `None`, all circuits are reset.
+        """
+        with self._lock:
+            if call is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(call if isinstance(call, str) else self.get_key(call), None)
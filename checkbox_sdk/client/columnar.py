@@ -0,0 +1,345 @@
+import datetime
+import logging
+import os
+from array import array
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from checkbox_sdk.client.partition import parse_datetime
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+MISSING_TIMESTAMP = -(2**63)
+"""
+The stored value of a missing timestamp, which NumPy reads as ``NaT``.
+"""
+
+MISSING_CATEGORY = -1
+"""
+The stored code of a missing categorical value.
+"""
+
+# The type codes of the buffers of the column kinds, strings are kept in lists
+_TYPECODES = {"int": "q", "float": "d", "timestamp": "q", "category": "i"}
+
+
+def field(*path: str) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Creates a getter of a nested field of a record.
+
+    Args:
+        *path: The keys leading to the field.
+
+    Returns:
+        A function returning the field, or `None` if a key is missing.
+    """
+
+    def getter(record: Dict[str, Any]) -> Any:
+        value: Any = record
+        for key in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    return getter
+
+
+def _sum_of(items_key: str, value_key: str) -> Callable[[Dict[str, Any]], Any]:
+    def getter(record: Dict[str, Any]) -> Any:
+        return sum(item.get(value_key) or 0 for item in record.get(items_key) or [])
+
+    return getter
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    A column of a columnar export.
+
+    Attributes:
+        name: The name of the column.
+        getter: The function extracting the value from a record.
+        kind: The kind of the column:
+
+            - ``"int"``: 64-bit integers, e.g. sums in kopecks. Missing values are stored as 0.
+            - ``"float"``: 64-bit floats. Missing values are stored as NaN.
+            - ``"timestamp"``: microseconds since the epoch in UTC, read as ``datetime64[us]``. Missing values are
+              stored as `MISSING_TIMESTAMP`.
+            - ``"category"``: dictionary-encoded strings, stored as 32-bit codes into the list of categories. Missing
+              values are stored as `MISSING_CATEGORY`.
+            - ``"string"``: plain strings, for unique values such as IDs.
+    """
+
+    name: str
+    getter: Callable[[Dict[str, Any]], Any]
+    kind: str
+
+    def __post_init__(self):
+        if self.kind not in _TYPECODES and self.kind != "string":
+            raise ValueError(f"Unknown column kind {self.kind!r}")
+
+
+RECEIPT_COLUMNS: Tuple[Column, ...] = (
+    Column("id", field("id"), "string"),
+    Column("fiscal_code", field("fiscal_code"), "string"),
+    Column("type", field("type"), "category"),
+    Column("status", field("status"), "category"),
+    Column("shift_id", field("shift", "id"), "category"),
+    Column("cash_register_id", field("shift", "cash_register", "id"), "category"),
+    Column("total_sum", field("total_sum"), "int"),
+    Column("total_payment", field("total_payment"), "int"),
+    Column("total_rest", field("total_rest"), "int"),
+    Column("discounts_sum", _sum_of("discounts", "sum"), "int"),
+    Column("taxes_sum", _sum_of("taxes", "value"), "int"),
+    Column("goods_count", lambda record: len(record.get("goods") or []), "int"),
+    Column("created_at", field("created_at"), "timestamp"),
+    Column("fiscal_date", field("fiscal_date"), "timestamp"),
+)
+"""
+The default columns of exported receipts.
+"""
+
+TRANSACTION_COLUMNS: Tuple[Column, ...] = (
+    Column("id", field("id"), "string"),
+    Column("type", field("type"), "category"),
+    Column("status", field("status"), "category"),
+    Column("serial", field("serial"), "int"),
+    Column("created_at", field("created_at"), "timestamp"),
+    Column("updated_at", field("updated_at"), "timestamp"),
+)
+"""
+The default columns of exported transactions.
+"""
+
+
+def _timestamp(value: Any) -> int:
+    moment = parse_datetime(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    delta = moment - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class ColumnarBuffer:
+    """
+    Collects records, e.g. streamed from a paginated search, into compact columnar buffers.
+
+    Every record is reduced to one value per column as soon as it is added, so the nested dictionaries of the pages
+    are released while the search is still running. Numbers and timestamps are stored in typed :mod:`array` buffers
+    of 8 bytes per value, and repeated strings such as statuses and shift IDs are dictionary-encoded. The numeric
+    buffers are exported without copying to NumPy arrays for vectorized aggregations, and to Arrow tables or Parquet
+    files.
+
+    NumPy and pyarrow are optional dependencies, installed with the ``columnar`` extra, which are only imported by the
+    methods needing them.
+
+    Args:
+        columns: The columns to collect. Defaults to `RECEIPT_COLUMNS`.
+
+    Example:
+        .. code-block:: python
+
+            buffer = ColumnarBuffer(RECEIPT_COLUMNS)
+            buffer.extend(client.receipts.get_receipts_search(from_date=from_date, to_date=to_date, limit=500))
+
+            columns = buffer.to_numpy()
+            revenue = columns["total_sum"].sum()
+            revenue_by_shift = buffer.group_sum("shift_id", "total_sum")
+            buffer.write_parquet("receipts.parquet")
+    """
+
+    def __init__(self, columns: Sequence[Column] = RECEIPT_COLUMNS):
+        names = [column.name for column in columns]
+        if len(set(names)) != len(names):
+            raise ValueError("Column names must be unique")
+
+        self.columns = tuple(columns)
+        self._values: Dict[str, Union[array, List[Optional[str]]]] = {
+            column.name: [] if column.kind == "string" else array(_TYPECODES[column.kind]) for column in self.columns
+        }
+        self._codes: Dict[str, Dict[str, int]] = {
+            column.name: {} for column in self.columns if column.kind == "category"
+        }
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _encode(self, column: Column, value: Any) -> Any:
+        if column.kind == "int":
+            return int(value or 0)
+        if column.kind == "float":
+            return float("nan") if value is None else float(value)
+        if column.kind == "timestamp":
+            return MISSING_TIMESTAMP if value is None else _timestamp(value)
+        if column.kind == "category":
+            if value is None:
+                return MISSING_CATEGORY
+            codes = self._codes[column.name]
+            return codes.setdefault(str(value), len(codes))
+        return None if value is None else str(value)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Adds a record.
+
+        Args:
+            record: The record as returned by the API.
+        """
+        for column in self.columns:
+            self._values[column.name].append(self._encode(column, column.getter(record)))  # type: ignore[arg-type]
+        self._length += 1
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> "ColumnarBuffer":
+        """
+        Adds records, consuming an iterator such as a paginated search one record at a time.
+
+        Args:
+            records: The records as returned by the API.
+
+        Returns:
+            The buffer itself.
+        """
+        for record in records:
+            self.append(record)
+        logger.debug("Collected %d records into columns", self._length)
+        return self
+
+    async def aextend(self, records: AsyncIterable[Dict[str, Any]]) -> "ColumnarBuffer":
+        """
+        Adds records from an asynchronous iterator, such as a paginated search of the asynchronous client.
+
+        Args:
+            records: The records as returned by the API.
+
+        Returns:
+            The buffer itself.
+        """
+        async for record in records:
+            self.append(record)
+        logger.debug("Collected %d records into columns", self._length)
+        return self
+
+    def values(self, name: str) -> Union[array, List[Optional[str]]]:
+        """
+        Returns the raw buffer of a column: an :class:`array.array` of numbers or codes, or a list of strings.
+
+        Args:
+            name: The name of the column.
+        """
+        return self._values[name]
+
+    def categories(self, name: str) -> List[str]:
+        """
+        Returns the categories of a categorical column, ordered by their codes.
+
+        Args:
+            name: The name of the column.
+        """
+        return list(self._codes[name])
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Exports the columns as NumPy arrays.
+
+        Numeric and categorical columns share the memory of the buffers, so the buffer must not be extended while the
+        arrays are used. Categorical columns hold the codes, see :meth:`categories`.
+
+        Returns:
+            The arrays by column name.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        arrays = {}
+        for column in self.columns:
+            values = self._values[column.name]
+            # Strings are kept in a list, every other kind in an array
+            if isinstance(values, list):
+                arrays[column.name] = numpy.array(values, dtype=object)
+            elif column.kind == "timestamp":
+                arrays[column.name] = numpy.frombuffer(values, dtype=numpy.int64).view("datetime64[us]")
+            else:
+                arrays[column.name] = numpy.frombuffer(values, dtype=numpy.dtype(values.typecode))
+        return arrays
+
+    def group_sum(self, category: str, column: str) -> Dict[Optional[str], Any]:
+        """
+        Sums a numeric column per category with one vectorized pass.
+
+        Args:
+            category: The name of the categorical column to group by.
+            column: The name of the numeric column to sum.
+
+        Returns:
+            The sums by category, records without a category are summed under `None`.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        arrays = self.to_numpy()
+        codes, weights = arrays[category], arrays[column]
+        labels: List[Optional[str]] = list(self.categories(category))
+        # The missing category is shifted to the first bin
+        sums = numpy.bincount(codes + 1, weights=weights, minlength=len(labels) + 1)
+        if numpy.issubdtype(weights.dtype, numpy.integer):
+            sums = sums.astype(numpy.int64)
+        result = dict(zip(labels, sums[1:].tolist()))
+        if (codes == MISSING_CATEGORY).any():
+            result[None] = sums[0].item()
+        return result
+
+    def to_arrow(self):
+        """
+        Exports the columns as an Arrow table. Categorical columns become dictionary arrays and timestamps are typed
+        as UTC timestamps with microsecond precision. Missing values become nulls.
+
+        Returns:
+            The :class:`pyarrow.Table`.
+
+        Raises:
+            ImportError: If NumPy or pyarrow is not installed.
+        """
+        import pyarrow  # type: ignore[import-untyped]  # pylint: disable=import-outside-toplevel
+
+        arrays = self.to_numpy()
+        fields = {}
+        for column in self.columns:
+            values = arrays[column.name]
+            if column.kind == "category":
+                indices = pyarrow.array(values, mask=values == MISSING_CATEGORY)
+                fields[column.name] = pyarrow.DictionaryArray.from_arrays(
+                    indices, pyarrow.array(self.categories(column.name), type=pyarrow.string())
+                )
+            elif column.kind == "timestamp":
+                raw = values.view("int64")
+                fields[column.name] = pyarrow.array(
+                    raw, type=pyarrow.timestamp("us", tz="UTC"), mask=raw == MISSING_TIMESTAMP
+                )
+            elif column.kind == "string":
+                fields[column.name] = pyarrow.array(values.tolist(), type=pyarrow.string())
+            else:
+                fields[column.name] = pyarrow.array(values)
+        return pyarrow.table(fields)
+
+    def write_parquet(self, path: Union[str, os.PathLike], **kwargs: Any) -> None:
+        """
+        Writes the columns to a Parquet file.
+
+        Args:
+            path: The path of the file.
+            **kwargs: Options passed to :func:`pyarrow.parquet.write_table`, e.g. ``compression``.
+
+        Raises:
+            ImportError: If NumPy or pyarrow is not installed.
+        """
+        from pyarrow import parquet  # pylint: disable=import-outside-toplevel
+
+        parquet.write_table(self.to_arrow(), os.fspath(path), **kwargs)
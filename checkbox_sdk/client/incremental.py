@@ -0,0 +1,423 @@
+import datetime
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+from checkbox_sdk.client.partition import DateLike, parse_datetime
+from checkbox_sdk.methods import receipts, transactions
+from checkbox_sdk.storage.simple import SessionStorage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYNC_OVERLAP = datetime.timedelta(minutes=10)
+"""
+The default time before the checkpoint that is scanned again to catch records changed or created late.
+"""
+
+DEFAULT_SYNC_PAGE_SIZE = 100
+"""
+The default number of records fetched by one request of a sync.
+"""
+
+RESOURCES = ("receipts", "transactions")
+"""
+The kinds of records an incremental sync can mirror.
+"""
+
+
+@dataclass
+class Checkpoint:
+    """
+    Progress of the incremental sync of one resource of one cash register.
+
+    Attributes:
+        watermark: The time of the newest record synced, as returned by the API. `None` before the first sync.
+        versions: The time and version of every record synced within the overlap before the watermark, by record ID.
+                  Used to skip records that did not change when the overlap is scanned again.
+    """
+
+    watermark: Optional[str] = None
+    versions: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"watermark": self.watermark, "versions": {key: list(value) for key, value in self.versions.items()}}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Checkpoint":
+        return cls(
+            watermark=data.get("watermark"),
+            versions={key: (value[0], value[1]) for key, value in data.get("versions", {}).items()},
+        )
+
+
+class CheckpointStore(ABC):
+    """
+    Abstract persistent storage of sync checkpoints.
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[Checkpoint]:
+        """
+        Loads a checkpoint.
+
+        Args:
+            key: The key of the checkpoint.
+
+        Returns:
+            The saved checkpoint, or `None` if nothing was saved under the key.
+        """
+
+    @abstractmethod
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        """
+        Saves a checkpoint, replacing the previous one.
+
+        Args:
+            key: The key of the checkpoint.
+            checkpoint: The checkpoint.
+        """
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store kept in the memory of the process, e.g. for tests.
+    """
+
+    def __init__(self):
+        self._checkpoints: Dict[str, Dict[str, Any]] = {}
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        data = self._checkpoints.get(key)
+        return Checkpoint.from_dict(data) if data is not None else None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        self._checkpoints[key] = checkpoint.to_dict()
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store keeping every checkpoint in its own JSON file in a directory.
+
+    Files are replaced atomically, so a crash during a save leaves the previous checkpoint intact.
+
+    Args:
+        directory: The directory where checkpoint files are kept. It is created if missing.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike]):
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha256(key.encode()).hexdigest()}.json")
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        try:
+            with open(self._path(key), encoding="utf-8") as file:
+                return Checkpoint.from_dict(json.load(file))
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump({"key": key, **checkpoint.to_dict()}, file)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store keeping the checkpoints in a table of an SQLite database.
+
+    Args:
+        path: The path of the database file, or ``":memory:"``. The table is created if missing.
+        table: The name of the table. Defaults to ``"checkbox_checkpoints"``.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], table: str = "checkbox_checkpoints"):
+        self.table = table
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        with self._lock:
+            row = self._connection.execute(f"SELECT data FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        return Checkpoint.from_dict(json.loads(row[0])) if row is not None else None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, data) VALUES (?, ?)",
+                (key, json.dumps(checkpoint.to_dict())),
+            )
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self._connection.close()
+
+
+class _BaseIncrementalSync:
+    """
+    Checkpoint bookkeeping shared by the synchronous and asynchronous syncs.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        client,
+        store: CheckpointStore,
+        resource: str = "receipts",
+        overlap: datetime.timedelta = DEFAULT_SYNC_OVERLAP,
+        time_key: str = "created_at",
+        version_keys: Tuple[str, ...] = ("updated_at", "status"),
+        page_size: int = DEFAULT_SYNC_PAGE_SIZE,
+        checkpoint_every: int = DEFAULT_SYNC_PAGE_SIZE,
+        start_date: Optional[DateLike] = None,
+    ):
+        if resource not in RESOURCES:
+            raise ValueError(f"'resource' must be one of {RESOURCES}")
+
+        self.client = client
+        self.store = store
+        self.resource = resource
+        self.overlap = overlap
+        self.time_key = time_key
+        self.version_keys = version_keys
+        self.page_size = page_size
+        self.checkpoint_every = checkpoint_every
+        self.start_date = parse_datetime(start_date) if start_date is not None else None
+
+    def _get_key(self, cash_register_id: Optional[str], storage: Optional[SessionStorage]) -> Tuple[str, str]:
+        if cash_register_id is None:
+            cash_register_id = ((storage or self.client.storage).cash_register or {}).get("id")
+        if cash_register_id is None:
+            raise ValueError("The cash register is unknown, pass cash_register_id or refresh the session info")
+        return f"{self.resource}:{cash_register_id}", str(cash_register_id)
+
+    def _get_since(self, checkpoint: Checkpoint) -> Optional[datetime.datetime]:
+        if checkpoint.watermark is None:
+            return self.start_date
+        return parse_datetime(checkpoint.watermark) - self.overlap
+
+    def _receipts_call(self, cash_register_id: str, since: Optional[datetime.datetime]) -> receipts.GetReceiptsSearch:
+        return receipts.GetReceiptsSearch(
+            cash_register_id=[cash_register_id], from_date=since, desc=False, limit=self.page_size
+        )
+
+    def _transactions_call(self) -> transactions.GetTransactions:
+        # Transactions can not be filtered by date, they are read from the newest until the checkpoint is passed
+        return transactions.GetTransactions(desc=True, limit=self.page_size)
+
+    def _is_before(self, record: Dict[str, Any], since: Optional[datetime.datetime]) -> bool:
+        return since is not None and parse_datetime(record[self.time_key]) < since
+
+    def _version(self, record: Dict[str, Any]) -> str:
+        return "|".join(str(record.get(key)) for key in self.version_keys)
+
+    def _is_new(self, checkpoint: Checkpoint, record: Dict[str, Any]) -> bool:
+        known = checkpoint.versions.get(str(record["id"]))
+        return known is None or known[1] != self._version(record)
+
+    def _apply(self, checkpoint: Checkpoint, record: Dict[str, Any]) -> None:
+        record_time = record[self.time_key]
+        checkpoint.versions[str(record["id"])] = (record_time, self._version(record))
+        if checkpoint.watermark is None or parse_datetime(record_time) > parse_datetime(checkpoint.watermark):
+            checkpoint.watermark = record_time
+
+    def _save(self, key: str, checkpoint: Checkpoint) -> None:
+        # Only the records inside the overlap can be fetched again, older versions are forgotten
+        if (since := self._get_since(checkpoint)) is not None:
+            checkpoint.versions = {
+                record_id: version
+                for record_id, version in checkpoint.versions.items()
+                if parse_datetime(version[0]) >= since
+            }
+        self.store.save(key, checkpoint)
+        logger.debug("Saved checkpoint %s at %s", key, checkpoint.watermark)
+
+
+class IncrementalSync(_BaseIncrementalSync):
+    """
+    Mirrors the receipts or transactions of cash registers incrementally, resuming from persisted checkpoints.
+
+    Every sync fetches only the records created since the checkpoint of the cash register, minus an ``overlap``
+    that is scanned again to catch records that changed, e.g. receipts that were fiscalized, or were stored late.
+    Records of the overlap that did not change since the last sync are skipped, so every record is yielded once per
+    version.
+
+    Receipts are searched by the cash register and creation date. Transactions can not be filtered, so they are
+    read from the newest until the checkpoint is passed, and always belong to the cash register of the session.
+    They are yielded only once the checkpoint is reached, so the first sync without ``start_date`` keeps the whole
+    history of transactions in memory before yielding the oldest one.
+
+    The checkpoint is saved every ``checkpoint_every`` records and when the sync ends. A record counts as synced once
+    the caller asks for the next one, so records are delivered at least once: after a crash, the records yielded
+    since the last save are yielded again.
+
+    Args:
+        client: The synchronous client used to send the requests.
+        store: The store of the checkpoints.
+        resource: ``"receipts"`` or ``"transactions"``. Defaults to ``"receipts"``.
+        overlap: The time before the checkpoint that is scanned again. Defaults to `DEFAULT_SYNC_OVERLAP`.
+        time_key: The field of the records holding their creation time. Defaults to ``"created_at"``.
+        version_keys: The fields of the records that change when a record changes. Defaults to ``updated_at`` and
+                      ``status``.
+        page_size: The number of records fetched by one request. Defaults to `DEFAULT_SYNC_PAGE_SIZE`.
+        checkpoint_every: The number of synced records after which the checkpoint is saved. Defaults to
+                          `DEFAULT_SYNC_PAGE_SIZE`.
+        start_date: The time the first sync starts from, older records are never synced. If `None`, the first sync
+                    mirrors the whole history.
+
+    Example:
+        .. code-block:: python
+
+            sync = IncrementalSync(client, FileCheckpointStore("checkpoints"), resource="receipts")
+            for receipt in sync.sync(cash_register_id):
+                warehouse.upsert(receipt)
+    """
+
+    def _fetch(self, cash_register_id: str, since: Optional[datetime.datetime], storage) -> Iterator[Dict[str, Any]]:
+        if self.resource == "receipts":
+            yield from self.client.receipts.fetch_paginated_results(
+                self._receipts_call(cash_register_id, since), storage=storage
+            )
+            return
+
+        newest_first = []
+        for record in self.client.transactions.fetch_paginated_results(self._transactions_call(), storage=storage):
+            if self._is_before(record, since):
+                break
+            newest_first.append(record)
+        yield from reversed(newest_first)
+
+    def sync(
+        self, cash_register_id: Optional[str] = None, storage: Optional[SessionStorage] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the records created or changed since the last sync, oldest first.
+
+        Args:
+            cash_register_id: The ID of the cash register. Defaults to the cash register of the session.
+            storage: Optional session storage of the cash register.
+
+        Yields:
+            The new and changed records.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        key, cash_register_id = self._get_key(cash_register_id, storage)
+        checkpoint = self.store.load(key) or Checkpoint()
+        unsaved = 0
+        try:
+            for record in self._fetch(cash_register_id, self._get_since(checkpoint), storage):
+                if not self._is_new(checkpoint, record):
+                    continue
+                yield record
+                self._apply(checkpoint, record)
+                unsaved += 1
+                if unsaved >= self.checkpoint_every:
+                    self._save(key, checkpoint)
+                    unsaved = 0
+        finally:
+            if unsaved:
+                self._save(key, checkpoint)
+
+
+class AsyncIncrementalSync(_BaseIncrementalSync):
+    """
+    Asynchronously mirrors the receipts or transactions of cash registers incrementally, resuming from persisted
+    checkpoints.
+
+    See :class:`IncrementalSync` for details.
+
+    Args:
+        client: The asynchronous client used to send the requests.
+        store: The store of the checkpoints.
+        resource: ``"receipts"`` or ``"transactions"``. Defaults to ``"receipts"``.
+        overlap: The time before the checkpoint that is scanned again. Defaults to `DEFAULT_SYNC_OVERLAP`.
+        time_key: The field of the records holding their creation time. Defaults to ``"created_at"``.
+        version_keys: The fields of the records that change when a record changes. Defaults to ``updated_at`` and
+                      ``status``.
+        page_size: The number of records fetched by one request. Defaults to `DEFAULT_SYNC_PAGE_SIZE`.
+        checkpoint_every: The number of synced records after which the checkpoint is saved. Defaults to
+                          `DEFAULT_SYNC_PAGE_SIZE`.
+        start_date: The time the first sync starts from, older records are never synced. If `None`, the first sync
+                    mirrors the whole history.
+
+    Example:
+        .. code-block:: python
+
+            sync = AsyncIncrementalSync(client, SQLiteCheckpointStore("sync.db"), resource="transactions")
+            async for transaction in sync.sync():
+                await warehouse.upsert(transaction)
+    """
+
+    async def _fetch(
+        self, cash_register_id: str, since: Optional[datetime.datetime], storage
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        if self.resource == "receipts":
+            async for record in self.client.receipts.fetch_paginated_results(
+                self._receipts_call(cash_register_id, since), storage=storage
+            ):
+                yield record
+            return
+
+        newest_first: List[Dict[str, Any]] = []
+        async for record in self.client.transactions.fetch_paginated_results(
+            self._transactions_call(), storage=storage
+        ):
+            if self._is_before(record, since):
+                break
+            newest_first.append(record)
+        for record in reversed(newest_first):
+            yield record
+
+    async def sync(
+        self, cash_register_id: Optional[str] = None, storage: Optional[SessionStorage] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronously yields the records created or changed since the last sync, oldest first.
+
+        Args:
+            cash_register_id: The ID of the cash register. Defaults to the cash register of the session.
+            storage: Optional session storage of the cash register.
+
+        Yields:
+            The new and changed records.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        key, cash_register_id = self._get_key(cash_register_id, storage)
+        checkpoint = self.store.load(key) or Checkpoint()
+        unsaved = 0
+        records = self._fetch(cash_register_id, self._get_since(checkpoint), storage)
+        try:
+            async for record in records:
+                if not self._is_new(checkpoint, record):
+                    continue
+                yield record
+                self._apply(checkpoint, record)
+                unsaved += 1
+                if unsaved >= self.checkpoint_every:
+                    self._save(key, checkpoint)
+                    unsaved = 0
+        finally:
+            await records.aclose()
+            if unsaved:
+                self._save(key, checkpoint)
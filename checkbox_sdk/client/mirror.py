@@ -0,0 +1,1005 @@
+import datetime
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from checkbox_sdk.client.partition import DateLike, parse_datetime
+from checkbox_sdk.methods import receipts, shifts, transactions
+from checkbox_sdk.storage.simple import SessionStorage
+
+logger = logging.getLogger(__name__)
+
+ALL_CASH_REGISTERS = "*"
+"""
+The scope of a synced range that is not limited to one cash register.
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS receipts (
+    id TEXT PRIMARY KEY,
+    fiscal_code TEXT,
+    shift_id TEXT,
+    cash_register_id TEXT,
+    status TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS receipts_fiscal_code ON receipts (fiscal_code);
+CREATE INDEX IF NOT EXISTS receipts_shift_id ON receipts (shift_id, created_at);
+CREATE INDEX IF NOT EXISTS receipts_cash_register_id ON receipts (cash_register_id, created_at);
+CREATE INDEX IF NOT EXISTS receipts_created_at ON receipts (created_at);
+
+CREATE TABLE IF NOT EXISTS receipt_items (
+    receipt_id TEXT NOT NULL REFERENCES receipts (id) ON DELETE CASCADE,
+    barcode TEXT NOT NULL,
+    PRIMARY KEY (barcode, receipt_id)
+);
+CREATE INDEX IF NOT EXISTS receipt_items_receipt_id ON receipt_items (receipt_id);
+
+CREATE TABLE IF NOT EXISTS shifts (
+    id TEXT PRIMARY KEY,
+    cash_register_id TEXT,
+    status TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS shifts_cash_register_id ON shifts (cash_register_id, created_at);
+CREATE INDEX IF NOT EXISTS shifts_created_at ON shifts (created_at);
+
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT PRIMARY KEY,
+    cash_register_id TEXT,
+    type TEXT,
+    status TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_cash_register_id ON transactions (cash_register_id, created_at);
+CREATE INDEX IF NOT EXISTS transactions_created_at ON transactions (created_at);
+
+CREATE TABLE IF NOT EXISTS synced_ranges (
+    resource TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    start TEXT NOT NULL,
+    end TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS synced_ranges_scope ON synced_ranges (resource, scope, start);
+"""
+
+
+def to_utc(value: DateLike) -> str:
+    """
+    Normalizes a time to a UTC ISO 8601 string, which sorts in time order. Times without a time zone are taken as
+    UTC.
+
+    Args:
+        value: A datetime or an ISO 8601 string.
+
+    Returns:
+        The normalized time.
+    """
+    moment = parse_datetime(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    return moment.astimezone(datetime.timezone.utc).isoformat(timespec="microseconds")
+
+
+def _nested_id(record: Dict[str, Any], *path: str) -> Optional[str]:
+    value: Any = record
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+    return str(value) if value is not None else None
+
+
+def _barcodes(receipt: Dict[str, Any]) -> List[str]:
+    barcodes: Set[str] = set()
+    for item in receipt.get("goods") or []:
+        barcode = (item.get("good") or {}).get("barcode")
+        if barcode:
+            # A good may have several barcodes separated by commas
+            barcodes.update(code.strip() for code in str(barcode).split(",") if code.strip())
+    return sorted(barcodes)
+
+
+class LocalMirror:
+    """
+    Local SQLite copy of receipts, shifts and transactions with indexed queries.
+
+    Records are ingested from the results of the API, e.g. of ``get_receipts_search``, ``get_shifts`` and
+    ``get_transactions``, and stored with their indexed fields next to the whole record. The mirror also remembers
+    which time ranges were synced completely, so :class:`MirrorSync` and :class:`AsyncMirrorSync` can answer queries
+    over synced ranges locally and fall back to the API for the rest.
+
+    Receipts are indexed by ID, fiscal code, shift, cash register, creation time and the barcodes of their goods.
+    Transactions do not name their cash register, it is stored as given on ingest.
+
+    Args:
+        path: The path of the database file, or ``":memory:"``. Defaults to ``":memory:"``.
+
+    Example:
+        .. code-block:: python
+
+            mirror = LocalMirror("checkbox.db")
+            mirror.ingest_receipts(client.receipts.get_receipts_search(from_date=from_date, to_date=to_date))
+            receipts = mirror.find_receipts(barcode="4820000000000", from_date=from_date)
+    """
+
+    def __init__(self, path: Union[str, os.PathLike] = ":memory:"):
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA foreign_keys = ON")
+            self._connection.executescript(_SCHEMA)
+
+    @staticmethod
+    def _encode(record: Dict[str, Any]) -> str:
+        return json.dumps(record, default=str)
+
+    @staticmethod
+    def _created_at(record: Dict[str, Any]) -> Optional[str]:
+        created_at = record.get("created_at")
+        return to_utc(created_at) if created_at else None
+
+    def ingest_receipts(self, records: Iterable[Dict[str, Any]], cash_register_id: Optional[str] = None) -> int:
+        """
+        Stores receipts, replacing the stored versions.
+
+        Args:
+            records: The receipts as returned by the API.
+            cash_register_id: The cash register of the receipts that do not name one.
+
+        Returns:
+            The number of stored receipts.
+        """
+        # A lazy iterator, e.g. a paginated search, is consumed before the database is locked
+        batch = list(records)
+        with self._lock, self._connection:
+            for receipt in batch:
+                receipt_id = str(receipt["id"])
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO receipts VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        receipt_id,
+                        receipt.get("fiscal_code"),
+                        _nested_id(receipt, "shift", "id"),
+                        _nested_id(receipt, "cash_register", "id")
+                        or _nested_id(receipt, "shift", "cash_register", "id")
+                        or cash_register_id,
+                        receipt.get("status"),
+                        self._created_at(receipt),
+                        self._encode(receipt),
+                    ),
+                )
+                self._connection.execute("DELETE FROM receipt_items WHERE receipt_id = ?", (receipt_id,))
+                self._connection.executemany(
+                    "INSERT INTO receipt_items VALUES (?, ?)",
+                    [(receipt_id, barcode) for barcode in _barcodes(receipt)],
+                )
+        return len(batch)
+
+    def ingest_shifts(self, records: Iterable[Dict[str, Any]], cash_register_id: Optional[str] = None) -> int:
+        """
+        Stores shifts, replacing the stored versions.
+
+        Args:
+            records: The shifts as returned by the API.
+            cash_register_id: The cash register of the shifts that do not name one.
+
+        Returns:
+            The number of stored shifts.
+        """
+        rows = [
+            (
+                str(shift["id"]),
+                _nested_id(shift, "cash_register", "id") or cash_register_id,
+                shift.get("status"),
+                self._created_at(shift),
+                self._encode(shift),
+            )
+            for shift in records
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO shifts VALUES (?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def ingest_transactions(self, records: Iterable[Dict[str, Any]], cash_register_id: Optional[str] = None) -> int:
+        """
+        Stores transactions, replacing the stored versions.
+
+        Args:
+            records: The transactions as returned by the API.
+            cash_register_id: The cash register of the transactions, i.e. of the session that read them.
+
+        Returns:
+            The number of stored transactions.
+        """
+        rows = [
+            (
+                str(transaction["id"]),
+                cash_register_id,
+                transaction.get("type"),
+                transaction.get("status"),
+                self._created_at(transaction),
+                self._encode(transaction),
+            )
+            for transaction in records
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def mark_synced(
+        self, resource: str, from_date: DateLike, to_date: DateLike, scope: str = ALL_CASH_REGISTERS
+    ) -> None:
+        """
+        Records that all records of a time range were ingested. Overlapping ranges are merged.
+
+        Args:
+            resource: ``"receipts"``, ``"shifts"`` or ``"transactions"``.
+            from_date: The beginning of the range.
+            to_date: The end of the range.
+            scope: The cash register the range is limited to. Defaults to `ALL_CASH_REGISTERS`.
+        """
+        start, end = to_utc(from_date), to_utc(to_date)
+        with self._lock, self._connection:
+            overlapping = self._connection.execute(
+                "SELECT rowid, start, end FROM synced_ranges "
+                "WHERE resource = ? AND scope = ? AND start <= ? AND end >= ?",
+                (resource, scope, end, start),
+            ).fetchall()
+            for rowid, other_start, other_end in overlapping:
+                start, end = min(start, other_start), max(end, other_end)
+                self._connection.execute("DELETE FROM synced_ranges WHERE rowid = ?", (rowid,))
+            self._connection.execute("INSERT INTO synced_ranges VALUES (?, ?, ?, ?)", (resource, scope, start, end))
+        logger.debug("Synced %s of %s from %s to %s", resource, scope, start, end)
+
+    def is_synced(
+        self, resource: str, from_date: DateLike, to_date: DateLike, scope: str = ALL_CASH_REGISTERS
+    ) -> bool:
+        """
+        Checks whether a time range was synced completely.
+
+        A range of one cash register is also covered by the ranges synced for all cash registers.
+
+        Args:
+            resource: ``"receipts"``, ``"shifts"`` or ``"transactions"``.
+            from_date: The beginning of the range.
+            to_date: The end of the range.
+            scope: The cash register the range is limited to. Defaults to `ALL_CASH_REGISTERS`.
+        """
+        start, end = to_utc(from_date), to_utc(to_date)
+        scopes = {scope, ALL_CASH_REGISTERS}
+        with self._lock:
+            ranges = self._connection.execute(
+                "SELECT start, end FROM synced_ranges "
+                f"WHERE resource = ? AND scope IN ({', '.join('?' * len(scopes))}) AND end >= ? ORDER BY start",
+                (resource, *scopes, start),
+            ).fetchall()
+        covered = start
+        for range_start, range_end in ranges:
+            if range_start > covered:
+                break
+            covered = max(covered, range_end)
+            if covered >= end:
+                return True
+        return False
+
+    def _find(
+        self,
+        table: str,
+        joins: str,
+        conditions: Sequence[Tuple[str, Any]],
+        from_date: Optional[DateLike],
+        to_date: Optional[DateLike],
+        desc: bool,
+        limit: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        where, params = [], []
+        for condition, value in conditions:
+            if value is not None:
+                where.append(condition)
+                params.append(value)
+        if from_date is not None:
+            where.append(f"{table}.created_at >= ?")
+            params.append(to_utc(from_date))
+        if to_date is not None:
+            where.append(f"{table}.created_at <= ?")
+            params.append(to_utc(to_date))
+
+        query = f"SELECT {table}.data FROM {table} {joins}"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += f" ORDER BY {table}.created_at {'DESC' if desc else 'ASC'}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def find_receipts(  # pylint: disable=too-many-arguments
+        self,
+        receipt_id: Optional[str] = None,
+        fiscal_code: Optional[str] = None,
+        barcode: Optional[str] = None,
+        shift_id: Optional[str] = None,
+        cash_register_id: Optional[str] = None,
+        status: Optional[str] = None,
+        from_date: Optional[DateLike] = None,
+        to_date: Optional[DateLike] = None,
+        desc: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Finds stored receipts.
+
+        Args:
+            receipt_id: The ID of the receipt.
+            fiscal_code: The fiscal code of the receipt.
+            barcode: A barcode of the goods of the receipt.
+            shift_id: The ID of the shift.
+            cash_register_id: The ID of the cash register.
+            status: The status of the receipt.
+            from_date: The earliest creation time.
+            to_date: The latest creation time.
+            desc: Whether to return the newest receipts first. Defaults to `False`.
+            limit: The maximum number of receipts to return.
+
+        Returns:
+            The matching receipts ordered by creation time.
+        """
+        joins = "JOIN receipt_items ON receipt_items.receipt_id = receipts.id" if barcode is not None else ""
+        return self._find(
+            "receipts",
+            joins,
+            [
+                ("receipts.id = ?", receipt_id),
+                ("receipts.fiscal_code = ?", fiscal_code),
+                ("receipt_items.barcode = ?", barcode),
+                ("receipts.shift_id = ?", shift_id),
+                ("receipts.cash_register_id = ?", cash_register_id),
+                ("receipts.status = ?", status),
+            ],
+            from_date,
+            to_date,
+            desc,
+            limit,
+        )
+
+    def find_shifts(  # pylint: disable=too-many-arguments
+        self,
+        shift_id: Optional[str] = None,
+        cash_register_id: Optional[str] = None,
+        status: Optional[str] = None,
+        from_date: Optional[DateLike] = None,
+        to_date: Optional[DateLike] = None,
+        desc: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Finds stored shifts.
+
+        Args:
+            shift_id: The ID of the shift.
+            cash_register_id: The ID of the cash register.
+            status: The status of the shift.
+            from_date: The earliest creation time.
+            to_date: The latest creation time.
+            desc: Whether to return the newest shifts first. Defaults to `False`.
+            limit: The maximum number of shifts to return.
+
+        Returns:
+            The matching shifts ordered by creation time.
+        """
+        return self._find(
+            "shifts",
+            "",
+            [
+                ("shifts.id = ?", shift_id),
+                ("shifts.cash_register_id = ?", cash_register_id),
+                ("shifts.status = ?", status),
+            ],
+            from_date,
+            to_date,
+            desc,
+            limit,
+        )
+
+    def find_transactions(  # pylint: disable=too-many-arguments
+        self,
+        transaction_id: Optional[str] = None,
+        transaction_type: Optional[str] = None,
+        cash_register_id: Optional[str] = None,
+        status: Optional[str] = None,
+        from_date: Optional[DateLike] = None,
+        to_date: Optional[DateLike] = None,
+        desc: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Finds stored transactions.
+
+        Args:
+            transaction_id: The ID of the transaction.
+            transaction_type: The type of the transaction.
+            cash_register_id: The ID of the cash register.
+            status: The status of the transaction.
+            from_date: The earliest creation time.
+            to_date: The latest creation time.
+            desc: Whether to return the newest transactions first. Defaults to `False`.
+            limit: The maximum number of transactions to return.
+
+        Returns:
+            The matching transactions ordered by creation time.
+        """
+        return self._find(
+            "transactions",
+            "",
+            [
+                ("transactions.id = ?", transaction_id),
+                ("transactions.type = ?", transaction_type),
+                ("transactions.cash_register_id = ?", cash_register_id),
+                ("transactions.status = ?", status),
+            ],
+            from_date,
+            to_date,
+            desc,
+            limit,
+        )
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class _BaseMirrorSync:
+    """
+    Requests and coverage checks shared by the synchronous and asynchronous mirror syncs.
+    """
+
+    def __init__(self, mirror: LocalMirror, client, page_size: int = 100):
+        self.mirror = mirror
+        self.client = client
+        self.page_size = page_size
+
+    def _receipts_search(
+        self, from_date: DateLike, to_date: DateLike, cash_register_id: Optional[str] = None, **filters: Any
+    ) -> receipts.GetReceiptsSearch:
+        return receipts.GetReceiptsSearch(
+            cash_register_id=[cash_register_id] if cash_register_id else None,
+            from_date=from_date,
+            to_date=to_date,
+            limit=self.page_size,
+            **filters,
+        )
+
+    def _shifts_search(self, from_date: DateLike, to_date: DateLike, **filters: Any) -> shifts.GetShifts:
+        return shifts.GetShifts(from_date=from_date, to_date=to_date, limit=self.page_size, **filters)
+
+    def _transactions_search(self, **filters: Any) -> transactions.GetTransactions:
+        # Transactions can not be filtered by date, they are read from the newest until the range is passed
+        return transactions.GetTransactions(desc=True, limit=self.page_size, **filters)
+
+    def _get_scope(self, cash_register_id: Optional[str], storage: Optional[SessionStorage]) -> str:
+        # The searches only return the records of the session, so a synced range holds for its cash register only
+        if cash_register_id is None:
+            cash_register_id = ((storage or self.client.storage).cash_register or {}).get("id")
+        if cash_register_id is None:
+            raise ValueError("The cash register is unknown, pass cash_register_id or refresh the session info")
+        return str(cash_register_id)
+
+    def _mark_synced(
+        self, resource: str, from_date: DateLike, to_date: DateLike, scope: str, started: datetime.datetime
+    ) -> None:
+        # Records created after the fetch started may be missing, so a range reaching into the future is only synced
+        # up to that moment
+        end = min(parse_datetime(to_date), started)
+        if end > parse_datetime(from_date):
+            self.mirror.mark_synced(resource, from_date, end, scope)
+
+    @staticmethod
+    def _now() -> datetime.datetime:
+        return datetime.datetime.now(datetime.timezone.utc)
+
+    @staticmethod
+    def _position(record: Dict[str, Any], from_date: DateLike, to_date: DateLike) -> int:
+        """
+        Returns -1 for a transaction older than the range, 1 for a newer one and 0 for one inside it.
+        """
+        created_at = to_utc(record["created_at"])
+        if created_at < to_utc(from_date):
+            return -1
+        return 1 if created_at > to_utc(to_date) else 0
+
+
+class MirrorSync(_BaseMirrorSync):
+    """
+    Fills a :class:`LocalMirror` from the API and answers queries from it, falling back to the API for time ranges
+    that were not synced.
+
+    The searches of the API only return the records of the session, so synced ranges are recorded for the cash
+    register of the session, or the one passed to the receipt methods, and only answer queries for that cash
+    register. Local queries are filtered by that cash register too, so the records of other cash registers kept in
+    the same mirror are not returned. A range reaching past the start of its sync is only recorded up to that moment,
+    as records created later may be missing; the rest of it is searched in the API until it is synced again.
+
+    Args:
+        mirror: The local mirror.
+        client: The synchronous client used to send the requests.
+        page_size: The number of records fetched by one request. Defaults to 100.
+
+    Example:
+        .. code-block:: python
+
+            mirror = MirrorSync(LocalMirror("checkbox.db"), client)
+            mirror.sync_receipts(from_date=month_start, to_date=month_end)
+
+            # Answered locally in milliseconds
+            receipts = mirror.search_receipts(barcode="4820000000000", from_date=day_start, to_date=day_end)
+    """
+
+    def sync_receipts(
+        self,
+        from_date: DateLike,
+        to_date: DateLike,
+        cash_register_id: Optional[str] = None,
+        storage: Optional[SessionStorage] = None,
+    ) -> int:
+        """
+        Ingests all receipts of a time range and marks the range as synced.
+
+        Args:
+            from_date: The beginning of the range.
+            to_date: The end of the range.
+            cash_register_id: Optional cash register the sync is limited to. Defaults to the cash register of the
+                              session.
+            storage: Optional session storage to use for the requests.
+
+        Returns:
+            The number of ingested receipts.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        scope, started = self._get_scope(cash_register_id, storage), self._now()
+        call = self._receipts_search(from_date, to_date, cash_register_id)
+        # The pages are fetched before the database is locked
+        found = list(self.client.receipts.fetch_paginated_results(call, storage=storage))
+        count = self.mirror.ingest_receipts(found, scope)
+        self._mark_synced("receipts", from_date, to_date, scope, started)
+        return count
+
+    def sync_shifts(self, from_date: DateLike, to_date: DateLike, storage: Optional[SessionStorage] = None) -> int:
+        """
+        Ingests all shifts of a time range and marks the range as synced.
+
+        Args:
+            from_date: The beginning of the range.
+            to_date: The end of the range.
+            storage: Optional session storage to use for the requests.
+
+        Returns:
+            The number of ingested shifts.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        scope, started = self._get_scope(None, storage), self._now()
+        call = self._shifts_search(from_date, to_date)
+        found = list(self.client.shifts.fetch_paginated_results(call, storage=storage))
+        count = self.mirror.ingest_shifts(found, scope)
+        self._mark_synced("shifts", from_date, to_date, scope, started)
+        return count
+
+    def _fetch_transactions(
+        self, from_date: DateLike, to_date: DateLike, storage: Optional[SessionStorage], **filters: Any
+    ) -> List[Dict[str, Any]]:
+        found = []
+        for record in self.client.transactions.fetch_paginated_results(
+            self._transactions_search(**filters), storage=storage
+        ):
+            position = self._position(record, from_date, to_date)
+            if position < 0:
+                break
+            if position == 0:
+                found.append(record)
+        return found
+
+    def sync_transactions(
+        self, from_date: DateLike, to_date: DateLike, storage: Optional[SessionStorage] = None
+    ) -> int:
+        """
+        Ingests all transactions of a time range and marks the range as synced.
+
+        Args:
+            from_date: The beginning of the range.
+            to_date: The end of the range.
+            storage: Optional session storage to use for the requests.
+
+        Returns:
+            The number of ingested transactions.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        scope, started = self._get_scope(None, storage), self._now()
+        count = self.mirror.ingest_transactions(self._fetch_transactions(from_date, to_date, storage), scope)
+        self._mark_synced("transactions", from_date, to_date, scope, started)
+        return count
+
+    def search_receipts(  # pylint: disable=too-many-arguments
+        self,
+        from_date: DateLike,
+        to_date: DateLike,
+        fiscal_code: Optional[str] = None,
+        barcode: Optional[str] = None,
+        shift_id: Optional[str] = None,
+        cash_register_id: Optional[str] = None,
+        storage: Optional[SessionStorage] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Searches receipts locally if the range was synced, otherwise searches the API and ingests the found receipts.
+
+        Args:
+            from_date: The earliest creation time.
+            to_date: The latest creation time.
+            fiscal_code: The fiscal code of the receipt.
+            barcode: A barcode of the goods of the receipt.
+            shift_id: The ID of the shift.
+            cash_register_id: The ID of the cash register. Defaults to the cash register of the session.
+            storage: Optional session storage to use for the requests.
+
+        Returns:
+            The matching receipts ordered by creation time.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        scope = self._get_scope(cash_register_id, storage)
+        if self.mirror.is_synced("receipts", from_date, to_date, scope):
+            return self.mirror.find_receipts(
+                fiscal_code=fiscal_code,
+                barcode=barcode,
+                shift_id=shift_id,
+                cash_register_id=scope,
+                from_date=from_date,
+                to_date=to_date,
+            )
+
+        call = self._receipts_search(
+            from_date,
+            to_date,
+            cash_register_id,
+            fiscal_code=fiscal_code,
+            barcode=barcode,
+            shift_id=[shift_id] if shift_id else None,
+        )
+        found = list(self.client.receipts.fetch_paginated_results(call, storage=storage))
+        self.mirror.ingest_receipts(found, scope)
+        return found
+
+    def search_shifts(
+        self,
+        from_date: DateLike,
+        to_date: DateLike,
+        status: Optional[str] = None,
+        storage: Optional[SessionStorage] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Searches shifts locally if the range was synced, otherwise searches the API and ingests the found shifts.
+
+        Args:
+            from_date: The earliest creation time.
+            to_date: The latest creation time.
+            status: The status of the shift.
+            storage: Optional session storage to use for the requests.
+
+        Returns:
+            The matching shifts ordered by creation time.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        scope = self._get_scope(None, storage)
+        if self.mirror.is_synced("shifts", from_date, to_date, scope):
+            return self.mirror.find_shifts(cash_register_id=scope, status=status, from_date=from_date, to_date=to_date)
+
+        call = self._shifts_search(from_date, to_date, statuses=[status] if status else None)
+        found = list(self.client.shifts.fetch_paginated_results(call, storage=storage))
+        self.mirror.ingest_shifts(found, scope)
+        return found
+
+    def search_transactions(
+        self,
+        from_date: DateLike,
+        to_date: DateLike,
+        transaction_type: Optional[str] = None,
+        status: Optional[str] = None,
+        storage: Optional[SessionStorage] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Searches transactions locally if the range was synced, otherwise reads them from the API and ingests them.
+
+        Args:
+            from_date: The earliest creation time.
+            to_date: The latest creation time.
+            transaction_type: The type of the transaction.
+            status: The status of the transaction.
+            storage: Optional session storage to use for the requests.
+
+        Returns:
+            The matching transactions ordered by creation time.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        scope = self._get_scope(None, storage)
+        if self.mirror.is_synced("transactions", from_date, to_date, scope):
+            return self.mirror.find_transactions(
+                transaction_type=transaction_type,
+                cash_register_id=scope,
+                status=status,
+                from_date=from_date,
+                to_date=to_date,
+            )
+
+        found = self._fetch_transactions(
+            from_date,
+            to_date,
+            storage,
+            type=[transaction_type] if transaction_type else None,
+            status=[status] if status else None,
+        )
+        self.mirror.ingest_transactions(found, scope)
+        return found[::-1]
+
+
+class AsyncMirrorSync(_BaseMirrorSync):
+    """
+    Asynchronously fills a :class:`LocalMirror` from the API and answers queries from it, falling back to the API
+    for time ranges that were not synced.
+
+    See :class:`MirrorSync` for details. Local queries are answered synchronously, as they take milliseconds.
+
+    Args:
+        mirror: The local mirror.
+        client: The asynchronous client used to send the requests.
+        page_size: The number of records fetched by one request. Defaults to 100.
+    """
+
+    async def sync_receipts(
+        self,
+        from_date: DateLike,
+        to_date: DateLike,
+        cash_register_id: Optional[str] = None,
+        storage: Optional[SessionStorage] = None,
+    ) -> int:
+        """
+        Asynchronously ingests all receipts of a time range and marks the range as synced.
+
+        Args:
+            from_date: The beginning of the range.
+            to_date: The end of the range.
+            cash_register_id: Optional cash register the sync is limited to. Defaults to the cash register of the
+                              session.
+            storage: Optional session storage to use for the requests.
+
+        Returns:
+            The number of ingested receipts.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        scope, started = self._get_scope(cash_register_id, storage), self._now()
+        call = self._receipts_search(from_date, to_date, cash_register_id)
+        found = [record async for record in self.client.receipts.fetch_paginated_results(call, storage=storage)]
+        count = self.mirror.ingest_receipts(found, scope)
+        self._mark_synced("receipts", from_date, to_date, scope, started)
+        return count
+
+    async def sync_shifts(
+        self, from_date: DateLike, to_date: DateLike, storage: Optional[SessionStorage] = None
+    ) -> int:
+        """
+        Asynchronously ingests all shifts of a time range and marks the range as synced.
+
+        Args:
+            from_date: The beginning of the range.
+            to_date: The end of the range.
+            storage: Optional session storage to use for the requests.
+
+        Returns:
+            The number of ingested shifts.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        scope, started = self._get_scope(None, storage), self._now()
+        call = self._shifts_search(from_date, to_date)
+        found = [record async for record in self.client.shifts.fetch_paginated_results(call, storage=storage)]
+        count = self.mirror.ingest_shifts(found, scope)
+        self._mark_synced("shifts", from_date, to_date, scope, started)
+        return count
+
+    async def _fetch_transactions(
+        self, from_date: DateLike, to_date: DateLike, storage: Optional[SessionStorage], **filters: Any
+    ) -> List[Dict[str, Any]]:
+        found = []
+        records = self.client.transactions.fetch_paginated_results(
+            self._transactions_search(**filters), storage=storage
+        )
+        try:
+            async for record in records:
+                position = self._position(record, from_date, to_date)
+                if position < 0:
+                    break
+                if position == 0:
+                    found.append(record)
+        finally:
+            await records.aclose()
+        return found
+
+    async def sync_transactions(
+        self, from_date: DateLike, to_date: DateLike, storage: Optional[SessionStorage] = None
+    ) -> int:
+        """
+        Asynchronously ingests all transactions of a time range and marks the range as synced.
+
+        Args:
+            from_date: The beginning of the range.
+            to_date: The end of the range.
+            storage: Optional session storage to use for the requests.
+
+        Returns:
+            The number of ingested transactions.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        scope, started = self._get_scope(None, storage), self._now()
+        found = await self._fetch_transactions(from_date, to_date, storage)
+        count = self.mirror.ingest_transactions(found, scope)
+        self._mark_synced("transactions", from_date, to_date, scope, started)
+        return count
+
+    async def search_receipts(  # pylint: disable=too-many-arguments
+        self,
+        from_date: DateLike,
+        to_date: DateLike,
+        fiscal_code: Optional[str] = None,
+        barcode: Optional[str] = None,
+        shift_id: Optional[str] = None,
+        cash_register_id: Optional[str] = None,
+        storage: Optional[SessionStorage] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Asynchronously searches receipts locally if the range was synced, otherwise searches the API and ingests the
+        found receipts.
+
+        Args:
+            from_date: The earliest creation time.
+            to_date: The latest creation time.
+            fiscal_code: The fiscal code of the receipt.
+            barcode: A barcode of the goods of the receipt.
+            shift_id: The ID of the shift.
+            cash_register_id: The ID of the cash register. Defaults to the cash register of the session.
+            storage: Optional session storage to use for the requests.
+
+        Returns:
+            The matching receipts ordered by creation time.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        scope = self._get_scope(cash_register_id, storage)
+        if self.mirror.is_synced("receipts", from_date, to_date, scope):
+            return self.mirror.find_receipts(
+                fiscal_code=fiscal_code,
+                barcode=barcode,
+                shift_id=shift_id,
+                cash_register_id=scope,
+                from_date=from_date,
+                to_date=to_date,
+            )
+
+        call = self._receipts_search(
+            from_date,
+            to_date,
+            cash_register_id,
+            fiscal_code=fiscal_code,
+            barcode=barcode,
+            shift_id=[shift_id] if shift_id else None,
+        )
+        found = [record async for record in self.client.receipts.fetch_paginated_results(call, storage=storage)]
+        self.mirror.ingest_receipts(found, scope)
+        return found
+
+    async def search_shifts(
+        self,
+        from_date: DateLike,
+        to_date: DateLike,
+        status: Optional[str] = None,
+        storage: Optional[SessionStorage] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Asynchronously searches shifts locally if the range was synced, otherwise searches the API and ingests the
+        found shifts.
+
+        Args:
+            from_date: The earliest creation time.
+            to_date: The latest creation time.
+            status: The status of the shift.
+            storage: Optional session storage to use for the requests.
+
+        Returns:
+            The matching shifts ordered by creation time.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        scope = self._get_scope(None, storage)
+        if self.mirror.is_synced("shifts", from_date, to_date, scope):
+            return self.mirror.find_shifts(cash_register_id=scope, status=status, from_date=from_date, to_date=to_date)
+
+        call = self._shifts_search(from_date, to_date, statuses=[status] if status else None)
+        found = [record async for record in self.client.shifts.fetch_paginated_results(call, storage=storage)]
+        self.mirror.ingest_shifts(found, scope)
+        return found
+
+    async def search_transactions(
+        self,
+        from_date: DateLike,
+        to_date: DateLike,
+        transaction_type: Optional[str] = None,
+        status: Optional[str] = None,
+        storage: Optional[SessionStorage] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Asynchronously searches transactions locally if the range was synced, otherwise reads them from the API and
+        ingests them.
+
+        Args:
+            from_date: The earliest creation time.
+            to_date: The latest creation time.
+            transaction_type: The type of the transaction.
+            status: The status of the transaction.
+            storage: Optional session storage to use for the requests.
+
+        Returns:
+            The matching transactions ordered by creation time.
+
+        Raises:
+            ValueError: If the cash register is not given and not known from the session.
+        """
+        scope = self._get_scope(None, storage)
+        if self.mirror.is_synced("transactions", from_date, to_date, scope):
+            return self.mirror.find_transactions(
+                transaction_type=transaction_type,
+                cash_register_id=scope,
+                status=status,
+                from_date=from_date,
+                to_date=to_date,
+            )
+
+        found = await self._fetch_transactions(
+            from_date,
+            to_date,
+            storage,
+            type=[transaction_type] if transaction_type else None,
+            status=[status] if status else None,
+        )
+        self.mirror.ingest_transactions(found, scope)
+        return found[::-1]
@@ -0,0 +1,495 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, List, Optional, Set
+
+from checkbox_sdk.exceptions import CheckBoxOfflineCodesError
+from checkbox_sdk.methods import cash_register
+from checkbox_sdk.storage.simple import SessionStorage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESERVOIR_SIZE = 2000
+"""
+The default number of offline codes a reservoir is filled up to.
+"""
+
+DEFAULT_LOW_WATERMARK = 500
+"""
+The default number of pooled offline codes below which a reservoir is refilled in the background.
+"""
+
+DEFAULT_ASK_COUNT = 2000
+"""
+The default number of offline codes asked from the tax service when Checkbox runs short of them.
+"""
+
+DEFAULT_REFILL_RETRY_DELAY = 5.0
+"""
+The default time, in seconds, after a failed refill before handing out or asking for a code starts another one.
+"""
+
+
+@dataclass(frozen=True)
+class ReservoirStats:
+    """
+    A snapshot of the metrics of an offline code reservoir.
+
+    Attributes:
+        available: The number of pooled codes.
+        size: The number of codes the reservoir is filled up to.
+        low_watermark: The number of pooled codes below which the reservoir is refilled.
+        handed_out: The number of codes handed out.
+        fetched: The number of codes fetched from the API.
+        duplicates: The number of fetched codes dropped because they were pooled or handed out already.
+        refills: The number of finished refills.
+        failed_refills: The number of refills that failed.
+        waits: The number of times a code was requested from an empty reservoir.
+        refilling: Whether a refill is running.
+        last_refill_at: The time, as returned by :func:`time.time`, of the last successful refill.
+        last_error: The error of the last failed refill, if the last refill failed.
+    """
+
+    available: int
+    size: int
+    low_watermark: int
+    handed_out: int
+    fetched: int
+    duplicates: int
+    refills: int
+    failed_refills: int
+    waits: int
+    refilling: bool
+    last_refill_at: Optional[float]
+    last_error: Optional[str]
+
+
+class _BaseOfflineCodeReservoir:
+    """
+    Pool bookkeeping shared by the synchronous and asynchronous reservoirs.
+    """
+
+    def __init__(
+        self,
+        client,
+        storage: Optional[SessionStorage] = None,
+        size: int = DEFAULT_RESERVOIR_SIZE,
+        low_watermark: int = DEFAULT_LOW_WATERMARK,
+        ask_count: int = DEFAULT_ASK_COUNT,
+        retry_delay: float = DEFAULT_REFILL_RETRY_DELAY,
+    ):
+        # An empty reservoir must always need a refill, or waiting for a code would never end
+        if not 1 <= low_watermark < size:
+            raise ValueError("'low_watermark' must be at least 1 and less than 'size'")
+
+        self.client = client
+        self.storage = storage
+        self.size = size
+        self.low_watermark = low_watermark
+        self.ask_count = ask_count
+        self.retry_delay = retry_delay
+        self._codes: Deque[str] = deque()
+        self._pooled: Set[str] = set()
+        # Recently handed out codes, to drop them if the API returns them again
+        self._handed: Deque[str] = deque(maxlen=size * 2)
+        self._handed_set: Set[str] = set()
+        self._refilling = False
+        self._generation = 0
+        self._last_error: Optional[BaseException] = None
+        self._retry_at: Optional[float] = None
+        self._handed_out = self._fetched = self._duplicates = 0
+        self._refills = self._failed_refills = self._waits = 0
+        self._last_refill_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def stats(self) -> ReservoirStats:
+        """
+        Returns a snapshot of the metrics of the reservoir.
+        """
+        return ReservoirStats(
+            available=len(self._codes),
+            size=self.size,
+            low_watermark=self.low_watermark,
+            handed_out=self._handed_out,
+            fetched=self._fetched,
+            duplicates=self._duplicates,
+            refills=self._refills,
+            failed_refills=self._failed_refills,
+            waits=self._waits,
+            refilling=self._refilling,
+            last_refill_at=self._last_refill_at,
+            last_error=None if self._last_error is None else str(self._last_error),
+        )
+
+    def _pop(self) -> Optional[str]:
+        if not self._codes:
+            return None
+        code = self._codes.popleft()
+        self._pooled.discard(code)
+        if len(self._handed) == self._handed.maxlen:
+            self._handed_set.discard(self._handed[0])
+        self._handed.append(code)
+        self._handed_set.add(code)
+        self._handed_out += 1
+        return code
+
+    def _needs_refill(self) -> bool:
+        # After a failed refill the next one waits for the retry delay, so takes do not hammer a failing API
+        if self._refilling or len(self._codes) >= self.low_watermark:
+            return False
+        return self._retry_at is None or time.monotonic() >= self._retry_at
+
+    def _missing(self) -> int:
+        return self.size - len(self._codes)
+
+    def _add(self, codes: List[Any]) -> None:
+        for item in codes:
+            code = item["fiscal_code"] if isinstance(item, dict) else str(item)
+            self._fetched += 1
+            if code in self._pooled or code in self._handed_set:
+                self._duplicates += 1
+                continue
+            self._codes.append(code)
+            self._pooled.add(code)
+
+    def _finish_refill(self, error: Optional[BaseException]) -> None:
+        self._refilling = False
+        self._generation += 1
+        self._last_error = error
+        if error is None:
+            self._refills += 1
+            self._last_refill_at = time.time()
+            self._retry_at = None
+        else:
+            self._failed_refills += 1
+            self._retry_at = time.monotonic() + self.retry_delay
+            logger.warning("Offline codes refill failed, %d codes left: %s", len(self._codes), error)
+
+    def _empty_error(self) -> CheckBoxOfflineCodesError:
+        if self._last_error is not None:
+            return CheckBoxOfflineCodesError(f"No offline codes available, the refill failed: {self._last_error}")
+        return CheckBoxOfflineCodesError("No offline codes available")
+
+
+class OfflineCodeReservoir(_BaseOfflineCodeReservoir):
+    """
+    Local pool of offline fiscal codes of one cash register, refilled in the background.
+
+    :meth:`CashRegisters.get_offline_codes <checkbox_sdk.client.api.cash_registers.CashRegisters.get_offline_codes>`
+    needs up to three requests, which is too late once the connection is lost. The reservoir keeps up to ``size``
+    codes in memory and hands them out in constant time without any request. When fewer than ``low_watermark`` codes
+    are left, a background thread tops the pool up: it asks the tax service for ``ask_count`` more codes if Checkbox
+    runs short of them, then fetches the missing codes. Codes returned twice by the API are handed out only once.
+    After a failed refill, no other one starts in the background for ``retry_delay`` seconds; :meth:`fill` still
+    refills at once.
+
+    The codes are bound to the cash register of the session, so every cash register needs its own reservoir.
+
+    Args:
+        client: The synchronous client used to send the requests.
+        storage: Optional session storage of the cash register. Defaults to the client's storage.
+        size: The number of codes the reservoir is filled up to. Defaults to `DEFAULT_RESERVOIR_SIZE`.
+        low_watermark: The number of codes below which the reservoir is refilled, at least 1. Defaults to
+                       `DEFAULT_LOW_WATERMARK`.
+        ask_count: The number of codes asked from the tax service when Checkbox runs short of them. Defaults to
+                   `DEFAULT_ASK_COUNT`.
+        retry_delay: The time, in seconds, after a failed refill before another one is started in the background.
+                     Defaults to `DEFAULT_REFILL_RETRY_DELAY`.
+
+    Example:
+        .. code-block:: python
+
+            reservoir = OfflineCodeReservoir(client, size=1000, low_watermark=200)
+            reservoir.fill()
+
+            # When the connection is lost
+            fiscal_code = reservoir.take_nowait()
+    """
+
+    def __init__(self, client, **kwargs):
+        super().__init__(client, **kwargs)
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def _fetch(self, count: int) -> List[Any]:
+        response = self.client(cash_register.GetOfflineCodesCount(), storage=self.storage)
+        if not response.get("enough_offline_codes", False) or response.get("available", 0) < count:
+            logger.info("Ask for more offline codes (count=%d)", self.ask_count)
+            self.client(cash_register.AskOfflineCodes(count=self.ask_count, sync=True), storage=self.storage)
+        return self.client(cash_register.GetOfflineCodes(count=count), storage=self.storage)
+
+    def _refill(self) -> None:
+        error = None
+        try:
+            with self._condition:
+                missing = self._missing()
+            if missing > 0:
+                codes = self._fetch(missing)
+                with self._condition:
+                    self._add(codes)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Any error, e.g. an unexpected response, must end the refill, or waiters would wait forever
+            error = e
+        finally:
+            with self._condition:
+                self._finish_refill(error)
+                self._condition.notify_all()
+
+    def _start_refill(self) -> None:
+        """
+        Starts a background refill unless one is running. Must be called with the condition held.
+        """
+        self._refilling = True
+        self._thread = threading.Thread(target=self._refill, name="checkbox-offline-codes", daemon=True)
+        self._thread.start()
+
+    def fill(self) -> ReservoirStats:
+        """
+        Fills the reservoir up to its size, waiting for the requests.
+
+        Returns:
+            The metrics after the refill.
+
+        Raises:
+            CheckBoxError: If the codes can not be fetched. Other errors of the refill, e.g. of an unexpected
+                response, are raised as well.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: not self._refilling)
+            self._refilling = True
+        self._refill()
+        if self._last_error is not None:
+            raise self._last_error
+        return self.stats()
+
+    def take_nowait(self) -> str:
+        """
+        Hands out a pooled code without waiting, and starts a background refill if the pool runs low.
+
+        Returns:
+            The fiscal code.
+
+        Raises:
+            CheckBoxOfflineCodesError: If the reservoir is empty.
+        """
+        with self._condition:
+            code = self._pop()
+            if code is None:
+                self._waits += 1
+            if self._needs_refill():
+                self._start_refill()
+            if code is None:
+                raise self._empty_error()
+            return code
+
+    def take(self, timeout: Optional[float] = None) -> str:
+        """
+        Hands out a code, waiting for a refill if the reservoir is empty.
+
+        Args:
+            timeout: The maximum time, in seconds, to wait for a refill. If `None`, waits until the refill finishes.
+
+        Returns:
+            The fiscal code.
+
+        Raises:
+            CheckBoxOfflineCodesError: If the reservoir is still empty after the refill or the timeout, or if it is
+                empty within the retry delay of a failed refill.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            if (code := self._pop()) is None:
+                self._waits += 1
+                if self._needs_refill():
+                    self._start_refill()
+                generation = self._generation
+                while (code := self._pop()) is None and self._refilling and self._generation == generation:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if code is None:
+                    raise self._empty_error()
+            if self._needs_refill():
+                self._start_refill()
+            return code
+
+    def take_many(self, count: int) -> List[str]:
+        """
+        Hands out up to ``count`` pooled codes without waiting.
+
+        Args:
+            count: The number of codes.
+
+        Returns:
+            The fiscal codes, fewer than ``count`` if the reservoir runs empty.
+        """
+        with self._condition:
+            codes: List[str] = []
+            while len(codes) < count and (code := self._pop()) is not None:
+                codes.append(code)
+            if self._needs_refill():
+                self._start_refill()
+            return codes
+
+    def close(self) -> None:
+        """
+        Waits for a running refill to finish.
+        """
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+
+
+class AsyncOfflineCodeReservoir(_BaseOfflineCodeReservoir):
+    """
+    Local pool of offline fiscal codes of one cash register, refilled asynchronously in the background.
+
+    See :class:`OfflineCodeReservoir` for details. The refills run in background tasks of the running event loop.
+
+    Args:
+        client: The asynchronous client used to send the requests.
+        storage: Optional session storage of the cash register. Defaults to the client's storage.
+        size: The number of codes the reservoir is filled up to. Defaults to `DEFAULT_RESERVOIR_SIZE`.
+        low_watermark: The number of codes below which the reservoir is refilled, at least 1. Defaults to
+                       `DEFAULT_LOW_WATERMARK`.
+        ask_count: The number of codes asked from the tax service when Checkbox runs short of them. Defaults to
+                   `DEFAULT_ASK_COUNT`.
+        retry_delay: The time, in seconds, after a failed refill before another one is started in the background.
+                     Defaults to `DEFAULT_REFILL_RETRY_DELAY`.
+
+    Example:
+        .. code-block:: python
+
+            reservoir = AsyncOfflineCodeReservoir(client)
+            await reservoir.fill()
+            fiscal_code = await reservoir.take(timeout=5)
+    """
+
+    def __init__(self, client, **kwargs):
+        super().__init__(client, **kwargs)
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._refilled: Optional[asyncio.Event] = None
+
+    async def _fetch(self, count: int) -> List[Any]:
+        response = await self.client(cash_register.GetOfflineCodesCount(), storage=self.storage)
+        if not response.get("enough_offline_codes", False) or response.get("available", 0) < count:
+            logger.info("Ask for more offline codes (count=%d)", self.ask_count)
+            await self.client(cash_register.AskOfflineCodes(count=self.ask_count, sync=True), storage=self.storage)
+        return await self.client(cash_register.GetOfflineCodes(count=count), storage=self.storage)
+
+    async def _refill(self) -> None:
+        error = None
+        try:
+            if (missing := self._missing()) > 0:
+                self._add(await self._fetch(missing))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            error = e
+        finally:
+            self._finish_refill(error)
+            if self._refilled is not None:
+                self._refilled.set()
+                self._refilled = None
+
+    def _start_refill(self) -> None:
+        self._refilling = True
+        self._task = asyncio.ensure_future(self._refill())
+
+    async def fill(self) -> ReservoirStats:
+        """
+        Asynchronously fills the reservoir up to its size, waiting for the requests.
+
+        Returns:
+            The metrics after the refill.
+
+        Raises:
+            CheckBoxError: If the codes can not be fetched. Other errors of the refill, e.g. of an unexpected
+                response, are raised as well.
+        """
+        if not self._refilling:
+            self._start_refill()
+        await asyncio.shield(self._task)  # type: ignore[arg-type]
+        if self._last_error is not None:
+            raise self._last_error
+        return self.stats()
+
+    def take_nowait(self) -> str:
+        """
+        Hands out a pooled code without waiting, and starts a background refill if the pool runs low. Must be called
+        from a running event loop.
+
+        Returns:
+            The fiscal code.
+
+        Raises:
+            CheckBoxOfflineCodesError: If the reservoir is empty.
+        """
+        code = self._pop()
+        if code is None:
+            self._waits += 1
+        if self._needs_refill():
+            self._start_refill()
+        if code is None:
+            raise self._empty_error()
+        return code
+
+    async def take(self, timeout: Optional[float] = None) -> str:
+        """
+        Asynchronously hands out a code, waiting for a refill if the reservoir is empty.
+
+        Args:
+            timeout: The maximum time, in seconds, to wait for a refill. If `None`, waits until the refill finishes.
+
+        Returns:
+            The fiscal code.
+
+        Raises:
+            CheckBoxOfflineCodesError: If the reservoir is still empty after the refill or the timeout, or if it is
+                empty within the retry delay of a failed refill.
+        """
+        if (code := self._pop()) is None:
+            self._waits += 1
+            if self._needs_refill():
+                self._start_refill()
+            if self._refilling:
+                if self._refilled is None:
+                    self._refilled = asyncio.Event()
+                try:
+                    await asyncio.wait_for(self._refilled.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            if (code := self._pop()) is None:
+                raise self._empty_error()
+        if self._needs_refill():
+            self._start_refill()
+        return code
+
+    def take_many(self, count: int) -> List[str]:
+        """
+        Hands out up to ``count`` pooled codes without waiting. Must be called from a running event loop.
+
+        Args:
+            count: The number of codes.
+
+        Returns:
+            The fiscal codes, fewer than ``count`` if the reservoir runs empty.
+        """
+        codes: List[str] = []
+        while len(codes) < count and (code := self._pop()) is not None:
+            codes.append(code)
+        if self._needs_refill():
+            self._start_refill()
+        return codes
+
+    async def close(self) -> None:
+        """
+        Waits for a running refill to finish.
+        """
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
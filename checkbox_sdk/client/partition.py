@@ -0,0 +1,351 @@
+import asyncio
+import copy
+import datetime
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Set, Union
+
+from checkbox_sdk.consts import DEFAULT_BATCH_CONCURRENCY
+from checkbox_sdk.methods.base import AbstractMethod
+from checkbox_sdk.storage.simple import SessionStorage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_PAGES = 10
+"""
+The default number of pages fetched from one time window before the rest of the window is split again.
+"""
+
+# Date range filters of the paginated methods, the flag of their sort order and the filtered field of the results
+_DATE_FIELDS = (
+    ("from_date", "to_date", "desc", "created_at"),
+    ("delivered_from_date", "delivered_to_date", "delivery_desc", "delivered_at"),
+)
+
+DateLike = Union[datetime.datetime, str]
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """
+    A part of the searched time range.
+
+    Attributes:
+        start: The beginning of the window.
+        end: The end of the window.
+    """
+
+    start: datetime.datetime
+    end: datetime.datetime
+
+
+@dataclass
+class _WindowResult:
+    items: List[Dict[str, Any]]
+    rest: List[TimeWindow]
+
+
+def parse_datetime(value: DateLike) -> datetime.datetime:
+    """
+    Parses a date returned by the API or passed as a filter. Times without a time zone are taken as UTC, so they can
+    be compared with the times returned by the API.
+
+    Args:
+        value: A datetime or an ISO 8601 string.
+
+    Returns:
+        The parsed datetime with a time zone.
+    """
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+def split_time_range(start: datetime.datetime, end: datetime.datetime, windows: int) -> List[TimeWindow]:
+    """
+    Splits a time range into windows of equal length.
+
+    Args:
+        start: The beginning of the range.
+        end: The end of the range.
+        windows: The number of windows.
+
+    Returns:
+        The windows in time order. Neighbouring windows share their boundary.
+    """
+    if windows < 1:
+        raise ValueError("'windows' must be positive")
+    step = (end - start) / windows
+    bounds = [start + step * index for index in range(windows)] + [end]
+    return [TimeWindow(bounds[index], bounds[index + 1]) for index in range(windows)]
+
+
+class _BoundaryFilter:
+    """
+    Drops the items yielded already, which appear again at the shared boundary of neighbouring windows.
+    """
+
+    def __init__(self, time_key: str):
+        self.time_key = time_key
+        self.last_time: Optional[datetime.datetime] = None
+        self.last_ids: Set[Any] = set()
+
+    def filter(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        new_items = []
+        for item in items:
+            try:
+                item_time: Optional[datetime.datetime] = parse_datetime(item[self.time_key])
+            except (KeyError, TypeError, ValueError):
+                item_time = None
+
+            if item_time is not None and item_time != self.last_time:
+                self.last_time = item_time
+                self.last_ids = set()
+            elif item.get("id") in self.last_ids:
+                continue
+            self.last_ids.add(item.get("id"))
+            new_items.append(item)
+        return new_items
+
+
+class _BasePartitionedSearch:
+    """
+    Windowing and merging shared by the synchronous and asynchronous partitioned searches.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        client,
+        request_obj: AbstractMethod,
+        from_date: DateLike,
+        to_date: DateLike,
+        windows: Optional[int] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        max_pages: int = DEFAULT_WINDOW_PAGES,
+        time_key: Optional[str] = None,
+        storage: Optional[SessionStorage] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be positive")
+        if max_pages < 1:
+            raise ValueError("'max_pages' must be positive")
+
+        self.client = client
+        self.request_obj = request_obj
+        self.from_date = parse_datetime(from_date)
+        self.to_date = parse_datetime(to_date)
+        self.windows = windows or concurrency
+        self.concurrency = concurrency
+        self.max_pages = max_pages
+        self.storage = storage
+        self.requests = 0
+        self.splits = 0
+        self._lock = threading.Lock()
+        self._fields = next(
+            (fields for fields in _DATE_FIELDS if hasattr(request_obj, fields[0])),
+            None,
+        )
+        if self._fields is None:
+            raise TypeError(f"{type(request_obj).__name__} does not support a date range filter")
+        self.time_key = time_key or self._fields[3]
+
+    def _window_call(self, window: TimeWindow) -> AbstractMethod:
+        from_field, to_field, desc_field, _ = self._fields  # type: ignore[misc]
+        call = copy.copy(self.request_obj)
+        setattr(call, from_field, window.start)
+        setattr(call, to_field, window.end)
+        # Only the order of the filtered field is kept, another sort flag would reorder the pages of the window
+        for _, _, flag, _ in _DATE_FIELDS:
+            if hasattr(call, flag):
+                setattr(call, flag, None)
+        setattr(call, desc_field, False)
+        call.offset = 0  # type: ignore[attr-defined]
+        return call
+
+    def _is_last_page(self, call: AbstractMethod, result: Dict[str, Any]) -> bool:
+        results = result.get("results", [])
+        if not results:
+            return True
+        call.resolve_pagination(result)  # type: ignore[attr-defined]
+        call.shift_next_page()  # type: ignore[attr-defined]
+        return len(results) < call.limit  # type: ignore[attr-defined]
+
+    def _split_rest(self, window: TimeWindow, items: List[Dict[str, Any]]) -> Optional[List[TimeWindow]]:
+        """
+        Splits the part of a dense window after its last fetched item, so it is scanned concurrently and without deep
+        offsets. Returns `None` if the window can not be narrowed, e.g. when all fetched items share one timestamp.
+        """
+        try:
+            last = parse_datetime(items[-1][self.time_key])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if last <= window.start:
+            return None
+
+        with self._lock:
+            self.splits += 1
+        logger.debug("Splitting the rest of dense window %s..%s at %s", window.start, window.end, last)
+        if last >= window.end:
+            return [TimeWindow(last, window.end)]
+        return split_time_range(last, window.end, 2)
+
+
+class PartitionedSearch(_BasePartitionedSearch):
+    """
+    Scans a long time range of a paginated search by splitting it into time windows fetched concurrently.
+
+    Deep offsets get slower on the server and are not safe to parallelize while data is changing, so the range is
+    split into ``windows`` windows scanned by up to ``concurrency`` threads, each with its own date filter and
+    shallow offsets. A window that still has results after ``max_pages`` pages is dense: the rest of it, after its
+    last fetched item, is split in two and scanned as new windows. Items at the shared boundary of windows are
+    deduplicated by ID, and the results are yielded in ascending time order.
+
+    Works with every paginated method with a date range filter, e.g.
+    :class:`checkbox_sdk.methods.receipts.GetReceiptsSearch`, :class:`checkbox_sdk.methods.shifts.GetShifts`,
+    :class:`checkbox_sdk.methods.reports.SearchReports` and :class:`checkbox_sdk.methods.orders.GetOrders`. The
+    method must sort its results by ``time_key`` when sorted in ascending order.
+
+    Args:
+        client: The synchronous client used to send the requests.
+        request_obj: The search with the filters other than the date range. It is copied for every window.
+        from_date: The beginning of the range.
+        to_date: The end of the range.
+        windows: The number of windows the range is initially split into. Defaults to ``concurrency``.
+        concurrency: The maximum number of windows fetched at the same time. Defaults to
+                     `DEFAULT_BATCH_CONCURRENCY`.
+        max_pages: The number of pages fetched from a window before the rest of it is split. Defaults to
+                   `DEFAULT_WINDOW_PAGES`.
+        time_key: The field of the results holding their time. Defaults to the field filtered by the date range:
+                  ``"delivered_at"`` for the ``delivered_*`` filters of
+                  :class:`checkbox_sdk.methods.orders.GetOrders`, ``"created_at"`` otherwise.
+        storage: Optional session storage to use for the requests.
+
+    Example:
+        .. code-block:: python
+
+            search = PartitionedSearch(
+                client,
+                receipts.GetReceiptsSearch(cash_register_id=[cash_register_id], limit=100),
+                from_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                to_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                concurrency=8,
+            )
+            for receipt in search:
+                process(receipt)
+    """
+
+    def _fetch_window(self, window: TimeWindow) -> _WindowResult:
+        call = self._window_call(window)
+        items: List[Dict[str, Any]] = []
+        pages = 0
+        while True:
+            result = self.client(call, storage=self.storage)
+            with self._lock:
+                self.requests += 1
+            pages += 1
+            items.extend(result.get("results", []))
+            if self._is_last_page(call, result):
+                return _WindowResult(items, [])
+            if pages >= self.max_pages and (rest := self._split_rest(window, items)) is not None:
+                return _WindowResult(items, rest)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        windows = deque(split_time_range(self.from_date, self.to_date, self.windows))
+        in_flight: Deque["Future[_WindowResult]"] = deque()
+        boundary = _BoundaryFilter(self.time_key)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="checkbox-partition") as executor:
+            try:
+                while windows or in_flight:
+                    # Windows are submitted in time order, a few ahead of the workers to keep them busy
+                    while windows and len(in_flight) < self.concurrency * 2:
+                        in_flight.append(executor.submit(self._fetch_window, windows.popleft()))
+
+                    window_result = in_flight.popleft().result()
+                    # The rest of a dense window precedes all windows submitted after it
+                    in_flight.extendleft(
+                        executor.submit(self._fetch_window, window) for window in reversed(window_result.rest)
+                    )
+                    yield from boundary.filter(window_result.items)
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+
+class AsyncPartitionedSearch(_BasePartitionedSearch):
+    """
+    Asynchronously scans a long time range of a paginated search by splitting it into time windows fetched
+    concurrently.
+
+    See :class:`PartitionedSearch` for details. The windows are fetched by tasks of the running event loop.
+
+    Args:
+        client: The asynchronous client used to send the requests.
+        request_obj: The search with the filters other than the date range. It is copied for every window.
+        from_date: The beginning of the range.
+        to_date: The end of the range.
+        windows: The number of windows the range is initially split into. Defaults to ``concurrency``.
+        concurrency: The maximum number of windows fetched at the same time. Defaults to
+                     `DEFAULT_BATCH_CONCURRENCY`.
+        max_pages: The number of pages fetched from a window before the rest of it is split. Defaults to
+                   `DEFAULT_WINDOW_PAGES`.
+        time_key: The field of the results holding their time. Defaults to the field filtered by the date range, see
+                  :class:`PartitionedSearch`.
+        storage: Optional session storage to use for the requests.
+
+    Example:
+        .. code-block:: python
+
+            search = AsyncPartitionedSearch(
+                client,
+                shifts.GetShifts(limit=100),
+                from_date="2024-01-01T00:00:00+00:00",
+                to_date="2025-01-01T00:00:00+00:00",
+            )
+            async for shift in search:
+                process(shift)
+    """
+
+    async def _fetch_window(self, window: TimeWindow, semaphore: asyncio.Semaphore) -> _WindowResult:
+        call = self._window_call(window)
+        items: List[Dict[str, Any]] = []
+        pages = 0
+        async with semaphore:
+            while True:
+                result = await self.client(call, storage=self.storage)
+                self.requests += 1
+                pages += 1
+                items.extend(result.get("results", []))
+                if self._is_last_page(call, result):
+                    return _WindowResult(items, [])
+                if pages >= self.max_pages and (rest := self._split_rest(window, items)) is not None:
+                    return _WindowResult(items, rest)
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        windows = deque(split_time_range(self.from_date, self.to_date, self.windows))
+        in_flight: Deque["asyncio.Task[_WindowResult]"] = deque()
+        boundary = _BoundaryFilter(self.time_key)
+
+        def fetch(window: TimeWindow) -> "asyncio.Task[_WindowResult]":
+            return asyncio.ensure_future(self._fetch_window(window, semaphore))
+
+        try:
+            while windows or in_flight:
+                while windows and len(in_flight) < self.concurrency * 2:
+                    in_flight.append(fetch(windows.popleft()))
+
+                window_result = await in_flight.popleft()
+                in_flight.extendleft(fetch(window) for window in reversed(window_result.rest))
+
+                for item in boundary.filter(window_result.items):
+                    yield item
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
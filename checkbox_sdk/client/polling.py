@@ -0,0 +1,153 @@
+import itertools
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional, Union
+
+from checkbox_sdk.consts import DEFAULT_REQUESTS_RELAX
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WaitStats:
+    """
+    Summary of a finished wait for a status change.
+
+    Attributes:
+        field: The monitored field.
+        value: The last value of the field.
+        polls: The number of requests sent while waiting.
+        elapsed: The time, in seconds, the wait took.
+        succeeded: Whether the field changed to one of the expected values.
+    """
+
+    field: str
+    value: Any
+    polls: int
+    elapsed: float
+    succeeded: bool
+
+
+class PollingStrategy(ABC):
+    """
+    Describes how long to sleep between the polls of a wait for a status change.
+
+    A strategy can be passed as the ``relax`` argument of every method that waits for a status, e.g.
+    :meth:`checkbox_sdk.client.synchronous.CheckBoxClient.wait_status`, ``check_status``, ``Shifts.create_shift`` or
+    ``Transactions.wait_transaction``. A plain number of seconds keeps the constant delay.
+
+    Every strategy accepts an optional ``on_wait`` callback called with the :class:`WaitStats` of every finished
+    wait, e.g. to tune the strategy by the number of polls.
+    """
+
+    on_wait: Optional[Callable[[WaitStats], None]] = None
+
+    @abstractmethod
+    def delays(self) -> Iterator[float]:
+        """
+        Returns the delays, in seconds, to sleep after the first, second and following polls.
+        """
+
+    def report(self, stats: WaitStats) -> None:
+        """
+        Reports a finished wait.
+
+        Args:
+            stats: The summary of the wait.
+        """
+        logger.debug(
+            "Waited %.3f seconds for %r with %d polls using %s", stats.elapsed, stats.field, stats.polls, self
+        )
+        if self.on_wait:
+            self.on_wait(stats)
+
+
+@dataclass
+class ConstantPolling(PollingStrategy):
+    """
+    Sleeps the same time between all polls.
+
+    Attributes:
+        delay: The delay, in seconds. Defaults to `DEFAULT_REQUESTS_RELAX`.
+        on_wait: Optional callback called with the :class:`WaitStats` of every finished wait.
+    """
+
+    delay: float = DEFAULT_REQUESTS_RELAX
+    on_wait: Optional[Callable[[WaitStats], None]] = None
+
+    def delays(self) -> Iterator[float]:
+        return itertools.repeat(self.delay)
+
+
+@dataclass
+class ExponentialPolling(PollingStrategy):
+    """
+    Starts with a short delay that grows exponentially up to a cap.
+
+    Quick operations, like most receipts, are noticed after a fraction of a second, while slow operations, like
+    closing a shift, are polled rarely.
+
+    Attributes:
+        initial: The first delay, in seconds. Defaults to 0.1.
+        factor: The factor the delay grows by after every poll. Defaults to 2.
+        max_delay: The maximum delay, in seconds. Defaults to 5.
+        warmup: The number of polls the initial delay is kept before it starts to grow. Defaults to 0.
+        on_wait: Optional callback called with the :class:`WaitStats` of every finished wait.
+    """
+
+    initial: float = 0.1
+    factor: float = 2.0
+    max_delay: float = 5.0
+    warmup: int = 0
+    on_wait: Optional[Callable[[WaitStats], None]] = None
+
+    def delays(self) -> Iterator[float]:
+        yield from itertools.repeat(min(self.initial, self.max_delay), self.warmup)
+        delay = self.initial
+        while True:
+            yield min(delay, self.max_delay)
+            delay *= self.factor
+
+
+@dataclass
+class FibonacciPolling(PollingStrategy):
+    """
+    Grows the delay along the Fibonacci sequence up to a cap, which is gentler than doubling it.
+
+    Attributes:
+        initial: The first delay, in seconds. Defaults to 0.1.
+        max_delay: The maximum delay, in seconds. Defaults to 5.
+        on_wait: Optional callback called with the :class:`WaitStats` of every finished wait.
+    """
+
+    initial: float = 0.1
+    max_delay: float = 5.0
+    on_wait: Optional[Callable[[WaitStats], None]] = None
+
+    def delays(self) -> Iterator[float]:
+        previous, delay = 0.0, self.initial
+        while True:
+            yield min(delay, self.max_delay)
+            previous, delay = delay, previous + delay
+
+
+Relax = Union[float, PollingStrategy]
+"""
+Delay between polls: a number of seconds or a :class:`PollingStrategy`.
+"""
+
+
+def get_polling(relax: Relax) -> PollingStrategy:
+    """
+    Returns the polling strategy for a ``relax`` argument.
+
+    Args:
+        relax: A number of seconds or a polling strategy.
+
+    Returns:
+        The given strategy, or a :class:`ConstantPolling` strategy for a number of seconds.
+    """
+    if isinstance(relax, PollingStrategy):
+        return relax
+    return ConstantPolling(delay=relax)
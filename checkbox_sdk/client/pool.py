@@ -0,0 +1,299 @@
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from typing import Any, Dict, Generic, Iterator, Optional, TypeVar
+
+from httpx import AsyncClient, Client, Response
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.methods.base import AbstractMethod
+from checkbox_sdk.storage.simple import SessionStorage
+
+C = TypeVar("C", CheckBoxClient, AsyncCheckBoxClient)
+
+
+class _PooledCheckBoxClient(CheckBoxClient):
+    """
+    Client of one tenant that sends its requests through the shared session of a :class:`CheckBoxClientPool`.
+    """
+
+    def __init__(self, pool: "CheckBoxClientPool", concurrency: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+
+        self._pool = pool
+        self._semaphore = threading.BoundedSemaphore(concurrency) if concurrency else None
+
+    @property
+    def session(self) -> Client:
+        return self._pool.session
+
+    def _send(self, *args, **kwargs) -> Response:  # pylint: disable=arguments-differ
+        with self._semaphore or nullcontext():
+            return super()._send(*args, **kwargs)
+
+
+class _AsyncPooledCheckBoxClient(AsyncCheckBoxClient):
+    """
+    Client of one tenant that sends its requests through the shared session of an
+    :class:`AsyncCheckBoxClientPool`.
+    """
+
+    def __init__(self, pool: "AsyncCheckBoxClientPool", concurrency: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+
+        self._pool = pool
+        self._concurrency = concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def session(self) -> AsyncClient:
+        return self._pool.session
+
+    async def _send(self, *args, **kwargs) -> Response:  # pylint: disable=arguments-differ
+        if not self._concurrency:
+            return await super()._send(*args, **kwargs)
+
+        # Created on first use, so the semaphore belongs to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        async with self._semaphore:
+            return await super()._send(*args, **kwargs)
+
+
+class _BaseClientPool(ABC, Generic[C]):
+    """
+    Registry of tenant clients that share one client configuration.
+
+    Args:
+        tenant_concurrency: The default maximum number of requests a single tenant may have in flight at once. `None`
+                            means no limit. Defaults to `None`.
+        **kwargs: Options of the shared client, see :class:`checkbox_sdk.client.base.BaseCheckBoxClient`. The
+                  ``max_connections`` option bounds the connections of all tenants together.
+    """
+
+    def __init__(self, tenant_concurrency: Optional[int] = None, **kwargs):
+        if "storage" in kwargs:
+            raise TypeError("The storage is defined per tenant, use add() instead")
+
+        self.tenant_concurrency = tenant_concurrency
+        self.client_options = kwargs
+        self._tenants: Dict[str, C] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _create_client(self, storage: SessionStorage, concurrency: Optional[int]) -> C:
+        """
+        Creates the client of a tenant.
+        """
+
+    def add(
+        self,
+        key: str,
+        storage: Optional[SessionStorage] = None,
+        concurrency: Optional[int] = None,
+    ) -> C:
+        """
+        Registers a tenant, e.g. a cash register, in the pool.
+
+        Args:
+            key: The key the tenant is addressed by.
+            storage: The session storage of the tenant. Defaults to a new `SessionStorage` instance.
+            concurrency: The maximum number of requests the tenant may have in flight at once. Defaults to the
+                         ``tenant_concurrency`` of the pool.
+
+        Returns:
+            The client of the tenant. It shares the connection pool, and the rate limiter, circuit breaker and
+            response cache if configured, with all other tenants and uses the tenant's storage by default.
+
+        Raises:
+            ValueError: If a tenant with the same key is already registered.
+        """
+        with self._lock:
+            if key in self._tenants:
+                raise ValueError(f"Tenant {key!r} is already registered")
+            client = self._create_client(
+                storage or SessionStorage(),
+                concurrency if concurrency is not None else self.tenant_concurrency,
+            )
+            self._tenants[key] = client
+        return client
+
+    def get(self, key: str) -> C:
+        """
+        Returns the client of a registered tenant.
+
+        Args:
+            key: The key of the tenant.
+
+        Raises:
+            KeyError: If the tenant is not registered.
+        """
+        try:
+            return self._tenants[key]
+        except KeyError:
+            raise KeyError(f"Tenant {key!r} is not registered") from None
+
+    def remove(self, key: str) -> None:
+        """
+        Removes a tenant from the pool. Requests of the tenant that are in flight are completed.
+
+        Args:
+            key: The key of the tenant.
+        """
+        with self._lock:
+            self._tenants.pop(key, None)
+
+    def storage(self, key: str) -> SessionStorage:
+        """
+        Returns the session storage of a registered tenant.
+
+        Args:
+            key: The key of the tenant.
+        """
+        return self.get(key).storage
+
+    def __getitem__(self, key: str) -> C:
+        return self.get(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._tenants
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._tenants))
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+
+class CheckBoxClientPool(_BaseClientPool[CheckBoxClient]):
+    """
+    Pool of clients for many tenants, e.g. cash registers, that share one HTTP connection pool.
+
+    Every tenant is registered with its own session storage and gets a lightweight client that sends its requests
+    through the single `httpx.Client` of the pool, so memory and socket usage do not grow with the number of
+    tenants. The API namespaces of a tenant client are created only when used.
+
+    Args:
+        tenant_concurrency: The default maximum number of requests a single tenant may have in flight at once. `None`
+                            means no limit. Defaults to `None`.
+        **kwargs: Options of the shared client, see :class:`checkbox_sdk.client.base.BaseCheckBoxClient`. The
+                  ``max_connections`` option bounds the connections of all tenants together.
+
+    Example:
+        .. code-block:: python
+
+            with CheckBoxClientPool(max_connections=50, tenant_concurrency=4) as pool:
+                for register in registers:
+                    pool.add(register.id, SessionStorage(license_key=register.license_key))
+
+                pool[register_id].receipts.get_receipt(receipt_id)
+                pool.emit(register_id, shift.GetShifts())
+    """
+
+    def __init__(self, tenant_concurrency: Optional[int] = None, **kwargs):
+        super().__init__(tenant_concurrency, **kwargs)
+        self._client = CheckBoxClient(**kwargs)
+
+    @property
+    def session(self) -> Client:
+        """
+        The HTTP session shared by all tenants, created on first use.
+        """
+        return self._client.session
+
+    def _create_client(self, storage: SessionStorage, concurrency: Optional[int]) -> CheckBoxClient:
+        return _PooledCheckBoxClient(self, concurrency, storage=storage, **self.client_options)
+
+    def emit(self, key: str, call: AbstractMethod, request_timeout: Optional[float] = None) -> Any:
+        """
+        Sends a request on behalf of a tenant.
+
+        Args:
+            key: The key of the tenant.
+            call: The API method to call.
+            request_timeout: Optional timeout value for the request.
+
+        Returns:
+            The parsed response from the API call.
+        """
+        return self.get(key).emit(call, request_timeout=request_timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the shared HTTP session. The tenants stay registered and a new session is created on next use.
+        """
+        self._client.close()
+
+
+class AsyncCheckBoxClientPool(_BaseClientPool[AsyncCheckBoxClient]):
+    """
+    Pool of asynchronous clients for many tenants, e.g. cash registers, that share one HTTP connection pool.
+
+    Every tenant is registered with its own session storage and gets a lightweight client that sends its requests
+    through the single `httpx.AsyncClient` of the pool, so memory and socket usage do not grow with the number of
+    tenants. The API namespaces of a tenant client are created only when used.
+
+    Args:
+        tenant_concurrency: The default maximum number of requests a single tenant may have in flight at once. `None`
+                            means no limit. Defaults to `None`.
+        **kwargs: Options of the shared client, see :class:`checkbox_sdk.client.base.BaseCheckBoxClient`. The
+                  ``max_connections`` option bounds the connections of all tenants together.
+
+    Example:
+        .. code-block:: python
+
+            async with AsyncCheckBoxClientPool(max_connections=50, tenant_concurrency=4) as pool:
+                for register in registers:
+                    pool.add(register.id, SessionStorage(license_key=register.license_key))
+
+                await pool[register_id].receipts.get_receipt(receipt_id)
+                await pool.emit(register_id, shift.GetShifts())
+    """
+
+    def __init__(self, tenant_concurrency: Optional[int] = None, **kwargs):
+        super().__init__(tenant_concurrency, **kwargs)
+        self._client = AsyncCheckBoxClient(**kwargs)
+
+    @property
+    def session(self) -> AsyncClient:
+        """
+        The HTTP session shared by all tenants, created on first use.
+        """
+        return self._client.session
+
+    def _create_client(self, storage: SessionStorage, concurrency: Optional[int]) -> AsyncCheckBoxClient:
+        return _AsyncPooledCheckBoxClient(self, concurrency, storage=storage, **self.client_options)
+
+    async def emit(self, key: str, call: AbstractMethod, request_timeout: Optional[float] = None) -> Any:
+        """
+        Asynchronously sends a request on behalf of a tenant.
+
+        Args:
+            key: The key of the tenant.
+            call: The API method to call.
+            request_timeout: Optional timeout value for the request.
+
+        Returns:
+            The parsed response from the API call.
+        """
+        return await self.get(key).emit(call, request_timeout=request_timeout)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the shared HTTP session. The tenants stay registered and a new session is created on next use.
+        """
+        await self._client.close()
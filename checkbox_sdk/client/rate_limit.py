@@ -0,0 +1,234 @@
+import asyncio
+import hashlib
+import logging
+import os
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Union
+
+from checkbox_sdk.storage.simple import SessionStorage
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+KeyFunc = Callable[[SessionStorage], Optional[str]]
+
+KEY_FUNCS: Dict[str, KeyFunc] = {
+    "global": lambda storage: None,
+    "license_key": lambda storage: storage.license_key,
+    "token": lambda storage: storage.token,
+}
+"""
+Predefined ways to choose the bucket of a request from its session storage.
+"""
+
+
+class BucketStore(ABC):
+    """
+    Abstract storage of token bucket states.
+
+    A store atomically refills a bucket, takes tokens from it and reports how long the caller has to wait until the
+    taken tokens become available. Tokens may be taken in advance, so concurrent callers are queued fairly.
+    """
+
+    @abstractmethod
+    def reserve(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        """
+        Takes tokens from the bucket.
+
+        Args:
+            key: The bucket key.
+            rate: The number of tokens added to the bucket per second.
+            capacity: The maximum number of tokens the bucket holds.
+            tokens: The number of tokens to take.
+
+        Returns:
+            The time, in seconds, to wait before the tokens may be used.
+        """
+
+    @staticmethod
+    def _take(available: float, updated: float, now: float, rate: float, capacity: float, tokens: float):
+        available = min(capacity, available + max(0.0, now - updated) * rate) - tokens
+        delay = -available / rate if available < 0 else 0.0
+        return available, delay
+
+
+class MemoryBucketStore(BucketStore):
+    """
+    Thread-safe bucket store kept in the memory of the current process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, List[float]] = {}
+
+    def reserve(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        now = time.monotonic()
+        with self._lock:
+            available, updated = self._buckets.get(key, (capacity, now))
+            available, delay = self._take(available, updated, now, rate, capacity, tokens)
+            self._buckets[key] = [available, now]
+        return delay
+
+
+class FileBucketStore(BucketStore):
+    """
+    Bucket store shared by all processes on the host through files in a directory.
+
+    Every bucket is kept in its own small file guarded by an exclusive file lock, so worker processes that use the
+    same directory share one budget.
+
+    Args:
+        directory: The directory where bucket files are kept. It is created if missing.
+    """
+
+    _state = struct.Struct("<dd")
+
+    def __init__(self, directory: Union[str, os.PathLike]):
+        if fcntl is None and msvcrt is None:  # pragma: no cover
+            raise RuntimeError("File locking is not supported on this platform")
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha256(key.encode()).hexdigest()}.bucket")
+
+    @staticmethod
+    def _lock(fd: int):
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:  # pragma: no cover
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    @staticmethod
+    def _unlock(fd: int):
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:  # pragma: no cover
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+    def reserve(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        fd = os.open(self._path(key), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self._lock(fd)
+            try:
+                # Wall clock is used because monotonic clocks are not comparable between processes on all platforms
+                now = time.time()
+                os.lseek(fd, 0, os.SEEK_SET)
+                data = os.read(fd, self._state.size)
+                available, updated = self._state.unpack(data) if len(data) == self._state.size else (capacity, now)
+                available, delay = self._take(available, updated, now, rate, capacity, tokens)
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, self._state.pack(available, now))
+            finally:
+                self._unlock(fd)
+        finally:
+            os.close(fd)
+        return delay
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter consulted by the clients before every request.
+
+    Requests are grouped into buckets by a key taken from their session storage, so one limiter instance can be
+    shared by many clients: every license key (or cashier token) gets its own budget, or all requests share one
+    global budget. Bursts up to ``capacity`` requests pass without delay, after that requests are smoothed to
+    ``rate`` requests per second instead of being rejected by the API with 429 responses.
+
+    Args:
+        rate: The number of requests per second allowed for every bucket.
+        capacity: The maximum burst size. Defaults to ``rate``.
+        key: Either one of ``"global"``, ``"license_key"``, ``"token"`` or a callable that returns the bucket key for
+             a session storage. Requests with no key fall into the global bucket. Defaults to ``"license_key"``.
+        store: The bucket store. Use :class:`FileBucketStore` to share the budget between processes. Defaults to a
+               new :class:`MemoryBucketStore`.
+    """
+
+    GLOBAL_KEY = "*"
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        key: Union[str, KeyFunc] = "license_key",
+        store: Optional[BucketStore] = None,
+    ):
+        if rate <= 0:
+            raise ValueError("'rate' must be positive")
+        if isinstance(key, str):
+            if key not in KEY_FUNCS:
+                raise ValueError(f"Unknown rate limiter key {key!r}, expected one of {sorted(KEY_FUNCS)}")
+            key = KEY_FUNCS[key]
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.key_func = key
+        self.store = store or MemoryBucketStore()
+
+    def get_key(self, storage: SessionStorage) -> str:
+        """
+        Returns the bucket key for the session storage.
+
+        Args:
+            storage: The session storage of the request.
+
+        Returns:
+            The bucket key.
+        """
+        return self.key_func(storage) or self.GLOBAL_KEY
+
+    def reserve(self, storage: SessionStorage) -> float:
+        """
+        Takes a token for one request without waiting.
+
+        Args:
+            storage: The session storage of the request.
+
+        Returns:
+            The time, in seconds, to wait before the request may be sent.
+        """
+        delay = self.store.reserve(self.get_key(storage), self.rate, self.capacity)
+        if delay:
+            logger.debug("Rate limit reached, request delayed for %.3f seconds", delay)
+        return delay
+
+    def acquire(self, storage: SessionStorage) -> None:
+        """
+        Waits until one request may be sent.
+
+        Args:
+            storage: The session storage of the request.
+        """
+        if delay := self.reserve(storage):
+            time.sleep(delay)
+
+    async def acquire_async(self, storage: SessionStorage) -> None:
+        """
+        Asynchronously waits until one request may be sent.
+
+        Stores other than :class:`MemoryBucketStore`, e.g. :class:`FileBucketStore`, may block on locks and disk I/O,
+        so their reservations are made in the default executor instead of the event loop.
+
+        Args:
+            storage: The session storage of the request.
+        """
+        if isinstance(self.store, MemoryBucketStore):
+            delay = self.reserve(storage)
+        else:
+            delay = await asyncio.get_running_loop().run_in_executor(None, self.reserve, storage)
+        if delay:
+            await asyncio.sleep(delay)
@@ -0,0 +1,427 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from checkbox_sdk.client.api.receipts import raise_for_receipt_error
+from checkbox_sdk.consts import DEFAULT_BATCH_CONCURRENCY, DEFAULT_REQUESTS_RELAX
+from checkbox_sdk.exceptions import CheckBoxError
+from checkbox_sdk.methods import receipts
+from checkbox_sdk.storage.simple import SessionStorage
+
+logger = logging.getLogger(__name__)
+
+FINAL_STATUSES = frozenset({"DONE", "ERROR"})
+"""
+Receipt statuses that end the wait.
+"""
+
+DEFAULT_SEARCH_LIMIT = 100
+"""
+The default number of newest receipts of the pending shifts fetched by one search request.
+"""
+
+
+@dataclass
+class _PendingReceipt:
+    receipt_id: str
+    shift_id: Optional[str]
+    storage: SessionStorage
+    futures: List[Any] = field(default_factory=list)
+
+
+class _BaseReceiptStatusPoller:
+    """
+    Bookkeeping of pending receipts shared by the synchronous and asynchronous pollers.
+    """
+
+    def __init__(
+        self,
+        client,
+        interval: float = DEFAULT_REQUESTS_RELAX,
+        search_limit: int = DEFAULT_SEARCH_LIMIT,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ):
+        self.client = client
+        self.interval = interval
+        self.search_limit = search_limit
+        self.concurrency = concurrency
+        self.requests = 0
+        self._pending: Dict[str, _PendingReceipt] = {}
+        self._lock = threading.Lock()
+        self._is_closed = False
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of receipts still waited for.
+        """
+        return len(self._pending)
+
+    def _register(self, receipt: Dict[str, Any], storage: Optional[SessionStorage], future: Any) -> None:
+        receipt_id = str(receipt["id"])
+        with self._lock:
+            if self._is_closed:
+                raise CheckBoxError("Receipt status poller is closed")
+            if (pending := self._pending.get(receipt_id)) is None:
+                pending = self._pending[receipt_id] = _PendingReceipt(
+                    receipt_id=receipt_id,
+                    shift_id=(receipt.get("shift") or {}).get("id"),
+                    storage=storage or self.client.storage,
+                )
+            pending.futures.append(future)
+
+    def discard(self, receipt_id: str, future: Any) -> None:
+        """
+        Stops waiting for a receipt with the future returned by ``submit``, e.g. after a timeout. The receipt is no
+        longer polled once no other future waits for it. The future itself is left as is.
+
+        Args:
+            receipt_id: The ID of the receipt.
+            future: The future returned when the receipt was submitted.
+        """
+        with self._lock:
+            if (pending := self._pending.get(receipt_id)) is not None and future in pending.futures:
+                pending.futures.remove(future)
+                if not pending.futures:
+                    del self._pending[receipt_id]
+
+    def _fail_all(self, exception: BaseException) -> None:
+        """
+        Fails every pending receipt with the exception.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for receipt in pending.values():
+            for future in receipt.futures:
+                self._set_exception(future, exception)
+
+    def _shutdown(self) -> None:
+        with self._lock:
+            self._is_closed = True
+        self._fail_all(CheckBoxError("Receipt status poller is closed"))
+
+    def _groups(self) -> List[Tuple[SessionStorage, List[_PendingReceipt]]]:
+        # Receipts of different cashiers or cash registers can only be searched with their own session
+        groups: Dict[int, Tuple[SessionStorage, List[_PendingReceipt]]] = {}
+        with self._lock:
+            for pending in self._pending.values():
+                groups.setdefault(id(pending.storage), (pending.storage, []))[1].append(pending)
+        return list(groups.values())
+
+    def _search_call(self, group: List[_PendingReceipt]) -> Optional[receipts.GetReceiptsSearch]:
+        shift_ids = sorted({pending.shift_id for pending in group if pending.shift_id})
+        if not shift_ids:
+            return None
+        return receipts.GetReceiptsSearch(shift_id=shift_ids, desc=True, limit=self.search_limit)
+
+    def _apply_search(self, group: List[_PendingReceipt], found: List[Dict[str, Any]]) -> List[_PendingReceipt]:
+        """
+        Completes the receipts found by a search and returns the receipts the search did not return.
+        """
+        by_id = {str(receipt["id"]): receipt for receipt in found}
+        missing = []
+        for pending in group:
+            if (receipt := by_id.get(pending.receipt_id)) is None:
+                missing.append(pending)
+            else:
+                self._complete(receipt)
+        return missing
+
+    def _complete(self, receipt: Dict[str, Any]) -> None:
+        if receipt.get("status") not in FINAL_STATUSES:
+            return
+        with self._lock:
+            pending = self._pending.pop(str(receipt["id"]), None)
+        if pending is None:
+            return
+
+        logger.info("Receipt %s changed status to %r", pending.receipt_id, receipt["status"])
+        try:
+            raise_for_receipt_error(receipt)
+        except CheckBoxError as e:
+            for future in pending.futures:
+                self._set_exception(future, e)
+        else:
+            for future in pending.futures:
+                self._set_result(future, receipt)
+
+    @staticmethod
+    def _set_result(future: Any, result: Dict[str, Any]) -> None:
+        if not future.done():
+            future.set_result(result)
+
+    @staticmethod
+    def _set_exception(future: Any, exception: BaseException) -> None:
+        if not future.done():
+            future.set_exception(exception)
+
+
+class ReceiptStatusPoller(_BaseReceiptStatusPoller):
+    """
+    Waits for the fiscalization of many receipts with one shared polling loop.
+
+    Instead of every waiter polling its own receipt, pending receipts are registered in the poller and resolved
+    together on every tick: the newest receipts of their shifts are fetched with one
+    :class:`checkbox_sdk.methods.receipts.GetReceiptsSearch` request per session, and only receipts the search did
+    not return are fetched one by one with bounded concurrency. The number of requests grows with the number of
+    ticks and sessions, not with the number of receipts in flight.
+
+    The polling runs in a background thread that is started when the first receipt is registered and exits when
+    nothing is pending.
+
+    Args:
+        client: The synchronous client used to send the requests.
+        interval: The time, in seconds, between two ticks. Defaults to `DEFAULT_REQUESTS_RELAX`.
+        search_limit: The number of newest receipts fetched by one search request. Defaults to
+                      `DEFAULT_SEARCH_LIMIT`.
+        concurrency: The maximum number of receipts fetched one by one at the same time. Defaults to
+                     `DEFAULT_BATCH_CONCURRENCY`.
+
+    Example:
+        .. code-block:: python
+
+            poller = ReceiptStatusPoller(client)
+            receipt = client.receipts.create_receipt(receipt=payload, wait=False)
+            receipt = poller.wait(receipt, timeout=30)
+    """
+
+    def __init__(self, client, **kwargs):
+        super().__init__(client, **kwargs)
+        self._thread: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+
+    def submit(
+        self, receipt: Dict[str, Any], storage: Optional[SessionStorage] = None
+    ) -> "concurrent.futures.Future[Dict[str, Any]]":
+        """
+        Registers a receipt to wait for.
+
+        Args:
+            receipt: The created receipt. Its shift, if present, lets the receipt be found by a shift search.
+            storage: Optional session storage the receipt was created with. Defaults to the client's storage.
+
+        Returns:
+            A future resolved with the receipt once it is fiscalized, or with a
+            :class:`checkbox_sdk.exceptions.StatusException` if the fiscalization failed.
+
+        Raises:
+            CheckBoxError: If the poller is closed.
+        """
+        future: "concurrent.futures.Future[Dict[str, Any]]" = concurrent.futures.Future()
+        self._register(receipt, storage, future)
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="checkbox-receipt-poller", daemon=True)
+                self._thread.start()
+        return future
+
+    def wait(
+        self,
+        receipt: Dict[str, Any],
+        storage: Optional[SessionStorage] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Waits until the receipt is fiscalized.
+
+        Args:
+            receipt: The created receipt.
+            storage: Optional session storage the receipt was created with. Defaults to the client's storage.
+            timeout: The maximum time, in seconds, to wait. If `None`, waits indefinitely.
+
+        Returns:
+            The fiscalized receipt.
+
+        Raises:
+            StatusException: If the fiscalization of the receipt failed.
+            CheckBoxError: If the poller is closed, or stops polling because of an unexpected error.
+            ValueError: If the receipt does not change its status within the timeout.
+        """
+        future = self.submit(receipt, storage)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            self.discard(str(receipt["id"]), future)
+            raise ValueError(f"Receipt {receipt['id']} did not change status in {timeout} seconds") from None
+
+    def close(self) -> None:
+        """
+        Stops the polling. Receipts that are still pending fail with a :class:`checkbox_sdk.exceptions.CheckBoxError`
+        and no more receipts can be submitted.
+        """
+        self._closed.set()
+        self._shutdown()
+
+    def _run(self) -> None:
+        while not self._closed.wait(self.interval):
+            if not self._pending:
+                with self._lock:
+                    if not self._pending:
+                        self._thread = None
+                        return
+            try:
+                self.tick()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Waiters would otherwise block forever on a dead thread
+                logger.exception("Receipt status polling failed")
+                self._fail_all(CheckBoxError(f"Receipt status polling failed: {e}"))
+
+    def tick(self) -> None:
+        """
+        Resolves the pending receipts once. Called by the background thread on every tick.
+        """
+        for storage, group in self._groups():
+            if (search := self._search_call(group)) is not None:
+                self.requests += 1
+                try:
+                    group = self._apply_search(group, self.client(search, storage=storage)["results"])
+                except CheckBoxError as e:
+                    logger.warning("Receipts search failed, fetching receipts one by one: %s", e)
+
+            if not group:
+                continue
+            self.requests += len(group)
+            results = self.client.emit_many(
+                (receipts.GetReceipt(receipt_id=pending.receipt_id) for pending in group),
+                storage=storage,
+                concurrency=self.concurrency,
+            )
+            for pending, result in zip(group, results):
+                if isinstance(result, Exception):
+                    logger.warning("Failed to get receipt %s: %s", pending.receipt_id, result)
+                else:
+                    self._complete(result)
+
+
+class AsyncReceiptStatusPoller(_BaseReceiptStatusPoller):
+    """
+    Asynchronously waits for the fiscalization of many receipts with one shared polling loop.
+
+    See :class:`ReceiptStatusPoller` for details. The polling runs in a background task of the running event loop
+    that is started when the first receipt is registered and exits when nothing is pending.
+
+    Args:
+        client: The asynchronous client used to send the requests.
+        interval: The time, in seconds, between two ticks. Defaults to `DEFAULT_REQUESTS_RELAX`.
+        search_limit: The number of newest receipts fetched by one search request. Defaults to
+                      `DEFAULT_SEARCH_LIMIT`.
+        concurrency: The maximum number of receipts fetched one by one at the same time. Defaults to
+                     `DEFAULT_BATCH_CONCURRENCY`.
+
+    Example:
+        .. code-block:: python
+
+            poller = AsyncReceiptStatusPoller(client)
+            receipt = await client.receipts.create_receipt(receipt=payload, wait=False)
+            receipt = await poller.wait(receipt, timeout=30)
+    """
+
+    def __init__(self, client, **kwargs):
+        super().__init__(client, **kwargs)
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def submit(self, receipt: Dict[str, Any], storage: Optional[SessionStorage] = None) -> "asyncio.Future[Any]":
+        """
+        Registers a receipt to wait for. Must be called from a running event loop.
+
+        Args:
+            receipt: The created receipt. Its shift, if present, lets the receipt be found by a shift search.
+            storage: Optional session storage the receipt was created with. Defaults to the client's storage.
+
+        Returns:
+            A future resolved with the receipt once it is fiscalized, or with a
+            :class:`checkbox_sdk.exceptions.StatusException` if the fiscalization failed.
+
+        Raises:
+            CheckBoxError: If the poller is closed.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._register(receipt, storage, future)
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return future
+
+    async def wait(
+        self,
+        receipt: Dict[str, Any],
+        storage: Optional[SessionStorage] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Asynchronously waits until the receipt is fiscalized.
+
+        Args:
+            receipt: The created receipt.
+            storage: Optional session storage the receipt was created with. Defaults to the client's storage.
+            timeout: The maximum time, in seconds, to wait. If `None`, waits indefinitely.
+
+        Returns:
+            The fiscalized receipt.
+
+        Raises:
+            StatusException: If the fiscalization of the receipt failed.
+            CheckBoxError: If the poller is closed, or stops polling because of an unexpected error.
+            ValueError: If the receipt does not change its status within the timeout.
+        """
+        future = self.submit(receipt, storage)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self.discard(str(receipt["id"]), future)
+            raise ValueError(f"Receipt {receipt['id']} did not change status in {timeout} seconds") from None
+        except asyncio.CancelledError:
+            self.discard(str(receipt["id"]), future)
+            raise
+
+    async def close(self) -> None:
+        """
+        Stops the polling. Receipts that are still pending fail with a :class:`checkbox_sdk.exceptions.CheckBoxError`
+        and no more receipts can be submitted.
+        """
+        self._shutdown()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.tick()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Waiters would otherwise wait forever on a finished task
+                logger.exception("Receipt status polling failed")
+                self._fail_all(CheckBoxError(f"Receipt status polling failed: {e}"))
+
+    async def tick(self) -> None:
+        """
+        Resolves the pending receipts once. Called by the background task on every tick.
+        """
+        for storage, group in self._groups():
+            if (search := self._search_call(group)) is not None:
+                self.requests += 1
+                try:
+                    group = self._apply_search(group, (await self.client(search, storage=storage))["results"])
+                except CheckBoxError as e:
+                    logger.warning("Receipts search failed, fetching receipts one by one: %s", e)
+
+            if not group:
+                continue
+            self.requests += len(group)
+            results = await self.client.emit_many(
+                (receipts.GetReceipt(receipt_id=pending.receipt_id) for pending in group),
+                storage=storage,
+                concurrency=self.concurrency,
+            )
+            for pending, result in zip(group, results):
+                if isinstance(result, Exception):
+                    logger.warning("Failed to get receipt %s: %s", pending.receipt_id, result)
+                else:
+                    self._complete(result)
@@ -0,0 +1,158 @@
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional, Tuple, Type
+
+from httpx import Response, TransportError
+
+from checkbox_sdk.methods.base import AbstractMethod, HTTPMethod
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({HTTPMethod.GET, HTTPMethod.PUT, HTTPMethod.DELETE})
+"""
+HTTP methods that can be safely repeated without changing the result on the server.
+"""
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+"""
+Response status codes that indicate a temporary failure worth retrying.
+"""
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Describes when and how failed API requests are retried.
+
+    A request is retried only if its method is allowed to be retried and either the response status is listed in
+    ``statuses`` or the request failed with one of ``exceptions``. The delay between attempts grows exponentially,
+    optionally randomized with full jitter, and the ``Retry-After`` response header takes precedence when present.
+
+    By default only idempotent HTTP methods are retried. An API method can opt in (or out) by setting its
+    :attr:`checkbox_sdk.methods.base.AbstractMethod.retryable` attribute.
+
+    Attributes:
+        max_attempts: The maximum number of attempts, including the first one. Defaults to 3.
+        statuses: Response status codes that trigger a retry. Defaults to `RETRY_STATUSES`.
+        exceptions: Exception types raised by the transport that trigger a retry. Defaults to
+                    `httpx.TransportError`, which covers connection failures and timeouts.
+        methods: HTTP methods retried unless the API method says otherwise. Defaults to `IDEMPOTENT_METHODS`.
+        backoff_factor: The base delay, in seconds, of the exponential backoff. Defaults to 0.5.
+        max_backoff: The maximum delay, in seconds, between two attempts. Defaults to 30.
+        jitter: Whether to randomize the backoff delay between zero and its computed value. Defaults to `True`.
+        respect_retry_after: Whether to wait as long as the ``Retry-After`` header asks. Defaults to `True`.
+        budget: The maximum total time, in seconds, a single call may take including all its retries. A retry that
+                would exceed the budget is not made. `None` means no limit. Defaults to 60.
+    """
+
+    max_attempts: int = 3
+    statuses: FrozenSet[int] = RETRY_STATUSES
+    exceptions: Tuple[Type[Exception], ...] = (TransportError,)
+    methods: FrozenSet[HTTPMethod] = IDEMPOTENT_METHODS
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    budget: Optional[float] = 60.0
+
+    def is_retryable(self, call: AbstractMethod) -> bool:
+        """
+        Checks whether the API method may be retried at all.
+
+        Args:
+            call: The API method being executed.
+
+        Returns:
+            `True` if the method explicitly opted in, or did not opt out and uses an allowed HTTP method.
+        """
+        if call.retryable is not None:
+            return call.retryable
+        return call.method in self.methods
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Calculates the exponential backoff delay after the given attempt.
+
+        Args:
+            attempt: The number of the attempt that has just failed, starting from 1.
+
+        Returns:
+            The delay in seconds.
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(response: Response) -> Optional[float]:
+        """
+        Parses the ``Retry-After`` header of the response.
+
+        Both forms of the header are supported: a number of seconds and an HTTP date.
+
+        Args:
+            response: The response to inspect.
+
+        Returns:
+            The delay in seconds, or `None` if the header is missing or invalid.
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            logger.info("Unable to parse Retry-After header %r", value)
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def get_delay(
+        self,
+        call: AbstractMethod,
+        attempt: int,
+        started: float,
+        response: Optional[Response] = None,
+        exception: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Decides whether a failed attempt must be retried and how long to wait before it.
+
+        Args:
+            call: The API method being executed.
+            attempt: The number of the attempt that has just finished, starting from 1.
+            started: The value of :func:`time.monotonic` when the first attempt started.
+            response: The response of the attempt, if one was received.
+            exception: The exception raised by the attempt, if any.
+
+        Returns:
+            The delay in seconds before the next attempt, or `None` if the call must not be retried.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(call):
+            return None
+
+        if exception is not None:
+            if not isinstance(exception, self.exceptions):
+                return None
+            delay = self.backoff(attempt)
+        elif response is not None and response.status_code in self.statuses:
+            retry_after = self.parse_retry_after(response) if self.respect_retry_after else None
+            delay = retry_after if retry_after is not None else self.backoff(attempt)
+        else:
+            return None
+
+        if self.budget is not None and time.monotonic() - started + delay > self.budget:
+            logger.info("Retry budget of %.3f seconds is exhausted", self.budget)
+            return None
+
+        return delay
@@ -1,35 +1,41 @@
 import logging
+import threading
 import time
-from typing import Any, Optional, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from httpcore import NetworkError
-from httpx import Client, HTTPError, Timeout
+from httpx import Client, HTTPError, Response
 
-from checkbox_sdk.client.base import BaseSyncCheckBoxClient
-from checkbox_sdk.consts import DEFAULT_REQUESTS_RELAX
+from checkbox_sdk.client.base import BaseSyncCheckBoxClient, LazyNamespace, Sink
+from checkbox_sdk.client.polling import Relax, get_polling
+from checkbox_sdk.codec import use_codec
+from checkbox_sdk.consts import DEFAULT_BATCH_CONCURRENCY, DEFAULT_CHUNK_SIZE, DEFAULT_REQUESTS_RELAX
 from checkbox_sdk.exceptions import CheckBoxNetworkError, CheckBoxError
-from checkbox_sdk.methods import cash_register, cashier
 from checkbox_sdk.methods.base import AbstractMethod, BaseMethod
 from checkbox_sdk.storage.simple import SessionStorage
-from .api import (
-    CashRegisters,
-    Cashier,
-    Receipts,
-    Shifts,
-    Tax,
-    Transactions,
-    Organization,
-    PrepaymentReceipts,
-    Reports,
-    ExtendedReports,
-    Goods,
-    Orders,
-    Currency,
-    Webhook,
-    Invoices,
-    NovaPost,
-    Branches,
-)
+
+if TYPE_CHECKING:
+    from .api import (
+        Cashier,
+        CashRegisters,
+        Shifts,
+        Receipts,
+        Transactions,
+        Tax,
+        Organization,
+        PrepaymentReceipts,
+        Reports,
+        ExtendedReports,
+        Goods,
+        Orders,
+        Currency,
+        Webhook,
+        Invoices,
+        NovaPost,
+        Branches,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -45,27 +51,45 @@ class CheckBoxClient(BaseSyncCheckBoxClient):  # pylint: disable=too-many-instan
     goods, orders, currency, webhooks, invoices, NovaPost, and branches.
     """
 
+    cashier: LazyNamespace["Cashier"] = LazyNamespace("cashier", "Cashier")
+    cash_registers: LazyNamespace["CashRegisters"] = LazyNamespace("cash_registers", "CashRegisters")
+    shifts: LazyNamespace["Shifts"] = LazyNamespace("shifts", "Shifts")
+    receipts: LazyNamespace["Receipts"] = LazyNamespace("receipts", "Receipts")
+    transactions: LazyNamespace["Transactions"] = LazyNamespace("transactions", "Transactions")
+    tax: LazyNamespace["Tax"] = LazyNamespace("tax", "Tax")
+    organization: LazyNamespace["Organization"] = LazyNamespace("organization", "Organization")
+    prepayment_receipts: LazyNamespace["PrepaymentReceipts"] = LazyNamespace(
+        "prepayment_receipts", "PrepaymentReceipts"
+    )
+    reports: LazyNamespace["Reports"] = LazyNamespace("reports", "Reports")
+    extended_reports: LazyNamespace["ExtendedReports"] = LazyNamespace("extended_reports", "ExtendedReports")
+    goods: LazyNamespace["Goods"] = LazyNamespace("goods", "Goods")
+    orders: LazyNamespace["Orders"] = LazyNamespace("orders", "Orders")
+    currency: LazyNamespace["Currency"] = LazyNamespace("currency", "Currency")
+    webhook: LazyNamespace["Webhook"] = LazyNamespace("webhook", "Webhook")
+    invoices: LazyNamespace["Invoices"] = LazyNamespace("invoices", "Invoices")
+    nova_post: LazyNamespace["NovaPost"] = LazyNamespace("nova_post", "NovaPost")
+    branches: LazyNamespace["Branches"] = LazyNamespace("branches", "Branches")
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        self._session = Client(proxies=self.proxy, timeout=Timeout(timeout=self.timeout), verify=self.verify_ssl)
-        self.cashier = Cashier(self)
-        self.cash_registers = CashRegisters(self)
-        self.shifts = Shifts(self)
-        self.receipts = Receipts(self)
-        self.transactions = Transactions(self)
-        self.tax = Tax(self)
-        self.organization = Organization(self)
-        self.prepayment_receipts = PrepaymentReceipts(self)
-        self.reports = Reports(self)
-        self.extended_reports = ExtendedReports(self)
-        self.goods = Goods(self)
-        self.orders = Orders(self)
-        self.currency = Currency(self)
-        self.webhook = Webhook(self)
-        self.invoices = Invoices(self)
-        self.nova_post = NovaPost(self)
-        self.branches = Branches(self)
+        self._session: Optional[Client] = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> Client:
+        """
+        The HTTP session of the client.
+
+        The session, with its connection pool and SSL context, is created on first use, so creating a client that is
+        never used to make requests stays cheap.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = Client(**self.session_options)
+        return self._session
 
     def __del__(self):
         # Attempt to close the session if it hasn't been already
@@ -118,37 +142,286 @@ class CheckBoxClient(BaseSyncCheckBoxClient):  # pylint: disable=too-many-instan
         Raises:
             CheckBoxError: If an HTTP error occurs during the request.
             CheckBoxNetworkError: If a network error occurs during the request.
+            CheckBoxCircuitOpenError: If the circuit breaker rejects the request.
 
         Notes:
             - The `url` for the request is constructed based on whether the call is internal or external.
+            - Every attempt waits for the client's rate limiter, if one is configured.
+            - Failed attempts are repeated according to the client's retry policy, if one is configured.
+            - Responses of cacheable methods are served from the client's response cache, if one is configured.
+            - The payload is encoded and the response is parsed with the client's JSON codec.
             - The response is checked and parsed according to the method call's specifications.
         """
         # pylint: disable=duplicate-code
         storage = storage or self.storage
 
-        if not call.internal:
-            url = f"{self.base_url}/api/v{self.api_version}/{call.uri}"
-        else:
-            url = f"{self.base_url}/{call.uri}"
+        url = self._get_url(call)
+        headers = self._get_headers(storage, call)
+        cache_key = self._get_cache_key(call, headers)
+        if (cached := self._get_cached_response(cache_key)) is not None:
+            with use_codec(self.codec):
+                return call.parse_response(storage=storage, response=cached)
+        response = self._send(call, storage, url, headers, self._encode_payload(call), request_timeout)
+
+        logger.debug("Request response: %s", response)
+        with use_codec(self.codec):
+            self._check_response(response=response)
+            self._store_response(call, cache_key, response)
+            return call.parse_response(storage=storage, response=response)
+
+    def _send(  # pylint: disable=too-many-arguments
+        self,
+        call: AbstractMethod,
+        storage: SessionStorage,
+        url: str,
+        headers: Dict[str, Any],
+        content: Optional[bytes],
+        request_timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> Response:
+        """
+        Sends the request, repeating it according to the client's retry policy.
+
+        Args:
+            call: The API method being executed.
+            storage: The session storage of the request.
+            url: The URL of the request.
+            headers: The headers of the request.
+            content: The payload encoded by :meth:`_encode_payload`.
+            request_timeout: Optional timeout value for the request.
+            stream: Whether to return before the response body is read. The caller must close such a response.
+
+        Returns:
+            The response of the last attempt.
+
+        Raises:
+            CheckBoxError: If an HTTP error occurs during the request.
+            CheckBoxNetworkError: If a network error occurs during the request.
+            CheckBoxCircuitOpenError: If the circuit breaker rejects the request.
+        """
+        attempt = 0
+        started = time.monotonic()
+        while True:
+            attempt += 1
+            if self.circuit_breaker:
+                self.circuit_breaker.before_request(call)
+            if self.rate_limiter:
+                self.rate_limiter.acquire(storage)
+            try:
+                request = self.session.build_request(
+                    method=call.method.name,
+                    url=url,
+                    timeout=request_timeout or self.timeout,
+                    params=call.query,
+                    **self._get_request_body(call, headers, content),
+                )
+                response = self.session.send(request, stream=stream)
+            except (HTTPError, NetworkError) as e:
+                self._record_attempt(call, exception=e)
+                if (delay := self._get_retry_delay(call, attempt, started, exception=e)) is None:
+                    if isinstance(e, NetworkError):
+                        raise CheckBoxNetworkError(e) from e
+                    raise CheckBoxError(e) from e
+            else:
+                self._record_attempt(call, response=response)
+                if (delay := self._get_retry_delay(call, attempt, started, response=response)) is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+
+    @contextmanager
+    def stream(
+        self,
+        call: AbstractMethod,
+        storage: Optional[SessionStorage] = None,
+        request_timeout: Optional[float] = None,
+    ) -> Iterator[Response]:
+        """
+        Sends the request and provides the response before its body is read.
+
+        The body can then be consumed in chunks with the `httpx` streaming methods, e.g.
+        :meth:`httpx.Response.iter_bytes`, so large files never sit fully in memory. Error responses are read and
+        checked as usual before the context is entered. The response cache is bypassed.
 
+        Args:
+            call: The API method to call.
+            storage: Optional session storage to use for the request. If not provided, the default storage will be
+                     used.
+            request_timeout: Optional timeout value for the request. If not provided, the default timeout will be used.
+
+        Yields:
+            The successful streaming response. It is closed when the context exits.
+
+        Raises:
+            CheckBoxError: If an HTTP error occurs during the request or while the body is read.
+            CheckBoxNetworkError: If a network error occurs during the request.
+            CheckBoxAPIError: If the API returns an error response.
+
+        Example:
+            .. code-block:: python
+
+                with client.stream(receipts.GetReceiptVisualizationPdf(receipt_id=receipt_id)) as response:
+                    for chunk in response.iter_bytes():
+                        archive.write(chunk)
+        """
+        storage = storage or self.storage
+        headers = self._get_headers(storage, call)
+        response = self._send(
+            call, storage, self._get_url(call), headers, self._encode_payload(call), request_timeout, stream=True
+        )
         try:
-            response = self._session.request(
-                method=call.method.name,
-                url=url,
-                timeout=request_timeout or self.timeout,
-                params=call.query,
-                files=call.files,
-                headers={**storage.headers, **call.headers, **self.client_headers},
-                json=call.payload,
-            )
-        except HTTPError as e:
-            raise CheckBoxError(e) from e
-        except NetworkError as e:
-            raise CheckBoxNetworkError(e) from e
+            logger.debug("Request response: %s", response)
+            if response.status_code >= 400:
+                response.read()
+            with use_codec(self.codec):
+                self._check_response(response=response)
+            self._store_response(call, None, response)
+            try:
+                yield response
+            except (HTTPError, NetworkError) as e:
+                raise CheckBoxError(e) from e
+        finally:
+            response.close()
+
+    def iter_bytes(
+        self,
+        call: AbstractMethod,
+        storage: Optional[SessionStorage] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        request_timeout: Optional[float] = None,
+    ) -> Iterator[bytes]:
+        """
+        Streams the response body of the API method in chunks.
 
-        logger.debug("Request response: %s", response)
-        self._check_response(response=response)
-        return call.parse_response(storage=storage, response=response)
+        The request is sent when the iteration starts and the connection is released when it ends.
+
+        Args:
+            call: The API method to call, usually a file download such as
+                  :class:`checkbox_sdk.methods.receipts.GetReceiptVisualizationPdf`.
+            storage: Optional session storage to use for the request.
+            chunk_size: The size of the chunks in bytes. Defaults to `DEFAULT_CHUNK_SIZE`.
+            request_timeout: Optional timeout value for the request.
+
+        Yields:
+            The chunks of the response body.
+        """
+        with self.stream(call, storage=storage, request_timeout=request_timeout) as response:
+            yield from response.iter_bytes(chunk_size)
+
+    def download(  # pylint: disable=too-many-arguments
+        self,
+        call: AbstractMethod,
+        sink: Sink,
+        storage: Optional[SessionStorage] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        request_timeout: Optional[float] = None,
+    ) -> int:
+        """
+        Streams the response body of the API method to a file.
+
+        Args:
+            call: The API method to call, usually a file download such as
+                  :class:`checkbox_sdk.methods.receipts.GetReceiptVisualizationPdf`.
+            sink: A file path or a binary file-like object to write to. A path is created only once the API has
+                  answered successfully and is removed if the download fails.
+            storage: Optional session storage to use for the request.
+            chunk_size: The size of the chunks in bytes. Defaults to `DEFAULT_CHUNK_SIZE`.
+            request_timeout: Optional timeout value for the request.
+
+        Returns:
+            The number of bytes written.
+        """
+        size = 0
+        with self.stream(call, storage=storage, request_timeout=request_timeout) as response:
+            with self._open_sink(sink) as file:
+                for chunk in response.iter_bytes(chunk_size):
+                    file.write(chunk)
+                    size += len(chunk)
+        return size
+
+    def emit_many(
+        self,
+        calls: Iterable[AbstractMethod],
+        storage: Optional[SessionStorage] = None,
+        request_timeout: Optional[float] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[Any]:
+        """
+        Sends many independent requests concurrently and returns their parsed responses in order.
+
+        The requests are sent from a pool of threads over the shared HTTP session, so the retry policy, rate limiter,
+        circuit breaker and response cache of the client apply to every one of them. A failing call does not abort
+        the batch: its exception is returned in place of the response.
+
+        Args:
+            calls: The API methods to call.
+            storage: Optional session storage to use for the requests. If not provided, the default storage will be
+                     used.
+            request_timeout: Optional timeout value for every request.
+            concurrency: The maximum number of requests sent at the same time. Defaults to
+                         `DEFAULT_BATCH_CONCURRENCY`.
+
+        Returns:
+            The parsed responses, or the raised exceptions, in the order of the calls.
+
+        Example:
+            .. code-block:: python
+
+                results = client.emit_many(receipts.GetReceipt(receipt_id=receipt_id) for receipt_id in receipt_ids)
+                failed = [result for result in results if isinstance(result, Exception)]
+        """
+        calls = list(calls)
+        results: List[Any] = [None] * len(calls)
+        for index, result in self.emit_as_completed(
+            calls, storage=storage, request_timeout=request_timeout, concurrency=concurrency
+        ):
+            results[index] = result
+        return results
+
+    def emit_as_completed(
+        self,
+        calls: Iterable[AbstractMethod],
+        storage: Optional[SessionStorage] = None,
+        request_timeout: Optional[float] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Sends many independent requests concurrently and yields their results as soon as they complete.
+
+        Works like :meth:`emit_many`, but the results are streamed in the order the requests finish. Requests that are
+        not started yet are cancelled when the iteration is stopped early.
+
+        Args:
+            calls: The API methods to call.
+            storage: Optional session storage to use for the requests.
+            request_timeout: Optional timeout value for every request.
+            concurrency: The maximum number of requests sent at the same time. Defaults to
+                         `DEFAULT_BATCH_CONCURRENCY`.
+
+        Yields:
+            Tuples of the index of the call and its parsed response, or the raised exception.
+        """
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be positive")
+
+        calls = list(calls)
+        if not calls:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(calls)), thread_name_prefix="checkbox") as executor:
+            futures = {
+                executor.submit(self.emit, call, storage=storage, request_timeout=request_timeout): index
+                for index, call in enumerate(calls)
+            }
+            try:
+                for future in as_completed(futures):
+                    try:
+                        yield futures[future], future.result()
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        yield futures[future], e
+            finally:
+                for future in futures:
+                    future.cancel()
 
     def refresh_info(self, storage: Optional[SessionStorage] = None):
         """
@@ -166,6 +439,9 @@ class CheckBoxClient(BaseSyncCheckBoxClient):  # pylint: disable=too-many-instan
             - If a `license_key` is present in the storage, information about the cash register is also updated.
             - The method makes API calls to fetch and update this information based on the provided storage.
         """
+        # The methods are only needed here, so they are not loaded when the client is imported
+        from checkbox_sdk.methods import cash_register, cashier  # pylint: disable=import-outside-toplevel
+
         storage = storage or self.storage
 
         self(cashier.GetMe(), storage=storage)
@@ -178,7 +454,7 @@ class CheckBoxClient(BaseSyncCheckBoxClient):  # pylint: disable=too-many-instan
         method: BaseMethod,
         expected_value: Set[Any],
         field: str = "status",
-        relax: float = DEFAULT_REQUESTS_RELAX,
+        relax: Relax = DEFAULT_REQUESTS_RELAX,
         timeout: Optional[float] = None,
         storage: Optional[SessionStorage] = None,
     ):
@@ -189,7 +465,9 @@ class CheckBoxClient(BaseSyncCheckBoxClient):  # pylint: disable=too-many-instan
             method: The method to call repeatedly to check the status.
             expected_value: A set of expected values for the specified field.
             field: The field in the result to monitor for changes. Defaults to "status".
-            relax: The amount of time (in seconds) to wait between checks. Defaults to `DEFAULT_REQUESTS_RELAX`.
+            relax: The amount of time (in seconds) to wait between checks, or a
+                   :class:`checkbox_sdk.client.polling.PollingStrategy` that adapts it. Defaults to
+                   `DEFAULT_REQUESTS_RELAX`.
             timeout: The maximum amount of time (in seconds) to wait for the status change. If `None`, waits
                      indefinitely.
             storage: Optional session storage to use for the method calls. If not provided, the default storage will be
@@ -207,15 +485,30 @@ class CheckBoxClient(BaseSyncCheckBoxClient):  # pylint: disable=too-many-instan
             - If the field's value does not match any of the expected values within the timeout period, a `ValueError`
               is raised.
             - The method logs the status of the wait operation and the time taken.
+            - With a ``webhook_dispatcher`` configured, the method is called again when a webhook event of the object
+              arrives instead of polling, until the fallback deadline of the dispatcher passes.
         """
         logger.info("Wait until %r will be changed to one of %s", field, expected_value)
+        polling = get_polling(relax)
+        delays = polling.delays()
+        polls = 1
         initial = time.monotonic()
+        watch = self._watch_status(method)
         # pylint: disable=duplicate-code
-        while (result := self(method, storage=storage))[field] not in expected_value:
-            if timeout is not None and time.monotonic() > initial + timeout:
-                logger.error("Status did not changed in required time")
-                break
-            time.sleep(relax)
-
-        self.handle_wait_status(result, field, expected_value, initial)
+        try:
+            while (result := self(method, storage=storage))[field] not in expected_value:
+                if timeout is not None and time.monotonic() > initial + timeout:
+                    logger.error("Status did not changed in required time")
+                    break
+                if watch is not None and watch.active:
+                    # The object is re-fetched when its webhook event arrives, polling is only a fallback
+                    watch.wait(None if timeout is None else initial + timeout - time.monotonic())
+                else:
+                    time.sleep(self._get_poll_delay(delays, initial, timeout))
+                polls += 1
+        finally:
+            if watch is not None:
+                watch.close()
+
+        self.handle_wait_status(result, field, expected_value, initial, polls, polling)
         return result
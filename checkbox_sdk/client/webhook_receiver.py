@@ -0,0 +1,492 @@
+import asyncio
+import concurrent.futures
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+from checkbox_sdk.exceptions import CheckBoxWebhookError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FALLBACK_AFTER = 30.0
+"""
+The default time, in seconds, a wait for a status relies on webhook events before it falls back to polling.
+"""
+
+DEFAULT_DEDUP_SIZE = 10000
+"""
+The default number of the latest delivery IDs remembered to drop repeated deliveries.
+"""
+
+DEFAULT_SIGNATURE_HEADER = "X-Signature"
+"""
+The default header carrying the HMAC-SHA256 signature of a webhook request body.
+"""
+
+_OBJECT_KEYS = ("data", "object", "receipt", "shift", "transaction")
+
+
+@dataclass(frozen=True)
+class WebhookEvent:
+    """
+    A webhook delivery received from the Checkbox API.
+
+    Attributes:
+        delivery_id: The ID of the delivery used to drop repeated deliveries.
+        type: The type of the event, if the payload declares one.
+        object_id: The ID of the object, e.g. a receipt or a shift, the event is about.
+        status: The status of the object, if the payload contains one.
+        payload: The whole decoded payload.
+    """
+
+    delivery_id: str
+    type: Optional[str]
+    object_id: Optional[str]
+    status: Optional[str]
+    payload: Dict[str, Any] = field(repr=False)
+
+
+def parse_event(body: bytes, headers: Mapping[str, str]) -> WebhookEvent:
+    """
+    Parses a webhook request into an event.
+
+    The object the event is about is taken from the ``data``, ``object``, ``receipt``, ``shift`` or ``transaction``
+    key of the payload, or is the payload itself. The delivery ID is taken from the ``X-Request-Id`` header or the
+    ``request_id`` key and falls back to a hash of the body, so the same payload delivered twice is dropped.
+
+    Args:
+        body: The raw request body.
+        headers: The request headers with lower-case names.
+
+    Returns:
+        The parsed event.
+
+    Raises:
+        CheckBoxWebhookError: If the body is not a JSON object.
+    """
+    try:
+        payload = json.loads(body)
+    except ValueError as e:
+        raise CheckBoxWebhookError(f"Webhook body is not valid JSON: {e}") from e
+    if not isinstance(payload, dict):
+        raise CheckBoxWebhookError("Webhook body is not a JSON object")
+
+    obj = next((payload[key] for key in _OBJECT_KEYS if isinstance(payload.get(key), dict)), payload)
+    delivery_id = headers.get("x-request-id") or payload.get("request_id") or hashlib.sha256(body).hexdigest()
+    event_type = payload.get("type") or payload.get("event") or payload.get("action")
+    return WebhookEvent(
+        delivery_id=str(delivery_id),
+        type=str(event_type) if event_type is not None else None,
+        object_id=str(obj["id"]) if obj.get("id") is not None else None,
+        status=obj.get("status"),
+        payload=payload,
+    )
+
+
+class StatusWatch:
+    """
+    Subscription of a wait for a status to the webhook events of one object.
+
+    Created by :meth:`WebhookDispatcher.watch`. Waiting returns as soon as an event of the object is delivered, so
+    the caller re-fetches the object once instead of polling it. After the fallback deadline, :attr:`active` is
+    `False` and the caller should poll as usual, e.g. when a delivery is lost.
+    """
+
+    # pylint: disable=protected-access
+
+    def __init__(self, dispatcher: "WebhookDispatcher", object_id: str, deadline: float):
+        self.dispatcher = dispatcher
+        self.object_id = object_id
+        self.deadline = deadline
+        self.events = 0
+        self._future = dispatcher._subscribe(object_id)
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether the fallback deadline has not passed yet.
+        """
+        return time.monotonic() < self.deadline
+
+    def _get_wait_timeout(self, timeout: Optional[float]) -> float:
+        remaining = self.deadline - time.monotonic()
+        return max(0.0, remaining if timeout is None else min(remaining, timeout))
+
+    def _renew(self) -> bool:
+        # A new subscription is made before the caller re-fetches the object, so no event can be missed
+        received = self._future.done()
+        if received:
+            self.events += 1
+        self.dispatcher._unsubscribe(self.object_id, self._future)
+        self._future = self.dispatcher._subscribe(self.object_id)
+        return received
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for the next event of the object, at most until the fallback deadline.
+
+        Args:
+            timeout: The maximum time, in seconds, to wait.
+
+        Returns:
+            Whether an event was delivered.
+        """
+        try:
+            self._future.result(self._get_wait_timeout(timeout))
+        except concurrent.futures.TimeoutError:
+            pass
+        return self._renew()
+
+    async def wait_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Asynchronously waits for the next event of the object, at most until the fallback deadline.
+
+        Args:
+            timeout: The maximum time, in seconds, to wait.
+
+        Returns:
+            Whether an event was delivered.
+        """
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(self._future)), self._get_wait_timeout(timeout)
+            )
+        except asyncio.TimeoutError:
+            pass
+        return self._renew()
+
+    def close(self) -> None:
+        """
+        Cancels the subscription.
+        """
+        self.dispatcher._unsubscribe(self.object_id, self._future)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class WebhookDispatcher:
+    """
+    Verifies, deduplicates and dispatches the webhook deliveries of the Checkbox API.
+
+    Pass the dispatcher as the ``webhook_dispatcher`` option of a client to let ``create_receipt``,
+    ``create_shift``, ``close_shift``, ``wait_transaction`` and every other wait for a status complete when the
+    event of the object arrives instead of polling it. Each event costs a single request that re-fetches the object.
+    If no event completes the wait within ``fallback_after`` seconds, the wait falls back to polling.
+
+    Deliveries reach the dispatcher through :class:`WebhookServer`, :class:`WebhookASGIApp` or :meth:`handle` called
+    from any web framework.
+
+    Args:
+        secret: Optional key the request bodies are signed with using HMAC-SHA256. Unsigned deliveries or deliveries
+                with a wrong signature are rejected. When `None`, signatures are not checked.
+        signature_header: The header carrying the hex signature, optionally prefixed with ``sha256=``. Defaults to
+                          `DEFAULT_SIGNATURE_HEADER`.
+        fallback_after: The time, in seconds, a wait relies on webhook events before it falls back to polling.
+                        Defaults to `DEFAULT_FALLBACK_AFTER`.
+        dedup_size: The number of the latest delivery IDs remembered to drop repeated deliveries. Defaults to
+                    `DEFAULT_DEDUP_SIZE`.
+        parser: The function that turns a request body and its headers into a :class:`WebhookEvent`. Defaults to
+                :func:`parse_event`.
+
+    Example:
+        .. code-block:: python
+
+            dispatcher = WebhookDispatcher(secret=webhook_secret)
+            with WebhookServer(dispatcher, port=8080), CheckBoxClient(webhook_dispatcher=dispatcher) as client:
+                client.webhook.set_webhook("https://example.com:8080/")
+                client.cashier.authenticate_token(auth_token, license_key=license_key)
+                receipt = client.receipts.create_receipt(receipt=payload)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        secret: Optional[Union[str, bytes]] = None,
+        signature_header: str = DEFAULT_SIGNATURE_HEADER,
+        fallback_after: float = DEFAULT_FALLBACK_AFTER,
+        dedup_size: int = DEFAULT_DEDUP_SIZE,
+        parser: Callable[[bytes, Mapping[str, str]], WebhookEvent] = parse_event,
+    ):
+        self.secret = secret.encode() if isinstance(secret, str) else secret
+        self.signature_header = signature_header.lower()
+        self.fallback_after = fallback_after
+        self.dedup_size = dedup_size
+        self.parser = parser
+        self.received = 0
+        self.duplicates = 0
+        self._handlers: List[Tuple[Optional[str], Callable[[WebhookEvent], Any]]] = []
+        self._subscribers: Dict[str, List[concurrent.futures.Future]] = {}
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def verify(self, body: bytes, headers: Mapping[str, str]) -> None:
+        """
+        Checks the signature of a delivery.
+
+        Args:
+            body: The raw request body.
+            headers: The request headers with lower-case names.
+
+        Raises:
+            CheckBoxWebhookError: If the signature is missing or wrong.
+        """
+        if self.secret is None:
+            return
+        signature = headers.get(self.signature_header, "")
+        if signature.startswith("sha256="):
+            signature = signature.split("=", 1)[1]
+        expected = hmac.new(self.secret, body, hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(signature.lower(), expected):
+            raise CheckBoxWebhookError("Webhook signature is missing or invalid")
+
+    def on(self, handler: Callable[[WebhookEvent], Any], event_type: Optional[str] = None) -> None:
+        """
+        Registers a handler called with every new event.
+
+        Handlers run in the thread or task that delivers the event and should return quickly. Exceptions raised by a
+        handler are logged and do not affect the delivery.
+
+        Args:
+            handler: The function called with the event.
+            event_type: Optional event type the handler is limited to.
+        """
+        self._handlers.append((event_type, handler))
+
+    def watch(self, object_id: str) -> StatusWatch:
+        """
+        Subscribes to the events of an object until the fallback deadline.
+
+        Args:
+            object_id: The ID of the object, e.g. a receipt.
+
+        Returns:
+            The subscription. Close it when the wait is over.
+        """
+        return StatusWatch(self, str(object_id), time.monotonic() + self.fallback_after)
+
+    def dispatch(self, event: WebhookEvent) -> bool:
+        """
+        Dispatches an event to the handlers and wakes up the waits for its object.
+
+        Args:
+            event: The event.
+
+        Returns:
+            `False` if the event is a repeated delivery and was dropped, otherwise `True`.
+        """
+        with self._lock:
+            if event.delivery_id in self._seen:
+                self.duplicates += 1
+                return False
+            self._seen[event.delivery_id] = None
+            if len(self._seen) > self.dedup_size:
+                self._seen.popitem(last=False)
+            self.received += 1
+            subscribers = self._subscribers.pop(event.object_id, []) if event.object_id else []
+
+        logger.debug("Received webhook event %s", event)
+        for subscriber in subscribers:
+            try:
+                subscriber.set_result(event)
+            except concurrent.futures.InvalidStateError:
+                pass
+
+        for event_type, handler in list(self._handlers):
+            if event_type is None or event_type == event.type:
+                try:
+                    handler(event)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("Webhook handler %r failed", handler)
+        return True
+
+    def handle(self, body: bytes, headers: Mapping[str, str]) -> int:
+        """
+        Verifies, parses and dispatches a webhook request.
+
+        Args:
+            body: The raw request body.
+            headers: The request headers.
+
+        Returns:
+            The HTTP status code to respond with: 200 for accepted and repeated deliveries, 401 for a wrong signature
+            and 400 for a malformed body.
+        """
+        headers = {key.lower(): value for key, value in headers.items()}
+        try:
+            self.verify(body, headers)
+        except CheckBoxWebhookError as e:
+            logger.warning("Rejected webhook delivery: %s", e)
+            return 401
+        try:
+            event = self.parser(body, headers)
+        except CheckBoxWebhookError as e:
+            logger.warning("Rejected webhook delivery: %s", e)
+            return 400
+        self.dispatch(event)
+        return 200
+
+    def _subscribe(self, object_id: str) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            self._subscribers.setdefault(object_id, []).append(future)
+        return future
+
+    def _unsubscribe(self, object_id: str, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(object_id)
+            if subscribers and future in subscribers:
+                subscribers.remove(future)
+                if not subscribers:
+                    del self._subscribers[object_id]
+
+
+class _WebhookRequestHandler(BaseHTTPRequestHandler):
+    server: "_WebhookHTTPServer"
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        if self.server.path is not None and self.path.split("?", 1)[0] != self.server.path:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        status = self.server.dispatcher.handle(body, dict(self.headers.items()))
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        logger.debug("Webhook server: " + format, *args)
+
+
+class _WebhookHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], dispatcher: WebhookDispatcher, path: Optional[str]):
+        super().__init__(address, _WebhookRequestHandler)
+        self.dispatcher = dispatcher
+        self.path = path
+
+
+class WebhookServer:
+    """
+    Standalone HTTP server receiving webhook deliveries, built on the standard library.
+
+    The server handles requests in a background thread, so it serves both synchronous and asynchronous clients in
+    the same process. Run it behind a TLS-terminating proxy, as the Checkbox API delivers webhooks over HTTPS.
+
+    Args:
+        dispatcher: The dispatcher the deliveries are passed to.
+        host: The address to listen on. Defaults to ``"127.0.0.1"``.
+        port: The port to listen on. ``0`` picks a free port. Defaults to ``0``.
+        path: Optional path deliveries are accepted on. Other paths are answered with 404. Defaults to any path.
+
+    Example:
+        .. code-block:: python
+
+            with WebhookServer(dispatcher, host="0.0.0.0", port=8080) as server:
+                print(server.url)
+    """
+
+    def __init__(
+        self,
+        dispatcher: WebhookDispatcher,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: Optional[str] = None,
+    ):
+        self.dispatcher = dispatcher
+        self._server = _WebhookHTTPServer((host, port), dispatcher, path)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """
+        The URL the server listens on.
+        """
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}{self._server.path or '/'}"  # noqa: E231
+
+    def start(self) -> "WebhookServer":
+        """
+        Starts serving in a background thread.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="checkbox-webhook-server", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """
+        Stops the server and closes its socket.
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class WebhookASGIApp:
+    """
+    ASGI application receiving webhook deliveries.
+
+    Mount it in an existing ASGI server or framework, e.g. ``uvicorn`` or Starlette, to receive deliveries in the
+    event loop of an asynchronous client.
+
+    Args:
+        dispatcher: The dispatcher the deliveries are passed to.
+        path: Optional path deliveries are accepted on. Other paths are answered with 404. Defaults to any path.
+
+    Example:
+        .. code-block:: python
+
+            dispatcher = WebhookDispatcher(secret=webhook_secret)
+            app = WebhookASGIApp(dispatcher)
+            client = AsyncCheckBoxClient(webhook_dispatcher=dispatcher)
+    """
+
+    def __init__(self, dispatcher: WebhookDispatcher, path: Optional[str] = None):
+        self.dispatcher = dispatcher
+        self.path = path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+
+        if self.path is not None and scope["path"] != self.path:
+            status = 404
+        elif scope["method"] != "POST":
+            status = 405
+        else:
+            chunks = []
+            more_body = True
+            while more_body:
+                message = await receive()
+                chunks.append(message.get("body", b""))
+                more_body = message.get("more_body", False)
+            headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+            status = self.dispatcher.handle(b"".join(chunks), headers)
+
+        await send({"type": "http.response.start", "status": status, "headers": [(b"content-length", b"0")]})
+        await send({"type": "http.response.body", "body": b""})
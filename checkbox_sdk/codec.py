@@ -0,0 +1,178 @@
+"""
+checkbox_sdk.codec
+==================
+
+This module defines JSON codecs used to encode request payloads and decode API responses.
+
+The standard library :mod:`json` module is used by default. Faster third-party libraries, `orjson` and `ujson`, are
+supported when they are installed and can be selected per client with the `codec` argument.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Type, Union
+
+from httpx import Response
+
+
+class JSONCodec(ABC):
+    """
+    Abstract JSON codec.
+
+    Attributes:
+        name: The name under which the codec can be selected.
+    """
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Serializes an object to JSON.
+
+        Args:
+            obj: The object to serialize.
+
+        Returns:
+            The UTF-8 encoded JSON document.
+        """
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Deserializes a JSON document.
+
+        Args:
+            data: The JSON document.
+
+        Returns:
+            The deserialized object.
+        """
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    Codec based on the standard library :mod:`json` module.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Codec based on the `orjson` library.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    Codec based on the `ujson` library.
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson  # type: ignore[import-untyped]  # pylint: disable=import-outside-toplevel
+
+        self._ujson = ujson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {codec.name: codec for codec in (StdlibJSONCodec, OrjsonCodec, UjsonCodec)}
+"""
+Known codecs by name.
+"""
+
+DEFAULT_CODEC = StdlibJSONCodec()
+
+_current_codec: ContextVar[JSONCodec] = ContextVar("checkbox_sdk_codec", default=DEFAULT_CODEC)
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """
+    Resolves a codec.
+
+    Args:
+        codec: A codec instance, a codec name (``"json"``, ``"orjson"``, ``"ujson"``) or ``"auto"`` to pick the fastest
+               installed library. `None` returns the default standard library codec.
+
+    Returns:
+        The codec instance.
+
+    Raises:
+        ValueError: If the codec name is unknown.
+        ImportError: If the library of the requested codec is not installed.
+    """
+    if codec is None:
+        return DEFAULT_CODEC
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        for name in ("orjson", "ujson"):
+            try:
+                return CODECS[name]()
+            except ImportError:
+                continue
+        return DEFAULT_CODEC
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec {codec!r}, expected one of {sorted(CODECS)} or 'auto'")
+    return CODECS[codec]()
+
+
+@contextmanager
+def use_codec(codec: JSONCodec) -> Iterator[JSONCodec]:
+    """
+    Makes the codec current for the code executed inside the context.
+
+    The clients use it while parsing responses, so :func:`decode_response` follows the codec of the client.
+
+    Args:
+        codec: The codec to use.
+
+    Yields:
+        The codec.
+    """
+    token = _current_codec.set(codec)
+    try:
+        yield codec
+    finally:
+        _current_codec.reset(token)
+
+
+def decode_response(response: Response) -> Any:
+    """
+    Decodes the JSON body of the response with the current codec.
+
+    Args:
+        response: The response to decode.
+
+    Returns:
+        The deserialized body.
+    """
+    return _current_codec.get().loads(response.content)
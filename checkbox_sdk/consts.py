@@ -11,6 +11,11 @@ Constants:
 - **API_VERSION**: The version of the Checkbox API to use.
 - **DEFAULT_REQUEST_TIMEOUT**: The default timeout for API requests, in seconds.
 - **DEFAULT_REQUESTS_RELAX**: The default delay between API requests, in seconds.
+- **DEFAULT_MAX_CONNECTIONS**: The default maximum number of concurrent connections in the HTTP connection pool.
+- **DEFAULT_MAX_KEEPALIVE_CONNECTIONS**: The default maximum number of idle keep-alive connections in the pool.
+- **DEFAULT_KEEPALIVE_EXPIRY**: The default time after which an idle keep-alive connection is closed, in seconds.
+- **DEFAULT_CHUNK_SIZE**: The default size of the chunks streamed downloads are read in, in bytes.
+- **DEFAULT_BATCH_CONCURRENCY**: The default maximum number of requests of a batch sent at the same time.
 """
 
 BASE_API_URL = "https://api.checkbox.in.ua"
@@ -43,3 +48,39 @@ The default delay between API requests.
 This value sets the default amount of time (in seconds) to wait between consecutive API requests to avoid
  overloading the server or hitting rate limits.
 """
+
+DEFAULT_MAX_CONNECTIONS = 100
+"""
+The default maximum number of concurrent connections in the HTTP connection pool.
+
+Requests that exceed this limit wait for a free connection instead of opening a new one.
+"""
+
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+"""
+The default maximum number of idle keep-alive connections in the HTTP connection pool.
+
+Keeping connections alive allows consecutive requests to reuse them and avoid repeated TLS handshakes.
+"""
+
+DEFAULT_KEEPALIVE_EXPIRY = 5.0  # seconds
+"""
+The default time after which an idle keep-alive connection is closed.
+
+This value sets the amount of time (in seconds) an idle connection stays in the pool before it is dropped.
+"""
+
+DEFAULT_CHUNK_SIZE = 64 * 1024  # bytes
+"""
+The default size of the chunks streamed downloads are read in.
+
+This value sets the amount of data (in bytes) held in memory at once while a file is downloaded from the API.
+"""
+
+DEFAULT_BATCH_CONCURRENCY = 10
+"""
+The default maximum number of requests of a batch sent at the same time.
+
+This value bounds how many calls of :meth:`emit_many` are in flight at once, so a large batch neither exhausts the
+connection pool nor trips the API rate limits.
+"""
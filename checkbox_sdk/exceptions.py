@@ -46,3 +46,21 @@ class CheckBoxAPIValidationError(CheckBoxAPIError):
 
 class StatusException(CheckBoxError):
     pass
+
+
+class CheckBoxCircuitOpenError(CheckBoxError):
+    def __init__(self, key: str, retry_after: float):
+        super().__init__(key, retry_after)
+        self.key = key
+        self.retry_after = retry_after
+
+    def __str__(self):
+        return f"Circuit for {self.key} is open, requests are rejected for {self.retry_after:.3f} seconds"
+
+
+class CheckBoxWebhookError(CheckBoxError):
+    pass
+
+
+class CheckBoxOfflineCodesError(CheckBoxError):
+    pass
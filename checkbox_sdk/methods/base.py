@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 
 from httpx import Response
 
+from checkbox_sdk.codec import decode_response
 from checkbox_sdk.storage.simple import SessionStorage
 
 logger = logging.getLogger(__name__)
@@ -43,12 +44,22 @@ class AbstractMethod(ABC):
         method: The HTTP method used for the API request. Defaults to `HTTPMethod.GET`.
         internal: A boolean flag indicating whether the URI follows a non-standard convention,
                   typically used for internal APIs. Defaults to `False`.
+        retryable: Whether the request may be repeated by a retry policy. `None` lets the policy decide based on
+                   the HTTP method. Defaults to `None`.
+        cache_ttl: The time, in seconds, a response may be served from the client's response cache. `None` means the
+                   response is never cached. Defaults to `None`.
+        status_object_id: The ID of the object whose status the method returns, e.g. a receipt. Lets webhook events
+                          of the object complete a wait for its status. `None` if the method does not return a
+                          single object with a status. Defaults to `None`.
     """
 
     method: HTTPMethod = HTTPMethod.GET
     # Some APIs do not follow regular convention: base_url/api/api_version/uri.
     # For example, /_internal/orders/{order_id}
     internal: bool = False
+    retryable: Optional[bool] = None
+    cache_ttl: Optional[float] = None
+    status_object_id: Optional[str] = None
 
     @property
     @abstractmethod
@@ -190,7 +201,7 @@ class BaseMethod(AbstractMethod, ABC):
         Returns:
             dict: The parsed JSON response with the server date added, if applicable.
         """
-        result = response.json()
+        result = decode_response(response)
         if isinstance(result, dict):
             result["@date"] = self._parse_server_date(response=response)
         return result
@@ -212,7 +223,7 @@ class BaseMethod(AbstractMethod, ABC):
             return datetime.strptime(response.headers.get("Date", None), "%a, %d %b %Y %H:%M:%S GMT").replace(
                 tzinfo=timezone.utc
             )
-        except ValueError:
+        except (TypeError, ValueError):
             logger.info("Unable to parse server date")
             return None
 
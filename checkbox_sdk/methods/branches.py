@@ -10,9 +10,11 @@ class GetAllBranches(PaginationMixin, BaseMethod):
 
     Attributes:
         uri (str): The API endpoint for retrieving branches, set to "branches".
+        cache_ttl (int): The time, in seconds, the list of branches may be served from the response cache.
     """
 
     uri = "branches"
+    cache_ttl = 300
 
     def __init__(
         self,
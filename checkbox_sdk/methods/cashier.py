@@ -1,5 +1,6 @@
 from httpx import Response
 
+from checkbox_sdk.codec import decode_response
 from checkbox_sdk.methods.base import BaseMethod, HTTPMethod
 from checkbox_sdk.storage.simple import SessionStorage
 
@@ -10,7 +11,7 @@ class _SignInMixin:  # pylint: disable=too-few-public-methods
     method = HTTPMethod.POST
 
     def parse_response(self, storage: SessionStorage, response: Response):
-        result = response.json()
+        result = decode_response(response)
         storage.token = result["access_token"]
         return result
 
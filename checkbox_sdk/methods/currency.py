@@ -7,6 +7,7 @@ URI_PREFIX = "currency/"
 
 class GetCurrencyRates(BaseMethod):
     uri = f"{URI_PREFIX}rate"
+    cache_ttl = 60
 
     def __init__(
         self,
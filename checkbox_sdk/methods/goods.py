@@ -3,8 +3,10 @@ from uuid import UUID
 
 from httpx import Response
 
+from checkbox_sdk.codec import decode_response
 from checkbox_sdk.methods.base import BaseMethod, PaginationMixin, HTTPMethod
 from checkbox_sdk.storage.simple import SessionStorage
+from checkbox_sdk.upload import MultipartUpload, UploadSource
 
 URI_PREFIX = "goods/"
 
@@ -154,7 +156,7 @@ class ExportGoodsFile(BaseMethod):
 
     def parse_response(self, storage: SessionStorage, response: Response):
         if self.export_extension == "json":
-            return response.json()
+            return decode_response(response)
 
         if self.export_extension == "csv":
             return response.content.decode()
@@ -169,14 +171,18 @@ class ImportGoodsFromFile(BaseMethod):
     def __init__(
         self,
         *args,
-        file: str,
+        file: UploadSource,
         ignore_barcode_duplicates: Optional[bool] = False,
         auto_supply: Optional[bool] = False,
+        filename: Optional[str] = None,
+        gzip: bool = False,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
 
         self.file = file
+        self.filename = filename
+        self.gzip = gzip
         self.ignore_barcode_duplicates = ignore_barcode_duplicates
         self.auto_supply = auto_supply
 
@@ -194,7 +200,7 @@ class ImportGoodsFromFile(BaseMethod):
 
     @property
     def files(self):
-        return {"file": open(self.file, "rb")}
+        return MultipartUpload(self.file, filename=self.filename, gzip=self.gzip)
 
 
 class ImportGoodsTaskStatus(BaseMethod):
@@ -9,6 +9,7 @@ URI_PREFIX = "invoices/"
 
 class GetTerminals(BaseMethod):
     uri = "terminals"
+    cache_ttl = 300
 
 
 class GetInvoices(PaginationMixin, BaseMethod):
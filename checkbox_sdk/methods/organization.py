@@ -8,10 +8,12 @@ URI_PREFIX = "organization/"
 
 class GetOrganizationReceiptConfig(BaseMethod):
     uri = f"{URI_PREFIX}receipt-config"
+    cache_ttl = 3600
 
 
 class GetOrganizationLogo(BaseMethod):
     uri = f"{URI_PREFIX}logo.png"
+    cache_ttl = 3600
 
     def parse_response(self, storage: SessionStorage, response: Response):
         return response.content
@@ -19,6 +21,7 @@ class GetOrganizationLogo(BaseMethod):
 
 class GetOrganizationTextLogo(BaseMethod):
     uri = f"{URI_PREFIX}text_logo.png"
+    cache_ttl = 3600
 
     def parse_response(self, storage: SessionStorage, response: Response):
         return response.content
@@ -1,6 +1,6 @@
 import datetime
 from typing import Dict, Optional, List, Union
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from httpx import Response
 
@@ -123,6 +123,10 @@ class GetReceipt(BaseMethod):
     def __init__(self, receipt_id: Union[str, UUID]):
         self.receipt_id = receipt_id
 
+    @property
+    def status_object_id(self) -> str:  # type: ignore[override]
+        return str(self.receipt_id)
+
     @property
     def uri(self) -> str:
         receipt_id_str = str(self.receipt_id) if isinstance(self.receipt_id, UUID) else self.receipt_id
@@ -162,11 +166,25 @@ class CreateReceipt(BaseMethod):
             raise ValueError("'receipt' and '**payload' can not be passed together")
         self.receipt = receipt or payload
 
+    def ensure_id(self) -> str:
+        """
+        Assigns a client-generated UUID to the receipt unless it already has an ID.
+
+        Sending the ID with the request makes the creation idempotent: the receipt can be looked up by this ID if
+        the response is lost. The ID is set on the receipt dictionary passed to the method, so the caller sees it too.
+
+        Returns:
+            The ID of the receipt.
+        """
+        if not self.receipt.get("id"):
+            self.receipt["id"] = str(uuid4())
+        return str(self.receipt["id"])
+
     @property
     def headers(self):
         headers = super().headers
         if "id" in self.receipt:
-            headers.update({"x-request-id": self.receipt["id"]})
+            headers.update({"x-request-id": str(self.receipt["id"])})
         return headers
 
     @property
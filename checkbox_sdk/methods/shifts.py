@@ -72,6 +72,10 @@ class GetShift(BaseMethod):
     def __init__(self, shift_id: str):
         self.shift_id = shift_id
 
+    @property
+    def status_object_id(self) -> str:  # type: ignore[override]
+        return str(self.shift_id)
+
     @property
     def uri(self) -> str:
         return f"shifts/{self.shift_id}"
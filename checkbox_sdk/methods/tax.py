@@ -3,3 +3,4 @@ from checkbox_sdk.methods.base import BaseMethod
 
 class GetTax(BaseMethod):
     uri = "tax"
+    cache_ttl = 3600
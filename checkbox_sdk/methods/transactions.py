@@ -37,6 +37,10 @@ class GetTransaction(BaseMethod):
     def __init__(self, transaction_id: str):
         self.transaction_id = transaction_id
 
+    @property
+    def status_object_id(self) -> str:  # type: ignore[override]
+        return str(self.transaction_id)
+
     @property
     def uri(self) -> str:
         return f"{URI_PREFIX}{self.transaction_id}"
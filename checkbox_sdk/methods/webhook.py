@@ -3,6 +3,7 @@ from checkbox_sdk.methods.base import BaseMethod, HTTPMethod
 
 class GetWebhookInfo(BaseMethod):
     uri = "webhook"
+    cache_ttl = 300
 
 
 class SetWebhook(BaseMethod):
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Union
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple, Union
 
-import jwt
+# Changing any of these fields changes the authentication headers
+_HEADER_FIELDS = frozenset({"token", "license_key", "machine_id"})
 
 
 @dataclass
@@ -13,6 +14,8 @@ class SessionStorage:
     and machine ID. It also manages the headers required for authentication and provides decoded
     token data.
 
+    The authentication headers are built once and cached until the token, license key or machine ID changes.
+
     Attributes:
         token (Optional[str]): The authentication token used for API requests.
         license_key (Optional[str]): The license key associated with the session.
@@ -28,18 +31,59 @@ class SessionStorage:
     cashier: Optional[Dict[str, Any]] = None
     cash_register: Optional[Dict[str, Any]] = None
     shift: Optional[Dict[str, Any]] = None
+    _headers: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    _merged_headers: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _HEADER_FIELDS:
+            super().__setattr__("_headers", None)
+            super().__setattr__("_merged_headers", None)
 
     @property
-    def headers(self):
-        headers = {}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        if self.license_key:
-            headers["X-License-Key"] = self.license_key
-        if self.machine_id:
-            headers["X-Device-ID"] = self.machine_id  # pragma: no cover
-        return headers
+    def headers(self) -> Dict[str, str]:
+        """
+        Returns the authentication headers of the session.
+
+        The returned dictionary is cached and shared, it must not be modified.
+
+        Returns:
+            A dictionary with the authorization, license key and device ID headers that are set.
+        """
+        if self._headers is None:
+            headers = {}
+            if self.token:
+                headers["Authorization"] = f"Bearer {self.token}"
+            if self.license_key:
+                headers["X-License-Key"] = self.license_key
+            if self.machine_id:
+                headers["X-Device-ID"] = self.machine_id  # pragma: no cover
+            self._headers = headers
+        return self._headers
+
+    def merge_headers(self, extra: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the authentication headers merged with extra headers, which take precedence.
+
+        The result is cached for the given ``extra`` dictionary object, so the clients can pass their own cached
+        headers without merging them on every request. The returned dictionary must not be modified.
+
+        Args:
+            extra: The headers to merge, usually the client headers.
+
+        Returns:
+            The merged headers.
+        """
+        merged = self._merged_headers
+        if merged is None or merged[0] is not extra:
+            merged = (extra, {**self.headers, **extra})
+            self._merged_headers = merged
+        return merged[1]
 
     @property
     def token_data(self) -> Union[Dict[str, Any], None]:
+        import jwt  # pylint: disable=import-outside-toplevel
+
         return jwt.decode(self.token, options={"verify_signature": False}) if self.token else None
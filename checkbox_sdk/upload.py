@@ -0,0 +1,192 @@
+"""
+checkbox_sdk.upload
+===================
+
+This module defines streamed multipart uploads used to send files to the Checkbox API.
+
+A file is read and sent in chunks, so large files never sit fully in memory, and it can be given as a path, a binary
+file-like object, bytes or a (sync or async) iterator of bytes. The body can optionally be compressed with gzip on
+the fly.
+"""
+
+import mimetypes
+import os
+import zlib
+from typing import IO, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Optional, Union, cast
+from uuid import uuid4
+
+from checkbox_sdk.consts import DEFAULT_CHUNK_SIZE
+
+UploadSource = Union[str, os.PathLike, IO[bytes], bytes, Iterable[bytes], AsyncIterable[bytes]]
+"""
+Source of an uploaded file: a file path, a binary file-like object, bytes or a sync or async iterator of bytes.
+"""
+
+
+class MultipartUpload:
+    """
+    A ``multipart/form-data`` request body with a single file field that is streamed in chunks.
+
+    The file is only opened while the body is being sent and is closed afterwards, even if the request fails. A
+    file-like object is left open and its position is restored after every attempt, so a path or a seekable file can
+    be sent again when the request is retried. Iterators can be consumed only once.
+
+    Attributes:
+        source: The file to upload.
+        field: The name of the form field. Defaults to ``"file"``.
+        filename: The name of the file sent to the API. Derived from the source if not given.
+        content_type: The content type of the file. Guessed from the file name if not given.
+        gzip: Whether to compress the whole body with gzip. Only use it if the server accepts
+              ``Content-Encoding: gzip`` requests.
+        chunk_size: The size of the chunks the file is read in, in bytes. Defaults to `DEFAULT_CHUNK_SIZE`.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        source: UploadSource,
+        field: str = "file",
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        gzip: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.source = source
+        self.field = field
+        self.filename = filename or self._get_filename(source)
+        self.content_type = content_type or mimetypes.guess_type(self.filename)[0] or "application/octet-stream"
+        self.gzip = gzip
+        self.chunk_size = chunk_size
+        self.boundary = uuid4().hex
+
+    @staticmethod
+    def _get_filename(source: UploadSource) -> str:
+        name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", None)
+        if isinstance(name, (str, os.PathLike)):
+            return os.path.basename(os.fspath(name))
+        return "upload"
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """
+        Returns the headers describing the body.
+
+        The ``Content-Length`` header is included when the size of the file is known in advance, otherwise the body
+        is sent with chunked transfer encoding.
+        """
+        headers = {"Content-Type": f"multipart/form-data; boundary={self.boundary}"}
+        if self.gzip:
+            headers["Content-Encoding"] = "gzip"
+        elif (length := self.content_length) is not None:
+            headers["Content-Length"] = str(length)
+        return headers
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """
+        Returns the size of the uncompressed body in bytes, or `None` if the size of the file is unknown.
+        """
+        if (size := self._get_file_size()) is None:
+            return None
+        return len(self._head) + size + len(self._tail)
+
+    def _get_file_size(self) -> Optional[int]:
+        if isinstance(self.source, (bytes, bytearray, memoryview)):
+            return len(self.source)
+        if isinstance(self.source, (str, os.PathLike)):
+            return os.path.getsize(self.source)
+        if hasattr(self.source, "seek") and getattr(self.source, "seekable", lambda: False)():
+            file = cast(IO[bytes], self.source)
+            position = file.tell()
+            try:
+                return file.seek(0, os.SEEK_END) - position
+            finally:
+                file.seek(position)
+        return None
+
+    @property
+    def _head(self) -> bytes:
+        filename = self.filename.replace('"', "%22")
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{self.field}"; filename="{filename}"\r\n'
+            f"Content-Type: {self.content_type}\r\n\r\n"
+        ).encode()
+
+    @property
+    def _tail(self) -> bytes:
+        return f"\r\n--{self.boundary}--\r\n".encode()
+
+    def _iter_file(self) -> Iterator[bytes]:
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source)
+            for offset in range(0, len(view), self.chunk_size):
+                end = offset + self.chunk_size
+                yield bytes(view[offset:end])
+        elif isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as file:
+                yield from iter(lambda: file.read(self.chunk_size), b"")
+        elif hasattr(source, "read"):
+            stream = cast(IO[bytes], source)
+            position = stream.tell() if getattr(stream, "seekable", lambda: False)() else None
+            try:
+                yield from iter(lambda: stream.read(self.chunk_size), b"")
+            finally:
+                if position is not None:
+                    stream.seek(position)
+        elif isinstance(source, Iterable):
+            yield from source
+        else:
+            raise TypeError("Async iterators can only be uploaded with the asynchronous client")
+
+    def _compress(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        if not self.gzip:
+            yield from chunks
+            return
+
+        compressor = zlib.compressobj(wbits=31)
+        for chunk in chunks:
+            if compressed := compressor.compress(chunk):
+                yield compressed
+        yield compressor.flush()
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        """
+        Iterates over the body in chunks.
+
+        Yields:
+            The chunks of the body.
+
+        Raises:
+            TypeError: If the source is an async iterator.
+        """
+
+        def chunks():
+            yield self._head
+            yield from self._iter_file()
+            yield self._tail
+
+        yield from self._compress(chunks())
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        """
+        Asynchronously iterates over the body in chunks.
+
+        Files and file-like objects are read synchronously, async iterators are awaited.
+
+        Yields:
+            The chunks of the body.
+        """
+        if not isinstance(self.source, AsyncIterable):
+            for chunk in self.iter_bytes():
+                yield chunk
+            return
+
+        compressor = zlib.compressobj(wbits=31) if self.gzip else None
+        yield compressor.compress(self._head) if compressor else self._head
+        async for chunk in self.source:
+            if compressor:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+        yield compressor.compress(self._tail) + compressor.flush() if compressor else self._tail
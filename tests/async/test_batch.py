@@ -0,0 +1,40 @@
+# pylint: disable=duplicate-code
+import asyncio
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.exceptions import CheckBoxAPIError
+from checkbox_sdk.methods import receipts
+
+RECEIPTS = 20
+
+
+@pytest.mark.asyncio
+async def test_emit_many_and_as_completed():
+    in_flight = []
+    peak = []
+
+    async def handler(request):
+        receipt_id = request.url.path.rsplit("/", 1)[-1]
+        in_flight.append(receipt_id)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.002 * (RECEIPTS - int(receipt_id)))
+        in_flight.remove(receipt_id)
+        if receipt_id == "13":
+            return httpx.Response(404, json={"message": "Not found"})
+        return httpx.Response(200, json={"id": receipt_id})
+
+    calls = [receipts.GetReceipt(receipt_id=str(index)) for index in range(RECEIPTS)]
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        results = await client.emit_many(calls, concurrency=4)
+        completed = [item async for item in client.emit_as_completed(calls)]
+
+    assert [result["id"] for index, result in enumerate(results) if index != 13] == [
+        str(index) for index in range(RECEIPTS) if index != 13
+    ]
+    assert isinstance(results[13], CheckBoxAPIError)
+    assert max(peak[:RECEIPTS]) == 4
+    assert sorted(index for index, _ in completed) == list(range(RECEIPTS))
+    assert [index for index, _ in completed] != list(range(RECEIPTS))
@@ -0,0 +1,43 @@
+# pylint: disable=duplicate-code
+import json
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.bulk import AsyncBulkReceiptSubmitter
+from checkbox_sdk.client.receipt_poller import AsyncReceiptStatusPoller
+
+
+@pytest.mark.asyncio
+async def test_submit_and_wait():
+    created = {}
+    chunks = []
+    lost = {"receipt-3"}
+
+    def handler(request):
+        if request.url.path.endswith("bulk-sell"):
+            sent = json.loads(request.content)["receipts"]
+            chunks.append(len(sent))
+            for receipt in sent:
+                created[receipt["id"]] = {"id": receipt["id"], "status": "CREATED", "name": receipt["name"]}
+            if lost & {receipt["name"] for receipt in sent}:
+                lost.clear()
+                return httpx.Response(500, text="Internal error")
+            return httpx.Response(200, json={"results": [created[receipt["id"]] for receipt in sent]})
+
+        receipt_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={**created[receipt_id], "status": "DONE"})
+
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        submitter = AsyncBulkReceiptSubmitter(
+            client, max_receipts=3, relax=0, poller=AsyncReceiptStatusPoller(client, interval=0.01)
+        )
+        receipts = [{"name": f"receipt-{index}"} for index in range(7)]
+        results = await submitter.submit(receipts, wait=True, timeout=10)
+
+    assert chunks == [3, 3, 1]
+    assert [result.result["name"] for result in results] == [receipt["name"] for receipt in receipts]
+    assert all(result.ok and result.result["status"] == "DONE" for result in results)
+    # The input receipts are not modified
+    assert "id" not in receipts[0]
@@ -0,0 +1,25 @@
+# pylint: disable=duplicate-code
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.cache import ResponseCache
+from checkbox_sdk.methods import organization
+
+
+@pytest.mark.asyncio
+async def test_cache_hit():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=b"PNG")
+
+    cache = ResponseCache()
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler), response_cache=cache) as client:
+        assert await client(organization.GetOrganizationLogo()) == b"PNG"
+        assert await client(organization.GetOrganizationLogo()) == b"PNG"
+        cache.invalidate(organization.GetOrganizationLogo())
+        assert await client(organization.GetOrganizationLogo()) == b"PNG"
+
+    assert len(requests) == 2
@@ -0,0 +1,65 @@
+# pylint: disable=duplicate-code
+import asyncio
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.catalog import AsyncGoodsCatalog, CatalogChanges
+
+from ..fake_api import FakeApi
+
+
+def good(index, price=1000):
+    return {
+        "id": f"good-{index}",
+        "code": f"CODE-{index}",
+        "barcode": f"48200000{index:05d}",
+        "uktzed": "2202",
+        "group": {"id": "group", "name": "Group"},
+        "price": price,
+    }
+
+
+@pytest.mark.asyncio
+async def test_catalog():
+    api = FakeApi([good(index) for index in range(25)])
+
+    async with AsyncCheckBoxClient(transport=api.transport) as client:
+        async with AsyncGoodsCatalog(client, interval=0.01, page_size=10) as catalog:
+            assert len(catalog) == 25
+            assert catalog.by_barcode("4820000000007")["code"] == "CODE-7"
+
+            api.records[7] = good(7, price=2000)
+            del api.records[0]
+            while catalog.by_code("CODE-0") is not None:
+                await asyncio.sleep(0.01)
+
+        assert catalog.by_barcode("4820000000007")["price"] == 2000
+        assert len(catalog.by_group("group")) == 24
+        assert await catalog.refresh() == CatalogChanges()
+
+
+@pytest.mark.asyncio
+async def test_scheduled_refresh_survives_errors():
+    class FlakyApi(FakeApi):
+        failures = 0
+
+        def respond(self, request):
+            if not self.failures:
+                return super().respond(request)
+            self.failures -= 1
+            return httpx.Response(200, text="<html>Bad gateway</html>")
+
+    api = FlakyApi([good(index) for index in range(5)])
+    async with AsyncCheckBoxClient(transport=api.transport) as client:
+        async with AsyncGoodsCatalog(client, interval=0.01) as catalog:
+            api.failures = 2
+            api.records.append(good(5))
+            for _ in range(500):
+                if catalog.by_code("CODE-5") is not None:
+                    break
+                await asyncio.sleep(0.01)
+
+    assert api.failures == 0
+    assert catalog.by_code("CODE-5") is not None
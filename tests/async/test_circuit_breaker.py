@@ -0,0 +1,22 @@
+# pylint: disable=duplicate-code
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.circuit_breaker import CircuitBreaker, CircuitState
+from checkbox_sdk.exceptions import CheckBoxCircuitOpenError, CheckBoxError
+from checkbox_sdk.methods import tax
+
+
+@pytest.mark.asyncio
+async def test_client_fails_fast():
+    def handler(request):
+        raise httpx.ConnectTimeout("Timed out", request=request)
+
+    breaker = CircuitBreaker(failure_threshold=1)
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler), circuit_breaker=breaker) as client:
+        with pytest.raises(CheckBoxError):
+            await client(tax.GetTax())
+        assert breaker.get_state(tax.GetTax()) is CircuitState.OPEN
+        with pytest.raises(CheckBoxCircuitOpenError):
+            await client(tax.GetTax())
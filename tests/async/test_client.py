@@ -0,0 +1,28 @@
+# pylint: disable=duplicate-code
+import httpx
+import pytest
+
+from checkbox_sdk.client.api import AsyncGoods
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.methods import tax
+
+
+@pytest.mark.asyncio
+async def test_custom_transport():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[{"code": 1}]))
+
+    async with AsyncCheckBoxClient(transport=transport, max_connections=5) as client:
+        assert client.limits.max_connections == 5
+        assert await client(tax.GetTax()) == [{"code": 1}]
+
+
+@pytest.mark.asyncio
+async def test_lazy_namespaces_and_session():
+    async with AsyncCheckBoxClient() as client:
+        assert client._session is None  # pylint: disable=protected-access
+
+        assert isinstance(client.goods, AsyncGoods)
+        assert client.goods is client.goods
+        assert client.session is client.session
+
+    assert client._session is None  # pylint: disable=protected-access
@@ -0,0 +1,23 @@
+# pylint: disable=duplicate-code
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.columnar import TRANSACTION_COLUMNS, ColumnarBuffer
+
+from ..fake_api import FakeApi
+
+
+@pytest.mark.asyncio
+async def test_export_paginated_results():
+    transactions = [
+        {"id": str(index), "type": "RECEIPT", "status": "DONE", "serial": index, "created_at": "2024-01-01T00:00:00"}
+        for index in range(25)
+    ]
+
+    async with AsyncCheckBoxClient(transport=FakeApi(transactions).transport) as client:
+        buffer = await ColumnarBuffer(TRANSACTION_COLUMNS).aextend(client.transactions.get_transactions(limit=10))
+
+    assert len(buffer) == 25
+    assert sum(buffer.values("serial")) == sum(range(25))
+    assert buffer.categories("type") == ["RECEIPT"]
+    assert set(buffer.values("created_at")) == {1704067200 * 1_000_000}
@@ -0,0 +1,31 @@
+# pylint: disable=duplicate-code
+import datetime
+
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.incremental import AsyncIncrementalSync, SQLiteCheckpointStore
+from checkbox_sdk.storage.simple import SessionStorage
+
+from ..fake_api import SearchApi
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("resource", ["receipts", "transactions"])
+async def test_incremental_sync(tmp_path, resource):
+    records = [
+        {"id": str(index), "created_at": (START + datetime.timedelta(minutes=index)).isoformat(), "status": "DONE"}
+        for index in range(50)
+    ]
+
+    storage = SessionStorage(cash_register={"id": "register"})
+    async with AsyncCheckBoxClient(transport=SearchApi(records).transport, storage=storage) as client:
+        sync = AsyncIncrementalSync(client, SQLiteCheckpointStore(tmp_path / "sync.db"), resource=resource)
+        assert len([item async for item in sync.sync()]) == 50
+
+        records[48] = {**records[48], "status": "ERROR"}
+        records.append({"id": "50", "created_at": (START + datetime.timedelta(hours=2)).isoformat(), "status": "DONE"})
+
+        assert [item["id"] async for item in sync.sync()] == ["48", "50"]
@@ -0,0 +1,66 @@
+# pylint: disable=duplicate-code
+import datetime
+
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.mirror import AsyncMirrorSync, LocalMirror
+
+from ..fake_api import FakeApi, search
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def created_at(minutes):
+    return (START + datetime.timedelta(minutes=minutes)).isoformat()
+
+
+class MirrorApi(FakeApi):
+    def __init__(self, receipts, transactions):
+        super().__init__()
+        self.receipts = receipts
+        self.transactions = transactions
+
+    def respond(self, request):
+        if not request.url.path.endswith("receipts/search"):
+            return search(request, self.transactions)
+        fiscal_code = request.url.params.get("fiscal_code")
+        return search(request, [item for item in self.receipts if fiscal_code in (None, item["fiscal_code"])])
+
+
+@pytest.mark.asyncio
+async def test_mirror_sync():
+    receipts = [
+        {
+            "id": str(index),
+            "fiscal_code": f"FISCAL-{index}",
+            "created_at": created_at(index),
+            "shift": {"id": "shift", "cash_register": {"id": "register"}},
+            "goods": [{"good": {"barcode": str(index % 3)}}],
+        }
+        for index in range(20)
+    ]
+    transactions = [{"id": str(index), "created_at": created_at(index), "type": "RECEIPT"} for index in range(20)]
+    api = MirrorApi(receipts, transactions)
+
+    async with AsyncCheckBoxClient(transport=api.transport) as client:
+        client.storage.cash_register = {"id": "session-register"}
+        with LocalMirror() as mirror:
+            sync = AsyncMirrorSync(mirror, client, page_size=8)
+            assert await sync.sync_receipts(created_at(0), created_at(9), cash_register_id="register") == 10
+            assert await sync.sync_transactions(created_at(5), created_at(14)) == 10
+            api.requests.clear()
+
+            found = await sync.search_receipts(created_at(0), created_at(9), barcode="1", cash_register_id="register")
+            assert [item["id"] for item in found] == ["1", "4", "7"]
+            assert len(await sync.search_transactions(created_at(5), created_at(9))) == 5
+            assert api.paths == []
+
+            # Receipts of the cash register of the session were not synced
+            assert len(await sync.search_receipts(created_at(0), created_at(9), fiscal_code="FISCAL-3")) == 1
+            assert [item["id"] for item in await sync.search_transactions(created_at(16), created_at(17))] == [
+                "16",
+                "17",
+            ]
+            assert set(api.paths) == {"/api/v1/receipts/search", "/api/v1/transactions"}
+            assert len(mirror.find_transactions()) == 12
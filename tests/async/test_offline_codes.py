@@ -0,0 +1,108 @@
+# pylint: disable=duplicate-code
+import asyncio
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.offline_codes import AsyncOfflineCodeReservoir
+from checkbox_sdk.exceptions import CheckBoxOfflineCodesError
+
+
+@pytest.mark.asyncio
+async def test_reservoir():
+    state = {"next": 0, "fail": False}
+    requests = []
+
+    async def handler(request):
+        path = request.url.path.rsplit("/", 1)[-1]
+        requests.append(path)
+        if state["fail"]:
+            return httpx.Response(503, text="Unavailable")
+        if path == "get-offline-codes-count":
+            return httpx.Response(200, json={"available": 1000, "enough_offline_codes": True})
+        await asyncio.sleep(0.01)
+        count = int(request.url.params["count"])
+        codes = [{"fiscal_code": f"CODE-{state['next'] + index}"} for index in range(count)]
+        state["next"] += count
+        return httpx.Response(200, json=codes)
+
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        reservoir = AsyncOfflineCodeReservoir(client, size=4, low_watermark=2)
+        with pytest.raises(CheckBoxOfflineCodesError):
+            reservoir.take_nowait()
+        # The refill started by the failed take is awaited
+        assert await reservoir.take(timeout=5) == "CODE-0"
+        await reservoir.close()
+
+        assert (await reservoir.fill()).available == 4
+        assert reservoir.take_many(3) == ["CODE-1", "CODE-2", "CODE-3"]
+        assert reservoir.stats().refilling
+        await reservoir.close()
+        assert len(reservoir) == 4
+
+        state["fail"] = True
+        requests.clear()
+        assert len(reservoir.take_many(4)) == 4
+        with pytest.raises(CheckBoxOfflineCodesError, match="refill failed"):
+            await reservoir.take()
+        await reservoir.close()
+
+    stats = reservoir.stats()
+    assert stats.failed_refills == 1
+    assert stats.handed_out == 8
+    assert stats.waits == 3
+
+
+@pytest.mark.asyncio
+async def test_unexpected_refill_error():
+    # Codes without a fiscal code break the refill with a KeyError
+    def handler(request):
+        if "count" not in request.url.params:
+            return httpx.Response(200, json={"available": 100, "enough_offline_codes": True})
+        return httpx.Response(200, json=[{}])
+
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        reservoir = AsyncOfflineCodeReservoir(client, size=5, low_watermark=2)
+        with pytest.raises(CheckBoxOfflineCodesError, match="refill failed"):
+            await reservoir.take(timeout=5)
+        await reservoir.close()
+
+    stats = reservoir.stats()
+    assert (stats.failed_refills, stats.refilling) == (1, False)
+    assert "fiscal_code" in stats.last_error
+
+
+@pytest.mark.asyncio
+async def test_refill_retry_delay():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503, text="Unavailable")
+
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        reservoir = AsyncOfflineCodeReservoir(client, size=5, low_watermark=2, retry_delay=0.1)
+        with pytest.raises(CheckBoxOfflineCodesError, match="refill failed"):
+            await reservoir.take(timeout=5)
+        failed = len(requests)
+
+        # Takes within the delay fail at once without requests
+        for _ in range(3):
+            with pytest.raises(CheckBoxOfflineCodesError, match="refill failed"):
+                await reservoir.take(timeout=5)
+        assert len(requests) == failed
+        assert not reservoir.stats().refilling
+
+        await asyncio.sleep(0.1)
+        with pytest.raises(CheckBoxOfflineCodesError):
+            reservoir.take_nowait()
+        assert reservoir.stats().refilling
+        await reservoir.close()
+
+    assert reservoir.stats().failed_refills == 2
+
+
+def test_invalid_watermark():
+    with pytest.raises(ValueError):
+        AsyncOfflineCodeReservoir(None, size=10, low_watermark=0)
@@ -0,0 +1,70 @@
+# pylint: disable=duplicate-code
+import asyncio
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.exceptions import CheckBoxError
+from checkbox_sdk.methods import receipts
+
+ITEMS = 95
+
+
+class FakeApi:
+    def __init__(self, fail_offset=None):
+        self.fail_offset = fail_offset
+        self.offsets = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handler(self, request):
+        offset, limit = int(request.url.params["offset"]), int(request.url.params["limit"])
+        self.offsets.append(offset)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later pages answer faster, so the order of the results depends on the mixin, not on the responses
+        await asyncio.sleep(0.05 - offset / 10000)
+        self.in_flight -= 1
+        if offset == self.fail_offset:
+            return httpx.Response(500, json={"message": "Failed"})
+        results = [{"id": index} for index in range(offset, min(offset + limit, ITEMS))]
+        return httpx.Response(200, json={"meta": {"limit": limit, "offset": offset}, "results": results})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [0, 1, 4])
+async def test_results_in_order(prefetch):
+    api = FakeApi()
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(api.handler), page_prefetch=prefetch) as client:
+        results = [item["id"] async for item in client.receipts.get_receipts_search(limit=10)]
+
+    assert results == list(range(ITEMS))
+    assert api.max_in_flight == max(prefetch, 1)
+    # The window is refilled until the first empty page is consumed
+    assert len(api.offsets) <= 11 + prefetch
+
+
+@pytest.mark.asyncio
+async def test_error_stops_iteration():
+    api = FakeApi(fail_offset=30)
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(api.handler)) as client:
+        results = []
+        with pytest.raises(CheckBoxError):
+            async for item in client.receipts.fetch_paginated_results(
+                receipts.GetReceiptsSearch(limit=10), prefetch=4
+            ):
+                results.append(item["id"])
+
+    assert results == list(range(30))
+
+
+@pytest.mark.asyncio
+async def test_early_close_cancels_pages():
+    api = FakeApi()
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(api.handler)) as client:
+        results = client.receipts.fetch_paginated_results(receipts.GetReceiptsSearch(limit=10), prefetch=4)
+        assert (await results.__anext__())["id"] == 0
+        await results.aclose()
+
+    assert api.in_flight == 0
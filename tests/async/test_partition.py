@@ -0,0 +1,33 @@
+# pylint: disable=duplicate-code
+import datetime
+
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.partition import AsyncPartitionedSearch
+from checkbox_sdk.methods import shifts
+
+from ..fake_api import SearchApi
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+END = START + datetime.timedelta(days=4)
+
+
+@pytest.mark.asyncio
+async def test_partitioned_search():
+    # A shift every hour and one more exactly at every window boundary
+    times = [START + datetime.timedelta(hours=hour) for hour in range(4 * 24)]
+    times += [START + datetime.timedelta(days=day) for day in range(1, 4)]
+    items = sorted(
+        ({"id": f"shift-{index}", "created_at": moment.isoformat()} for index, moment in enumerate(times)),
+        key=lambda item: item["created_at"],
+    )
+
+    async with AsyncCheckBoxClient(transport=SearchApi(items).transport) as client:
+        search = AsyncPartitionedSearch(
+            client, shifts.GetShifts(limit=10), from_date=START, to_date=END, windows=4, concurrency=2, max_pages=2
+        )
+        results = [item["id"] async for item in search]
+
+    assert results == [item["id"] for item in items]
+    assert search.splits > 0
@@ -0,0 +1,24 @@
+# pylint: disable=duplicate-code
+import httpx
+import pytest
+
+from checkbox_sdk.client.api.receipts import check_status_async
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.polling import FibonacciPolling
+
+
+@pytest.mark.asyncio
+async def test_check_status_reports_polls():
+    statuses = iter(["CREATED", "PENDING", "DONE"])
+    stats = []
+
+    def handler(request):  # pylint: disable=unused-argument
+        return httpx.Response(200, json={"id": "receipt", "status": next(statuses)})
+
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        result = await check_status_async(
+            client, {"id": "receipt"}, relax=FibonacciPolling(initial=0.001, on_wait=stats.append)
+        )
+
+    assert result["status"] == "DONE"
+    assert stats[0].polls == 3
@@ -0,0 +1,37 @@
+# pylint: disable=duplicate-code
+import asyncio
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.pool import AsyncCheckBoxClientPool
+from checkbox_sdk.methods import tax
+from checkbox_sdk.storage.simple import SessionStorage
+
+
+@pytest.mark.asyncio
+async def test_routes_by_tenant_with_concurrency_limit():
+    license_keys = []
+    in_flight = []
+    peak = []
+
+    async def handler(request):
+        license_keys.append(request.headers["X-License-Key"])
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return httpx.Response(200, json=[])
+
+    async with AsyncCheckBoxClientPool(transport=httpx.MockTransport(handler), tenant_concurrency=2) as pool:
+        pool.add("first", SessionStorage(license_key="first-key"))
+        pool.add("second", SessionStorage(license_key="second-key"), concurrency=1)
+
+        await asyncio.gather(*(pool.emit("first", tax.GetTax()) for _ in range(6)))
+        await asyncio.gather(*(pool["second"].tax.get_all_taxes() for _ in range(3)))
+
+        assert pool["first"].session is pool["second"].session is pool.session
+
+    assert license_keys == ["first-key"] * 6 + ["second-key"] * 3
+    assert max(peak[:6]) == 2
+    assert max(peak[6:]) == 1
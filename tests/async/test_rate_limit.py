@@ -0,0 +1,43 @@
+# pylint: disable=duplicate-code
+import threading
+import time
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.rate_limit import BucketStore, MemoryBucketStore, RateLimiter
+from checkbox_sdk.methods import tax
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_client():
+    limiter = RateLimiter(rate=20, capacity=1)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+
+    start = time.monotonic()
+    async with AsyncCheckBoxClient(transport=transport, rate_limiter=limiter) as client:
+        for _ in range(3):
+            await client(tax.GetTax())
+    assert time.monotonic() - start >= 0.09
+
+
+class ThreadRecordingStore(BucketStore):
+    def __init__(self):
+        self.store = MemoryBucketStore()
+        self.threads = []
+
+    def reserve(self, key, rate, capacity, tokens=1):
+        self.threads.append(threading.get_ident())
+        return self.store.reserve(key, rate, capacity, tokens)
+
+
+@pytest.mark.asyncio
+async def test_blocking_store_reserves_in_executor():
+    store = ThreadRecordingStore()
+    limiter = RateLimiter(rate=20, capacity=1, store=store)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+
+    async with AsyncCheckBoxClient(transport=transport, rate_limiter=limiter) as client:
+        await client(tax.GetTax())
+    assert store.threads and threading.get_ident() not in store.threads
@@ -0,0 +1,85 @@
+# pylint: disable=duplicate-code
+import asyncio
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.receipt_poller import AsyncReceiptStatusPoller
+from checkbox_sdk.exceptions import CheckBoxError
+
+RECEIPTS = 50
+
+
+@pytest.mark.asyncio
+async def test_coalesced_polling():
+    requests = []
+    polls = {}
+
+    def handler(request):
+        requests.append(request.url.path)
+        polls["tick"] = polls.get("tick", 0) + 1
+        status = "DONE" if polls["tick"] > 1 else "CREATED"
+        return httpx.Response(
+            200, json={"meta": {}, "results": [{"id": str(index), "status": status} for index in range(RECEIPTS)]}
+        )
+
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        poller = AsyncReceiptStatusPoller(client, interval=0.01)
+        results = await asyncio.gather(
+            *(poller.wait({"id": str(index), "shift": {"id": "shift"}}, timeout=5) for index in range(RECEIPTS))
+        )
+        await poller.close()
+
+    assert [result["status"] for result in results] == ["DONE"] * RECEIPTS
+    assert len(requests) == 2
+    assert all(path.endswith("/receipts/search") for path in requests)
+
+
+@pytest.mark.asyncio
+async def test_close_fails_pending():
+    async with AsyncCheckBoxClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "1", "status": "CREATED"}))
+    ) as client:
+        poller = AsyncReceiptStatusPoller(client, interval=0.01)
+        future = poller.submit({"id": "1"})
+        await poller.close()
+
+        with pytest.raises(CheckBoxError):
+            await asyncio.wait_for(future, 1)
+        with pytest.raises(CheckBoxError):
+            poller.submit({"id": "2"})
+
+    assert poller.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_unexpected_error_fails_pending():
+    # A search result without an ID breaks the tick with a KeyError
+    async with AsyncCheckBoxClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"meta": {}, "results": [{}]}))
+    ) as client:
+        poller = AsyncReceiptStatusPoller(client, interval=0.01)
+        with pytest.raises(CheckBoxError, match="polling failed"):
+            await poller.wait({"id": "1", "shift": {"id": "shift"}}, timeout=5)
+
+    assert poller.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_wait_discards_receipt():
+    async with AsyncCheckBoxClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"meta": {}, "results": [{"id": "1", "status": "CREATED"}]})
+        )
+    ) as client:
+        poller = AsyncReceiptStatusPoller(client, interval=0.01)
+        task = asyncio.ensure_future(poller.wait({"id": "1", "shift": {"id": "shift"}}))
+        await asyncio.sleep(0.05)
+        assert poller.pending == 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert poller.pending == 0
+        await poller.close()
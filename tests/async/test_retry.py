@@ -0,0 +1,37 @@
+# pylint: disable=duplicate-code
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.retry import RetryPolicy
+from checkbox_sdk.exceptions import CheckBoxError
+from checkbox_sdk.methods import tax
+
+
+@pytest.mark.asyncio
+async def test_retry_on_status():
+    statuses = iter([503, 429, 200])
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(next(statuses), json=[])
+
+    policy = RetryPolicy(backoff_factor=0, jitter=False)
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler), retry_policy=policy) as client:
+        assert await client(tax.GetTax()) == []
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_without_policy():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(CheckBoxError):
+            await client(tax.GetTax())
+    assert len(calls) == 1
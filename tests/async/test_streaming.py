@@ -0,0 +1,49 @@
+# pylint: disable=duplicate-code
+import io
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.exceptions import CheckBoxAPIError
+from checkbox_sdk.methods import receipts
+
+PAYLOAD = b"%PDF" + bytes(range(256)) * 1024
+
+
+def handler(request):
+    if request.url.path.endswith("/missing/pdf"):
+        return httpx.Response(404, json={"message": "Not found"})
+    return httpx.Response(200, content=PAYLOAD)
+
+
+@pytest.mark.asyncio
+async def test_aiter_bytes():
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        call = receipts.GetReceiptVisualizationPdf(receipt_id="id")
+        chunks = [chunk async for chunk in client.aiter_bytes(call, chunk_size=4096)]
+
+    assert b"".join(chunks) == PAYLOAD
+    assert max(len(chunk) for chunk in chunks) == 4096
+
+
+@pytest.mark.asyncio
+async def test_download(tmp_path):
+    path = tmp_path / "receipt.pdf"
+    sink = io.BytesIO()
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        size = await client.receipts.download_receipt_visualization_pdf(receipt_id="id", sink=path)
+        await client.download(receipts.GetReceiptVisualizationPdf(receipt_id="id"), sink)
+
+    assert size == len(PAYLOAD)
+    assert path.read_bytes() == PAYLOAD == sink.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_download_error_leaves_no_file(tmp_path):
+    path = tmp_path / "receipt.pdf"
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(CheckBoxAPIError):
+            await client.download(receipts.GetReceiptVisualizationPdf(receipt_id="missing"), path)
+
+    assert not path.exists()
@@ -0,0 +1,56 @@
+# pylint: disable=duplicate-code
+import gzip
+from email.parser import BytesParser
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.methods import goods
+
+CSV = b"code,name,price\n" + b"".join(b"%d,Good %d,1.00\n" % (row, row) for row in range(10_000))
+
+
+def parse_file(request, body):
+    if request.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    header = b"Content-Type: " + request.headers["Content-Type"].encode() + b"\r\n\r\n"
+    message = BytesParser().parsebytes(header + body)
+    (part,) = message.get_payload()
+    return part.get_filename(), part.get_payload(decode=True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compress", [False, True])
+async def test_upload_from_async_iterator(compress):
+    requests = []
+
+    async def handler(request):
+        requests.append((request, await request.aread()))
+        return httpx.Response(200, json={"task_id": "task"})
+
+    async def chunks():
+        for offset in range(0, len(CSV), 1000):
+            end = offset + 1000
+            yield CSV[offset:end]
+
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        await client(goods.ImportGoodsFromFile(file=chunks(), filename="goods.csv", gzip=compress))
+
+    assert parse_file(*requests[0]) == ("goods.csv", CSV)
+
+
+@pytest.mark.asyncio
+async def test_upload_from_path(tmp_path):
+    requests = []
+    path = tmp_path / "goods.csv"
+    path.write_bytes(CSV)
+
+    async def handler(request):
+        requests.append((request, await request.aread()))
+        return httpx.Response(200, json={"task_id": "task"})
+
+    async with AsyncCheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        await client(goods.ImportGoodsFromFile(file=path))
+
+    assert parse_file(*requests[0]) == ("goods.csv", CSV)
@@ -0,0 +1,44 @@
+# pylint: disable=duplicate-code
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.webhook_receiver import WebhookASGIApp, WebhookDispatcher
+from checkbox_sdk.methods import shifts
+
+
+@pytest.mark.asyncio
+async def test_wait_completed_by_webhook():
+    state = {"status": "OPENING", "requests": 0}
+
+    def handler(request):
+        state["requests"] += 1
+        return httpx.Response(200, json={"id": "shift", "status": state["status"]})
+
+    dispatcher = WebhookDispatcher()
+    app = WebhookASGIApp(dispatcher, path="/webhook")
+
+    async def deliver():
+        await asyncio.sleep(0.1)
+        state["status"] = "OPENED"
+        body = json.dumps({"type": "shift", "shift": {"id": "shift", "status": "OPENED"}}).encode()
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as webhook:
+            assert (await webhook.post("/other", content=body)).status_code == 404
+            assert (await webhook.post("/webhook", content=body)).status_code == 200
+
+    async with AsyncCheckBoxClient(
+        transport=httpx.MockTransport(handler), webhook_dispatcher=dispatcher
+    ) as client:
+        result, _ = await asyncio.gather(
+            client.wait_status(
+                shifts.GetShift(shift_id="shift"), expected_value={"OPENED", "CLOSED"}, relax=30, timeout=5
+            ),
+            deliver(),
+        )
+
+    assert result["status"] == "OPENED"
+    assert state["requests"] == 2
+    assert dispatcher.received == 1
@@ -0,0 +1,33 @@
+import json
+import pathlib
+import timeit
+
+import pytest
+
+from checkbox_sdk.codec import CODECS, get_codec
+
+RECEIPT = json.loads((pathlib.Path(__file__).parent.parent / "test_data" / "receipt.json").read_text())
+
+
+@pytest.mark.parametrize("name", list(CODECS))
+@pytest.mark.parametrize("receipts", [1, 500])
+def test_codec_speed(run_benchmarks, name, receipts):
+    # sourcery skip: no-conditionals-in-tests
+    if not run_benchmarks:
+        pytest.skip("Skip benchmarks")
+
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+    # A bulk receipt request and its response have the same shape
+    payload = {"receipts": [dict(RECEIPT, id=str(index)) for index in range(receipts)]}
+    encoded = codec.dumps(payload)
+    number = max(1, 2000 // receipts)
+
+    dumps = timeit.timeit(lambda: codec.dumps(payload), number=number) / number
+    loads = timeit.timeit(lambda: codec.loads(encoded), number=number) / number
+
+    print(f"\n{name} x{receipts}: dumps {dumps * 1e6:.1f} us, loads {loads * 1e6:.1f} us")
+    assert codec.loads(encoded) == payload
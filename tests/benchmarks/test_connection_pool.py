@@ -0,0 +1,32 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.methods import tax
+from .server import StandInServer, json_response
+
+REQUESTS = 200
+WORKERS = 16
+
+
+@pytest.mark.parametrize("pool_size", [1, 4, 16])
+def test_pool_size_throughput(run_benchmarks, pool_size):
+    # sourcery skip: no-conditionals-in-tests
+    if not run_benchmarks:
+        pytest.skip("Skip benchmarks")
+
+    with StandInServer(handler=lambda *_: json_response([]), latency=0.005) as server:
+        with CheckBoxClient(
+            base_url=server.base_url,
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+        ) as client:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+                list(executor.map(lambda _: client(tax.GetTax()), range(REQUESTS)))
+            elapsed = time.perf_counter() - start
+
+    print(f"\npool_size={pool_size}: {REQUESTS / elapsed:.1f} requests/s")
+    assert server.requests == REQUESTS
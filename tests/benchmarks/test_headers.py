@@ -0,0 +1,50 @@
+import timeit
+
+import pytest
+
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.methods import receipts
+from checkbox_sdk.storage.simple import SessionStorage
+
+NUMBER = 100_000
+REPEAT = 5
+
+
+def prepare_uncached(client: CheckBoxClient, storage: SessionStorage, call):
+    # The way emit() prepared every request before the headers and URL prefixes were cached
+    headers = {}
+    if storage.token:
+        headers["Authorization"] = f"Bearer {storage.token}"
+    if storage.license_key:
+        headers["X-License-Key"] = storage.license_key
+    client_headers = {"X-Client-Name": client.client_name, "X-Client-Version": client.client_version}
+    if client.integration_key:
+        client_headers["X-Access-Key"] = client.integration_key
+    if not call.internal:
+        url = f"{client.base_url}/api/v{client.api_version}/{call.uri}"
+    else:
+        url = f"{client.base_url}/{call.uri}"
+    return url, {**headers, **call.headers, **client_headers}
+
+
+def prepare_cached(client: CheckBoxClient, storage: SessionStorage, call):
+    # pylint: disable=protected-access
+    return client._get_url(call), client._get_headers(storage, call)
+
+
+def test_request_preparation_overhead(run_benchmarks):
+    # sourcery skip: no-conditionals-in-tests
+    if not run_benchmarks:
+        pytest.skip("Skip benchmarks")
+
+    storage = SessionStorage(token="token", license_key="license_key")
+    call = receipts.GetReceipt(receipt_id="00000000-0000-0000-0000-000000000000")
+    with CheckBoxClient(storage=storage, integration_key="integration") as client:
+        assert prepare_uncached(client, storage, call) == prepare_cached(client, storage, call)
+
+        # The best of several runs is the least disturbed by other processes
+        before = min(timeit.repeat(lambda: prepare_uncached(client, storage, call), number=NUMBER, repeat=REPEAT))
+        after = min(timeit.repeat(lambda: prepare_cached(client, storage, call), number=NUMBER, repeat=REPEAT))
+
+    print(f"\nper-call overhead: before {before / NUMBER * 1e9:.0f} ns, after {after / NUMBER * 1e9:.0f} ns")
+    assert after <= before
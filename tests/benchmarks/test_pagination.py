@@ -0,0 +1,59 @@
+import asyncio
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from checkbox_sdk.client.asynchronous import AsyncCheckBoxClient
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from .server import StandInServer, json_response
+
+ITEMS = 5000
+LIMIT = 100
+
+
+def pages_handler(method, path, body):  # pylint: disable=unused-argument
+    query = parse_qs(urlsplit(path).query)
+    offset, limit = int(query["offset"][0]), int(query["limit"][0])
+    results = [{"id": index} for index in range(offset, min(offset + limit, ITEMS))]
+    return json_response({"meta": {"limit": limit, "offset": offset}, "results": results})
+
+
+@pytest.mark.parametrize("prefetch", [0, 4, 16])
+def test_async_pagination_throughput(run_benchmarks, prefetch):
+    # sourcery skip: no-conditionals-in-tests
+    if not run_benchmarks:
+        pytest.skip("Skip benchmarks")
+
+    async def fetch_all(base_url):
+        async with AsyncCheckBoxClient(base_url=base_url, page_prefetch=prefetch) as client:
+            return [item async for item in client.receipts.get_receipts_search(limit=LIMIT)]
+
+    with StandInServer(handler=pages_handler, latency=0.01) as server:
+        start = time.perf_counter()
+        results = asyncio.run(fetch_all(server.base_url))
+        elapsed = time.perf_counter() - start
+
+    print(f"\nprefetch={prefetch}: {len(results) / elapsed:.0f} items/s")
+    assert len(results) == ITEMS
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 4])
+def test_sync_pagination_pipelining(run_benchmarks, prefetch):
+    # sourcery skip: no-conditionals-in-tests
+    if not run_benchmarks:
+        pytest.skip("Skip benchmarks")
+
+    processed = 0
+    with StandInServer(handler=pages_handler, latency=0.01) as server:
+        with CheckBoxClient(base_url=server.base_url, page_prefetch=prefetch) as client:
+            start = time.perf_counter()
+            for item in client.transactions.get_transactions(limit=LIMIT):
+                processed += 1
+                if item["id"] % LIMIT == 0:
+                    # Processing a page takes about as long as fetching it
+                    time.sleep(0.01)
+            elapsed = time.perf_counter() - start
+
+    print(f"\nprefetch={prefetch}: {processed / elapsed:.0f} items/s")
+    assert processed == ITEMS
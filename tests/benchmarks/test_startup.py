@@ -0,0 +1,74 @@
+import subprocess
+import sys
+import timeit
+from typing import Dict
+
+import pytest
+
+from checkbox_sdk.client.synchronous import CheckBoxClient
+
+NUMBER = 100
+
+EAGER_MODULES = (
+    "jwt",
+    "checkbox_sdk.client.api.",
+    "checkbox_sdk.methods.cash_register",
+    "checkbox_sdk.methods.cashier",
+    "checkbox_sdk.methods.shifts",
+)
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], capture_output=True, check=True, text=True)
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """
+    Returns the cumulative import time, in microseconds, of every module loaded by importing ``module``, as reported
+    by ``python -X importtime``.
+    """
+    times = {}
+    for line in run_python("-X", "importtime", "-c", f"import {module}").stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_lazy_imports():
+    loaded = run_python(
+        "-c",
+        "import sys\n"
+        "import checkbox_sdk.client.asynchronous, checkbox_sdk.client.synchronous\n"
+        "print('\\n'.join(sys.modules))",
+    ).stdout.split()
+
+    assert not [module for module in loaded if module.startswith(EAGER_MODULES)]
+
+
+def test_startup_time(run_benchmarks):
+    # sourcery skip: no-conditionals-in-tests
+    if not run_benchmarks:
+        pytest.skip("Skip benchmarks")
+
+    times = import_times("checkbox_sdk.client.synchronous")
+    import_time = times["checkbox_sdk.client.synchronous"]
+
+    def create():
+        CheckBoxClient().close()
+
+    def create_and_use():
+        with CheckBoxClient() as client:
+            client.receipts  # pylint: disable=pointless-statement
+            client.session  # pylint: disable=pointless-statement
+
+    created = timeit.timeit(create, number=NUMBER) / NUMBER
+    used = timeit.timeit(create_and_use, number=NUMBER) / NUMBER
+
+    print(
+        f"\nimport: {import_time / 1e3:.1f} ms, client: {created * 1e6:.0f} us, "
+        f"client with session and namespace: {used * 1e3:.2f} ms"
+    )
+    assert not [name for name in times if name.startswith(EAGER_MODULES)]
@@ -0,0 +1,53 @@
+import gzip
+import time
+
+import pytest
+
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from .server import StandInServer, json_response
+
+ROWS = 200_000
+
+
+@pytest.fixture
+def goods_csv(tmp_path):
+    path = tmp_path / "goods.csv"
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("code,name,price,barcode\n")
+        for row in range(ROWS):
+            file.write(f"{row},Good {row},{row % 1000}.99,{4820000000000 + row}\n")
+    return path
+
+
+def import_handler(uploads):
+    applied = []
+
+    def handler(method, path, body):
+        if path.startswith("/api/v1/goods/import/upload"):
+            uploads.append(body)
+            return json_response({"task_id": "task"})
+        if path.startswith("/api/v1/goods/import/apply_changes"):
+            applied.append(True)
+            return json_response({})
+        return json_response({"status": "done" if applied else "completed"})
+
+    return handler
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_import_goods_throughput(run_benchmarks, goods_csv, compress):  # pylint: disable=redefined-outer-name
+    # sourcery skip: no-conditionals-in-tests
+    if not run_benchmarks:
+        pytest.skip("Skip benchmarks")
+
+    uploads = []
+    size = goods_csv.stat().st_size
+    with StandInServer(handler=import_handler(uploads)) as server:
+        with CheckBoxClient(base_url=server.base_url) as client:
+            start = time.perf_counter()
+            client.goods.import_goods(file=goods_csv, relax=0, gzip=compress)
+            elapsed = time.perf_counter() - start
+
+    body = gzip.decompress(uploads[0]) if compress else uploads[0]
+    print(f"\ngzip={compress}: {size / elapsed / 2**20:.1f} MiB/s, {len(uploads[0]) / 2**20:.1f} MiB sent")
+    assert goods_csv.read_bytes() in body
@@ -24,6 +24,8 @@ def pytest_addoption(parser):
     parser.addoption("--check_receipt_creation", action="store_true", default=False, help="Check receipt creation")
     parser.addoption("--client_email", action="store", help="Email address on which send receipts")
     parser.addoption("--client_phone", action="store", help="Enable tests which require sending sms")
+    # Benchmarks run against a local stand-in server and only report timings, so they are disabled by default.
+    parser.addoption("--run_benchmarks", action="store_true", default=False, help="Run benchmarks")
 
 
 @pytest.fixture(scope="session")
@@ -66,3 +68,8 @@ def client_email(request):
 @pytest.fixture(scope="session")
 def client_phone(request):
     return request.config.getoption("--client_phone")
+
+
+@pytest.fixture(scope="session")
+def run_benchmarks(request):
+    return request.config.getoption("--run_benchmarks")
@@ -0,0 +1,101 @@
+"""
+A stand-in for the Checkbox API used by the offline tests of the clients.
+"""
+
+import datetime
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+
+def paginate(request: httpx.Request, records: Sequence[Any]) -> httpx.Response:
+    """
+    Returns the page of the records selected by the ``offset`` and ``limit`` parameters of the request.
+    """
+    offset, limit = int(request.url.params["offset"]), int(request.url.params["limit"])
+    end = offset + limit
+    return httpx.Response(200, json={"meta": {"limit": limit, "offset": offset}, "results": list(records[offset:end])})
+
+
+def search(
+    request: httpx.Request,
+    records: Sequence[Dict[str, Any]],
+    fields: Tuple[str, str, str, str] = ("from_date", "to_date", "desc", "created_at"),
+) -> httpx.Response:
+    """
+    Returns the page of the records within the date range of the request, ordered by its sort flag.
+
+    ``fields`` are the names of the date range filters, of the sort flag and of the filtered field of the records.
+    """
+    from_field, to_field, desc_field, time_key = fields
+    params = request.url.params
+
+    def get_time(record: Dict[str, Any]) -> datetime.datetime:
+        return datetime.datetime.fromisoformat(record[time_key])
+
+    found = sorted(records, key=get_time, reverse=params.get(desc_field) == "true")
+    if from_field in params:
+        from_date = datetime.datetime.fromisoformat(params[from_field])
+        found = [record for record in found if get_time(record) >= from_date]
+    if to_field in params:
+        to_date = datetime.datetime.fromisoformat(params[to_field])
+        found = [record for record in found if get_time(record) <= to_date]
+    return paginate(request, found)
+
+
+class FakeApi:
+    """
+    Answers the requests sent through `transport` and records them in `requests`.
+
+    The records are returned page by page, subclasses override `respond` to fake other endpoints.
+    """
+
+    def __init__(self, records: Optional[List[Any]] = None):
+        self.records = records if records is not None else []
+        self.requests: List[httpx.Request] = []
+        self.lock = threading.Lock()
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handler)
+
+    @property
+    def paths(self) -> List[str]:
+        """
+        The URL paths of the recorded requests.
+        """
+        with self.lock:
+            return [request.url.path for request in self.requests]
+
+    @property
+    def endpoints(self) -> List[str]:
+        """
+        The last segments of the URL paths of the recorded requests.
+        """
+        return [path.rsplit("/", 1)[-1] for path in self.paths]
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append(request)
+        return self.respond(request)
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        return paginate(request, self.records)
+
+
+class SearchApi(FakeApi):
+    """
+    Answers searches of the records by a date range, see `search`.
+    """
+
+    def __init__(
+        self,
+        records: Optional[List[Dict[str, Any]]] = None,
+        fields: Tuple[str, str, str, str] = ("from_date", "to_date", "desc", "created_at"),
+    ):
+        super().__init__(records)
+        self.fields = fields
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        return search(request, self.records, self.fields)
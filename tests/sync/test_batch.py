@@ -0,0 +1,63 @@
+# pylint: disable=duplicate-code
+import threading
+import time
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.exceptions import CheckBoxAPIError
+from checkbox_sdk.methods import receipts
+
+RECEIPTS = 20
+
+
+def make_transport(peak):
+    lock = threading.Lock()
+    in_flight = []
+
+    def handler(request):
+        receipt_id = request.url.path.rsplit("/", 1)[-1]
+        with lock:
+            in_flight.append(receipt_id)
+            peak.append(len(in_flight))
+        # Later receipts are answered faster, so requests complete out of order
+        time.sleep(0.002 * (RECEIPTS - int(receipt_id)))
+        with lock:
+            in_flight.remove(receipt_id)
+        if receipt_id == "13":
+            return httpx.Response(404, json={"message": "Not found"})
+        return httpx.Response(200, json={"id": receipt_id})
+
+    return httpx.MockTransport(handler)
+
+
+def test_emit_many():
+    peak = []
+    with CheckBoxClient(transport=make_transport(peak)) as client:
+        results = client.emit_many(
+            (receipts.GetReceipt(receipt_id=str(index)) for index in range(RECEIPTS)), concurrency=4
+        )
+
+    assert [result["id"] for index, result in enumerate(results) if index != 13] == [
+        str(index) for index in range(RECEIPTS) if index != 13
+    ]
+    assert isinstance(results[13], CheckBoxAPIError)
+    assert max(peak) == 4
+
+
+def test_emit_as_completed():
+    with CheckBoxClient(transport=make_transport([])) as client:
+        completed = list(
+            client.emit_as_completed([receipts.GetReceipt(receipt_id=str(index)) for index in range(RECEIPTS)])
+        )
+
+    assert sorted(index for index, _ in completed) == list(range(RECEIPTS))
+    assert [index for index, _ in completed] != list(range(RECEIPTS))
+
+
+def test_invalid_concurrency():
+    with CheckBoxClient() as client:
+        with pytest.raises(ValueError):
+            client.emit_many([receipts.GetReceipt(receipt_id="1")], concurrency=0)
+        assert not client.emit_many([])
@@ -0,0 +1,126 @@
+# pylint: disable=duplicate-code
+import json
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.bulk import BulkReceiptSubmitter, split_chunks
+from checkbox_sdk.client.receipt_poller import ReceiptStatusPoller
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.exceptions import CheckBoxAPIError, CheckBoxError, StatusException
+
+
+def test_split_chunks():
+    assert split_chunks([10] * 5, max_receipts=2, max_bytes=1000) == [[0, 1], [2, 3], [4]]
+    # The payload overhead and separators count towards the size
+    assert split_chunks([40, 40, 40], max_receipts=10, max_bytes=100) == [[0, 1], [2]]
+    assert split_chunks([500, 10, 10], max_receipts=10, max_bytes=100) == [[0], [1, 2]]
+    assert not split_chunks([], max_receipts=10, max_bytes=100)
+    with pytest.raises(ValueError):
+        split_chunks([10], max_receipts=0, max_bytes=100)
+
+
+class FakeApi:
+    def __init__(self, fail=(), too_large=1000, rejected=()):
+        self.fail = set(fail)
+        self.too_large = too_large
+        self.rejected = set(rejected)
+        self.created = {}
+        self.chunks = []
+
+    def handler(self, request):
+        path = request.url.path
+        if path.endswith("bulk-sell"):
+            sent = json.loads(request.content)["receipts"]
+            self.chunks.append([receipt["name"] for receipt in sent])
+            if len(sent) > self.too_large:
+                return httpx.Response(413, json={"message": "Too large"})
+            if any(receipt["name"] in self.rejected for receipt in sent):
+                return httpx.Response(400, json={"message": "Rejected"})
+            for receipt in sent:
+                self.created[receipt["id"]] = {"id": receipt["id"], "status": "CREATED", "name": receipt["name"]}
+            if any(receipt["name"] in self.fail for receipt in sent):
+                self.fail -= {receipt["name"] for receipt in sent}
+                return httpx.Response(502, text="Bad gateway")
+            # The results are returned in reverse order to check they are mapped by ID
+            return httpx.Response(200, json={"results": [self.created[receipt["id"]] for receipt in sent][::-1]})
+
+        receipt_id = path.rsplit("/", 1)[-1]
+        if receipt_id not in self.created:
+            return httpx.Response(404, json={"message": "Not found"})
+        receipt = self.created[receipt_id]
+        receipt["status"] = "ERROR" if receipt["name"] == "receipt-0" else "DONE"
+        receipt["transaction"] = {"status": "ERROR", "response_status": "ERROR", "response_error_message": "Invalid"}
+        return httpx.Response(200, json=receipt)
+
+
+def receipt_list(count):
+    return [{"name": f"receipt-{index}", "goods": []} for index in range(count)]
+
+
+def test_submit():
+    api = FakeApi()
+    with CheckBoxClient(transport=httpx.MockTransport(api.handler)) as client:
+        submitter = BulkReceiptSubmitter(client, max_receipts=4, concurrency=3)
+        results = submitter.submit(receipt_list(10))
+
+    assert [len(chunk) for chunk in api.chunks] == [4, 4, 2]
+    assert all(result.ok for result in results)
+    assert [result.result["name"] for result in results] == [f"receipt-{index}" for index in range(10)]
+    assert [result.receipt_id for result in results] == [result.result["id"] for result in results]
+    assert submitter.requests == 3
+
+
+def test_split_too_large_chunks():
+    api = FakeApi(too_large=2)
+    with CheckBoxClient(transport=httpx.MockTransport(api.handler)) as client:
+        results = BulkReceiptSubmitter(client, max_receipts=8).submit(receipt_list(8))
+
+    assert all(result.ok for result in results)
+    assert sorted(len(chunk) for chunk in api.chunks) == [2, 2, 2, 2, 4, 4, 8]
+
+
+def test_retry_lost_chunks():
+    api = FakeApi(fail={"receipt-5"}, rejected={"receipt-9"})
+    with CheckBoxClient(transport=httpx.MockTransport(api.handler)) as client:
+        submitter = BulkReceiptSubmitter(client, max_receipts=4, relax=0)
+        results = submitter.submit(receipt_list(10))
+
+    # The lost chunk was created and is recovered by lookups instead of being re-sent
+    assert len(api.chunks) == 3
+    assert all(result.ok for result in results[:8])
+    assert results[5].result["status"] == "DONE"
+    assert [isinstance(result.error, CheckBoxAPIError) for result in results[8:]] == [True, True]
+
+
+def test_retry_unsent_receipts():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if request.url.path.endswith("bulk-sell") and len(calls) < 3:
+            raise httpx.ConnectError("Connection refused")
+        if request.url.path.endswith("bulk-sell"):
+            return httpx.Response(200, json={"results": json.loads(request.content)["receipts"]})
+        return httpx.Response(404, json={"message": "Not found"})
+
+    with CheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        results = BulkReceiptSubmitter(client, relax=0).submit(receipt_list(2))
+        assert all(result.ok for result in results)
+
+        calls.clear()
+        results = BulkReceiptSubmitter(client, attempts=1, relax=0).submit(receipt_list(2))
+        assert len(calls) == 1 + 2
+        assert all(isinstance(result.error, CheckBoxError) for result in results)
+
+
+def test_submit_and_wait():
+    api = FakeApi()
+    with CheckBoxClient(transport=httpx.MockTransport(api.handler)) as client:
+        poller = ReceiptStatusPoller(client, interval=0.01)
+        submitter = BulkReceiptSubmitter(client, max_receipts=2, poller=poller)
+        results = submitter.submit(receipt_list(5), wait=True, timeout=10)
+        assert poller.pending == 0
+
+    assert isinstance(results[0].error, StatusException)
+    assert [result.result["status"] for result in results[1:]] == ["DONE"] * 4
@@ -0,0 +1,91 @@
+# pylint: disable=duplicate-code
+import time
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.cache import ResponseCache
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.methods import currency, tax, webhook
+from checkbox_sdk.storage.simple import SessionStorage
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+def transport(requests):  # pylint: disable=redefined-outer-name
+    def handler(request):
+        requests.append(request)
+        if request.method == "GET":
+            return httpx.Response(200, json={"url": str(request.url), "n": len(requests)})
+        return httpx.Response(200, json={})
+
+    return httpx.MockTransport(handler)
+
+
+def test_cache_hit(requests, transport):  # pylint: disable=redefined-outer-name
+    cache = ResponseCache()
+    with CheckBoxClient(transport=transport, response_cache=cache) as client:
+        first = client(webhook.GetWebhookInfo())
+        first["n"] = "changed"
+        second = client(webhook.GetWebhookInfo())
+
+    assert len(requests) == 1
+    assert second["n"] == 1, "Cached response must be parsed again"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_not_cacheable_method(requests, transport):  # pylint: disable=redefined-outer-name
+    with CheckBoxClient(transport=transport, response_cache=ResponseCache()) as client:
+        client(currency.GetCurrencyRate("USD"))
+        client(currency.GetCurrencyRate("USD"))
+
+    assert len(requests) == 2
+
+
+def test_cache_keyed_by_identity_and_query(requests, transport):  # pylint: disable=redefined-outer-name
+    with CheckBoxClient(transport=transport, response_cache=ResponseCache()) as client:
+        client(tax.GetTax(), storage=SessionStorage(license_key="first"))
+        client(tax.GetTax(), storage=SessionStorage(license_key="second"))
+        client(tax.GetTax(), storage=SessionStorage(license_key="first"))
+        client(currency.GetCurrencyRates(active=True))
+        client(currency.GetCurrencyRates(active=False))
+
+    assert len(requests) == 4
+
+
+def test_invalidation_by_mutation(requests, transport):  # pylint: disable=redefined-outer-name
+    with CheckBoxClient(transport=transport, response_cache=ResponseCache()) as client:
+        client(webhook.GetWebhookInfo())
+        client(tax.GetTax())
+        client(webhook.SetWebhook(url="https://example.com"))
+        client(webhook.GetWebhookInfo())
+        client(tax.GetTax())
+
+    assert [request.url.path for request in requests] == [
+        "/api/v1/webhook",
+        "/api/v1/tax",
+        "/api/v1/webhook",
+        "/api/v1/webhook",
+    ]
+
+
+def test_ttl_and_lru(requests, transport):  # pylint: disable=redefined-outer-name
+    cache = ResponseCache(maxsize=1)
+    call = tax.GetTax()
+    call.cache_ttl = 0.01
+    with CheckBoxClient(transport=transport, response_cache=cache) as client:
+        client(call)
+        time.sleep(0.02)
+        client(call)
+        client(webhook.GetWebhookInfo())
+
+    assert len(requests) == 3
+    assert cache.stats().evictions == 1
+
+    cache.clear()
+    assert cache.stats().size == 0
@@ -0,0 +1,140 @@
+# pylint: disable=duplicate-code
+import json
+import pathlib
+import time
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.catalog import CatalogChanges, GoodsCatalog, good_barcodes
+from checkbox_sdk.client.synchronous import CheckBoxClient
+
+from ..fake_api import FakeApi
+
+EXPORT = json.loads((pathlib.Path(__file__).parent.parent / "test_data" / "checkbox_goods.json").read_text())
+
+
+def good(index, price=1000):
+    return {
+        "id": f"good-{index}",
+        "code": f"CODE-{index}",
+        "barcode": f"48200000{index:05d}",
+        "barcodes": f"48200000{index:05d}, 48299999{index:05d}",
+        "uktzed": "2202" if index % 2 else "2009",
+        "group": {"id": f"group-{index % 3}", "name": f"Group {index % 3}"},
+        "price": price,
+    }
+
+
+def test_good_barcodes():
+    assert good_barcodes({"barcode": "1", "barcodes": "1, 2,,3"}) == ["1", "2", "3"]
+    assert good_barcodes({"barcode": None, "barcodes": ["4", "5"]}) == ["4", "5"]
+    assert not good_barcodes({})
+
+
+def test_lookups():
+    api = FakeApi([good(index) for index in range(30)])
+    with CheckBoxClient(transport=api.transport) as client:
+        catalog = GoodsCatalog(client, page_size=10)
+        assert catalog.refresh() == CatalogChanges(added=30)
+
+    assert len(catalog) == 30
+    assert catalog.by_barcode("4820000000007")["id"] == "good-7"
+    assert catalog.by_barcode(" 4829999900007 ")["id"] == "good-7"
+    assert catalog.by_barcode("0000") is None
+    assert catalog.by_code("CODE-12")["id"] == "good-12"
+    assert len(catalog.by_uktzed("2202")) == 15
+    assert catalog.by_group("group-1") == catalog.by_group("Group 1")
+    assert len(catalog.by_group("group-1")) == 10
+
+
+def test_incremental_refresh():
+    api = FakeApi([good(index) for index in range(30)])
+    with CheckBoxClient(transport=api.transport) as client:
+        catalog = GoodsCatalog(client, page_size=10)
+        catalog.refresh()
+        unchanged = catalog.by_code("CODE-1")
+
+        api.records[2] = good(2, price=2000)
+        api.records[3] = {**good(3), "barcode": "1111", "barcodes": "1111", "group": None}
+        del api.records[4]
+        api.records.append(good(30))
+
+        assert catalog.refresh() == CatalogChanges(added=1, updated=2, removed=1)
+        assert catalog.refresh() == CatalogChanges()
+        assert catalog.refreshes == 3
+
+    assert catalog.by_code("CODE-1") is unchanged
+    assert catalog.by_barcode("4820000000002")["price"] == 2000
+    assert catalog.by_barcode("1111")["id"] == "good-3"
+    assert catalog.by_barcode("4820000000003") is None
+    assert all(item["id"] != "good-3" for item in catalog.by_group("group-0"))
+    assert catalog.by_code("CODE-4") is None
+    assert catalog.by_barcode("4820000000004") is None
+    assert len(catalog.by_group("Group 1")) == 9
+    assert catalog.by_code("CODE-30")["id"] == "good-30"
+    assert len(catalog) == 30
+
+
+def test_export_source():
+    def handler(request):
+        path = request.url.path
+        if path.endswith("goods/export/json"):
+            return httpx.Response(200, json={"task_id": "task"})
+        if path.endswith("goods/export/task_status/task"):
+            return httpx.Response(200, json={"status": "done"})
+        if path.endswith("goods/export/file/task"):
+            return httpx.Response(200, json=EXPORT)
+        return httpx.Response(404, json={"message": path})
+
+    with CheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        catalog = GoodsCatalog(client, source="export")
+        assert catalog.refresh().added == 2
+
+    assert catalog.by_barcode("2000000000011")["code"] == "123457"
+    assert len(catalog.by_group(EXPORT["goods"][0]["group"])) == 1
+
+
+def test_scheduled_refresh():
+    api = FakeApi([good(index) for index in range(5)])
+    with CheckBoxClient(transport=api.transport) as client:
+        with GoodsCatalog(client, interval=0.01) as catalog:
+            assert len(catalog) == 5
+            api.records.append(good(5))
+            while catalog.by_code("CODE-5") is None:
+                time.sleep(0.01)
+        refreshes = catalog.refreshes
+
+    assert refreshes > 1
+    assert catalog.refreshes == refreshes
+
+
+def test_scheduled_refresh_survives_errors():
+    class FlakyApi(FakeApi):
+        failures = 0
+
+        def respond(self, request):
+            if not self.failures:
+                return super().respond(request)
+            self.failures -= 1
+            if self.failures % 2:
+                raise httpx.ConnectError("Connection refused", request=request)
+            # E.g. an error page of a proxy, which is not JSON
+            return httpx.Response(200, text="<html>Bad gateway</html>")
+
+    api = FlakyApi([good(index) for index in range(5)])
+    with CheckBoxClient(transport=api.transport) as client:
+        with GoodsCatalog(client, interval=0.01) as catalog:
+            api.failures = 4
+            api.records.append(good(5))
+            deadline = time.monotonic() + 5
+            while catalog.by_code("CODE-5") is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+    assert api.failures == 0
+    assert catalog.by_code("CODE-5") is not None
+
+
+def test_unknown_source():
+    with pytest.raises(ValueError):
+        GoodsCatalog(None, source="csv")
@@ -0,0 +1,104 @@
+# pylint: disable=duplicate-code
+import time
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.circuit_breaker import CircuitBreaker, CircuitState
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.exceptions import CheckBoxAPIError, CheckBoxCircuitOpenError, CheckBoxError
+from checkbox_sdk.methods import receipts, tax, webhook
+
+
+def test_circuit_opens_and_recovers():
+    changes = []
+    breaker = CircuitBreaker(
+        failure_threshold=2,
+        recovery_timeout=0.05,
+        on_state_change=lambda key, old, new: changes.append(new),
+    )
+    call = tax.GetTax()
+
+    breaker.before_request(call)
+    breaker.record(call, success=False)
+    assert breaker.get_state(call) is CircuitState.CLOSED
+    breaker.record(call, success=False)
+    assert breaker.get_state(call) is CircuitState.OPEN
+
+    with pytest.raises(CheckBoxCircuitOpenError) as error:
+        breaker.before_request(call)
+    assert error.value.retry_after > 0
+
+    time.sleep(0.06)
+    breaker.before_request(call)
+    assert breaker.get_state(call) is CircuitState.HALF_OPEN
+    # Only one trial request at a time
+    with pytest.raises(CheckBoxCircuitOpenError):
+        breaker.before_request(call)
+
+    breaker.record(call, success=True)
+    assert breaker.get_state(call) is CircuitState.CLOSED
+    assert changes == [CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED]
+
+
+def test_failed_trial_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.01)
+    call = tax.GetTax()
+
+    breaker.record(call, success=False)
+    time.sleep(0.02)
+    breaker.before_request(call)
+    breaker.record(call, success=False)
+    assert breaker.get_state(call) is CircuitState.OPEN
+
+
+def test_circuits_per_method():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record(tax.GetTax(), success=False)
+
+    breaker.before_request(webhook.GetWebhookInfo())
+    with pytest.raises(CheckBoxCircuitOpenError):
+        breaker.before_request(tax.GetTax())
+
+    stats = breaker.stats()
+    assert stats["checkbox_sdk.methods.tax.GetTax"].state is CircuitState.OPEN
+    assert stats["checkbox_sdk.methods.tax.GetTax"].failures == 1
+
+    breaker.reset()
+    assert breaker.get_state(tax.GetTax()) is CircuitState.CLOSED
+
+
+def test_client_fails_fast():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path.endswith("webhook"):
+            return httpx.Response(400, json={"message": "Bad request"})
+        return httpx.Response(503)
+
+    breaker = CircuitBreaker(failure_threshold=2, key="uri")
+    with CheckBoxClient(transport=httpx.MockTransport(handler), circuit_breaker=breaker) as client:
+        for _ in range(2):
+            with pytest.raises(CheckBoxError):
+                client(tax.GetTax())
+        with pytest.raises(CheckBoxCircuitOpenError):
+            client(tax.GetTax())
+
+        # Client errors do not open the circuit
+        for _ in range(3):
+            with pytest.raises(CheckBoxAPIError):
+                client(webhook.GetWebhookInfo())
+
+    assert len(requests) == 5
+    assert breaker.get_state("GET webhook") is CircuitState.CLOSED
+
+
+def test_uri_key_templates_ids():
+    breaker = CircuitBreaker(failure_threshold=2, key="uri")
+    breaker.record(receipts.GetReceipt(receipt_id="0b9c4d5e-1f2a-4b3c-8d4e-5f6a7b8c9d0e"), success=False)
+    breaker.record(receipts.GetReceipt(receipt_id="1c0d5e6f-2a3b-4c4d-9e5f-6a7b8c9d0e1f"), success=False)
+
+    # Receipts polled with different IDs share the circuit of the endpoint
+    assert list(breaker.stats()) == ["GET receipts/{id}"]
+    assert breaker.get_state("GET receipts/{id}") is CircuitState.OPEN
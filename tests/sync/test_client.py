@@ -0,0 +1,81 @@
+# pylint: disable=duplicate-code
+import httpx
+
+from checkbox_sdk.client.api import Goods
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.consts import DEFAULT_MAX_CONNECTIONS
+from checkbox_sdk.methods import orders, tax
+from checkbox_sdk.storage.simple import SessionStorage
+
+
+def test_pool_limits():
+    with CheckBoxClient(max_connections=5, max_keepalive_connections=2, keepalive_expiry=1.5) as client:
+        assert client.limits == httpx.Limits(max_connections=5, max_keepalive_connections=2, keepalive_expiry=1.5)
+
+    with CheckBoxClient() as client:
+        assert client.limits.max_connections == DEFAULT_MAX_CONNECTIONS
+
+
+def test_custom_transport():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[{"code": 1}]))
+
+    with CheckBoxClient(transport=transport) as client:
+        assert client(tax.GetTax()) == [{"code": 1}]
+
+
+def test_cached_headers():
+    storage = SessionStorage(token="first")
+    with CheckBoxClient(storage=storage, integration_key="integration") as client:
+        headers = client._get_headers(storage, tax.GetTax())  # pylint: disable=protected-access
+        assert headers["Authorization"] == "Bearer first"
+        assert headers["X-Access-Key"] == "integration"
+        assert client._get_headers(storage, tax.GetTax()) is headers  # pylint: disable=protected-access
+
+        storage.token = "second"
+        storage.license_key = "key"
+        headers = client._get_headers(storage, tax.GetTax())  # pylint: disable=protected-access
+        assert headers["Authorization"] == "Bearer second"
+        assert headers["X-License-Key"] == "key"
+
+        client.integration_key = None
+        headers = client._get_headers(storage, tax.GetTax())  # pylint: disable=protected-access
+        assert "X-Access-Key" not in headers
+
+
+def test_request_headers_and_url():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=[])
+
+    storage = SessionStorage(token="token")
+    with CheckBoxClient(transport=httpx.MockTransport(handler), storage=storage, base_url="http://first") as client:
+        client(tax.GetTax())
+        client.base_url = "http://second"
+        client.api_version = "2"
+        storage.token = None
+        client(tax.GetTax())
+        client(orders.DeleteOrder(order_id="order"))
+
+    assert str(requests[0].url) == "http://first/api/v1/tax"
+    assert requests[0].headers["Authorization"] == "Bearer token"
+    assert str(requests[1].url) == "http://second/api/v2/tax"
+    assert "Authorization" not in requests[1].headers
+    assert str(requests[2].url) == "http://second/_internal/orders/order"
+
+
+def test_lazy_namespaces_and_session():
+    with CheckBoxClient() as client:
+        assert client._session is None  # pylint: disable=protected-access
+        assert "goods" not in vars(client)
+
+        goods = client.goods
+        assert isinstance(goods, Goods)
+        assert goods.client is client
+        assert client.goods is goods
+
+        assert client.session is client.session
+        assert client._session is not None  # pylint: disable=protected-access
+
+    assert client._session is None  # pylint: disable=protected-access
@@ -0,0 +1,77 @@
+# pylint: disable=duplicate-code
+import json
+import pathlib
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.codec import CODECS, DEFAULT_CODEC, JSONCodec, StdlibJSONCodec, get_codec
+from checkbox_sdk.methods import receipts, webhook
+
+RECEIPT = json.loads((pathlib.Path(__file__).parent.parent / "test_data" / "receipt.json").read_text())
+
+
+def available_codecs():
+    codecs = []
+    # sourcery skip: no-loop-in-tests
+    for name in CODECS:
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            continue
+    return codecs
+
+
+@pytest.mark.parametrize("codec", available_codecs(), ids=lambda codec: codec.name)
+def test_round_trip(codec):
+    assert codec.loads(codec.dumps(RECEIPT)) == RECEIPT
+
+
+def test_get_codec():
+    assert get_codec() is DEFAULT_CODEC
+    assert isinstance(get_codec("json"), StdlibJSONCodec)
+    assert isinstance(get_codec("auto"), JSONCodec)
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+class RecordingCodec(StdlibJSONCodec):
+    def __init__(self):
+        self.encoded = 0
+        self.decoded = 0
+
+    def dumps(self, obj):
+        self.encoded += 1
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+
+def test_client_uses_codec():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"id": "1", "shift": {}})
+
+    codec = RecordingCodec()
+    with CheckBoxClient(transport=httpx.MockTransport(handler), codec=codec) as client:
+        result = client(receipts.CreateReceipt(receipt=RECEIPT))
+
+    assert result["id"] == "1"
+    assert (codec.encoded, codec.decoded) == (1, 1)
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert json.loads(requests[0].content)["goods"] == RECEIPT["goods"]
+
+
+def test_client_error_decoded_with_codec():
+    codec = RecordingCodec()
+    transport = httpx.MockTransport(lambda request: httpx.Response(400, json={"message": "Bad"}))
+    with CheckBoxClient(transport=transport, codec=codec) as client:
+        with pytest.raises(Exception, match="Bad"):
+            client(webhook.GetWebhookInfo())
+
+    assert codec.decoded == 1
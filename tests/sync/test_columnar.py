@@ -0,0 +1,122 @@
+# pylint: disable=duplicate-code
+import datetime
+import math
+
+import pytest
+
+from checkbox_sdk.client.columnar import (
+    MISSING_CATEGORY,
+    MISSING_TIMESTAMP,
+    RECEIPT_COLUMNS,
+    TRANSACTION_COLUMNS,
+    Column,
+    ColumnarBuffer,
+    field,
+)
+from checkbox_sdk.client.synchronous import CheckBoxClient
+
+from ..fake_api import FakeApi
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def receipt(index):
+    return {
+        "id": f"receipt-{index}",
+        "fiscal_code": f"FISCAL-{index}",
+        "type": "SELL" if index % 4 else "RETURN",
+        "status": "DONE",
+        "shift": {"id": f"shift-{index % 3}", "cash_register": {"id": "register"}} if index != 5 else None,
+        "total_sum": 1000 + index,
+        "total_payment": 2000,
+        "total_rest": 1000 - index,
+        "discounts": [{"sum": 10}, {"sum": 5}],
+        "taxes": [{"value": 166}, {"value": None}],
+        "goods": [{"good": {"code": "1"}}] * (index % 3),
+        "created_at": (START + datetime.timedelta(minutes=index)).isoformat(),
+        "fiscal_date": None,
+    }
+
+
+def test_columnar_buffer():
+    buffer = ColumnarBuffer().extend(receipt(index) for index in range(10))
+
+    assert len(buffer) == 10
+    assert buffer.values("id")[3] == "receipt-3"
+    assert list(buffer.values("total_sum")) == [1000 + index for index in range(10)]
+    assert set(buffer.values("taxes_sum")) == {166}
+    assert set(buffer.values("discounts_sum")) == {15}
+    assert list(buffer.values("goods_count"))[:4] == [0, 1, 2, 0]
+    assert buffer.values("created_at")[1] == 1704067260 * 1_000_000
+    assert set(buffer.values("fiscal_date")) == {MISSING_TIMESTAMP}
+
+    assert buffer.categories("type") == ["RETURN", "SELL"]
+    assert list(buffer.values("type"))[:5] == [0, 1, 1, 1, 0]
+    assert buffer.categories("shift_id") == ["shift-0", "shift-1", "shift-2"]
+    assert buffer.values("shift_id")[5] == MISSING_CATEGORY
+
+
+def test_column_validation():
+    with pytest.raises(ValueError):
+        Column("total", field("total"), "decimal")
+    with pytest.raises(ValueError):
+        ColumnarBuffer([Column("id", field("id"), "string")] * 2)
+
+    buffer = ColumnarBuffer([Column("rate", field("tax", "rate"), "float")])
+    buffer.extend([{"tax": {"rate": 20}}, {"tax": None}])
+    assert buffer.values("rate")[0] == 20.0
+    assert math.isnan(buffer.values("rate")[1])
+
+
+def test_export_paginated_results():
+    transactions = [
+        {
+            "id": str(index),
+            "type": "RECEIPT",
+            "status": "DONE" if index % 2 else "ERROR",
+            "serial": index,
+            "created_at": (START + datetime.timedelta(seconds=index)).isoformat(),
+            "updated_at": "2024-01-01T00:00:00Z",
+        }
+        for index in range(25)
+    ]
+
+    with CheckBoxClient(transport=FakeApi(transactions).transport) as client:
+        buffer = ColumnarBuffer(TRANSACTION_COLUMNS).extend(client.transactions.get_transactions(limit=10))
+
+    assert len(buffer) == 25
+    assert list(buffer.values("serial")) == list(range(25))
+    assert buffer.categories("status") == ["ERROR", "DONE"]
+    assert set(buffer.values("updated_at")) == {1704067200 * 1_000_000}
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    buffer = ColumnarBuffer(RECEIPT_COLUMNS).extend(receipt(index) for index in range(10))
+
+    columns = buffer.to_numpy()
+    assert columns["total_sum"].dtype == numpy.int64
+    assert columns["total_sum"].sum() == sum(1000 + index for index in range(10))
+    assert columns["created_at"][0] == numpy.datetime64("2024-01-01T00:00:00", "us")
+    assert numpy.isnat(columns["fiscal_date"]).all()
+    assert (columns["type"] == buffer.categories("type").index("RETURN")).sum() == 3
+
+    assert buffer.group_sum("shift_id", "total_rest") == {
+        "shift-0": 1000 * 4 - (0 + 3 + 6 + 9),
+        "shift-1": 1000 * 3 - (1 + 4 + 7),
+        "shift-2": 1000 * 2 - (2 + 8),
+        None: 1000 - 5,
+    }
+
+
+def test_parquet(tmp_path):
+    pytest.importorskip("numpy")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    buffer = ColumnarBuffer(RECEIPT_COLUMNS).extend(receipt(index) for index in range(10))
+
+    buffer.write_parquet(tmp_path / "receipts.parquet")
+    table = parquet.read_table(tmp_path / "receipts.parquet")
+    assert table.num_rows == 10
+    assert table.column("shift_id").to_pylist()[4:6] == ["shift-1", None]
+    assert table.column("fiscal_date").null_count == 10
+    assert table.column("created_at").to_pylist()[0] == START
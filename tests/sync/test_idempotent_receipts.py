@@ -0,0 +1,95 @@
+# pylint: disable=duplicate-code
+import json
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.circuit_breaker import CircuitBreaker
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.exceptions import CheckBoxAPIError, CheckBoxCircuitOpenError, CheckBoxError
+from checkbox_sdk.methods import receipts
+
+
+def lost_response_transport(created: bool):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.method == "POST":
+            if len(requests) == 1:
+                raise httpx.ReadTimeout("Response lost", request=request)
+            return httpx.Response(200, json={**json.loads(request.content), "shift": {}})
+        if created:
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1], "status": "DONE"})
+        return httpx.Response(404, json={"message": "Not found"})
+
+    return httpx.MockTransport(handler), requests
+
+
+def test_create_receipt_lost_response_created():
+    transport, requests = lost_response_transport(created=True)
+    with CheckBoxClient(transport=transport) as client:
+        receipt = client.receipts.create_receipt(goods=[], wait=False, attempts=3, relax=0)
+
+    assert [request.method for request in requests] == ["POST", "GET"]
+    assert json.loads(requests[0].content)["id"] == receipt["id"]
+    assert requests[0].headers["x-request-id"] == receipt["id"]
+
+
+def test_create_receipt_lost_response_not_created():
+    transport, requests = lost_response_transport(created=False)
+    with CheckBoxClient(transport=transport) as client:
+        receipt = client.receipts.create_receipt_offline(goods=[], wait=False, attempts=3, relax=0)
+
+    assert [request.method for request in requests] == ["POST", "GET", "POST"]
+    assert json.loads(requests[0].content)["id"] == json.loads(requests[2].content)["id"] == receipt["id"]
+
+
+def test_create_receipt_lost_response_single_attempt():
+    transport, requests = lost_response_transport(created=False)
+    with CheckBoxClient(transport=transport) as client:
+        with pytest.raises(CheckBoxError):
+            client.receipts.create_receipt(goods=[], wait=False, relax=0)
+
+    assert [request.method for request in requests] == ["POST", "GET"]
+
+
+def test_create_receipt_circuit_open_is_not_retried():
+    transport, requests = lost_response_transport(created=False)
+    with CheckBoxClient(transport=transport, circuit_breaker=CircuitBreaker(failure_threshold=1)) as client:
+        with pytest.raises(CheckBoxCircuitOpenError):
+            client.receipts.create_receipt(goods=[], wait=False, attempts=3, relax=0)
+
+    # The re-sent receipt is rejected by the open circuit without a request, so there is nothing to look up
+    assert [request.method for request in requests] == ["POST", "GET"]
+
+
+def test_create_receipt_rate_limited_is_not_looked_up():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(429, json={"message": "Too many requests"})
+
+    with CheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(CheckBoxAPIError) as exc_info:
+            client.receipts.create_receipt(goods=[], wait=False, attempts=3, relax=0)
+
+    assert exc_info.value.status == 429
+    assert [request.method for request in requests] == ["POST"]
+
+
+def test_create_receipt_keeps_caller_payload():
+    transport, requests = lost_response_transport(created=True)
+    payload = {"goods": []}
+    with CheckBoxClient(transport=transport) as client:
+        receipt = client.receipts.create_receipt(receipt=payload, wait=False, attempts=3, relax=0)
+
+    # The client-generated ID is set on the caller's payload
+    assert payload["id"] == receipt["id"] == json.loads(requests[0].content)["id"]
+
+
+def test_ensure_id():
+    assert receipts.CreateReceipt({"id": "receipt"}).ensure_id() == "receipt"
+    call = receipts.CreateReceipt(goods=[])
+    assert call.ensure_id() == call.receipt["id"]
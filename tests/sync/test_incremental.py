@@ -0,0 +1,87 @@
+# pylint: disable=duplicate-code
+import datetime
+
+import pytest
+
+from checkbox_sdk.client.incremental import (
+    Checkpoint,
+    FileCheckpointStore,
+    IncrementalSync,
+    MemoryCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from checkbox_sdk.client.synchronous import CheckBoxClient
+
+from ..fake_api import SearchApi
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def record(index, status="DONE", minutes=None):
+    created_at = START + datetime.timedelta(minutes=index if minutes is None else minutes)
+    return {"id": f"record-{index}", "created_at": created_at.isoformat(), "status": status}
+
+
+@pytest.mark.parametrize("resource", ["receipts", "transactions"])
+def test_incremental_sync(tmp_path, resource):
+    api = SearchApi([record(index) for index in range(100)])
+    with CheckBoxClient(transport=api.transport) as client:
+        sync = IncrementalSync(client, FileCheckpointStore(tmp_path), resource=resource, page_size=30)
+        assert [item["id"] for item in sync.sync("register")] == [f"record-{index}" for index in range(100)]
+
+        # A receipt inside the overlap is fiscalized, one is created late inside the overlap and one is new
+        api.records[95] = record(95, status="ERROR")
+        api.records.append(record(100, minutes=93))
+        api.records.append(record(101, minutes=120))
+        api.requests.clear()
+
+        restarted = IncrementalSync(client, FileCheckpointStore(tmp_path), resource=resource, page_size=30)
+        assert [item["id"] for item in restarted.sync("register")] == ["record-100", "record-95", "record-101"]
+        assert list(restarted.sync("register")) == []
+
+    # Only the records since the checkpoint minus the overlap are fetched again
+    assert len(api.requests) <= 2 * 2
+
+
+@pytest.mark.parametrize("resource", ["receipts", "transactions"])
+def test_start_date(resource):
+    api = SearchApi([record(index) for index in range(100)])
+    with CheckBoxClient(transport=api.transport) as client:
+        sync = IncrementalSync(
+            client,
+            MemoryCheckpointStore(),
+            resource=resource,
+            page_size=10,
+            start_date=START + datetime.timedelta(minutes=90),
+        )
+        assert [item["id"] for item in sync.sync("register")] == [f"record-{index}" for index in range(90, 100)]
+
+    # The older history is never fetched
+    assert len(api.requests) <= 2
+
+
+def test_early_stop_resumes():
+    api = SearchApi([record(index) for index in range(10)])
+    store = MemoryCheckpointStore()
+    with CheckBoxClient(transport=api.transport) as client:
+        sync = IncrementalSync(client, store, checkpoint_every=1)
+        for item in sync.sync("register"):
+            if item["id"] == "record-4":
+                break
+
+        assert [item["id"] for item in sync.sync("register")] == [f"record-{index}" for index in range(4, 10)]
+
+
+def test_unknown_cash_register():
+    with CheckBoxClient() as client:
+        with pytest.raises(ValueError):
+            next(IncrementalSync(client, MemoryCheckpointStore()).sync())
+
+
+def test_sqlite_store(tmp_path):
+    store = SQLiteCheckpointStore(tmp_path / "sync.db")
+    checkpoint = Checkpoint(watermark=START.isoformat(), versions={"1": (START.isoformat(), "DONE")})
+    store.save("receipts:register", checkpoint)
+    store.close()
+
+    assert SQLiteCheckpointStore(tmp_path / "sync.db").load("receipts:register") == checkpoint
@@ -0,0 +1,195 @@
+# pylint: disable=duplicate-code
+import datetime
+
+import pytest
+
+from checkbox_sdk.client.mirror import LocalMirror, MirrorSync
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.storage.simple import SessionStorage
+
+from ..fake_api import FakeApi, search
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def created_at(minutes):
+    return (START + datetime.timedelta(minutes=minutes)).isoformat()
+
+
+def receipt(index, shift="shift-1", barcode="100"):
+    return {
+        "id": f"receipt-{index}",
+        "fiscal_code": f"FISCAL-{index}",
+        "created_at": created_at(index),
+        "status": "DONE",
+        "shift": {"id": shift, "cash_register": {"id": "register"}},
+        "goods": [{"good": {"code": "1", "barcode": f"{barcode}, 200"}}, {"good": {"code": "2", "barcode": None}}],
+    }
+
+
+class MirrorApi(FakeApi):
+    def __init__(self):
+        super().__init__()
+        self.receipts = [receipt(index, barcode="300" if index == 7 else "100") for index in range(40)]
+        self.shifts = [
+            {"id": f"shift-{index}", "created_at": created_at(index * 10), "status": "CLOSED"} for index in range(4)
+        ]
+        self.transactions = [
+            {"id": f"transaction-{index}", "created_at": created_at(index), "type": "RECEIPT", "status": "DONE"}
+            for index in range(40)
+        ]
+
+    def respond(self, request):
+        params = request.url.params
+        records = {
+            "/api/v1/receipts/search": self.receipts,
+            "/api/v1/shifts": self.shifts,
+            "/api/v1/transactions": self.transactions,
+        }[request.url.path]
+        if "barcode" in params:
+            records = [item for item in records if params["barcode"] in item["goods"][0]["good"]["barcode"]]
+        return search(request, records)
+
+
+def test_mirror_queries():
+    with LocalMirror() as mirror:
+        assert mirror.ingest_receipts([receipt(index, shift=f"shift-{index % 2}") for index in range(10)]) == 10
+        # Ingesting again replaces the stored version
+        mirror.ingest_receipts([{**receipt(3, shift="shift-1", barcode="300"), "status": "ERROR"}])
+
+        assert [item["id"] for item in mirror.find_receipts(barcode="200", limit=3)] == [
+            "receipt-0",
+            "receipt-1",
+            "receipt-2",
+        ]
+        assert [item["id"] for item in mirror.find_receipts(barcode="300")] == ["receipt-3"]
+        assert mirror.find_receipts(barcode="100", status="ERROR") == []
+        assert mirror.find_receipts(fiscal_code="FISCAL-4")[0]["goods"][0]["good"]["code"] == "1"
+        assert [item["id"] for item in mirror.find_receipts(shift_id="shift-1", desc=True, limit=2)] == [
+            "receipt-9",
+            "receipt-7",
+        ]
+        found = mirror.find_receipts(cash_register_id="register", from_date=created_at(2), to_date=created_at(5))
+        assert len(found) == 4
+        # Times with another time zone are normalized to UTC
+        assert len(mirror.find_receipts(from_date="2024-01-01T02:05:00+02:00")) == 5
+
+
+def test_synced_ranges():
+    with LocalMirror() as mirror:
+        mirror.mark_synced("receipts", created_at(0), created_at(10))
+        mirror.mark_synced("receipts", created_at(20), created_at(30))
+        assert mirror.is_synced("receipts", created_at(2), created_at(8))
+        assert not mirror.is_synced("receipts", created_at(5), created_at(25))
+        assert not mirror.is_synced("shifts", created_at(2), created_at(8))
+
+        mirror.mark_synced("receipts", created_at(10), created_at(20), scope="register")
+        assert mirror.is_synced("receipts", created_at(5), created_at(25), scope="register")
+        assert not mirror.is_synced("receipts", created_at(5), created_at(25))
+
+        # Overlapping ranges are merged
+        mirror.mark_synced("receipts", created_at(5), created_at(25))
+        assert mirror.is_synced("receipts", created_at(0), created_at(30))
+
+
+def test_mirror_sync(tmp_path):
+    api = MirrorApi()
+    with CheckBoxClient(transport=api.transport) as client:
+        client.storage.cash_register = {"id": "register"}
+        sync = MirrorSync(LocalMirror(tmp_path / "mirror.db"), client, page_size=15)
+        assert sync.sync_receipts(created_at(0), created_at(29)) == 30
+        assert sync.sync_shifts(created_at(0), created_at(30)) == 4
+        assert sync.sync_transactions(created_at(10), created_at(19)) == 10
+        api.requests.clear()
+
+        # Synced ranges are answered from the mirror
+        assert [item["id"] for item in sync.search_receipts(created_at(5), created_at(10), barcode="300")] == [
+            "receipt-7"
+        ]
+        assert len(sync.search_receipts(created_at(0), created_at(29), shift_id="shift-1")) == 30
+        assert len(sync.search_shifts(created_at(0), created_at(15), status="CLOSED")) == 2
+        assert [item["id"] for item in sync.search_transactions(created_at(18), created_at(19))] == [
+            "transaction-18",
+            "transaction-19",
+        ]
+        assert api.paths == []
+
+        # Other ranges fall back to the API, the found records are ingested
+        assert len(sync.search_receipts(created_at(25), created_at(35), barcode="100")) == 11
+        assert set(api.paths) == {"/api/v1/receipts/search"}
+        assert len(sync.mirror.find_receipts(from_date=created_at(30))) == 6
+        assert [item["id"] for item in sync.search_transactions(created_at(30), created_at(31))] == [
+            "transaction-30",
+            "transaction-31",
+        ]
+        assert len(sync.mirror.find_transactions()) == 12
+        sync.mirror.close()
+
+    # The mirror is persisted
+    with LocalMirror(tmp_path / "mirror.db") as mirror:
+        assert len(mirror.find_receipts()) == 36
+        assert mirror.is_synced("shifts", created_at(0), created_at(30), scope="register")
+        assert not mirror.is_synced("shifts", created_at(0), created_at(30), scope="other-register")
+
+
+def test_mirror_sync_scope():
+    api = MirrorApi()
+    with CheckBoxClient(transport=api.transport) as client:
+        with LocalMirror() as mirror:
+            sync = MirrorSync(mirror, client, page_size=15)
+            with pytest.raises(ValueError):
+                sync.sync_transactions(created_at(0), created_at(9))
+
+            sync.sync_transactions(created_at(0), created_at(9), storage=SessionStorage(cash_register={"id": "one"}))
+            api.requests.clear()
+
+            # The range synced with the session of one cash register is not reused for another one
+            other = SessionStorage(cash_register={"id": "two"})
+            assert len(sync.search_transactions(created_at(0), created_at(9), storage=other)) == 10
+            assert api.requests
+
+
+def test_mirror_sync_filters_by_cash_register():
+    api = MirrorApi()
+    with CheckBoxClient(transport=api.transport) as client:
+        with LocalMirror() as mirror:
+            sync = MirrorSync(mirror, client)
+            # Both cash registers synced the same range into one mirror
+            for register in ("A", "B"):
+                mirror.ingest_receipts(
+                    [{**receipt(index), "id": f"{register}-{index}", "shift": {"id": "shift"}} for index in range(5)],
+                    register,
+                )
+                mirror.ingest_shifts([{"id": f"{register}-shift", "created_at": created_at(1)}], register)
+                mirror.ingest_transactions(
+                    [{"id": f"{register}-{index}", "created_at": created_at(index)} for index in range(5)], register
+                )
+                for resource in ("receipts", "shifts", "transactions"):
+                    mirror.mark_synced(resource, created_at(0), created_at(10), scope=register)
+
+            storage = SessionStorage(cash_register={"id": "A"})
+            found = sync.search_receipts(created_at(0), created_at(10), storage=storage)
+            assert [item["id"] for item in found] == [f"A-{index}" for index in range(5)]
+            found = sync.search_receipts(created_at(0), created_at(10), cash_register_id="B", storage=storage)
+            assert [item["id"] for item in found] == [f"B-{index}" for index in range(5)]
+            found = sync.search_shifts(created_at(0), created_at(10), storage=storage)
+            assert [item["id"] for item in found] == ["A-shift"]
+            found = sync.search_transactions(created_at(0), created_at(10), storage=storage)
+            assert [item["id"] for item in found] == [f"A-{index}" for index in range(5)]
+
+    assert api.paths == []
+
+
+def test_mirror_sync_future_range():
+    api = MirrorApi()
+    with CheckBoxClient(transport=api.transport) as client:
+        client.storage.cash_register = {"id": "register"}
+        with LocalMirror() as mirror:
+            sync = MirrorSync(mirror, client, page_size=15)
+            now = datetime.datetime.now(datetime.timezone.utc)
+            future = now + datetime.timedelta(days=1)
+            sync.sync_receipts(created_at(0), future)
+
+            # Receipts created after the sync may be missing, so only the past part of the range is synced
+            assert mirror.is_synced("receipts", created_at(0), now - datetime.timedelta(minutes=1), scope="register")
+            assert not mirror.is_synced("receipts", created_at(0), future, scope="register")
@@ -0,0 +1,131 @@
+# pylint: disable=duplicate-code
+import threading
+import time
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.offline_codes import OfflineCodeReservoir
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.exceptions import CheckBoxOfflineCodesError
+
+from ..fake_api import FakeApi
+
+
+class OfflineCodesApi(FakeApi):
+    def __init__(self, available=0):
+        super().__init__()
+        self.available = available
+        self.next_code = 0
+        self.fail = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def respond(self, request):
+        path = request.url.path.rsplit("/", 1)[-1]
+        if self.fail:
+            return httpx.Response(503, text="Unavailable")
+        if path == "get-offline-codes-count":
+            return httpx.Response(200, json={"available": self.available, "enough_offline_codes": self.available > 0})
+        if path == "ask-offline-codes":
+            self.available += int(request.url.params["count"])
+            return httpx.Response(200, json={})
+
+        self.release.wait(5)
+        count = min(int(request.url.params["count"]), self.available)
+        codes = [{"fiscal_code": f"CODE-{self.next_code + index}"} for index in range(count)]
+        # The last code is returned again to check duplicates are dropped
+        codes.append({"fiscal_code": f"CODE-{self.next_code}"})
+        self.next_code += count
+        self.available -= count
+        return httpx.Response(200, json=codes)
+
+
+def test_fill_and_take():
+    api = OfflineCodesApi()
+    with CheckBoxClient(transport=api.transport) as client:
+        reservoir = OfflineCodeReservoir(client, size=10, low_watermark=4, ask_count=100)
+        stats = reservoir.fill()
+        assert api.endpoints == ["get-offline-codes-count", "ask-offline-codes", "get-offline-codes"]
+        assert (stats.available, stats.fetched, stats.duplicates, stats.refills) == (10, 11, 1, 1)
+
+        api.requests.clear()
+        assert [reservoir.take_nowait() for _ in range(6)] == [f"CODE-{index}" for index in range(6)]
+        assert not api.requests
+
+        # Dropping below the low watermark refills in the background, without asking the tax service
+        assert reservoir.take_nowait() == "CODE-6"
+        reservoir.close()
+        assert api.endpoints == ["get-offline-codes-count", "get-offline-codes"]
+        assert len(reservoir) == 10
+        assert reservoir.take_many(20) == [f"CODE-{index}" for index in range(7, 17)]
+
+        stats = reservoir.stats()
+        assert stats.handed_out == 17
+        assert stats.available == 0
+        assert stats.last_refill_at is not None
+
+
+def test_take_waits_for_refill():
+    api = OfflineCodesApi(available=100)
+    api.release.clear()
+    with CheckBoxClient(transport=api.transport) as client:
+        reservoir = OfflineCodeReservoir(client, size=5, low_watermark=2)
+        with pytest.raises(CheckBoxOfflineCodesError):
+            reservoir.take_nowait()
+        with pytest.raises(CheckBoxOfflineCodesError):
+            reservoir.take(timeout=0.01)
+
+        threading.Timer(0.05, api.release.set).start()
+        assert reservoir.take(timeout=5) == "CODE-0"
+        assert reservoir.stats().waits == 3
+        reservoir.close()
+
+
+def test_failed_refill():
+    api = OfflineCodesApi(available=100)
+    with CheckBoxClient(transport=api.transport) as client:
+        reservoir = OfflineCodeReservoir(client, size=5, low_watermark=2, retry_delay=0.2)
+        reservoir.fill()
+        api.fail = True
+        assert len(reservoir.take_many(4)) == 4
+        reservoir.close()
+
+        stats = reservoir.stats()
+        assert stats.failed_refills == 1
+        assert "503" in stats.last_error
+        # The pooled code is still handed out, and no refill is retried before the delay
+        api.requests.clear()
+        assert reservoir.take() == "CODE-4"
+        with pytest.raises(CheckBoxOfflineCodesError, match="refill failed"):
+            reservoir.take()
+        assert not api.requests
+
+        api.fail = False
+        time.sleep(0.2)
+        assert reservoir.take() == "CODE-5"
+        reservoir.close()
+
+
+def test_unexpected_refill_error():
+    # Codes without a fiscal code break the refill with a KeyError
+    def handler(request):
+        if "count" not in request.url.params:
+            return httpx.Response(200, json={"available": 100, "enough_offline_codes": True})
+        return httpx.Response(200, json=[{}])
+
+    with CheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        reservoir = OfflineCodeReservoir(client, size=5, low_watermark=2)
+        with pytest.raises(CheckBoxOfflineCodesError, match="refill failed"):
+            reservoir.take(timeout=5)
+        reservoir.close()
+
+        stats = reservoir.stats()
+        assert (stats.failed_refills, stats.refilling) == (1, False)
+        assert "fiscal_code" in stats.last_error
+
+
+@pytest.mark.parametrize("low_watermark", [0, 10])
+def test_invalid_watermark(low_watermark):
+    with pytest.raises(ValueError):
+        OfflineCodeReservoir(None, size=10, low_watermark=low_watermark)
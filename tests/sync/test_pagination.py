@@ -0,0 +1,63 @@
+# pylint: disable=duplicate-code
+import threading
+import time
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.exceptions import CheckBoxError
+from checkbox_sdk.methods import transactions
+
+ITEMS = 95
+
+
+class FakeApi:
+    def __init__(self, fail_offset=None):
+        self.fail_offset = fail_offset
+        self.offsets = []
+        self.threads = set()
+
+    def handler(self, request):
+        offset, limit = int(request.url.params["offset"]), int(request.url.params["limit"])
+        self.offsets.append(offset)
+        self.threads.add(threading.current_thread().name)
+        if offset == self.fail_offset:
+            return httpx.Response(500, json={"message": "Failed"})
+        results = [{"id": index} for index in range(offset, min(offset + limit, ITEMS))]
+        return httpx.Response(200, json={"meta": {"limit": limit, "offset": offset}, "results": results})
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_results_in_order(prefetch):
+    api = FakeApi()
+    with CheckBoxClient(transport=httpx.MockTransport(api.handler), page_prefetch=prefetch) as client:
+        results = [item["id"] for item in client.transactions.get_transactions(limit=10)]
+
+    assert results == list(range(ITEMS))
+    assert api.offsets == list(range(0, 110, 10))
+    assert ("checkbox-page-prefetch" in api.threads) is (prefetch > 0)
+
+
+def test_error_raised_after_previous_pages():
+    api = FakeApi(fail_offset=30)
+    with CheckBoxClient(transport=httpx.MockTransport(api.handler)) as client:
+        results = []
+        pages = client.transactions.fetch_paginated_results(transactions.GetTransactions(limit=10), prefetch=2)
+        with pytest.raises(CheckBoxError):
+            for item in pages:
+                results.append(item["id"])
+
+    assert results == list(range(30))
+
+
+def test_early_close_stops_prefetch():
+    api = FakeApi()
+    with CheckBoxClient(transport=httpx.MockTransport(api.handler)) as client:
+        results = client.transactions.fetch_paginated_results(transactions.GetTransactions(limit=10), prefetch=2)
+        assert next(results)["id"] == 0
+        results.close()
+        time.sleep(0.3)
+
+    # The first page, at most two queued pages and the page in flight while the queue was full
+    assert len(api.offsets) <= 4
@@ -0,0 +1,109 @@
+# pylint: disable=duplicate-code
+import datetime
+
+import pytest
+
+from checkbox_sdk.client.partition import PartitionedSearch, split_time_range
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.methods import orders, receipts, tax
+
+from ..fake_api import SearchApi
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+END = START + datetime.timedelta(days=8)
+
+
+def make_items(time_key="created_at"):
+    # One receipt every hour, a dense burst on the third day and receipts exactly at the window boundaries
+    times = [START + datetime.timedelta(hours=hour) for hour in range(8 * 24)]
+    times += [START + datetime.timedelta(days=2, seconds=second) for second in range(1, 500)]
+    times += [START + datetime.timedelta(days=day) for day in range(1, 8)]
+    items = [{"id": f"receipt-{index}", time_key: moment.isoformat()} for index, moment in enumerate(times)]
+    return sorted(items, key=lambda item: item[time_key])
+
+
+class PartitionApi(SearchApi):
+    def __init__(self, items, fields=("from_date", "to_date", "desc", "created_at")):
+        super().__init__(items, fields)
+        self.max_offset = 0
+
+    def respond(self, request):
+        params = request.url.params
+        desc_field = self.fields[2]
+        assert params[desc_field] == "false"
+        assert [flag for flag in ("desc", "delivery_desc") if flag in params] == [desc_field]
+        with self.lock:
+            self.max_offset = max(self.max_offset, int(params["offset"]))
+        return super().respond(request)
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_partitioned_search(concurrency):
+    items = make_items()
+    api = PartitionApi(items)
+    with CheckBoxClient(transport=api.transport) as client:
+        search = PartitionedSearch(
+            client,
+            receipts.GetReceiptsSearch(limit=20),
+            from_date=START,
+            to_date=END.isoformat(),
+            windows=8,
+            concurrency=concurrency,
+            max_pages=3,
+        )
+        results = list(search)
+
+    assert [item["id"] for item in results] == [item["id"] for item in items]
+    assert search.splits > 0
+    # Dense windows are split instead of being paginated deeply
+    assert api.max_offset < 20 * 3
+
+
+def test_naive_range():
+    # Times without a time zone are taken as UTC and compared with the aware times of a dense window
+    items = make_items()
+    api = PartitionApi(items)
+    with CheckBoxClient(transport=api.transport) as client:
+        search = PartitionedSearch(
+            client,
+            receipts.GetReceiptsSearch(limit=20),
+            from_date=START.replace(tzinfo=None),
+            to_date=END.replace(tzinfo=None).isoformat(),
+            windows=2,
+            max_pages=3,
+        )
+        results = list(search)
+
+    assert [item["id"] for item in results] == [item["id"] for item in items]
+    assert search.splits > 0
+
+
+def test_partitioned_orders():
+    # Orders are filtered and ordered by the delivery time only, the default `desc` flag is dropped
+    items = make_items("delivered_at")
+    api = PartitionApi(items, ("delivered_from_date", "delivered_to_date", "delivery_desc", "delivered_at"))
+    with CheckBoxClient(transport=api.transport) as client:
+        search = PartitionedSearch(
+            client, orders.GetOrders(limit=20), from_date=START, to_date=END, windows=4, concurrency=2, max_pages=3
+        )
+        results = list(search)
+
+    assert [item["id"] for item in results] == [item["id"] for item in items]
+    assert search.splits > 0
+
+
+def test_time_key():
+    assert PartitionedSearch(None, receipts.GetReceiptsSearch(), from_date=START, to_date=END).time_key == "created_at"
+    assert PartitionedSearch(None, orders.GetOrders(), from_date=START, to_date=END).time_key == "delivered_at"
+
+
+def test_split_time_range():
+    windows = split_time_range(START, END, 4)
+
+    assert [window.start for window in windows] == [START + datetime.timedelta(days=day) for day in range(0, 8, 2)]
+    assert windows[-1].end == END
+
+
+def test_unsupported_method():
+    with pytest.raises(TypeError):
+        PartitionedSearch(None, tax.GetTax(), from_date=START, to_date=END)
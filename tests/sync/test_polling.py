@@ -0,0 +1,64 @@
+# pylint: disable=duplicate-code
+import itertools
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.polling import ConstantPolling, ExponentialPolling, FibonacciPolling, get_polling
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.methods import receipts
+
+
+def take(polling, count):
+    return list(itertools.islice(polling.delays(), count))
+
+
+def test_strategies():
+    assert take(get_polling(0.5), 3) == [0.5, 0.5, 0.5]
+    assert take(ExponentialPolling(initial=0.1, factor=2, max_delay=0.5, warmup=2), 6) == [
+        0.1,
+        0.1,
+        0.1,
+        0.2,
+        0.4,
+        0.5,
+    ]
+    assert take(FibonacciPolling(initial=1, max_delay=6), 7) == [1, 1, 2, 3, 5, 6, 6]
+    polling = ConstantPolling(delay=1)
+    assert get_polling(polling) is polling
+
+
+def test_wait_status_reports_polls():
+    statuses = iter(["CREATED", "PENDING", "PENDING", "DONE"])
+    stats = []
+
+    def handler(request):  # pylint: disable=unused-argument
+        return httpx.Response(200, json={"id": "receipt", "status": next(statuses)})
+
+    polling = ExponentialPolling(initial=0.001, on_wait=stats.append)
+    with CheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        result = client.wait_status(
+            receipts.GetReceipt(receipt_id="receipt"), relax=polling, expected_value={"DONE", "ERROR"}
+        )
+
+    assert result["status"] == "DONE"
+    assert (stats[0].polls, stats[0].value, stats[0].succeeded) == (4, "DONE", True)
+
+
+def test_wait_status_timeout_reported():
+    stats = []
+
+    def handler(request):  # pylint: disable=unused-argument
+        return httpx.Response(200, json={"id": "receipt", "status": "PENDING"})
+
+    with CheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(ValueError):
+            client.wait_status(
+                receipts.GetReceipt(receipt_id="receipt"),
+                relax=ConstantPolling(delay=10, on_wait=stats.append),
+                expected_value={"DONE"},
+                timeout=0.05,
+            )
+
+    assert not stats[0].succeeded
+    assert stats[0].elapsed < 1, "The delay must be shortened to the remaining timeout"
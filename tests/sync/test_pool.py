@@ -0,0 +1,70 @@
+# pylint: disable=duplicate-code
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.pool import CheckBoxClientPool
+from checkbox_sdk.methods import tax
+from checkbox_sdk.storage.simple import SessionStorage
+
+
+def test_routes_by_tenant():
+    license_keys = []
+
+    def handler(request):
+        license_keys.append(request.headers["X-License-Key"])
+        return httpx.Response(200, json=[])
+
+    with CheckBoxClientPool(transport=httpx.MockTransport(handler)) as pool:
+        pool.add("first", SessionStorage(license_key="first-key"))
+        pool.add("second", SessionStorage(license_key="second-key"))
+
+        pool.emit("second", tax.GetTax())
+        pool["first"].tax.get_all_taxes()
+
+        assert pool["first"].session is pool["second"].session is pool.session
+        assert sorted(pool) == ["first", "second"]
+        assert pool.storage("first").license_key == "first-key"
+
+    assert license_keys == ["second-key", "first-key"]
+
+
+def test_tenant_registry():
+    pool = CheckBoxClientPool()
+    pool.add("first")
+
+    with pytest.raises(ValueError):
+        pool.add("first")
+
+    pool.remove("first")
+    assert "first" not in pool
+    with pytest.raises(KeyError):
+        pool.emit("first", tax.GetTax())
+
+    with pytest.raises(TypeError):
+        CheckBoxClientPool(storage=SessionStorage())
+
+
+def test_tenant_concurrency():
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def handler(request):  # pylint: disable=unused-argument
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.pop()
+        return httpx.Response(200, json=[])
+
+    with CheckBoxClientPool(transport=httpx.MockTransport(handler), tenant_concurrency=2) as pool:
+        pool.add("first")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: pool.emit("first", tax.GetTax()), range(16)))
+
+    assert max(peak) == 2
@@ -0,0 +1,72 @@
+# pylint: disable=duplicate-code
+import time
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.rate_limit import FileBucketStore, MemoryBucketStore, RateLimiter
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.methods import tax
+from checkbox_sdk.storage.simple import SessionStorage
+
+
+def test_burst_then_delay():
+    limiter = RateLimiter(rate=10, capacity=2)
+    storage = SessionStorage(license_key="key")
+
+    assert limiter.reserve(storage) == 0
+    assert limiter.reserve(storage) == 0
+    assert limiter.reserve(storage) == pytest.approx(0.1, abs=0.01)
+    assert limiter.reserve(storage) == pytest.approx(0.2, abs=0.01)
+
+
+def test_buckets_by_key():
+    limiter = RateLimiter(rate=1, capacity=1, key="license_key")
+
+    assert limiter.reserve(SessionStorage(license_key="first")) == 0
+    assert limiter.reserve(SessionStorage(license_key="second")) == 0
+    assert limiter.reserve(SessionStorage(license_key="first")) > 0
+    # Requests without a license key share the global bucket
+    assert limiter.reserve(SessionStorage()) == 0
+    assert limiter.reserve(SessionStorage()) > 0
+
+
+def test_global_and_custom_keys():
+    limiter = RateLimiter(rate=1, capacity=1, key="global")
+    assert limiter.reserve(SessionStorage(license_key="first")) == 0
+    assert limiter.reserve(SessionStorage(license_key="second")) > 0
+
+    limiter = RateLimiter(rate=1, capacity=1, key=lambda storage: storage.machine_id)
+    assert limiter.get_key(SessionStorage(machine_id="device")) == "device"
+
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, key="unknown")
+
+
+def test_file_store_shared(tmp_path):
+    # Two stores over the same directory behave like two processes
+    first = RateLimiter(rate=10, capacity=1, store=FileBucketStore(tmp_path))
+    second = RateLimiter(rate=10, capacity=1, store=FileBucketStore(tmp_path))
+    storage = SessionStorage(license_key="key")
+
+    assert first.reserve(storage) == 0
+    assert second.reserve(storage) == pytest.approx(0.1, abs=0.02)
+
+
+def test_refill():
+    store = MemoryBucketStore()
+    assert store.reserve("key", rate=1000, capacity=1) == 0
+    time.sleep(0.01)
+    assert store.reserve("key", rate=1000, capacity=1) == 0
+
+
+def test_shared_between_clients():
+    limiter = RateLimiter(rate=20, capacity=1, key="global")
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+
+    start = time.monotonic()
+    with CheckBoxClient(transport=transport, rate_limiter=limiter) as first:
+        with CheckBoxClient(transport=transport, rate_limiter=limiter) as second:
+            for client in (first, second, first, second):
+                client(tax.GetTax())
+    assert time.monotonic() - start >= 0.14
@@ -0,0 +1,117 @@
+# pylint: disable=duplicate-code
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.receipt_poller import ReceiptStatusPoller
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.exceptions import CheckBoxError, StatusException
+
+RECEIPTS = 50
+
+ERROR_TRANSACTION = {"status": "ERROR", "response_status": "ERROR", "response_error_message": "Failed"}
+
+
+class FakeApi:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = []
+        self.polls = {}
+
+    def receipt(self, receipt_id):
+        # Every receipt is fiscalized on its second poll, receipt "13" fails
+        self.polls[receipt_id] = self.polls.get(receipt_id, 0) + 1
+        if self.polls[receipt_id] < 2:
+            return {"id": receipt_id, "status": "CREATED"}
+        if receipt_id == "13":
+            return {"id": receipt_id, "status": "ERROR", "transaction": ERROR_TRANSACTION}
+        return {"id": receipt_id, "status": "DONE"}
+
+    def handler(self, request):
+        with self.lock:
+            self.requests.append(request.url.path)
+            if request.url.path.endswith("/receipts/search"):
+                # The search only knows receipts with a shift
+                return httpx.Response(
+                    200, json={"meta": {}, "results": [self.receipt(str(index)) for index in range(1, RECEIPTS)]}
+                )
+            return httpx.Response(200, json=self.receipt(request.url.path.rsplit("/", 1)[-1]))
+
+
+def test_coalesced_polling():
+    api = FakeApi()
+    with CheckBoxClient(transport=httpx.MockTransport(api.handler)) as client:
+        poller = ReceiptStatusPoller(client, interval=0.01)
+        created = [{"id": "0"}] + [{"id": str(index), "shift": {"id": "shift"}} for index in range(1, RECEIPTS)]
+
+        def wait(receipt):
+            try:
+                return poller.wait(receipt, timeout=5)
+            except StatusException as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=RECEIPTS) as executor:
+            results = list(executor.map(wait, created))
+
+    assert [result["status"] for index, result in enumerate(results) if index != 13] == ["DONE"] * (RECEIPTS - 1)
+    assert isinstance(results[13], StatusException)
+    assert poller.pending == 0
+    # Two ticks of one search plus the receipt without a shift, instead of two requests per receipt
+    assert poller.requests == len(api.requests) <= 6
+
+
+def test_timeout():
+    with CheckBoxClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "1", "status": "CREATED"}))
+    ) as client:
+        poller = ReceiptStatusPoller(client, interval=0.01)
+        with pytest.raises(ValueError):
+            poller.wait({"id": "1"}, timeout=0.05)
+        poller.close()
+
+    assert poller.pending == 0
+
+
+def test_discard():
+    with CheckBoxClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "1", "status": "CREATED"}))
+    ) as client:
+        poller = ReceiptStatusPoller(client, interval=0.01)
+        first, second = poller.submit({"id": "1"}), poller.submit({"id": "1"})
+        poller.discard("1", first)
+        assert poller.pending == 1
+        poller.discard("1", second)
+        assert poller.pending == 0
+        poller.close()
+
+    assert not first.done()
+
+
+def test_close_fails_pending():
+    with CheckBoxClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "1", "status": "CREATED"}))
+    ) as client:
+        poller = ReceiptStatusPoller(client, interval=0.01)
+        future = poller.submit({"id": "1"})
+        poller.close()
+
+        with pytest.raises(CheckBoxError):
+            future.result(timeout=1)
+        with pytest.raises(CheckBoxError):
+            poller.submit({"id": "2"})
+
+    assert poller.pending == 0
+
+
+def test_unexpected_error_fails_pending():
+    # A search result without an ID breaks the tick with a KeyError
+    with CheckBoxClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"meta": {}, "results": [{}]}))
+    ) as client:
+        poller = ReceiptStatusPoller(client, interval=0.01)
+        with pytest.raises(CheckBoxError, match="polling failed"):
+            poller.wait({"id": "1", "shift": {"id": "shift"}}, timeout=5)
+
+    assert poller.pending == 0
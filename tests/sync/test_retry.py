@@ -0,0 +1,99 @@
+# pylint: disable=duplicate-code
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.retry import RetryPolicy
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.exceptions import CheckBoxError
+from checkbox_sdk.methods import tax, webhook
+
+
+def make_client(responses, policy=None):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        response = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client = CheckBoxClient(
+        transport=httpx.MockTransport(handler),
+        retry_policy=policy or RetryPolicy(backoff_factor=0, jitter=False),
+    )
+    return client, calls
+
+
+def test_retry_on_status():
+    client, calls = make_client([httpx.Response(503), httpx.Response(502), httpx.Response(200, json=[])])
+    with client:
+        assert client(tax.GetTax()) == []
+    assert len(calls) == 3
+
+
+def test_retry_attempts_exhausted():
+    client, calls = make_client([httpx.Response(503)])
+    with client, pytest.raises(CheckBoxError):
+        client(tax.GetTax())
+    assert len(calls) == 3
+
+
+def test_retry_on_exception():
+    client, calls = make_client([httpx.ConnectError("boom"), httpx.Response(200, json=[])])
+    with client:
+        assert client(tax.GetTax()) == []
+    assert len(calls) == 2
+
+
+def test_no_retry_for_post_by_default():
+    client, calls = make_client([httpx.Response(503), httpx.Response(200, json={})])
+    with client, pytest.raises(CheckBoxError):
+        client(webhook.SetWebhook(url="https://example.com"))
+    assert len(calls) == 1
+
+
+def test_post_opt_in():
+    call = webhook.SetWebhook(url="https://example.com")
+    call.retryable = True
+    client, calls = make_client([httpx.Response(503), httpx.Response(200, json={})])
+    with client:
+        client(call)
+    assert len(calls) == 2
+
+
+def test_retry_budget():
+    policy = RetryPolicy(max_attempts=10, respect_retry_after=True, budget=1)
+    client, calls = make_client([httpx.Response(429, headers={"Retry-After": "5"}, json={})], policy=policy)
+    with client, pytest.raises(CheckBoxError):
+        client(tax.GetTax())
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        pytest.param("3", 3.0, id="seconds"),
+        pytest.param("-1", 0.0, id="negative"),
+        pytest.param("soon", None, id="invalid"),
+        pytest.param(None, None, id="missing"),
+    ],
+)
+def test_parse_retry_after(header, expected):
+    headers = {"Retry-After": header} if header is not None else {}
+    assert RetryPolicy.parse_retry_after(httpx.Response(429, headers=headers)) == expected
+
+
+def test_parse_retry_after_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    response = httpx.Response(503, headers={"Retry-After": format_datetime(retry_at, usegmt=True)})
+    assert 25 < RetryPolicy.parse_retry_after(response) <= 30
+
+
+def test_backoff():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.backoff(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+    assert 0 <= RetryPolicy(backoff_factor=1).backoff(3) <= 4
@@ -0,0 +1,53 @@
+# pylint: disable=duplicate-code
+import io
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.exceptions import CheckBoxAPIError
+from checkbox_sdk.methods import receipts
+
+PAYLOAD = b"%PDF" + bytes(range(256)) * 1024
+
+
+def handler(request):
+    if request.url.path.endswith("/missing/pdf"):
+        return httpx.Response(404, json={"message": "Not found"})
+    return httpx.Response(200, content=PAYLOAD)
+
+
+def test_iter_bytes():
+    with CheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        chunks = list(client.iter_bytes(receipts.GetReceiptVisualizationPdf(receipt_id="id"), chunk_size=4096))
+
+    assert b"".join(chunks) == PAYLOAD
+    assert max(len(chunk) for chunk in chunks) == 4096
+
+
+def test_download_to_path(tmp_path):
+    path = tmp_path / "receipt.pdf"
+    with CheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        size = client.receipts.download_receipt_visualization_pdf(receipt_id="id", sink=path)
+
+    assert size == len(PAYLOAD)
+    assert path.read_bytes() == PAYLOAD
+
+
+def test_download_to_file_object():
+    sink = io.BytesIO()
+    with CheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        client.download(receipts.GetReceiptVisualizationPdf(receipt_id="id"), sink)
+
+    assert sink.getvalue() == PAYLOAD
+    assert not sink.closed
+
+
+def test_download_error_leaves_no_file(tmp_path):
+    path = tmp_path / "receipt.pdf"
+    with CheckBoxClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(CheckBoxAPIError) as excinfo:
+            client.download(receipts.GetReceiptVisualizationPdf(receipt_id="missing"), path)
+
+    assert excinfo.value.status == 404
+    assert not path.exists()
@@ -0,0 +1,77 @@
+# pylint: disable=duplicate-code
+import gzip
+import io
+from email.parser import BytesParser
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.methods import goods
+
+CSV = b"code,name,price\n" + b"".join(b"%d,Good %d,1.00\n" % (row, row) for row in range(10_000))
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+def transport(requests):  # pylint: disable=redefined-outer-name
+    def handler(request):
+        requests.append((request, request.read()))
+        return httpx.Response(200, json={"task_id": "task"})
+
+    return httpx.MockTransport(handler)
+
+
+def parse_file(request, body):
+    if request.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    header = b"Content-Type: " + request.headers["Content-Type"].encode() + b"\r\n\r\n"
+    message = BytesParser().parsebytes(header + body)
+    (part,) = message.get_payload()
+    return part.get_filename(), part.get_payload(decode=True)
+
+
+def test_upload_from_path(requests, transport, tmp_path):  # pylint: disable=redefined-outer-name
+    path = tmp_path / "goods.csv"
+    path.write_bytes(CSV)
+    with CheckBoxClient(transport=transport) as client:
+        client(goods.ImportGoodsFromFile(file=path))
+
+    request, body = requests[0]
+    assert int(request.headers["Content-Length"]) == len(body)
+    assert parse_file(request, body) == ("goods.csv", CSV)
+
+
+def test_upload_from_file_object(requests, transport):  # pylint: disable=redefined-outer-name
+    file = io.BytesIO(b"skipped" + CSV)
+    file.seek(len(b"skipped"))
+    with CheckBoxClient(transport=transport) as client:
+        client(goods.ImportGoodsFromFile(file=file, filename="goods.csv"))
+
+    assert parse_file(*requests[0]) == ("goods.csv", CSV)
+    assert not file.closed
+    assert file.tell() == len(b"skipped"), "File position must be restored so the upload can be repeated"
+
+
+def test_upload_from_iterator_with_gzip(requests, transport):  # pylint: disable=redefined-outer-name
+    chunks = (CSV[offset:][:1000] for offset in range(0, len(CSV), 1000))
+    with CheckBoxClient(transport=transport) as client:
+        client(goods.ImportGoodsFromFile(file=chunks, filename="goods.csv", gzip=True))
+
+    request, body = requests[0]
+    assert request.headers["Transfer-Encoding"] == "chunked"
+    assert len(body) < len(CSV)
+    assert parse_file(request, body) == ("goods.csv", CSV)
+
+
+def test_async_iterator_rejected(transport):  # pylint: disable=redefined-outer-name
+    async def chunks():
+        yield CSV
+
+    with CheckBoxClient(transport=transport) as client:
+        with pytest.raises(TypeError):
+            client(goods.ImportGoodsFromFile(file=chunks(), filename="goods.csv"))
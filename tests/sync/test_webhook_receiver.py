@@ -0,0 +1,86 @@
+# pylint: disable=duplicate-code
+import hashlib
+import hmac
+import json
+import threading
+
+import httpx
+import pytest
+
+from checkbox_sdk.client.synchronous import CheckBoxClient
+from checkbox_sdk.client.webhook_receiver import WebhookDispatcher, WebhookServer
+from checkbox_sdk.methods import receipts
+
+SECRET = "secret"
+
+
+def sign(body):
+    return hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+
+
+class FakeApi:
+    def __init__(self):
+        self.status = "CREATED"
+        self.requests = 0
+
+    def handler(self, request):
+        self.requests += 1
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1], "status": self.status})
+
+
+def test_wait_completed_by_webhook():
+    api = FakeApi()
+    dispatcher = WebhookDispatcher(secret=SECRET)
+    with WebhookServer(dispatcher) as server, CheckBoxClient(
+        transport=httpx.MockTransport(api.handler), webhook_dispatcher=dispatcher
+    ) as client:
+
+        def deliver():
+            api.status = "DONE"
+            body = json.dumps({"type": "receipt", "data": {"id": "42", "status": "DONE"}}).encode()
+            for _ in range(2):
+                response = httpx.post(server.url, content=body, headers={"X-Signature": sign(body)}, trust_env=False)
+                assert response.status_code == 200
+
+        delivery = threading.Timer(0.1, deliver)
+        delivery.start()
+        result = client.wait_status(receipts.GetReceipt(receipt_id="42"), expected_value={"DONE"}, relax=30, timeout=5)
+        delivery.join()
+
+    assert result["status"] == "DONE"
+    assert api.requests == 2
+    assert dispatcher.received == 1
+    assert dispatcher.duplicates == 1
+
+
+def test_fallback_to_polling():
+    api = FakeApi()
+    dispatcher = WebhookDispatcher(fallback_after=0.05)
+    with CheckBoxClient(transport=httpx.MockTransport(api.handler), webhook_dispatcher=dispatcher) as client:
+        threading.Timer(0.2, lambda: setattr(api, "status", "DONE")).start()
+        result = client.wait_status(
+            receipts.GetReceipt(receipt_id="42"), expected_value={"DONE"}, relax=0.01, timeout=5
+        )
+
+    assert result["status"] == "DONE"
+    assert api.requests > 2
+
+
+def test_wait_timeout():
+    dispatcher = WebhookDispatcher()
+    with CheckBoxClient(transport=httpx.MockTransport(FakeApi().handler), webhook_dispatcher=dispatcher) as client:
+        with pytest.raises(ValueError):
+            client.wait_status(receipts.GetReceipt(receipt_id="42"), expected_value={"DONE"}, timeout=0.1)
+
+
+def test_rejected_deliveries():
+    dispatcher = WebhookDispatcher(secret=SECRET)
+    events = []
+    dispatcher.on(events.append, event_type="receipt")
+    body = json.dumps({"type": "receipt", "id": "1", "status": "DONE"}).encode()
+
+    assert dispatcher.handle(body, {"X-Signature": "wrong"}) == 401
+    assert dispatcher.handle(b"[]", {"X-Signature": sign(b"[]")}) == 400
+    assert dispatcher.handle(body, {"x-signature": f"sha256={sign(body)}"}) == 200
+
+    assert [(event.object_id, event.status) for event in events] == [("1", "DONE")]